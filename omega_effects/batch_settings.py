@@ -33,6 +33,7 @@ Sample Data Rows
         Save Vehicle-Level Cost Effects Files,all,FALSE,,enter True or False - these files can be large especially in CSV format
         Format for Vehicle-Level Output Files,all,csv,,enter 'csv' for large Excel-readable files 'parquet' for compressed files usable in Pandas
         Powertrain Costs FEV,all,TRUE,,enter TRUE or FALSE (must be consistent with the compliance run)
+        Session Worker Processes,all,1,,enter the number of sessions to run concurrently (1 runs sessions one after another)
         BATCH SETTINGS,,,,
         batch_folder,all,,C:\omega\compliance\<batch folder>,
         Vehicles File Base Year,all,2022,,this should be consistent with the OMEGA compliance run
@@ -108,6 +109,10 @@ Data Row Name and Description
 :Powertrain Costs FEV:
     True/False entry for whether to save the FEV developed powertrain costs
 
+:Session Worker Processes:
+    The number of worker processes used to run session effects concurrently (optional; default=1, i.e. sessions are
+    run one after another); batch-level inputs are shared read-only with the workers
+
 **BATCH SETTINGS**
 
 :batch_folder:
@@ -247,8 +252,6 @@ Data Row Name and Description
 
 """
 import sys
-import tkinter as tk
-from tkinter import filedialog
 import numpy as np
 import pandas as pd
 from pathlib import Path
@@ -273,6 +276,7 @@ from omega_effects.consumer.cost_factors_insurance_and_taxes import InsuranceAnd
 from omega_effects.context.fuel_prices import FuelPrice
 from omega_effects.context.context_stock_vmt import ContextStockVMT
 from omega_effects.context.onroad_fuels import OnroadFuel
+from omega_effects.general.fuel_cost_per_mile import FuelCostPerMile
 from omega_effects.context.maintenance_cost import MaintenanceCost
 from omega_effects.context.repair_cost import RepairCost
 from omega_effects.context.refueling_cost import RefuelingCost
@@ -305,6 +309,7 @@ class BatchSettings:
         self.save_vehicle_cost_effects_files = None
         self.save_input_files = False
         self.powertrain_costs_fev = True
+        self.session_worker_processes = 1
 
         self._dict = {}
         self.session_dict = {}
@@ -366,6 +371,7 @@ class BatchSettings:
         self.context_stock_and_vmt = None
         self.onroad_fuels = None
         self.context_fuel_cost_per_mile = None
+        self.fuel_cost_per_mile = None
         self.legacy_fleet = None
         self.ip_deflators = None
         self.cpi_deflators = None
@@ -671,6 +677,8 @@ class BatchSettings:
             self.onroad_fuels.init_from_file(self.onroad_fuels_file, effects_log)
             self.inputs_filelist.append(self.onroad_fuels_file)
 
+            self.fuel_cost_per_mile = FuelCostPerMile(self)
+
             self.legacy_fleet = LegacyFleet()
             self.legacy_fleet.init_from_file(self.legacy_fleet_file, self.vehicles_base_year, effects_log)
             self.inputs_filelist.append(self.legacy_fleet_file)
@@ -812,6 +820,14 @@ class BatchSettings:
             self.powertrain_costs_fev = self.true_false_dict[self.powertrain_costs_fev]
             effects_log.logwrite(f'{string_id} is {self.powertrain_costs_fev}')
 
+        string_id = 'Session Worker Processes'
+        if (string_id, 'all') in self._dict:
+            # protect against NaN or empty string, older batch settings files run sessions one after another
+            session_worker_processes = pd.to_numeric(self._dict[(string_id, 'all')]['value'], errors='coerce')
+            if not pd.isna(session_worker_processes):
+                self.session_worker_processes = max(1, int(session_worker_processes))
+        effects_log.logwrite(f'{string_id} is {self.session_worker_processes}')
+
     @staticmethod
     def path_of_batch_settings_csv():
         """
@@ -823,6 +839,9 @@ class BatchSettings:
             This method allows for a user-interactive means of selecting the desired batch settings file.
 
         """
+        import tkinter as tk
+        from tkinter import filedialog
+
         # set full path to the batch settings file
         root = tk.Tk()
         root.attributes("-topmost", True)
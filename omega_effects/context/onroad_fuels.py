@@ -58,9 +58,8 @@ Data Column Name and Description
 **CODE**
 
 """
-import numpy as np
-
 from omega_effects.general.general_functions import read_input_file
+from omega_effects.general.start_year_table import StartYearTable
 from omega_effects.general.input_validation import validate_template_version_info, validate_template_column_names
 
 
@@ -114,7 +113,10 @@ class OnroadFuel:
         validate_template_column_names(filepath, df, input_template_columns, effects_log)
 
         self._data = df.set_index(['fuel_id', 'start_year']).to_dict(orient='index')
-        self._data.update(df[['start_year', 'fuel_id']].set_index('fuel_id').to_dict(orient='series'))
+        self._data['start_year_table'] = {
+            fuel_id: StartYearTable(df.loc[df['fuel_id'] == fuel_id, 'start_year'])
+            for fuel_id in df['fuel_id'].unique()
+        }
         self.fuel_ids = df['fuel_id'].unique()
 
     def get_fuel_attribute(self, calendar_year, in_use_fuel_id, attribute):
@@ -139,10 +141,9 @@ class OnroadFuel:
         cache_key = (calendar_year, in_use_fuel_id, attribute)
 
         if cache_key not in self._data:
-            start_years = np.atleast_1d(self._data['start_year'][in_use_fuel_id])
-            if len(start_years[start_years <= calendar_year]) > 0:
-                year = max([yr for yr in start_years if yr <= calendar_year])
+            year = self._data['start_year_table'][in_use_fuel_id].get_start_year(calendar_year)
 
+            if year is not None:
                 self._data[cache_key] = self._data[in_use_fuel_id, year][attribute]
             else:
                 raise Exception('Missing policy fuel values for %s, %d or prior' % (in_use_fuel_id, calendar_year))
@@ -8,7 +8,6 @@ subsequent sessions.
 **CODE**
 
 """
-from omega_effects.general.general_functions import calc_fuel_cost_per_mile
 
 
 def calc_context_fuel_cost_per_mile(batch_settings, session_settings):
@@ -75,8 +74,8 @@ def calc_context_fuel_cost_per_mile(batch_settings, session_settings):
             key = (cost_per_mile_group, context_size_class, int(model_year), int(age))
             if key not in calendar_year_fuel_cpm_dict:
 
-                fuel_cost_per_mile = calc_fuel_cost_per_mile(
-                    batch_settings, session_settings, calendar_year,
+                fuel_cost_per_mile = batch_settings.fuel_cost_per_mile.calc_fuel_cost_per_mile(
+                    session_settings, calendar_year,
                     onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile, in_use_fuel_id
                 )
                 weighted_fuel_cost_per_mile = registered_count * fuel_cost_per_mile
@@ -93,9 +92,9 @@ def calc_context_fuel_cost_per_mile(batch_settings, session_settings):
                     'fuel_cost_per_mile': weighted_fuel_cost_per_mile,
                 }
             else:
-                fuel_cost_per_mile = calc_fuel_cost_per_mile(
-                    batch_settings, session_settings, calendar_year, onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile,
-                    in_use_fuel_id
+                fuel_cost_per_mile = batch_settings.fuel_cost_per_mile.calc_fuel_cost_per_mile(
+                    session_settings, calendar_year,
+                    onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile, in_use_fuel_id
                 )
                 weighted_fuel_cost_per_mile = calendar_year_fuel_cpm_dict[key]['fuel_cost_per_mile']
                 weighted_fuel_cost_per_mile += registered_count * fuel_cost_per_mile
@@ -51,6 +51,7 @@ Data Column Name and Description
 **CODE**
 
 """
+import numpy as np
 import pandas as pd
 
 from omega_effects.general.general_functions import read_input_file
@@ -70,6 +71,8 @@ class EGUdata:
         self.calendar_year_min = None
         self.calendar_year_max = None
         self.rate_names = None
+        self._rate_index = {}  # column index of each rate name in the rate arrays
+        self._tables = {}  # dense arrays of interpolated data by case, indexed by calendar year and rate name
         self.deets = {}  # all the calc details; this dictionary will not include the legacy fleet
         self.pollutant_ids = [
             'pm25',
@@ -138,6 +141,7 @@ class EGUdata:
         self._data = df_rates.to_dict('index')
 
         self.interpolate_input_data()
+        self.build_tables()
 
     def calc_rates(self, df):
         """
@@ -175,21 +179,17 @@ class EGUdata:
             A list of emission rates for the given kwh_demand in the given calendar_year.
 
         """
-        rates = []
-
-        if cyear < self.calendar_year_min:
-            calendar_year = self.calendar_year_min
-        elif cyear > self.calendar_year_max:
-            calendar_year = self.calendar_year_max
-        else:
-            calendar_year = cyear
-
         if (v['session_policy'], cyear) in self._cache:
             return self._cache[v['session_policy'], cyear]
 
-        kwh_generation_us_low = self._data[(calendar_year, 'low_demand')]['kwh_generation_us']
-        kwh_generation_us_high = self._data[(calendar_year, 'high_demand')]['kwh_generation_us']
-        kwh_demand_fleet_ipm = self._data[(calendar_year, 'low_demand')]['kwh_demand']
+        calendar_year = min(max(cyear, self.calendar_year_min), self.calendar_year_max)
+        year_idx = calendar_year - self.calendar_year_min
+
+        low_data = self._tables['low_demand'][year_idx]
+        high_data = self._tables['high_demand'][year_idx]
+        kwh_generation_us_low = low_data[self._rate_index['kwh_generation_us']]
+        kwh_generation_us_high = high_data[self._rate_index['kwh_generation_us']]
+        kwh_demand_fleet_ipm = low_data[self._rate_index['kwh_demand']]
 
         # back out the low_demand case fleet demand provided to IPM to establish a base working base
         kwh_generation_us_base = kwh_generation_us_low - kwh_demand_fleet_ipm
@@ -197,49 +197,91 @@ class EGUdata:
         # add the kwh_session to the new kwh base value to determine the US generation for this session
         kwh_generation_us_session = session_kwh_generation + kwh_generation_us_base
 
-        for idx, rate_name in enumerate(rate_names):
-            self.deets.update({(v['session_policy'], cyear, rate_name): {}})
+        rates = self.get_emission_rates([cyear], session_kwh_generation, rate_names)[0].tolist()
+
+        for rate_name, rate in zip(rate_names, rates):
+            rate_low = low_data[self._rate_index[rate_name]]
+            rate_high = high_data[self._rate_index[rate_name]]
 
-            self.deets[(v['session_policy'], cyear, rate_name)] = {
-                    'session_policy': v['session_policy'],
-                    'session_name': v['session_name'],
-                    'calendar_year': cyear,
-                    'kwh_generation_us_low': kwh_generation_us_low,
-                    'kwh_generation_us_high': kwh_generation_us_high,
-                    'kwh_demand_fleet_ipm': kwh_demand_fleet_ipm,
-                    'kwh_generation_us_base': kwh_generation_us_base,
-                    'kwh_generation_us_session': kwh_generation_us_session,
-                    'fleet_kwh_consumption': session_kwh_consumption,
-                    'fleet_kwh_generation': session_kwh_generation,
-                    'rate_name': rate_name,
-                }
-            rate_low = self._data[(calendar_year, 'low_demand')][rate_name]
-            rate_high = self._data[(calendar_year, 'high_demand')][rate_name]
-
-            # interpolate the rate for kwh_demand
-            if calendar_year <= self.calendar_year_min:
-                rate = rate_low
-            else:
-                rate = ((kwh_generation_us_session - kwh_generation_us_low) * (rate_high - rate_low)
-                        / (kwh_generation_us_high - kwh_generation_us_low)
-                        + rate_low)
-
-            rates.append(rate)
             if rate <= 0:
                 rate = (rate_low + rate_high) / 2
 
-            self.deets[v['session_policy'], cyear, rate_name].update({
+            self.deets[(v['session_policy'], cyear, rate_name)] = {
+                'session_policy': v['session_policy'],
+                'session_name': v['session_name'],
+                'calendar_year': cyear,
+                'kwh_generation_us_low': kwh_generation_us_low,
+                'kwh_generation_us_high': kwh_generation_us_high,
+                'kwh_demand_fleet_ipm': kwh_demand_fleet_ipm,
+                'kwh_generation_us_base': kwh_generation_us_base,
+                'kwh_generation_us_session': kwh_generation_us_session,
+                'fleet_kwh_consumption': session_kwh_consumption,
+                'fleet_kwh_generation': session_kwh_generation,
+                'rate_name': rate_name,
                 'rate_low': rate_low,
                 'rate_high': rate_high,
                 'rate': rate,
                 'US_inventory_grams': rate * kwh_generation_us_session,
                 'analysis_fleet_inventory_grams': rate * session_kwh_generation,
-            })
+            }
 
         self._cache[v['session_policy'], cyear] = rates
 
         return rates
 
+    def get_emission_rates(self, calendar_years, session_kwh_generation, rate_names):
+        """
+
+        Get emission rates for an array of calendar years in a single lookup.
+
+        Args:
+            calendar_years (array-like): calendar years for which to get emission rates
+            session_kwh_generation (numeric or array-like): the session kwh generation in each calendar year.
+            rate_names (str, [strs]): name of emission rate(s) to get
+
+        Returns:
+            An array of emission rates with one row per calendar year and one column per rate name.
+
+        """
+        calendar_years = np.clip(np.asarray(calendar_years), self.calendar_year_min, self.calendar_year_max)
+        year_idx = calendar_years - self.calendar_year_min
+        rate_idx = [self._rate_index[rate_name] for rate_name in rate_names]
+
+        low_data = self._tables['low_demand'][year_idx]
+        high_data = self._tables['high_demand'][year_idx]
+        kwh_generation_us_low = low_data[:, self._rate_index['kwh_generation_us']]
+        kwh_generation_us_high = high_data[:, self._rate_index['kwh_generation_us']]
+        kwh_demand_fleet_ipm = low_data[:, self._rate_index['kwh_demand']]
+
+        kwh_generation_us_session = \
+            np.asarray(session_kwh_generation) + (kwh_generation_us_low - kwh_demand_fleet_ipm)
+
+        rate_low = low_data[:, rate_idx]
+        rate_high = high_data[:, rate_idx]
+
+        # interpolate the rate for kwh_demand
+        rates = ((kwh_generation_us_session - kwh_generation_us_low)[:, np.newaxis] * (rate_high - rate_low)
+                 / (kwh_generation_us_high - kwh_generation_us_low)[:, np.newaxis]
+                 + rate_low)
+
+        return np.where((calendar_years <= self.calendar_year_min)[:, np.newaxis], rate_low, rates)
+
+    def build_tables(self):
+        """
+
+        Returns:
+            Nothing, but builds dense arrays of the interpolated data by case, indexed by calendar year offset from
+            calendar_year_min and rate name index.
+
+        """
+        self._rate_index = {rate_name: idx for idx, rate_name in enumerate(self.rate_names)}
+        years = range(self.calendar_year_min, self.calendar_year_max + 1)
+
+        for case in self.cases:
+            self._tables[case] = np.array(
+                [[self._data[(yr, case)][rate_name] for rate_name in self.rate_names] for yr in years], dtype=float
+            )
+
     def interpolate_input_data(self):
         """
 
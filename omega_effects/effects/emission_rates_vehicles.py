@@ -54,9 +54,11 @@ Data Column Name and Description
 **CODE**
 
 """
+import numpy as np
 import pandas as pd
 
 from omega_effects.general.general_functions import read_input_file
+from omega_effects.general.start_year_table import StartYearTable
 from omega_effects.general.input_validation import validate_template_version_info, validate_template_column_names
 
 
@@ -66,11 +68,15 @@ class EmissionRatesVehicles:
 
     """
     def __init__(self):
-        self.data = {}
         self.startyear_min = 0
         self.start_years = None
+        self._start_year_table = None
         self.deets = None
         self.max_ages_dict = {}
+        self.max_data_age = 30
+        self._index_dicts = {}  # the sourcetype_name, reg_class_id and in_use_fuel_id array indices
+        self._tables = {}  # dense rate arrays by in_use_fuel_id
+        self._max_ages = None  # array of max data ages by start year index
         self.gasoline_rate_names = [
             'pm25_brakewear_grams_per_mile',
             'pm25_tirewear_grams_per_mile',
@@ -165,32 +171,112 @@ class EmissionRatesVehicles:
         df = read_input_file(filepath, effects_log, skiprows=1)
         validate_template_column_names(filepath, df, input_template_columns, effects_log)
 
-        keys = zip(
-            df['start_year'],
-            df['sourcetype_name'],
-            df['reg_class_id'],
-            df['in_use_fuel_id'],
-            df['age'],
-        )
-        df.set_index(keys, inplace=True)
-
-        for idx, row in df.iterrows():
-            key = (
-                row['start_year'], row['sourcetype_name'], row['reg_class_id'], row['in_use_fuel_id'], row['age']
-            )
-            if 'gasoline' in row['in_use_fuel_id']:
-                self.data[key] = row[self.gasoline_rate_names].values
-            elif 'diesel' in row['in_use_fuel_id']:
-                self.data[key] = row[self.diesel_rate_names].values
-            else:
-                self.data[key] = row[self.bev_rate_names].values
-
         self.startyear_min = min(df['start_year'])
-        self.start_years = df['start_year'].unique()
+        self.start_years = np.sort(df['start_year'].unique())
+        self._start_year_table = StartYearTable(self.start_years)
 
         for start_year in self.start_years:
             self.max_ages_dict[start_year] = max(df.loc[df['start_year'] == start_year, 'age'])
 
+        self.build_tables(df)
+
+    def get_rate_names(self, in_use_fuel_id):
+        """
+
+        Args:
+            in_use_fuel_id (str): the liquid fuel ID, e.g., 'pump gasoline'
+
+        Returns:
+            The list of rate names provided for the given in-use fuel.
+
+        """
+        if 'gasoline' in in_use_fuel_id:
+            return self.gasoline_rate_names
+        elif 'diesel' in in_use_fuel_id:
+            return self.diesel_rate_names
+        else:
+            return self.bev_rate_names
+
+    def build_tables(self, df):
+        """
+
+        Build dense rate arrays indexed by start year, sourcetype, reg class and age for each in-use fuel.
+
+        Args:
+            df (DataFrame): the emission rate input data.
+
+        Returns:
+            Nothing, but populates the rate tables; entries with no source data (e.g., BEVs prior to 2025) are zero.
+
+        """
+        for col in ['sourcetype_name', 'reg_class_id', 'in_use_fuel_id']:
+            self._index_dicts[col] = {value: idx for idx, value in enumerate(df[col].unique())}
+
+        self._max_ages = np.array([self.max_ages_dict[start_year] for start_year in self.start_years], dtype=int)
+
+        start_year_idx = np.searchsorted(self.start_years, df['start_year'].values)
+        sourcetype_idx = df['sourcetype_name'].map(self._index_dicts['sourcetype_name']).values
+        reg_class_idx = df['reg_class_id'].map(self._index_dicts['reg_class_id']).values
+        age_idx = df['age'].values.astype(int)
+
+        num_ages = min(self.max_data_age, self._max_ages.max()) + 1
+        for in_use_fuel_id in self._index_dicts['in_use_fuel_id']:
+            rate_names = self.get_rate_names(in_use_fuel_id)
+            table = np.zeros((
+                len(self.start_years),
+                len(self._index_dicts['sourcetype_name']),
+                len(self._index_dicts['reg_class_id']),
+                num_ages,
+                len(rate_names),
+            ))
+            mask = ((df['in_use_fuel_id'] == in_use_fuel_id) & (df['age'] < num_ages)).values
+            table[start_year_idx[mask], sourcetype_idx[mask], reg_class_idx[mask], age_idx[mask]] = \
+                df.loc[mask, rate_names].values.astype(float)
+
+            self._tables[in_use_fuel_id] = table
+
+    def get_emission_rates(self, model_years, sourcetype_names, reg_class_ids, in_use_fuel_id, ages):
+        """
+
+        Get emission rates for arrays of vehicle-years of the given in-use fuel in a single lookup.
+
+        Args:
+            model_years (array-like): vehicle model years for which to get emission factors
+            sourcetype_names (array-like): the MOVES sourcetype names (e.g., 'passenger car', 'light commercial truck')
+            reg_class_ids (array-like): the regulatory classes, e.g., 'car' or 'truck'
+            in_use_fuel_id (str): the liquid fuel ID, e.g., 'pump gasoline'
+            ages (array-like): vehicle ages in years
+
+        Returns:
+            An array of emission rates with one row per vehicle-year and one column per rate name as provided by
+            ``get_rate_names(in_use_fuel_id)``.
+
+        """
+        model_years = np.asarray(model_years)
+        num_rates = len(self.get_rate_names(in_use_fuel_id))
+
+        start_year_idx = np.maximum(self._start_year_table.get_indices(model_years), 0)
+        sourcetype_idx = np.array(
+            [self._index_dicts['sourcetype_name'].get(name, -1) for name in sourcetype_names], dtype=int
+        )
+        reg_class_idx = np.array(
+            [self._index_dicts['reg_class_id'].get(name, -1) for name in reg_class_ids], dtype=int
+        )
+        age_idx = np.minimum(
+            np.minimum(np.asarray(ages, dtype=int), self.max_data_age), self._max_ages[start_year_idx]
+        )
+
+        if in_use_fuel_id not in self._tables:
+            return np.zeros((len(model_years), num_rates))
+
+        table = self._tables[in_use_fuel_id]
+        valid = (sourcetype_idx >= 0) & (reg_class_idx >= 0) & (age_idx < table.shape[3])
+
+        rates = np.zeros((len(model_years), num_rates))
+        rates[valid] = table[start_year_idx[valid], sourcetype_idx[valid], reg_class_idx[valid], age_idx[valid]]
+
+        return rates
+
     def get_emission_rate(self, session_settings, model_year, sourcetype_name, reg_class_id, in_use_fuel_id, age):
         """
 
@@ -203,25 +289,17 @@ class EmissionRatesVehicles:
             age (int): vehicle age in years
 
         Returns:
-            A list of emission rates for the given type of vehicle of the given model_year and age.
+            An array of emission rates for the given type of vehicle of the given model_year and age.
 
         """
-        if model_year < self.startyear_min:
-            start_year = self.startyear_min
-        else:
-            start_year = max([yr for yr in self.start_years if yr <= model_year])
+        start_year_idx = self._start_year_table.get_index(model_year) or 0
+        data_age = int(min(self.max_data_age, age, self._max_ages[start_year_idx]))
 
-        max_age_in_data_for_model_year = self.max_ages_dict[start_year]
-        data_age = min(30, age, max_age_in_data_for_model_year)
+        sourcetype_idx = self._index_dicts['sourcetype_name'].get(sourcetype_name)
+        reg_class_idx = self._index_dicts['reg_class_id'].get(reg_class_id)
+        table = self._tables.get(in_use_fuel_id)
 
-        if (start_year, sourcetype_name, reg_class_id, in_use_fuel_id, data_age) in self.data:
-            rates = self.data[(start_year, sourcetype_name, reg_class_id, in_use_fuel_id, data_age)]
-        else:  # this sets to 0 the rates for which there may not have been source data (e.g., BEVs prior to 2025)
-            if 'gasoline' in in_use_fuel_id:
-                rates = len(self.gasoline_rate_names) * [0]
-            elif 'diesel' in in_use_fuel_id:
-                rates = len(self.diesel_rate_names) * [0]
-            else:
-                rates = len(self.bev_rate_names) * [0]
+        if table is None or sourcetype_idx is None or reg_class_idx is None or data_age >= table.shape[3]:
+            return np.zeros(len(self.get_rate_names(in_use_fuel_id)))
 
-        return rates
+        return table[start_year_idx, sourcetype_idx, reg_class_idx, data_age]
@@ -43,6 +43,7 @@ Data Column Name and Description
 **CODE**
 
 """
+import numpy as np
 import pandas as pd
 
 from omega_effects.general.general_functions import read_input_file
@@ -56,6 +57,7 @@ class FatalityRates:
     """
     def __init__(self):
         self._data = dict()
+        self._rates = None  # average fatality rates indexed by model year and age
         self.model_year_max = None
 
     def init_from_file(self, filepath, effects_log):
@@ -100,6 +102,8 @@ class FatalityRates:
         ))
         df.insert(0, 'key', key)
         self._data = df.set_index(key).to_dict(orient='index')
+        self._rates = df.set_index(['model_year', 'age'])['average_fatality_rate']
+        self._rates = self._rates[~self._rates.index.duplicated(keep='last')]
 
     def get_fatality_rate(self, model_year, age):
         """
@@ -117,3 +121,24 @@ class FatalityRates:
             year = self.model_year_max
 
         return self._data[year, age]['average_fatality_rate']
+
+    def get_fatality_rates(self, model_years, ages):
+        """
+
+        Args:
+            model_years (array-like): the model years for which fatality rates are needed.
+            ages (array-like): vehicle ages in years
+
+        Returns:
+            An array of the average fatality rates for vehicles of the given model years and ages.
+
+        """
+        years = np.minimum(np.asarray(model_years, dtype=int), self.model_year_max)
+        ages = np.asarray(ages, dtype=int)
+
+        rates = self._rates.reindex(pd.MultiIndex.from_arrays([years, ages])).values
+        if np.isnan(rates).any():
+            missing = list(zip(years[np.isnan(rates)], ages[np.isnan(rates)]))
+            raise KeyError(f'No fatality rates for model year and age {missing[0]}')
+
+        return rates
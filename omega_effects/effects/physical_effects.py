@@ -43,6 +43,64 @@ def get_inputs_for_effects(batch_settings, arg=None):
         return values
 
 
+def get_sourcetype_name(reg_class_id, body_style, sourcetype_name):
+    """
+
+    Args:
+        reg_class_id (str): the (base year) regulatory class, e.g., 'car' or 'truck'
+        body_style (str): the vehicle body style, e.g., 'cuv_suv' or 'pickup'
+        sourcetype_name (str): the prior vehicle's sourcetype name, returned if there is no proper sourcetype name
+
+    Returns:
+        The MOVES sourcetype name for use with vehicle emission rates.
+
+    """
+    if reg_class_id == 'car':
+        sourcetype_name = 'passenger car'
+    elif reg_class_id == 'truck':
+        sourcetype_name = 'passenger truck'
+    elif reg_class_id == 'mediumduty' and 'cuv' in body_style:
+        sourcetype_name = 'passenger truck'
+    elif reg_class_id == 'mediumduty' and 'pickup' in body_style:
+        sourcetype_name = 'light commercial truck'
+    else:
+        print('Improper sourcetype_name for vehicle emission rates.')
+
+    return sourcetype_name
+
+
+def get_vehicle_emission_rates(session_settings, rate_lookups):
+    """
+
+    Get vehicle emission rates for many vehicle-years with one batch lookup per in-use fuel.
+
+    Args:
+        session_settings: an instance of the SessionSettings class.
+        rate_lookups (list): (model_year, sourcetype_name, reg_class_id, fuel, age) tuples, one per vehicle-year, or
+            None where no emission rates are needed.
+
+    Returns:
+        A list of emission rate arrays (or None), in the order of rate_lookups.
+
+    """
+    rates = [None] * len(rate_lookups)
+
+    indices_by_fuel = {}
+    for idx, rate_lookup in enumerate(rate_lookups):
+        if rate_lookup is not None:
+            indices_by_fuel.setdefault(rate_lookup[3], []).append(idx)
+
+    for fuel, indices in indices_by_fuel.items():
+        model_years, sourcetype_names, reg_class_ids, fuels, ages = zip(*[rate_lookups[idx] for idx in indices])
+        fuel_rates = session_settings.emission_rates_vehicles.get_emission_rates(
+            model_years, sourcetype_names, reg_class_ids, fuel, ages
+        )
+        for idx, fuel_rate in zip(indices, fuel_rates):
+            rates[idx] = fuel_rate
+
+    return rates
+
+
 def calc_physical_effects(batch_settings, session_settings, analysis_fleet_safety):
     """
 
@@ -101,15 +159,41 @@ def calc_physical_effects(batch_settings, session_settings, analysis_fleet_safet
         adjusted_vads = \
             session_settings.vehicle_annual_data.get_adjusted_vehicle_annual_data_by_calendar_year(calendar_year)
 
-        # this loops thru vehicles this calendar year to calc physical effects for this calendar year
+        # get the emission rates of all vehicles this calendar year in one lookup per fuel
+        rate_lookups = []
         for v in adjusted_vads:
 
-            vehicle_data = VehiclePhysicalData()
-
             if v['vehicle_id'] not in vehicle_info_dict:
                 vehicle_info_dict[v['vehicle_id']] \
                     = session_settings.vehicles.get_vehicle_attributes(v['vehicle_id'], *vehicle_attribute_list)
 
+            vehicle_info = dict(zip(vehicle_attribute_list, vehicle_info_dict[v['vehicle_id']]))
+
+            if vehicle_info['target_co2e_grams_per_mile'] is not None:
+                fuel = [item for item in eval(vehicle_info['in_use_fuel_id']).keys()][0]
+
+                sourcetype_name = get_sourcetype_name(
+                    vehicle_info['base_year_reg_class_id'], vehicle_info['body_style'], sourcetype_name
+                )
+
+                veh_rates_by = 'age'  # for now; set as an input if we want to; value can be 'age' or 'odometer'
+                ind_var_value = v['age']
+                if veh_rates_by == 'odometer':
+                    ind_var_value = v['odometer']
+
+                rate_lookups.append(
+                    (vehicle_info['model_year'], sourcetype_name, vehicle_info['reg_class_id'], fuel, ind_var_value)
+                )
+            else:
+                rate_lookups.append(None)
+
+        emission_rates = get_vehicle_emission_rates(session_settings, rate_lookups)
+
+        # this loops thru vehicles this calendar year to calc physical effects for this calendar year
+        for v, rates in zip(adjusted_vads, emission_rates):
+
+            vehicle_data = VehiclePhysicalData()
+
             (base_year_vehicle_id, manufacturer_id, name, model_year, base_year_reg_class_id, reg_class_id,
                 in_use_fuel_id, market_class_id, fueling_class, base_year_powertrain_type, powertrain_type,
                 footprint_ft2, workfactor, target_co2e_grams_per_mile,
@@ -191,22 +275,6 @@ def calc_physical_effects(batch_settings, session_settings, analysis_fleet_safet
                     'context_size_class': vse['context_size_class'],
                 })
 
-                if base_year_reg_class_id == 'car':
-                    sourcetype_name = 'passenger car'
-                elif base_year_reg_class_id == 'truck':
-                    sourcetype_name = 'passenger truck'
-                elif base_year_reg_class_id == 'mediumduty' and 'cuv' in body_style:
-                    sourcetype_name = 'passenger truck'
-                elif base_year_reg_class_id == 'mediumduty' and 'pickup' in body_style:
-                    sourcetype_name = 'light commercial truck'
-                else:
-                    print('Improper sourcetype_name for vehicle emission rates.')
-
-                veh_rates_by = 'age'  # for now; set as an input if we want to; value can be 'age' or 'odometer'
-                ind_var_value = v['age']
-                if veh_rates_by == 'odometer':
-                    ind_var_value = v['odometer']
-
                 # calc fuel consumption and update emission rates
                 if onroad_direct_kwh_per_mile:
                     refuel_efficiency = batch_settings.onroad_fuels.get_fuel_attribute(
@@ -226,10 +294,7 @@ def calc_physical_effects(batch_settings, session_settings, analysis_fleet_safet
                     })
 
                     if fueling_class == 'BEV':
-                        pm25_brakewear_rate_e, pm25_tirewear_rate_e = \
-                            session_settings.emission_rates_vehicles.get_emission_rate(
-                                session_settings, model_year, sourcetype_name, reg_class_id, fuel, ind_var_value
-                            )
+                        pm25_brakewear_rate_e, pm25_tirewear_rate_e = rates
                         vehicle_data.update_value({
                             'pm25_brakewear_rate_e': pm25_brakewear_rate_e,
                             'pm25_tirewear_rate_e': pm25_tirewear_rate_e,
@@ -262,10 +327,7 @@ def calc_physical_effects(batch_settings, session_settings, analysis_fleet_safet
                             ethylbenzene_venting_rate, ethylbenzene_leaks_rate, \
                             ethylbenzene_refuel_disp_rate, ethylbenzene_refuel_spill_rate, \
                             formaldehyde_exh_rate, naphthalene_exh_rate, \
-                            butadiene13_exh_rate, pah15_exh_rate = \
-                            session_settings.emission_rates_vehicles.get_emission_rate(
-                                session_settings, model_year, sourcetype_name, reg_class_id, fuel, ind_var_value
-                            )
+                            butadiene13_exh_rate, pah15_exh_rate = rates
                         energy_density_ratio, pure_share = e0_energy_density_ratio, e0_share
 
                         vehicle_data.update_value({
@@ -319,10 +381,7 @@ def calc_physical_effects(batch_settings, session_settings, analysis_fleet_safet
                             acrolein_exh_rate, benzene_exh_rate, benzene_refuel_spill_rate, \
                             ethylbenzene_exh_rate, ethylbenzene_refuel_spill_rate, \
                             formaldehyde_exh_rate, naphthalene_exh_rate, naphthalene_refuel_spill_rate, \
-                            butadiene13_exh_rate, pah15_exh_rate = \
-                            session_settings.emission_rates_vehicles.get_emission_rate(
-                                session_settings, model_year, sourcetype_name, reg_class_id, fuel, ind_var_value
-                            )
+                            butadiene13_exh_rate, pah15_exh_rate = rates
                         energy_density_ratio, pure_share = diesel_energy_density_ratio, 1
 
                         vehicle_data.update_value({
@@ -392,8 +451,28 @@ def calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_
 
     sourcetype_name = None
 
+    legacy_vads = list(batch_settings.legacy_fleet.adjusted_legacy_fleet.values())
+
+    # get the emission rates of all legacy fleet vehicles in one lookup per fuel
+    rate_lookups = []
+    for v in legacy_vads:
+        model_year = v['calendar_year'] - v['age']
+
+        sourcetype_name = get_sourcetype_name(v['reg_class_id'], v['body_style'], sourcetype_name)
+
+        veh_rates_by = 'age'  # for now; set as an input if we want to; value can be 'age' or 'odometer'
+        ind_var_value = pd.to_numeric(v['age'])
+        if veh_rates_by == 'odometer':
+            ind_var_value = pd.to_numeric(v['odometer'])
+
+        fuel = [item for item in eval(v['in_use_fuel_id']).keys()][0]
+
+        rate_lookups.append((model_year, sourcetype_name, v['reg_class_id'], fuel, ind_var_value))
+
+    emission_rates = get_vehicle_emission_rates(session_settings, rate_lookups)
+
     physical_effects = {}
-    for v in batch_settings.legacy_fleet.adjusted_legacy_fleet.values():
+    for v, rates in zip(legacy_vads, emission_rates):
 
         vehicle_data = VehiclePhysicalData()
 
@@ -464,22 +543,6 @@ def calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_
             'powertrain_type': vse['powertrain_type'],
         })
 
-        if v['reg_class_id'] == 'car':
-            sourcetype_name = 'passenger car'
-        elif v['reg_class_id'] == 'truck':
-            sourcetype_name = 'passenger truck'
-        elif v['reg_class_id'] == 'mediumduty' and 'cuv' in v['body_style']:
-            sourcetype_name = 'passenger truck'  # TODO is this right?
-        elif v['reg_class_id'] == 'mediumduty' and 'pickup' in v['body_style']:
-            sourcetype_name = 'light commercial truck'  # TODO is this right?
-        else:
-            print('Improper sourcetype_name for vehicle emission rates.')
-
-        veh_rates_by = 'age'  # for now; set as an input if we want to; value can be 'age' or 'odometer'
-        ind_var_value = pd.to_numeric(v['age'])
-        if veh_rates_by == 'odometer':
-            ind_var_value = pd.to_numeric(v['odometer'])
-
         fuel_dict = eval(v['in_use_fuel_id'])
         fuel = [item for item in fuel_dict.keys()][0]
         if onroad_direct_kwh_per_mile:
@@ -502,10 +565,7 @@ def calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_
 
             if vse['fueling_class'] == 'BEV':
                 onroad_charge_depleting_range = 300
-                pm25_brakewear_rate_e, pm25_tirewear_rate_e = \
-                    session_settings.emission_rates_vehicles.get_emission_rate(
-                        session_settings, model_year, sourcetype_name, v['reg_class_id'], fuel, ind_var_value
-                    )
+                pm25_brakewear_rate_e, pm25_tirewear_rate_e = rates
                 vehicle_data.update_value({
                     'pm25_brakewear_rate_e': pm25_brakewear_rate_e,
                     'pm25_tirewear_rate_e': pm25_tirewear_rate_e,
@@ -531,10 +591,7 @@ def calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_
                     ethylbenzene_exh_rate, ethylbenzene_permeation_rate, ethylbenzene_venting_rate, \
                     ethylbenzene_leaks_rate, ethylbenzene_refuel_disp_rate, ethylbenzene_refuel_spill_rate, \
                     formaldehyde_exh_rate, naphthalene_exh_rate, \
-                    butadiene13_exh_rate, pah15_exh_rate = \
-                    session_settings.emission_rates_vehicles.get_emission_rate(
-                        session_settings, model_year, sourcetype_name, v['reg_class_id'], fuel, ind_var_value
-                    )
+                    butadiene13_exh_rate, pah15_exh_rate = rates
 
                 energy_density_ratio, pure_share = e0_energy_density_ratio, e0_share
 
@@ -588,9 +645,7 @@ def calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_
                     benzene_exh_rate, benzene_refuel_spill_rate, \
                     ethylbenzene_exh_rate, ethylbenzene_refuel_spill_rate, \
                     formaldehyde_exh_rate, naphthalene_exh_rate, naphthalene_refuel_spill_rate, \
-                    butadiene13_exh_rate, pah15_exh_rate = session_settings.emission_rates_vehicles.get_emission_rate(
-                    session_settings, model_year, sourcetype_name, v['reg_class_id'], fuel, ind_var_value
-                )
+                    butadiene13_exh_rate, pah15_exh_rate = rates
 
                 energy_density_ratio, pure_share = diesel_energy_density_ratio, 1
 
@@ -3,50 +3,53 @@
 Functions to get vehicle data based on vehicle ID, safety values based on body style and fatality rates based on
 calendar year and vehicle age, and to calculate fatalities.
 
+Safety effects are calculated for all vehicle-years of a session at once using arrays.
+
 ----
 
 **CODE**
 
 """
+import numpy as np
 import pandas as pd
 
 
-def get_safety_values(session_settings, body_style):
+def get_safety_values(batch_settings, body_styles):
     """
 
     Args:
-        session_settings: an instance of the SessionSettings class.
-        body_style (str): the OMEGA body style (e.g., sedan, cuv_suv, pickup)
+        batch_settings: an instance of the BatchSettings class.
+        body_styles (array-like): the OMEGA body styles (e.g., sedan, cuv_suv, pickup)
 
     Returns:
-        The curb weight threshold and percentage changes in fatality rates for weight changes above and below
-        that threshold.
+        Arrays of the curb weight thresholds and percentage changes in fatality rates for weight changes above and
+        below those thresholds.
 
     """
-    return session_settings.safety_values.get_safety_values(body_style)
+    return batch_settings.safety_values.get_safety_values_array(body_styles)
 
 
-def get_fatality_rate(batch_settings, model_year, age):
+def get_fatality_rates(batch_settings, model_years, ages):
     """
 
     Args:
         batch_settings: an instance of the BatchSettings class.
-        model_year (int): the model year for which a fatality rate is needed.
-        age (int): vehicle age in years
+        model_years (array-like): the model years for which fatality rates are needed.
+        ages (array-like): vehicle ages in years
 
     Returns:
-        The average fatality rate for vehicles of a specific model year and age.
+        An array of the average fatality rates for vehicles of the given model years and ages.
 
     """
-    return batch_settings.fatality_rates.get_fatality_rate(model_year, age)
+    return batch_settings.fatality_rates.get_fatality_rates(model_years, ages)
 
 
 def calc_lbs_changed(base_weight, final_weight):
     """
 
     Args:
-        base_weight: (numeric); base curb weight in pounds
-        final_weight: (numeric); final curb weight in pounds
+        base_weight: (numeric or array); base curb weight in pounds
+        final_weight: (numeric or array); final curb weight in pounds
 
     Returns:
         The change in curb weight - positive denotes a weight increase, negative a weight decrease.
@@ -59,62 +62,117 @@ def calc_lbs_changed_below_threshold(threshold, base_weight, final_weight):
     """
 
     Args:
-        threshold: (numeric); the curb weight threshold, in pounds, above and below which safety values change
-        base_weight: (numeric); base curb weight in pounds
-        final_weight: (numeric); final curb weight in pounds
+        threshold: (numeric or array); the curb weight threshold, in pounds, above and below which safety values change
+        base_weight: (numeric or array); base curb weight in pounds
+        final_weight: (numeric or array); final curb weight in pounds
 
     Returns:
         The portion of the weight change that occurs below the threshold - positive denotes a weight increase,
         negative a weight decrease.
 
     """
-    if threshold < base_weight and threshold < final_weight:
-        lbs_changed = 0
-
-    elif base_weight < threshold and final_weight < threshold:
-        lbs_changed = final_weight - base_weight
-
-    elif base_weight < threshold < final_weight:
-        lbs_changed = threshold - base_weight
-
-    elif final_weight < threshold < base_weight:
-        lbs_changed = final_weight - threshold
-
-    else:
-        lbs_changed = 10000  # this flags a logic error
-
-    return lbs_changed
+    threshold, base_weight, final_weight = np.broadcast_arrays(threshold, base_weight, final_weight)
+
+    return np.select(
+        [
+            (threshold < base_weight) & (threshold < final_weight),
+            (base_weight < threshold) & (final_weight < threshold),
+            (base_weight < threshold) & (threshold < final_weight),
+            (final_weight < threshold) & (threshold < base_weight),
+        ],
+        [
+            0,
+            final_weight - base_weight,
+            threshold - base_weight,
+            final_weight - threshold,
+        ],
+        default=10000  # this flags a logic error
+    )
 
 
 def calc_lbs_changed_above_threshold(threshold, base_weight, final_weight):
     """
 
     Args:
-        threshold: (numeric); the curb weight threshold, in pounds, above and below which safety values change
-        base_weight: (numeric); base curb weight in pounds
-        final_weight: (numeric); final curb weight in pounds
+        threshold: (numeric or array); the curb weight threshold, in pounds, above and below which safety values change
+        base_weight: (numeric or array); base curb weight in pounds
+        final_weight: (numeric or array); final curb weight in pounds
 
     Returns:
         The portion of the weight change that occurs above the threshold - positive denotes a weight increase,
         negative a weight decrease.
 
     """
-    if base_weight < threshold and final_weight < threshold:
-        lbs_changed = 0
+    threshold, base_weight, final_weight = np.broadcast_arrays(threshold, base_weight, final_weight)
+
+    return np.select(
+        [
+            (base_weight < threshold) & (final_weight < threshold),
+            (threshold <= base_weight) & (threshold <= final_weight),
+            (base_weight <= threshold) & (threshold <= final_weight),
+            (final_weight <= threshold) & (threshold <= base_weight),
+        ],
+        [
+            0,
+            final_weight - base_weight,
+            final_weight - threshold,
+            threshold - base_weight,
+        ],
+        default=10000  # this flags a logic error
+    )
+
+
+def calc_fatalities(batch_settings, body_styles, model_years, ages, base_weights, final_weights, vmt):
+    """
 
-    elif threshold <= base_weight and threshold <= final_weight:
-        lbs_changed = final_weight - base_weight
+    Calculate curb weight changes, threshold splits and fatality estimates for arrays of vehicle-years.
 
-    elif base_weight <= threshold <= final_weight:
-        lbs_changed = final_weight - threshold
+    Args:
+        batch_settings: an instance of the BatchSettings class.
+        body_styles (array-like): the OMEGA body styles (e.g., sedan, cuv_suv, pickup)
+        model_years (array-like): vehicle model years.
+        ages (array-like): vehicle ages in years.
+        base_weights (array-like): base year curb weights in pounds.
+        final_weights (array-like): session curb weights in pounds.
+        vmt (array-like): vehicle miles traveled.
 
-    elif final_weight <= threshold <= base_weight:
-        lbs_changed = threshold - base_weight
+    Returns:
+        A dictionary of safety effect arrays by safety effect name.
 
-    else:
-        lbs_changed = 10000  # this flags a logic error
+    """
+    base_weights = np.asarray(base_weights)
+    final_weights = np.asarray(final_weights)
+    vmt = np.asarray(vmt)
+
+    threshold_lbs, change_per_100lbs_below, change_per_100lbs_above = get_safety_values(batch_settings, body_styles)
+    fatality_rate_base = get_fatality_rates(batch_settings, model_years, ages)
+
+    lbs_changed = calc_lbs_changed(base_weights, final_weights)
+    lbs_changed_below_threshold = calc_lbs_changed_below_threshold(threshold_lbs, base_weights, final_weights)
+    lbs_changed_above_threshold = calc_lbs_changed_above_threshold(threshold_lbs, base_weights, final_weights)
+
+    check = np.abs(lbs_changed_below_threshold) + np.abs(lbs_changed_above_threshold) - np.abs(lbs_changed)
+
+    rate_change_below = change_per_100lbs_below * (-lbs_changed_below_threshold) / 100
+    rate_change_above = change_per_100lbs_above * (-lbs_changed_above_threshold) / 100
 
-    return lbs_changed
+    fatality_rate_session = fatality_rate_base * (1 + rate_change_below) * (1 + rate_change_above)
+
+    return {
+        'change_per_100lbs_below': change_per_100lbs_below,
+        'change_per_100lbs_above': change_per_100lbs_above,
+        'threshold_lbs': threshold_lbs,
+        'lbs_changed': lbs_changed,
+        'lbs_changed_below_threshold': lbs_changed_below_threshold,
+        'lbs_changed_above_threshold': lbs_changed_above_threshold,
+        'check_for_0': check,
+        'base_fatality_rate': fatality_rate_base,
+        'fatality_rate_change_below_threshold': rate_change_below,
+        'fatality_rate_change_above_threshold': rate_change_above,
+        'session_fatality_rate': fatality_rate_session,
+        'base_fatalities': fatality_rate_base * vmt / 1000000000,
+        'session_fatalities': fatality_rate_session * vmt / 1000000000,
+    }
 
 
 def calc_safety_effects(batch_settings, session_settings):
@@ -148,104 +206,86 @@ def calc_safety_effects(batch_settings, session_settings):
         'curbweight_lbs',
         ]
 
-    safety_effects_dict = {}
-    vehicle_info_dict = {}
-    calendar_years = batch_settings.calendar_years
-    for calendar_year in calendar_years:
-
-        adjusted_vads = \
-            session_settings.vehicle_annual_data.get_adjusted_vehicle_annual_data_by_calendar_year(calendar_year)
-
+    adjusted_vads = []
+    for calendar_year in batch_settings.calendar_years:
         # limit to adjusted_vads having model_year >= analysis_initial_year since only those might have new fuel
         # consumption
-        adjusted_vads = \
-            [v for v in adjusted_vads if (v['calendar_year'] - v['age']) >= batch_settings.analysis_initial_year]
-
-        calendar_year_safety_dict = {}
-        for v in adjusted_vads:
-
-            vehicle_safety_dict = {}
-
-            # need vehicle info once for each vehicle, not every calendar year for each vehicle
-            if v['vehicle_id'] not in vehicle_info_dict:
-                vehicle_info_dict[v['vehicle_id']] \
-                    = session_settings.vehicles.get_vehicle_attributes(v['vehicle_id'], *vehicle_attribute_list)
-
-            (base_year_vehicle_id, manufacturer_id, name, model_year, base_year_reg_class_id, reg_class_id, size_class,
-                in_use_fuel_id, market_class_id, fueling_class, base_year_powertrain_type, powertrain_type,
-                footprint, workfactor, body_style, base_year_curbweight_lbs, curbweight_lbs) = \
-                vehicle_info_dict[v['vehicle_id']]
-
-            threshold_lbs, change_per_100lbs_below, change_per_100lbs_above \
-                = get_safety_values(batch_settings, body_style)
-            fatality_rate_base = get_fatality_rate(batch_settings, model_year, v['age'])
-
-            lbs_changed = calc_lbs_changed(base_year_curbweight_lbs, curbweight_lbs)
-
-            lbs_changed_below_threshold \
-                = calc_lbs_changed_below_threshold(threshold_lbs, base_year_curbweight_lbs, curbweight_lbs)
-
-            lbs_changed_above_threshold \
-                = calc_lbs_changed_above_threshold(threshold_lbs, base_year_curbweight_lbs, curbweight_lbs)
-
-            check = abs(lbs_changed_below_threshold) + abs(lbs_changed_above_threshold) - abs(lbs_changed)
-
-            rate_change_below = change_per_100lbs_below * (-lbs_changed_below_threshold) / 100
-            rate_change_above = change_per_100lbs_above * (-lbs_changed_above_threshold) / 100
-
-            fatality_rate_session = fatality_rate_base * (1 + rate_change_below) * (1 + rate_change_above)
-
-            fatalities_base = fatality_rate_base * v['vmt'] / 1000000000
-
-            fatalities_session = fatality_rate_session * v['vmt'] / 1000000000
-
-            vehicle_safety_dict.update({
-                'session_policy': session_settings.session_policy,
-                'session_name': session_settings.session_name,
-                'vehicle_id': v['vehicle_id'],
-                'base_year_vehicle_id': base_year_vehicle_id,
-                'manufacturer_id': manufacturer_id,
-                'name': name,
-                'calendar_year': calendar_year,
-                'model_year': int(model_year),
-                'age': int(v['age']),
-                'base_year_reg_class_id': base_year_reg_class_id,
-                'reg_class_id': reg_class_id,
-                'context_size_class': size_class,
-                'in_use_fuel_id': in_use_fuel_id,
-                'market_class_id': market_class_id,
-                'fueling_class': fueling_class,
-                'base_year_powertrain_type': base_year_powertrain_type,
-                'powertrain_type': powertrain_type,
-                'registered_count': v['registered_count'],
-                'context_vmt_adjustment': v['context_vmt_adjustment'],
-                'annual_vmt': v['annual_vmt'],
-                'odometer': v['odometer'],
-                'vmt': v['vmt'],
-                'annual_vmt_rebound': v['annual_vmt_rebound'],
-                'vmt_rebound': v['vmt_rebound'],
-                'body_style': body_style,
-                'footprint_ft2': footprint,
-                'workfactor': workfactor,
-                'change_per_100lbs_below': change_per_100lbs_below,
-                'change_per_100lbs_above': change_per_100lbs_above,
-                'threshold_lbs': threshold_lbs,
-                'base_year_curbweight_lbs': base_year_curbweight_lbs,
-                'curbweight_lbs': curbweight_lbs,
-                'lbs_changed': lbs_changed,
-                'lbs_changed_below_threshold': lbs_changed_below_threshold,
-                'lbs_changed_above_threshold': lbs_changed_above_threshold,
-                'check_for_0': check,
-                'base_fatality_rate': fatality_rate_base,
-                'fatality_rate_change_below_threshold': rate_change_below,
-                'fatality_rate_change_above_threshold': rate_change_above,
-                'session_fatality_rate': fatality_rate_session,
-                'base_fatalities': fatalities_base,
-                'session_fatalities': fatalities_session,
-            })
-            calendar_year_safety_dict[v['vehicle_id'], int(calendar_year)] = vehicle_safety_dict
-
-        safety_effects_dict.update(calendar_year_safety_dict)
+        adjusted_vads += [
+            v for v
+            in session_settings.vehicle_annual_data.get_adjusted_vehicle_annual_data_by_calendar_year(calendar_year)
+            if (v['calendar_year'] - v['age']) >= batch_settings.analysis_initial_year
+        ]
+
+    if not adjusted_vads:
+        return {}
+
+    # need vehicle info once for each vehicle, not every calendar year for each vehicle
+    vehicle_info_dict = {}
+    for v in adjusted_vads:
+        if v['vehicle_id'] not in vehicle_info_dict:
+            vehicle_info_dict[v['vehicle_id']] = dict(zip(
+                vehicle_attribute_list,
+                session_settings.vehicles.get_vehicle_attributes(v['vehicle_id'], *vehicle_attribute_list)
+            ))
+    vehicle_info = [vehicle_info_dict[v['vehicle_id']] for v in adjusted_vads]
+
+    safety = calc_fatalities(
+        batch_settings,
+        [info['body_style'] for info in vehicle_info],
+        [info['model_year'] for info in vehicle_info],
+        [v['age'] for v in adjusted_vads],
+        [info['base_year_curbweight_lbs'] for info in vehicle_info],
+        [info['curbweight_lbs'] for info in vehicle_info],
+        [v['vmt'] for v in adjusted_vads],
+    )
+    safety = {k: values.tolist() for k, values in safety.items()}
+
+    safety_effects_dict = {}
+    for idx, (v, info) in enumerate(zip(adjusted_vads, vehicle_info)):
+        safety_effects_dict[v['vehicle_id'], int(v['calendar_year'])] = {
+            'session_policy': session_settings.session_policy,
+            'session_name': session_settings.session_name,
+            'vehicle_id': v['vehicle_id'],
+            'base_year_vehicle_id': info['base_year_vehicle_id'],
+            'manufacturer_id': info['manufacturer_id'],
+            'name': info['name'],
+            'calendar_year': v['calendar_year'],
+            'model_year': int(info['model_year']),
+            'age': int(v['age']),
+            'base_year_reg_class_id': info['base_year_reg_class_id'],
+            'reg_class_id': info['reg_class_id'],
+            'context_size_class': info['context_size_class'],
+            'in_use_fuel_id': info['in_use_fuel_id'],
+            'market_class_id': info['market_class_id'],
+            'fueling_class': info['fueling_class'],
+            'base_year_powertrain_type': info['base_year_powertrain_type'],
+            'powertrain_type': info['powertrain_type'],
+            'registered_count': v['registered_count'],
+            'context_vmt_adjustment': v['context_vmt_adjustment'],
+            'annual_vmt': v['annual_vmt'],
+            'odometer': v['odometer'],
+            'vmt': v['vmt'],
+            'annual_vmt_rebound': v['annual_vmt_rebound'],
+            'vmt_rebound': v['vmt_rebound'],
+            'body_style': info['body_style'],
+            'footprint_ft2': info['footprint_ft2'],
+            'workfactor': info['workfactor'],
+            'change_per_100lbs_below': safety['change_per_100lbs_below'][idx],
+            'change_per_100lbs_above': safety['change_per_100lbs_above'][idx],
+            'threshold_lbs': safety['threshold_lbs'][idx],
+            'base_year_curbweight_lbs': info['base_year_curbweight_lbs'],
+            'curbweight_lbs': info['curbweight_lbs'],
+            'lbs_changed': safety['lbs_changed'][idx],
+            'lbs_changed_below_threshold': safety['lbs_changed_below_threshold'][idx],
+            'lbs_changed_above_threshold': safety['lbs_changed_above_threshold'][idx],
+            'check_for_0': safety['check_for_0'][idx],
+            'base_fatality_rate': safety['base_fatality_rate'][idx],
+            'fatality_rate_change_below_threshold': safety['fatality_rate_change_below_threshold'][idx],
+            'fatality_rate_change_above_threshold': safety['fatality_rate_change_above_threshold'][idx],
+            'session_fatality_rate': safety['session_fatality_rate'][idx],
+            'base_fatalities': safety['base_fatalities'][idx],
+            'session_fatalities': safety['session_fatalities'][idx],
+        }
 
     return safety_effects_dict
 
@@ -266,10 +306,23 @@ def calc_legacy_fleet_safety_effects(batch_settings, session_settings):
     """
     manufacturer_id = 'legacy_fleet'
 
+    legacy_fleet = list(batch_settings.legacy_fleet.adjusted_legacy_fleet.values())
+    if not legacy_fleet:
+        return {}
+
+    model_years = [v['calendar_year'] - v['age'] for v in legacy_fleet]
+
+    threshold_lbs, change_per_100lbs_below, change_per_100lbs_above = \
+        [values.tolist() for values in get_safety_values(batch_settings, [v['body_style'] for v in legacy_fleet])]
+
+    fatality_rate_base = get_fatality_rates(batch_settings, model_years, [v['age'] for v in legacy_fleet])
+    fatalities_base = fatality_rate_base * np.array([v['vmt'] for v in legacy_fleet]) / 1000000000
+    fatality_rate_base, fatalities_base = fatality_rate_base.tolist(), fatalities_base.tolist()
+
     legacy_fleet_safety_effects_dict = {}
-    for v in batch_settings.legacy_fleet.adjusted_legacy_fleet.values():
+    for idx, v in enumerate(legacy_fleet):
 
-        model_year = v['calendar_year'] - v['age']
+        model_year = model_years[idx]
         reg_class_id = v['reg_class_id']
         in_use_fuel_id = v['in_use_fuel_id']
         registered_count = v['registered_count']
@@ -283,15 +336,8 @@ def calc_legacy_fleet_safety_effects(batch_settings, session_settings):
         name = batch_settings.legacy_fleet.set_legacy_fleet_name(v['vehicle_id'], v['market_class_id'], fueling_class)
         powertrain_type = batch_settings.legacy_fleet.set_legacy_fleet_powertrain_type(v['market_class_id'])
 
-        threshold_lbs, change_per_100lbs_below, change_per_100lbs_above = \
-            get_safety_values(batch_settings, v['body_style'])
-
         vehicle_safety_dict = {}
 
-        fatality_rate_base = get_fatality_rate(batch_settings, model_year, v['age'])
-
-        fatalities_base = fatality_rate_base * v['vmt'] / 1000000000
-
         vehicle_safety_dict.update({
             'session_policy': session_settings.session_policy,
             'session_name': session_settings.session_name,
@@ -320,21 +366,21 @@ def calc_legacy_fleet_safety_effects(batch_settings, session_settings):
             'body_style': v['body_style'],
             'footprint_ft2': 0,
             'workfactor': 0,
-            'change_per_100lbs_below': change_per_100lbs_below,
-            'change_per_100lbs_above': change_per_100lbs_above,
-            'threshold_lbs': threshold_lbs,
+            'change_per_100lbs_below': change_per_100lbs_below[idx],
+            'change_per_100lbs_above': change_per_100lbs_above[idx],
+            'threshold_lbs': threshold_lbs[idx],
             'base_year_curbweight_lbs': v['curbweight_lbs'],
             'curbweight_lbs': v['curbweight_lbs'],
             'lbs_changed': 0,
             'lbs_changed_below_threshold': 0,
             'lbs_changed_above_threshold': 0,
             'check_for_0': 0,
-            'base_fatality_rate': fatality_rate_base,
+            'base_fatality_rate': fatality_rate_base[idx],
             'fatality_rate_change_below_threshold': 0,
             'fatality_rate_change_above_threshold': 0,
-            'session_fatality_rate': fatality_rate_base,
-            'base_fatalities': fatalities_base,
-            'session_fatalities': fatalities_base,
+            'session_fatality_rate': fatality_rate_base[idx],
+            'base_fatalities': fatalities_base[idx],
+            'session_fatalities': fatalities_base[idx],
         }
         )
         key = (v['vehicle_id'], int(v['calendar_year']))
@@ -343,6 +389,35 @@ def calc_legacy_fleet_safety_effects(batch_settings, session_settings):
     return legacy_fleet_safety_effects_dict
 
 
+def calc_registered_count_weighted_sums(input_df, cols, groupby_cols):
+    """
+
+    Args:
+        input_df (DataFrame): DataFrame of safety effects.
+        cols (list): the columns to sum.
+        groupby_cols (list): the columns to group by.
+
+    Returns:
+        A DataFrame of cols summed by groupby_cols along with registered_count weighted averages of the curb weight
+        ('lbs') attributes.
+
+    """
+    attributes_to_weight = [col for col in input_df.columns if 'lbs' in col]
+    wtd_attributes = [f'wtd_avg_{attribute}' for attribute in attributes_to_weight]
+
+    # weight appropriate columns by registered_count to work toward weighted averages
+    wtd_df = input_df[attributes_to_weight].mul(input_df['registered_count'], axis=0)
+    wtd_df.columns = wtd_attributes
+
+    df = pd.concat([input_df[cols], wtd_df], axis=1)
+
+    return_df = df.groupby(by=groupby_cols, axis=0, as_index=False).sum()
+
+    return_df[wtd_attributes] = return_df[wtd_attributes].div(return_df['registered_count'], axis=0)
+
+    return return_df
+
+
 def calc_annual_avg_safety_effects(input_df):
     """
 
@@ -356,32 +431,14 @@ def calc_annual_avg_safety_effects(input_df):
     attributes = [col for col in input_df.columns
                   if ('vmt' in col or 'vmt_' in col)
                   and '_vmt' not in col]
-    attribute_keys_for_weighting = ['lbs']
-    attributes_to_weight = []
-    for attribute in attribute_keys_for_weighting:
-        for col in input_df:
-            if attribute in col:
-                attributes_to_weight.append(col)
-
-    # weight appropriate columns by registered_count to work toward weighted averages
-    temp_df = pd.DataFrame()
-    wtd_attributes = []
-    for attribute in attributes_to_weight:
-        wtd_attributes.append(f'wtd_avg_{attribute}')
-        s = pd.Series(input_df['registered_count'] * input_df[attribute], name=f'wtd_avg_{attribute}')
-        temp_df = pd.concat([temp_df, s], axis=1)
 
     mediumduty = None
     if 'medium' in [item for item in input_df['reg_class_id']]:  # TODO is this what is needed?
         mediumduty = 1
 
     cols = ['session_policy', 'session_name', 'calendar_year', 'reg_class_id', 'body_style', 'in_use_fuel_id', 'fueling_class',
-            'registered_count', 'base_fatalities', 'session_fatalities'
+            'registered_count', 'base_fatalities', 'session_fatalities', *attributes
             ]
-    for attribute in attributes:
-        cols.append(attribute)
-    df = input_df[cols]
-    df = pd.concat([df, temp_df], axis=1)
 
     # groupby calendar year, regclass, body style and fuel
     if mediumduty:
@@ -389,12 +446,7 @@ def calc_annual_avg_safety_effects(input_df):
     else:
         groupby_cols = ['session_policy', 'session_name', 'calendar_year', 'reg_class_id', 'body_style', 'fueling_class']
 
-    return_df = df.groupby(by=groupby_cols, axis=0, as_index=False).sum()
-
-    for attribute in wtd_attributes:
-        return_df[attribute] = return_df[attribute] / return_df['registered_count']
-
-    return return_df
+    return calc_registered_count_weighted_sums(input_df, cols, groupby_cols)
 
 
 def calc_annual_avg_safety_effects_by_body_style(input_df):
@@ -410,34 +462,12 @@ def calc_annual_avg_safety_effects_by_body_style(input_df):
     attributes = [col for col in input_df.columns
                   if ('vmt' in col or 'vmt_' in col)
                   and '_vmt' not in col]
-    attribute_keys_for_weighting = ['lbs']
-    attributes_to_weight = []
-    for attribute in attribute_keys_for_weighting:
-        for col in input_df:
-            if attribute in col:
-                attributes_to_weight.append(col)
-
-    # weight appropriate columns by registered_count to work toward weighted averages
-    temp_df = pd.DataFrame()
-    wtd_attributes = []
-    for attribute in attributes_to_weight:
-        wtd_attributes.append(f'wtd_avg_{attribute}')
-        s = pd.Series(input_df['registered_count'] * input_df[attribute], name=f'wtd_avg_{attribute}')
-        temp_df = pd.concat([temp_df, s], axis=1)
 
     cols = ['session_policy', 'session_name', 'calendar_year', 'body_style',
-            'registered_count', 'base_fatalities', 'session_fatalities'
+            'registered_count', 'base_fatalities', 'session_fatalities', *attributes
             ]
-    for attribute in attributes:
-        cols.append(attribute)
-    df = input_df[cols]
-    df = pd.concat([df, temp_df], axis=1)
 
     # groupby calendar year, body style
     groupby_cols = ['session_policy', 'session_name', 'calendar_year', 'body_style']
-    return_df = df.groupby(by=groupby_cols, axis=0, as_index=False).sum()
 
-    for attribute in wtd_attributes:
-        return_df[attribute] = return_df[attribute] / return_df['registered_count']
-
-    return return_df
+    return calc_registered_count_weighted_sums(input_df, cols, groupby_cols)
@@ -51,6 +51,8 @@ Data Column Name and Description
 **CODE**
 
 """
+import pandas as pd
+
 from omega_effects.general.general_functions import read_input_file
 from omega_effects.general.input_validation import validate_template_version_info, validate_template_column_names
 
@@ -119,3 +121,29 @@ class SafetyValues:
         change_above = self._data[body_style]['change_per_100_lbs_at_or_above_threshold']
 
         return threshold, change_below, change_above
+
+    def get_safety_values_array(self, body_styles):
+        """
+
+        Get safety values for an array of body styles.
+
+        Args:
+            body_styles (array-like): the OMEGA body styles (e.g., sedan, cuv_suv, pickup)
+
+        Returns:
+            Arrays of the curb weight thresholds and percentage changes in fatality rates for weight changes above and
+            below those thresholds.
+
+        """
+        body_styles = pd.Series(body_styles)
+
+        missing = set(body_styles.unique()) - set(self._data)
+        if missing:
+            raise KeyError(f'No safety values for body style(s) {missing}')
+
+        return tuple(
+            body_styles.map({k: v[col] for k, v in self._data.items()}).values
+            for col in (
+                'threshold_lbs', 'change_per_100_lbs_below_threshold', 'change_per_100_lbs_at_or_above_threshold'
+            )
+        )
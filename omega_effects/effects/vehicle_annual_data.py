@@ -7,10 +7,10 @@
 **CODE**
 
 """
+import numpy as np
 import pandas as pd
 
-from omega_effects.general.general_functions import read_input_file
-from omega_effects.general.general_functions import calc_rebound_effect, calc_fuel_cost_per_mile
+from omega_effects.general.general_functions import read_input_file, calc_rebound_effect
 
 
 class VehicleAnnualData:
@@ -129,72 +129,88 @@ class VehicleAnnualData:
             vads = self.get_vehicle_annual_data_by_calendar_year(calendar_year)
 
             # eliminate any adjusted_vads having model_year < the analysis_initial_year
-            vads = [v for v in vads if (v['calendar_year'] - v['age']) >= batch_settings.analysis_initial_year]
+            vads = [
+                v for v in vads
+                if (v['calendar_year'] - v['age']) >= batch_settings.analysis_initial_year
+                and v['registered_count'] >= 1
+            ]
+            if not vads:
+                continue
 
             context_vmt_adjustment = vmt_adjustments_session.get_vmt_adjustment(calendar_year)
 
+            # need vehicle info once for each vehicle, not every calendar year for each vehicle
             for v in vads:
-                if v['registered_count'] >= 1:
-                    age = v['age']
-                    # need vehicle info once for each vehicle, not every calendar year for each vehicle
-                    vehicle_id = v['vehicle_id']
-
-                    if vehicle_id not in vehicle_info_dict:
-                        vehicle_info_dict[vehicle_id] \
-                            = session_settings.vehicles.get_vehicle_attributes(vehicle_id, *vehicle_attribute_list)
-
-                    base_year_vehicle_id, manufacturer_id, model_year, in_use_fuel_id, base_year_powertrain_type, \
-                        onroad_direct_co2e_grams_per_mile, onroad_direct_kwh_per_mile, fueling_class, context_size_class \
-                        = vehicle_info_dict[vehicle_id]
-
-                    # onroad_kwh_per_mile = onroad_gallons_per_mile = fuel_cpm = 0
-                    rebound_rate = rebound_rate_ice
-                    if 'electricity' in in_use_fuel_id:
-                        rebound_rate = rebound_rate_bev
-
-                    # calc fuel cost per mile
-                    fuel_cost_per_mile = calc_fuel_cost_per_mile(
-                        batch_settings, session_settings, calendar_year,
-                        onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile, in_use_fuel_id
-                    )
-
-                    # get context fuel cost per mile
-                    cost_per_mile_group = 'nonBEV'
-                    if fueling_class == 'BEV':
-                        cost_per_mile_group = 'BEV'
-                    context_fuel_cpm_dict_key = (cost_per_mile_group, context_size_class, int(model_year), int(age))
-                    context_fuel_cpm = context_fuel_cpm_dict[context_fuel_cpm_dict_key]['fuel_cost_per_mile']
-
-                    if context_fuel_cpm > 0:
-                        rebound_effect = calc_rebound_effect(context_fuel_cpm, fuel_cost_per_mile, rebound_rate)
-                    else:
-                        rebound_effect = 0
-
-                    vmt = v['vmt'] * context_vmt_adjustment
-                    vmt_rebound = vmt * rebound_effect
-
-                    vmt += vmt_rebound
-                    annual_vmt_adjusted = vmt / v['registered_count']
-                    annual_vmt_rebound = vmt_rebound / v['registered_count']
-
-                    if v['age'] == 0:
-                        odometer = annual_vmt_adjusted
-                    else:
-                        odometer_last_year = \
-                            self.adjusted_vads[(vehicle_id, calendar_year - 1)]['odometer']
-                        odometer = odometer_last_year + annual_vmt_adjusted
-
-                    update_dict = {
-                        'manufacturer_id': manufacturer_id,
-                        'vehicle_id': vehicle_id,
-                        'age': v['age'],
-                        'calendar_year': calendar_year,
-                        'registered_count': v['registered_count'],
-                        'context_vmt_adjustment': context_vmt_adjustment,
-                        'annual_vmt': annual_vmt_adjusted,
-                        'annual_vmt_rebound': annual_vmt_rebound,
-                        'odometer': odometer,
-                        'vmt': vmt,
-                        'vmt_rebound': vmt_rebound,
-                    }
-                    self.adjusted_vads[(vehicle_id, calendar_year)] = update_dict
+                if v['vehicle_id'] not in vehicle_info_dict:
+                    vehicle_info_dict[v['vehicle_id']] = dict(zip(
+                        vehicle_attribute_list,
+                        session_settings.vehicles.get_vehicle_attributes(v['vehicle_id'], *vehicle_attribute_list)
+                    ))
+
+            vehicle_info = [vehicle_info_dict[v['vehicle_id']] for v in vads]
+            manufacturer_ids, model_years, in_use_fuel_ids, onroad_direct_co2e_grams_per_mile, \
+                onroad_direct_kwh_per_mile, fueling_classes, context_size_classes \
+                = [[info[attribute_name] for info in vehicle_info] for attribute_name in (
+                    'manufacturer_id', 'model_year', 'in_use_fuel_id', 'onroad_direct_co2e_grams_per_mile',
+                    'onroad_direct_kwh_per_mile', 'fueling_class', 'context_size_class'
+                )]
+
+            rebound_rate = np.array([
+                rebound_rate_bev if 'electricity' in in_use_fuel_id else rebound_rate_ice
+                for in_use_fuel_id in in_use_fuel_ids
+            ])
+
+            # calc fuel cost per mile
+            fuel_cost_per_mile = batch_settings.fuel_cost_per_mile.calc_fuel_costs_per_mile(
+                session_settings, calendar_year,
+                onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile, in_use_fuel_ids
+            )
+
+            # get context fuel cost per mile
+            context_fuel_cpm = np.array([
+                context_fuel_cpm_dict[
+                    ('BEV' if fueling_class == 'BEV' else 'nonBEV', context_size_class, int(model_year), int(v['age']))
+                ]['fuel_cost_per_mile']
+                for v, fueling_class, context_size_class, model_year
+                in zip(vads, fueling_classes, context_size_classes, model_years)
+            ], dtype=float)
+
+            has_context_fuel_cpm = context_fuel_cpm > 0
+            rebound_effect = np.where(
+                has_context_fuel_cpm,
+                calc_rebound_effect(
+                    np.where(has_context_fuel_cpm, context_fuel_cpm, 1), fuel_cost_per_mile, rebound_rate
+                ),
+                0
+            )
+
+            registered_count = np.array([v['registered_count'] for v in vads], dtype=float)
+            ages = np.array([v['age'] for v in vads])
+
+            vmt = np.array([v['vmt'] for v in vads], dtype=float) * context_vmt_adjustment
+            vmt_rebound = vmt * rebound_effect
+
+            vmt += vmt_rebound
+            annual_vmt_adjusted = vmt / registered_count
+            annual_vmt_rebound = vmt_rebound / registered_count
+
+            odometer_last_year = np.array([
+                0 if v['age'] == 0 else self.adjusted_vads[(v['vehicle_id'], calendar_year - 1)]['odometer']
+                for v in vads
+            ], dtype=float)
+            odometer = np.where(ages == 0, annual_vmt_adjusted, odometer_last_year + annual_vmt_adjusted)
+
+            for idx, v in enumerate(vads):
+                self.adjusted_vads[(v['vehicle_id'], calendar_year)] = {
+                    'manufacturer_id': manufacturer_ids[idx],
+                    'vehicle_id': v['vehicle_id'],
+                    'age': v['age'],
+                    'calendar_year': calendar_year,
+                    'registered_count': v['registered_count'],
+                    'context_vmt_adjustment': context_vmt_adjustment,
+                    'annual_vmt': annual_vmt_adjusted[idx].item(),
+                    'annual_vmt_rebound': annual_vmt_rebound[idx].item(),
+                    'odometer': odometer[idx].item(),
+                    'vmt': vmt[idx].item(),
+                    'vmt_rebound': vmt_rebound[idx].item(),
+                }
@@ -7,6 +7,7 @@
 **CODE**
 
 """
+import os
 from csv import reader, writer
 
 
@@ -60,16 +61,16 @@ def add_id_to_csv(filepath, output_file_id_info):
         Nothing, but reads the appropriate input file, inserts a new first row and saves the output_file_id_info in that
         first row.
 
-    """
+    Note:
+        Rows are copied one at a time through a temporary file so that large files are never held in memory.
 
-    with open(filepath, 'r') as read_file:
-        rd = reader(read_file)
-        lines = list(rd)
-        lines.insert(0, output_file_id_info)
+    """
+    temp_filepath = filepath.with_name(f'{filepath.name}.tmp')
 
-    with open(filepath, 'w', newline='') as write_file:
+    with open(filepath, 'r', newline='') as read_file, open(temp_filepath, 'w', newline='') as write_file:
         wt = writer(write_file)
-        wt.writerows(lines)
+        wt.writerow(output_file_id_info)
+        for line in reader(read_file):
+            wt.writerow(line)
 
-    read_file.close()
-    write_file.close()
+    os.replace(temp_filepath, filepath)
@@ -0,0 +1,172 @@
+"""
+
+**OMEGA effects fuel cost per mile module.**
+
+Fuel costs per mile depend only on the vehicle's onroad energy consumption and on per-unit fuel factors (price,
+refuel efficiency and carbon content) that vary by calendar year and fuel. The per-unit factors are looked up once
+per (calendar year, fuel ID, price type) and kept for the life of the batch; electricity prices are session inputs
+and so are also keyed by session name. Fuel costs per mile can then be evaluated for single vehicles or for arrays
+of vehicles in one call.
+
+----
+
+**CODE**
+
+"""
+import numpy as np
+
+
+class FuelCostPerMile:
+    """
+
+    Batch-level fuel cost per mile service.
+
+    """
+    def __init__(self, batch_settings):
+        """
+
+        Args:
+            batch_settings: an instance of the BatchSettings class.
+
+        """
+        self.batch_settings = batch_settings
+        self._fuel_ids = {}  # in_use_fuel_id strings and their fuel IDs
+        self._liquid_factors = {}  # price and grams per unit by (calendar_year, fuel_id, price_type)
+        self._electricity_factors = {}  # price and refuel efficiency by (electricity_prices, calendar_year, price_type)
+
+    def get_fuel_id(self, in_use_fuel_id):
+        """
+
+        Args:
+            in_use_fuel_id (str): a dict-like string providing fuel id information, e.g., "{'pump gasoline':1.0}".
+
+        Returns:
+            The fuel ID, e.g., 'pump gasoline'.
+
+        """
+        if in_use_fuel_id not in self._fuel_ids:
+            fuel_dict = eval(in_use_fuel_id)
+            self._fuel_ids[in_use_fuel_id] = [fuel for fuel in fuel_dict.keys()][0]
+
+        return self._fuel_ids[in_use_fuel_id]
+
+    def get_liquid_factors(self, calendar_year, fuel_id, price_type='retail_dollars_per_unit'):
+        """
+
+        Args:
+            calendar_year (int): the calendar year needed for fuel prices.
+            fuel_id (str): the fuel ID, e.g., 'pump gasoline'.
+            price_type (str): the price type, e.g., 'retail_dollars_per_unit'.
+
+        Returns:
+            The fuel price per gallon and the onroad CO2e grams per gallon.
+
+        """
+        key = (calendar_year, fuel_id, price_type)
+        if key not in self._liquid_factors:
+            onroad_fuels = self.batch_settings.onroad_fuels
+            price_per_gallon = \
+                self.batch_settings.context_fuel_prices.get_fuel_price(calendar_year, fuel_id, price_type)
+            refuel_efficiency_l = onroad_fuels.get_fuel_attribute(calendar_year, fuel_id, 'refuel_efficiency')
+            co2_emissions_grams_per_unit = \
+                onroad_fuels.get_fuel_attribute(calendar_year, fuel_id, 'direct_co2e_grams_per_unit') \
+                / refuel_efficiency_l
+
+            self._liquid_factors[key] = price_per_gallon, co2_emissions_grams_per_unit
+
+        return self._liquid_factors[key]
+
+    def get_electricity_factors(self, session_settings, calendar_year, price_type='retail_dollars_per_unit'):
+        """
+
+        Args:
+            session_settings: an instance of the SessionSettings class.
+            calendar_year (int): the calendar year needed for fuel prices.
+            price_type (str): the price type, e.g., 'retail_dollars_per_unit'.
+
+        Returns:
+            The electricity price per kWh and the electricity refuel efficiency.
+
+        """
+        # key on the session's ElectricityPrices object, session names are not unique across context and analysis
+        key = (session_settings.electricity_prices, calendar_year, price_type)
+        if key not in self._electricity_factors:
+            price_per_kwh = session_settings.electricity_prices.get_fuel_price(calendar_year, price_type)
+            refuel_efficiency_e = self.batch_settings.onroad_fuels.get_fuel_attribute(
+                calendar_year, 'US electricity', 'refuel_efficiency'
+            )
+
+            self._electricity_factors[key] = price_per_kwh, refuel_efficiency_e
+
+        return self._electricity_factors[key]
+
+    def calc_fuel_cost_per_mile(
+            self, session_settings, calendar_year,
+            onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile, in_use_fuel_id,
+            price_type='retail_dollars_per_unit'
+    ):
+        """
+
+        Args:
+            session_settings: an instance of the SessionSettings class.
+            calendar_year(int): the calendar year needed for fuel prices.
+            onroad_direct_kwh_per_mile (float): the onroad electricity consumption.
+            onroad_direct_co2e_grams_per_mile (float): the onroad co2 grams per mile.
+            in_use_fuel_id (str): a dict-like string providing fuel id information.
+            price_type (str): the price type, e.g., 'retail_dollars_per_unit'.
+
+        Returns:
+            The fuel cost per mile in the given year for the given vehicle.
+
+        """
+        fuel_cost_per_mile = 0
+        if onroad_direct_kwh_per_mile:
+            price_per_kwh, refuel_efficiency_e = \
+                self.get_electricity_factors(session_settings, calendar_year, price_type)
+            fuel_cost_per_mile = onroad_direct_kwh_per_mile * price_per_kwh / refuel_efficiency_e
+
+        if onroad_direct_co2e_grams_per_mile:
+            price_per_gallon, co2_emissions_grams_per_unit = \
+                self.get_liquid_factors(calendar_year, self.get_fuel_id(in_use_fuel_id), price_type)
+            onroad_gallons_per_mile = onroad_direct_co2e_grams_per_mile / co2_emissions_grams_per_unit
+            fuel_cost_per_mile += onroad_gallons_per_mile * price_per_gallon
+
+        return fuel_cost_per_mile
+
+    def calc_fuel_costs_per_mile(
+            self, session_settings, calendar_year,
+            onroad_direct_kwh_per_mile, onroad_direct_co2e_grams_per_mile, in_use_fuel_ids,
+            price_type='retail_dollars_per_unit'
+    ):
+        """
+
+        Args:
+            session_settings: an instance of the SessionSettings class.
+            calendar_year(int): the calendar year needed for fuel prices.
+            onroad_direct_kwh_per_mile (array-like): the onroad electricity consumption of each vehicle.
+            onroad_direct_co2e_grams_per_mile (array-like): the onroad co2 grams per mile of each vehicle.
+            in_use_fuel_ids (array-like): dict-like strings providing fuel id information for each vehicle.
+            price_type (str): the price type, e.g., 'retail_dollars_per_unit'.
+
+        Returns:
+            An array of fuel costs per mile in the given year for the given vehicles.
+
+        """
+        kwh_per_mile = np.asarray(onroad_direct_kwh_per_mile, dtype=float)
+        co2e_grams_per_mile = np.asarray(onroad_direct_co2e_grams_per_mile, dtype=float)
+
+        price_per_kwh, refuel_efficiency_e = self.get_electricity_factors(session_settings, calendar_year, price_type)
+        liquid_factors = np.array([
+            self.get_liquid_factors(calendar_year, self.get_fuel_id(in_use_fuel_id), price_type)
+            if co2e_grams_per_mile[idx] else (0, 1)
+            for idx, in_use_fuel_id in enumerate(in_use_fuel_ids)
+        ], dtype=float).reshape(-1, 2)
+
+        electricity_cost_per_mile = np.where(
+            kwh_per_mile != 0, kwh_per_mile * price_per_kwh / refuel_efficiency_e, 0
+        )
+        liquid_cost_per_mile = np.where(
+            co2e_grams_per_mile != 0, co2e_grams_per_mile / liquid_factors[:, 1] * liquid_factors[:, 0], 0
+        )
+
+        return electricity_cost_per_mile + liquid_cost_per_mile
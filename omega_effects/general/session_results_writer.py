@@ -0,0 +1,190 @@
+"""
+
+**OMEGA effects session results writer module.**
+
+Session results are appended to on-disk datasets, partitioned by result name and session, as soon as each session
+completes. This keeps the batch's memory footprint at roughly one session's worth of results regardless of the number
+of sessions in the batch. Batch-level stages then read back only the results (and columns) they need and the batch
+summary files are streamed out one partition at a time.
+
+----
+
+**CODE**
+
+"""
+import shutil
+import pandas as pd
+
+
+class SessionResultsWriter:
+    """
+
+    Incremental, partitioned writer (and reader) for session results.
+
+    """
+    def __init__(self, path_of_run_folder, session_dict, extension='csv'):
+        """
+
+        Args:
+            path_of_run_folder: Path object of the run folder, partitions are written to a subfolder.
+            session_dict (dict): the BatchSettings session_dict, used to order partitions.
+            extension (str): partition file format, 'csv' or 'parquet'.
+
+        """
+        self.path_of_results_folder = path_of_run_folder / 'session_results'
+        self.extension = extension
+        self.sessions = [(v['session_policy'], v['session_name']) for v in session_dict.values()]
+
+    def partition_path(self, result_name, session_name):
+        """
+
+        Args:
+            result_name (str): the name of the result, e.g. 'annual_physical'.
+            session_name (str): the session name.
+
+        Returns:
+            The Path object of the partition file for the given result and session.
+
+        """
+        return self.path_of_results_folder / result_name / f'{session_name}.{self.extension}'
+
+    def partitions(self, result_name, sort_sessions=False):
+        """
+
+        Args:
+            result_name (str): the name of the result, e.g. 'annual_physical'.
+            sort_sessions (bool): if True, order partitions by session policy then session name, otherwise use batch
+                session order.
+
+        Returns:
+            A list of the partition Path objects that exist for the given result.
+
+        """
+        sessions = self.sessions
+        if sort_sessions:
+            sessions = sorted(sessions)
+
+        partition_paths = [self.partition_path(result_name, session_name) for _, session_name in sessions]
+
+        return [path for path in partition_paths if path.is_file()]
+
+    def append(self, result_name, session_name, df):
+        """
+
+        Write a session's result to its partition; empty results are not written.
+
+        Args:
+            result_name (str): the name of the result, e.g. 'annual_physical'.
+            session_name (str): the session name.
+            df (DataFrame): the session result.
+
+        Returns:
+            Nothing, but writes the partition file.
+
+        """
+        if df.empty:
+            return
+
+        filepath = self.partition_path(result_name, session_name)
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.extension == 'parquet':
+            df.to_parquet(filepath, engine='fastparquet', compression='snappy', index=False)
+        else:
+            df.to_csv(filepath, index=False)
+
+    def read_partition(self, filepath, columns=None):
+        """
+
+        Args:
+            filepath: the Path object of the partition file.
+            columns (list): optional list of columns to read, or None to read all columns.
+
+        Returns:
+            A DataFrame of the partition data.
+
+        """
+        if self.extension == 'parquet':
+            return pd.read_parquet(filepath, engine='fastparquet', columns=columns)
+        else:
+            return pd.read_csv(filepath, usecols=columns, float_precision='round_trip')
+
+    def columns(self, result_name):
+        """
+
+        Args:
+            result_name (str): the name of the result, e.g. 'annual_physical'.
+
+        Returns:
+            The list of columns across all partitions of the given result, in order of first appearance.
+
+        """
+        columns = []
+        for filepath in self.partitions(result_name):
+            if self.extension == 'parquet':
+                from fastparquet import ParquetFile
+                partition_columns = ParquetFile(filepath).columns
+            else:
+                partition_columns = pd.read_csv(filepath, nrows=0).columns
+            columns += [col for col in partition_columns if col not in columns]
+
+        return columns
+
+    def read(self, result_name, columns=None):
+        """
+
+        Args:
+            result_name (str): the name of the result, e.g. 'annual_physical'.
+            columns (list): optional list of columns to read, or None to read all columns.
+
+        Returns:
+            A DataFrame of the given result for all sessions, in batch session order.
+
+        """
+        dfs = [self.read_partition(filepath, columns) for filepath in self.partitions(result_name)]
+
+        if not dfs:
+            return pd.DataFrame(columns=columns)
+
+        return pd.concat(dfs, axis=0, ignore_index=True)
+
+    def write_csv(self, result_name, filepath, sort_by=None):
+        """
+
+        Stream the partitions of a result to a single CSV file, one partition in memory at a time.
+
+        Args:
+            result_name (str): the name of the result, e.g. 'annual_physical'.
+            filepath: the Path object of the CSV file to write.
+            sort_by (list): optional list of columns to sort by; partitions are ordered by session policy then session
+                name so this is equivalent to sorting the full result when the list leads with 'session_policy' and
+                'session_name'.
+
+        Returns:
+            True if the file was written, False if there were no partitions to write.
+
+        """
+        partitions = self.partitions(result_name, sort_sessions=sort_by is not None)
+        if not partitions:
+            return False
+
+        columns = self.columns(result_name)
+
+        header = True
+        for partition_filepath in partitions:
+            df = self.read_partition(partition_filepath).reindex(columns=columns)
+            if sort_by is not None:
+                df = df.sort_values(by=sort_by)
+            df.to_csv(filepath, index=False, header=header, mode='w' if header else 'a')
+            header = False
+
+        return True
+
+    def cleanup(self):
+        """
+
+        Returns:
+            Nothing, but removes the partition files once the batch summary files have been written.
+
+        """
+        shutil.rmtree(self.path_of_results_folder, ignore_errors=True)
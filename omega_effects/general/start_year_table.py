@@ -0,0 +1,88 @@
+"""
+
+**OMEGA effects start year table module.**
+
+Maps years to the applicable "start year" of step-function input data, i.e. data that applies from its start year
+until the next start year.
+
+----
+
+**CODE**
+
+"""
+import numpy as np
+
+
+class StartYearTable:
+    """
+    Maps years to the applicable start year of step-function input data.  A dense year -> start year index is
+    precomputed over the span of the start years so lookups are an array index rather than a scan of the start years,
+    and arrays of years can be looked up at once.
+
+    """
+    def __init__(self, start_years):
+        """
+
+        Args:
+            start_years (list or array): the start years, in any order, duplicates are ignored
+
+        """
+        self.start_years = np.unique(np.atleast_1d(start_years)).astype(int)
+        self.first_year = self.start_years[0]
+
+        # dense start year index from the first to the last start year:
+        years = np.arange(self.first_year, self.start_years[-1] + 1)
+        self._dense_indices = np.searchsorted(self.start_years, years, side='right') - 1
+
+    def get_indices(self, years):
+        """
+        Get the index into ``start_years`` of the applicable start year of each of the given years.
+
+        Args:
+            years (array-like): the years to look up
+
+        Returns:
+            An array of ``start_years`` indices, -1 where a year precedes the first start year.
+
+        """
+        dense_indices = np.minimum(np.asarray(years).astype(int) - self.first_year, len(self._dense_indices) - 1)
+
+        return np.where(dense_indices < 0, -1, self._dense_indices[np.maximum(dense_indices, 0)])
+
+    def get_index(self, year):
+        """
+        Get the index into ``start_years`` of the applicable start year of a year.
+
+        Args:
+            year (int): the year to look up
+
+        Returns:
+            The ``start_years`` index, or None if the year precedes the first start year.
+
+        """
+        dense_index = int(year) - self.first_year
+
+        if dense_index < 0:
+            return None
+        elif dense_index >= len(self._dense_indices):
+            return len(self.start_years) - 1
+        else:
+            return int(self._dense_indices[dense_index])
+
+    def get_start_year(self, year):
+        """
+        Get the applicable start year of a year.
+
+        Args:
+            year (int): the year to look up
+
+        Returns:
+            The start year, or None if the year precedes the first start year.
+
+        """
+        index = self.get_index(year)
+
+        if index is None:
+            return None
+        else:
+            return int(self.start_years[index])
@@ -12,6 +12,8 @@ import shutil
 import traceback
 import pandas as pd
 
+from multiprocessing import Pool, freeze_support
+
 from time import time
 from datetime import datetime
 
@@ -23,6 +25,7 @@ from omega_effects.session_settings import SessionSettings
 from omega_effects.general.effects_log import EffectsLog
 from omega_effects.general.general_functions import copy_files
 from omega_effects.general.file_id_and_save import add_id_to_csv, save_file
+from omega_effects.general.session_results_writer import SessionResultsWriter
 
 from omega_effects.effects.vmt_adjustments import AdjustmentsVMT
 from omega_effects.effects.context_fuel_cost_per_mile import calc_context_fuel_cost_per_mile
@@ -42,6 +45,192 @@ from omega_effects.effects.benefits import calc_benefits
 from omega_effects.effects.sum_social_effects import calc_social_effects
 
 
+_session_worker_args = None  # batch-level inputs shared with each session worker process, see init_session_worker()
+
+
+def calc_session_effects(batch_settings, set_paths, session_results_writer, context_fuel_cpm_dict,
+                         start_time_readable, effects_log, session_num):
+    """
+
+    Calculate the safety, physical and cost effects for a single session.
+
+    Args:
+        batch_settings: an instance of the BatchSettings class.
+        set_paths: an instance of the SetPaths class.
+        session_results_writer: an instance of the SessionResultsWriter class.
+        context_fuel_cpm_dict (dict): the context fuel cost per mile dictionary.
+        start_time_readable (str): the start time of the run, in text readable format.
+        effects_log: an instance of the EffectsLog class.
+        session_num (int): the session number.
+
+    Returns:
+        The session name, the session's annual and model year period results are appended to the session results
+        partitions for use in the batch-level calcs.
+
+    Note:
+        Batch-level inputs are treated as read-only here, with the exception of the adjusted legacy fleet which is
+        rebuilt in full for each session.
+
+    """
+    session_settings = SessionSettings()
+    session_settings.get_session_settings(batch_settings, session_num, effects_log)
+    session_name = session_settings.session_name
+    if batch_settings.save_input_files:
+        copy_files(session_settings.inputs_filelist, set_paths.path_of_run_folder / f'{session_name}_inputs')
+
+    # vmt adjustments to vehicle annual data ___________________________________________________________________________
+    effects_log.logwrite(f'\nCalculating vmt adjustments for session {session_name}')
+    vmt_adjustments_session = AdjustmentsVMT()
+    vmt_adjustments_session.calc_vmt_adjustments(batch_settings, session_settings)
+
+    effects_log.logwrite(f'\nAdjusting analysis fleet VMT for {session_name}')
+    session_settings.vehicle_annual_data.adjust_vad(batch_settings, session_settings,
+                                                    vmt_adjustments_session, context_fuel_cpm_dict)
+
+    effects_log.logwrite(f'\nAdjusting legacy fleet VMT and stock for {session_name}')
+    batch_settings.legacy_fleet.adjust_legacy_fleet_stock_and_vmt(batch_settings, vmt_adjustments_session)
+
+    # safety effects ___________________________________________________________________________________________________
+    effects_log.logwrite(f'\nCalculating legacy fleet safety effects for {session_name}')
+    legacy_fleet_safety = calc_legacy_fleet_safety_effects(batch_settings, session_settings)
+
+    effects_log.logwrite(f'Calculating analysis fleet safety effects for {session_name}')
+    analysis_fleet_safety = calc_safety_effects(batch_settings, session_settings)
+
+    session_fleet_safety = {**analysis_fleet_safety, **legacy_fleet_safety}
+    session_fleet_safety_df = \
+        pd.DataFrame.from_dict(session_fleet_safety, orient='index').reset_index(drop=True)
+
+    if batch_settings.save_vehicle_safety_effects_files:
+        effects_log.logwrite(f'Saving safety effects file for {session_name}')
+        save_file(
+            session_settings, session_fleet_safety_df, set_paths.path_of_run_folder, 'safety_effects',
+            effects_log, extension=batch_settings.file_format
+        )
+
+    effects_log.logwrite(f'\nCalculating annual safety effects for {session_name}')
+    session_annual_safety_df = calc_annual_avg_safety_effects(session_fleet_safety_df)
+    session_annual_safety_by_body_style_df = (
+        calc_annual_avg_safety_effects_by_body_style(session_annual_safety_df)
+    )
+
+    # physical effects _________________________________________________________________________________________________
+    effects_log.logwrite(f'\nCalculating analysis fleet physical effects for {session_name}')
+    analysis_fleet_physical = calc_physical_effects(batch_settings, session_settings, analysis_fleet_safety)
+
+    effects_log.logwrite(f'Calculating legacy fleet physical effects for {session_name}')
+    legacy_fleet_physical = \
+        calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_fleet_safety)
+
+    session_fleet_physical = {**analysis_fleet_physical, **legacy_fleet_physical}
+
+    session_fleet_physical_df = \
+        pd.DataFrame.from_dict(session_fleet_physical, orient='index').reset_index(drop=True)
+
+    if batch_settings.save_vehicle_physical_effects_files:
+        effects_log.logwrite(f'\nSaving physical effects file for {session_name}')
+        save_file(
+            session_settings, session_fleet_physical_df, set_paths.path_of_run_folder, 'physical_effects',
+            effects_log, extension=batch_settings.file_format
+        )
+
+    effects_log.logwrite(f'\nCalculating annual physical effects for {session_name}')
+    session_annual_physical_df = calc_annual_physical_effects(batch_settings, session_fleet_physical_df)
+
+    effects_log.logwrite(f'\nCalculating model year period_duration physical effects for {session_name}')
+    periods = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_2')
+    session_my_period_physical_df = calc_period_consumer_physical_view(session_fleet_physical_df, periods)
+
+    session_vehicle_inventory_details_df = pd.DataFrame()
+    if session_settings.emission_rates_vehicles.deets:
+        session_vehicle_inventory_details_df = pd.DataFrame.from_dict(
+            session_settings.emission_rates_vehicles.deets, orient='index').reset_index(drop=True)
+
+    # cost effects _____________________________________________________________________________________________________
+    effects_log.logwrite(f'\nCalculating cost effects for {session_name}')
+    session_fleet_costs = {}
+    session_fleet_costs.update(
+        calc_cost_effects(batch_settings, session_settings, session_fleet_physical, context_fuel_cpm_dict)
+    )
+    session_costs_df = pd.DataFrame.from_dict(session_fleet_costs, orient='index').reset_index(drop=True)
+
+    if batch_settings.save_vehicle_cost_effects_files:
+        effects_log.logwrite(f'Saving cost effects file for {session_name}')
+        save_file(
+            session_settings, session_costs_df, set_paths.path_of_run_folder, 'cost_effects', effects_log,
+            extension=batch_settings.file_format
+        )
+
+    effects_log.logwrite(f'\nCalculating annual costs effects for {session_name}')
+    session_annual_costs_df = calc_annual_cost_effects(session_costs_df)
+
+    effects_log.logwrite(f'\nCalculating model year period_duration cost effects for {session_name}')
+    periods_1 = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_1')
+    periods_2 = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_2')
+    session_my_period_costs_df_1 = calc_period_consumer_view(batch_settings, session_costs_df, periods_1)
+    session_my_period_costs_df_2 = calc_period_consumer_view(batch_settings, session_costs_df, periods_2)
+
+    session_settings.electricity_prices.df.to_csv(
+        set_paths.path_of_modified_inputs_folder / f'{start_time_readable}_electricity_prices_{session_name}.csv',
+        index=False
+    )
+
+    session_results = {
+        'annual_safety': session_annual_safety_df,
+        'annual_safety_by_body_style': session_annual_safety_by_body_style_df,
+        'annual_physical': session_annual_physical_df,
+        'my_lifetime_physical': session_my_period_physical_df,
+        'vehicle_inventory_details': session_vehicle_inventory_details_df,
+        'annual_costs': session_annual_costs_df,
+        'my_lifetime_costs_1': session_my_period_costs_df_1,
+        'my_lifetime_costs_2': session_my_period_costs_df_2,
+    }
+    effects_log.logwrite(f'\nSaving session results for {session_name}')
+    for result_name, df in session_results.items():
+        session_results_writer.append(result_name, session_name, df)
+
+    return session_name
+
+
+def init_session_worker(batch_settings, set_paths, session_results_writer, context_fuel_cpm_dict,
+                        start_time_readable, effects_log):
+    """
+
+    Pool initializer, receives the batch-level inputs once per worker process rather than once per session.
+
+    Args:
+        batch_settings: an instance of the BatchSettings class.
+        set_paths: an instance of the SetPaths class.
+        session_results_writer: an instance of the SessionResultsWriter class.
+        context_fuel_cpm_dict (dict): the context fuel cost per mile dictionary.
+        start_time_readable (str): the start time of the run, in text readable format.
+        effects_log: an instance of the EffectsLog class.
+
+    Returns:
+        Nothing, but sets the module-level ``_session_worker_args``.
+
+    """
+    global _session_worker_args
+
+    _session_worker_args = \
+        (batch_settings, set_paths, session_results_writer, context_fuel_cpm_dict, start_time_readable, effects_log)
+
+
+def run_session_worker(session_num):
+    """
+
+    Calculate session effects in a worker process using the batch-level inputs provided by ``init_session_worker()``.
+
+    Args:
+        session_num (int): the session number.
+
+    Returns:
+        The result of ``calc_session_effects()`` for the given session.
+
+    """
+    return calc_session_effects(*_session_worker_args, session_num)
+
+
 def main():
     """
 
@@ -109,161 +298,33 @@ def main():
             )
 
         # loop thru sessions to calc safety effects, physical effects, cost effects for each ___________________________
-        annual_safety_df = annual_safety_by_body_style_df = pd.DataFrame()
-        annual_physical_df = pd.DataFrame()
-        vehicle_inventory_details_df = pd.DataFrame()
-        annual_costs_df = pd.DataFrame()
-        my_lifetime_physical_df = pd.DataFrame()
-        my_lifetime_costs_df_1 = pd.DataFrame()
-        my_lifetime_costs_df_2 = pd.DataFrame()
-        periods_1 = periods_2 = 0
-
         effects_log.logwrite(f'\nStarting work on sessions')
-        for session_num in batch_settings.session_dict:
-
-            session_settings = SessionSettings()
-            session_settings.get_session_settings(batch_settings, session_num, effects_log)
-            session_name = session_settings.session_name
-            if batch_settings.save_input_files:
-                copy_files(session_settings.inputs_filelist, set_paths.path_of_run_folder / f'{session_name}_inputs')
-
-            # vmt adjustments to vehicle annual data ___________________________________________________________________
-            effects_log.logwrite(f'\nCalculating vmt adjustments for session {session_name}')
-            vmt_adjustments_session = AdjustmentsVMT()
-            vmt_adjustments_session.calc_vmt_adjustments(batch_settings, session_settings)
-
-            effects_log.logwrite(f'\nAdjusting analysis fleet VMT for {session_name}')
-            session_settings.vehicle_annual_data.adjust_vad(batch_settings, session_settings,
-                                                            vmt_adjustments_session, context_fuel_cpm_dict)
-
-            effects_log.logwrite(f'\nAdjusting legacy fleet VMT and stock for {session_name}')
-            batch_settings.legacy_fleet.adjust_legacy_fleet_stock_and_vmt(batch_settings, vmt_adjustments_session)
-
-            # safety effects ___________________________________________________________________________________________
-            effects_log.logwrite(f'\nCalculating legacy fleet safety effects for {session_name}')
-            legacy_fleet_safety = calc_legacy_fleet_safety_effects(batch_settings, session_settings)
-
-            effects_log.logwrite(f'Calculating analysis fleet safety effects for {session_name}')
-            analysis_fleet_safety = calc_safety_effects(batch_settings, session_settings)
-
-            session_fleet_safety = {**analysis_fleet_safety, **legacy_fleet_safety}
-            session_fleet_safety_df = \
-                pd.DataFrame.from_dict(session_fleet_safety, orient='index').reset_index(drop=True)
-
-            if batch_settings.save_vehicle_safety_effects_files:
-                effects_log.logwrite(f'Saving safety effects file for {session_name}')
-                save_file(
-                    session_settings, session_fleet_safety_df, set_paths.path_of_run_folder, 'safety_effects',
-                    effects_log, extension=batch_settings.file_format
-                )
-
-            effects_log.logwrite(f'\nCalculating annual safety effects for {session_name}')
-            session_annual_safety_df = calc_annual_avg_safety_effects(session_fleet_safety_df)
-            session_annual_safety_by_body_style_df = (
-                calc_annual_avg_safety_effects_by_body_style(session_annual_safety_df)
-            )
-
-            # create an annual_safety_effects_df
-            annual_safety_df = pd.concat([annual_safety_df, session_annual_safety_df], axis=0, ignore_index=True)
-            annual_safety_df.reset_index(inplace=True, drop=True)
-
-            annual_safety_by_body_style_df = pd.concat(
-                [annual_safety_by_body_style_df, session_annual_safety_by_body_style_df],
-                axis=0, ignore_index=True
-            )
-            annual_safety_by_body_style_df.reset_index(inplace=True, drop=True)
-
-            # physical effects _________________________________________________________________________________________
-            effects_log.logwrite(f'\nCalculating analysis fleet physical effects for {session_name}')
-            analysis_fleet_physical = calc_physical_effects(batch_settings, session_settings, analysis_fleet_safety)
-
-            effects_log.logwrite(f'Calculating legacy fleet physical effects for {session_name}')
-            legacy_fleet_physical = \
-                calc_legacy_fleet_physical_effects(batch_settings, session_settings, legacy_fleet_safety)
-
-            session_fleet_physical = {**analysis_fleet_physical, **legacy_fleet_physical}
-
-            session_fleet_physical_df = \
-                pd.DataFrame.from_dict(session_fleet_physical, orient='index').reset_index(drop=True)
-
-            if batch_settings.save_vehicle_physical_effects_files:
-                effects_log.logwrite(f'\nSaving physical effects file for {session_name}')
-                save_file(
-                    session_settings, session_fleet_physical_df, set_paths.path_of_run_folder, 'physical_effects',
-                    effects_log, extension=batch_settings.file_format
-                )
-
-            effects_log.logwrite(f'\nCalculating annual physical effects for {session_name}')
-            session_annual_physical_df = calc_annual_physical_effects(batch_settings, session_fleet_physical_df)
-
-            effects_log.logwrite(f'\nCalculating model year period_duration physical effects for {session_name}')
-            periods = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_2')
-            session_my_period_physical_df = calc_period_consumer_physical_view(session_fleet_physical_df, periods)
-
-            # for use in benefits calcs, create an annual_physical_effects_df
-            annual_physical_df = pd.concat(
-                [annual_physical_df, session_annual_physical_df], axis=0, ignore_index=True
-            )
-            annual_physical_df.reset_index(inplace=True, drop=True)
-
-            # for use in consumer calcs, create a my_lifetime_physical_effects_df of lifetime physical effects
-            my_lifetime_physical_df = \
-                pd.concat([my_lifetime_physical_df, session_my_period_physical_df], axis=0, ignore_index=True)
-            my_lifetime_physical_df.reset_index(inplace=True, drop=True)
-
-            if session_settings.emission_rates_vehicles.deets:
-                session_vehicle_inventory_details_df = pd.DataFrame.from_dict(
-                    session_settings.emission_rates_vehicles.deets, orient='index').reset_index(drop=True)
-                vehicle_inventory_details_df = pd.concat(
-                    [vehicle_inventory_details_df, session_vehicle_inventory_details_df], axis=0, ignore_index=True
-                )
-
-            # cost effects _____________________________________________________________________________________________
-            effects_log.logwrite(f'\nCalculating cost effects for {session_name}')
-            session_fleet_costs = {}
-            session_fleet_costs.update(
-                calc_cost_effects(batch_settings, session_settings, session_fleet_physical, context_fuel_cpm_dict)
-            )
-            session_costs_df = pd.DataFrame.from_dict(session_fleet_costs, orient='index').reset_index(drop=True)
-
-            if batch_settings.save_vehicle_cost_effects_files:
-                effects_log.logwrite(f'Saving cost effects file for {session_name}')
-                save_file(
-                    session_settings, session_costs_df, set_paths.path_of_run_folder, 'cost_effects', effects_log,
-                    extension=batch_settings.file_format
-                )
-
-            effects_log.logwrite(f'\nCalculating annual costs effects for {session_name}')
-            session_annual_costs_df = calc_annual_cost_effects(session_costs_df)
-
-            effects_log.logwrite(f'\nCalculating model year period_duration cost effects for {session_name}')
-            periods_1 = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_1')
-            periods_2 = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_2')
-            session_my_period_costs_df_1 = calc_period_consumer_view(batch_settings, session_costs_df, periods_1)
-            session_my_period_costs_df_2 = calc_period_consumer_view(batch_settings, session_costs_df, periods_2)
-
-            # for use in benefits calcs, create an annual_cost_effects_df of undiscounted annual costs
-            annual_costs_df = pd.concat([annual_costs_df, session_annual_costs_df], axis=0, ignore_index=True)
-            annual_costs_df.reset_index(inplace=True, drop=True)
-
-            # for use in consumer calcs, create a my_lifetime_cost_effects_df of lifetime costs
-            my_lifetime_costs_df_1 = pd.concat(
-                [my_lifetime_costs_df_1, session_my_period_costs_df_1], axis=0, ignore_index=True
-            )
-            my_lifetime_costs_df_1.reset_index(inplace=True, drop=True)
-
-            my_lifetime_costs_df_2 = pd.concat(
-                [my_lifetime_costs_df_2, session_my_period_costs_df_2], axis=0, ignore_index=True
-            )
-            my_lifetime_costs_df_2.reset_index(inplace=True, drop=True)
+        session_nums = list(batch_settings.session_dict.keys())
+        session_results_writer = SessionResultsWriter(
+            set_paths.path_of_run_folder, batch_settings.session_dict, batch_settings.file_format
+        )
+        num_processes = min(batch_settings.session_worker_processes, len(session_nums))
+
+        if num_processes > 1:
+            effects_log.logwrite(f'Running {len(session_nums)} sessions on {num_processes} worker processes')
+            freeze_support()
+            with Pool(processes=num_processes, initializer=init_session_worker,
+                      initargs=(batch_settings, set_paths, session_results_writer, context_fuel_cpm_dict,
+                                start_time_readable, effects_log)) as pool:
+                results = [pool.apply_async(func=run_session_worker, args=(session_num, ))
+                           for session_num in session_nums]
+                [r.get() for r in results]
+        else:
+            for session_num in session_nums:
+                calc_session_effects(batch_settings, set_paths, session_results_writer, context_fuel_cpm_dict,
+                                     start_time_readable, effects_log, session_num)
 
-            session_settings.electricity_prices.df.to_csv(
-                set_paths.path_of_modified_inputs_folder / f'{start_time_readable}_electricity_prices_{session_name}.csv',
-                index=False
-            )
+        periods_1 = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_1')
+        periods_2 = batch_settings.general_inputs_for_effects.get_value('years_in_consumer_view_2')
 
         # discount annual costs ________________________________________________________________________________________
         effects_log.logwrite('\nCalculating discounted annual costs, PVs and EAVs for the batch')
+        annual_costs_df = session_results_writer.read('annual_costs')
         discounted_costs = DiscountingCosts()
         discounted_costs.discount_annual_values(batch_settings, annual_costs_df)
         discounted_costs.calc_present_values(batch_settings)
@@ -275,6 +336,7 @@ def main():
 
         # calculate refinery, egu and total emissions using the annual_physical_df DataFrame ___________________________
         effects_log.logwrite(f'\nCalculating refinery inventories and oil import effects for the batch')
+        annual_physical_df = session_results_writer.read('annual_physical')
         annual_physical_df = calc_refinery_inventory_and_oil_imports(batch_settings, annual_physical_df)
         refinery_inventory_details_df = pd.DataFrame.from_dict(
             batch_settings.refinery_data.data, orient='index').reset_index(drop=True)
@@ -289,6 +351,11 @@ def main():
 
         # calculate annual benefits and annual physical effects deltas _________________________________________________
         effects_log.logwrite(f'\nCalculating annual benefits for the batch')
+        annual_costs_df = session_results_writer.read(
+            'annual_costs',
+            columns=['session_policy', 'calendar_year', 'reg_class_id', 'in_use_fuel_id', 'fueling_class',
+                     'drive_value_cost_dollars', 'refueling_cost_dollars']
+        )
         annual_benefits, delta_fleet_physical = calc_benefits(
             batch_settings, annual_physical_df, annual_costs_df,
             calc_health_effects=batch_settings.criteria_cost_factors.calc_health_effects
@@ -349,24 +416,22 @@ def main():
             'model_year',
             'body_style',
         ]
-        if 'fueling_class' in my_lifetime_costs_df_1.columns:
+        if 'fueling_class' in session_results_writer.columns('my_lifetime_costs_1'):
             arg_sort_list.append('fueling_class')
         else:
             arg_sort_list.append('in_use_fuel_id')
-        if 'fueling_class' in my_lifetime_costs_df_2.columns:
+        if 'fueling_class' in session_results_writer.columns('my_lifetime_costs_2'):
             arg_sort_list.append('fueling_class')
         else:
             arg_sort_list.append('in_use_fuel_id')
 
-        my_lifetime_costs_df_1 = my_lifetime_costs_df_1.sort_values(by=arg_sort_list)
-        my_lifetime_costs_df_2 = my_lifetime_costs_df_2.sort_values(by=arg_sort_list)
-
-        # save files to CSV ____________________________________________________________________________________________
-        annual_safety_df.to_csv(
-            set_paths.path_of_run_folder / f'{start_time_readable}_safety_effects_summary.csv', index=False
+        # save files to CSV, session results are streamed from their partitions ________________________________________
+        session_results_writer.write_csv(
+            'annual_safety', set_paths.path_of_run_folder / f'{start_time_readable}_safety_effects_summary.csv'
         )
-        annual_safety_by_body_style_df.to_csv(
-            set_paths.path_of_run_folder / f'{start_time_readable}_safety_effects_by_body_style_summary.csv', index=False
+        session_results_writer.write_csv(
+            'annual_safety_by_body_style',
+            set_paths.path_of_run_folder / f'{start_time_readable}_safety_effects_by_body_style_summary.csv'
         )
         annual_physical_df.to_csv(
             set_paths.path_of_run_folder / f'{start_time_readable}_physical_effects_annual.csv', index=False
@@ -389,19 +454,24 @@ def main():
             social_effects_domestic_df.to_csv(
                 set_paths.path_of_run_folder / f'{start_time_readable}_social_effects_domestic_ghg_annual.csv', index=False
             )
-        my_lifetime_physical_df.to_csv(
-            set_paths.path_of_run_folder / f'{start_time_readable}_MY_period_physical_effects.csv', index=False
+        session_results_writer.write_csv(
+            'my_lifetime_physical',
+            set_paths.path_of_run_folder / f'{start_time_readable}_MY_period_physical_effects.csv'
         )
-        my_lifetime_costs_df_1.to_csv(
-            set_paths.path_of_run_folder / f'{start_time_readable}_MY_{int(periods_1)}_period_costs.csv', index=False
+        session_results_writer.write_csv(
+            'my_lifetime_costs_1',
+            set_paths.path_of_run_folder / f'{start_time_readable}_MY_{int(periods_1)}_period_costs.csv',
+            sort_by=arg_sort_list
         )
-        my_lifetime_costs_df_2.to_csv(
-            set_paths.path_of_run_folder / f'{start_time_readable}_MY_{int(periods_2)}_period_costs.csv', index=False
+        session_results_writer.write_csv(
+            'my_lifetime_costs_2',
+            set_paths.path_of_run_folder / f'{start_time_readable}_MY_{int(periods_2)}_period_costs.csv',
+            sort_by=arg_sort_list
+        )
+        vehicle_inventory_details_saved = session_results_writer.write_csv(
+            'vehicle_inventory_details',
+            set_paths.path_of_run_folder / f'{start_time_readable}_vehicle_emission_rate_details.csv'
         )
-        if session_settings.emission_rates_vehicles.deets:
-            vehicle_inventory_details_df.to_csv(
-                set_paths.path_of_run_folder / f'{start_time_readable}_vehicle_emission_rate_details.csv', index=False
-            )
         egu_inventory_details_df.to_csv(
             set_paths.path_of_run_folder / f'{start_time_readable}_egu_inventory_details.csv', index=False
         )
@@ -452,7 +522,7 @@ def main():
         add_id_to_csv(set_paths.path_of_run_folder / f'{start_time_readable}_MY_{int(periods_2)}_period_costs.csv',
                       output_file_id_info
                       )
-        if session_settings.emission_rates_vehicles.deets:
+        if vehicle_inventory_details_saved:
             add_id_to_csv(set_paths.path_of_run_folder / f'{start_time_readable}_vehicle_emission_rate_details.csv',
                           output_file_id_info
                           )
@@ -470,6 +540,9 @@ def main():
         batch_settings.scghg_cost_factors.factors_in_analysis_dollars.to_csv(
             set_paths.path_of_modified_inputs_folder / f'{start_time_readable}_cost_factors_scghg.csv', index=False
         )
+
+        session_results_writer.cleanup()
+
     except Exception as e:
         effects_log.logwrite(f'*** {e} ***\n{traceback.format_exc()}\n', stamp=True)
         sys.exit()
@@ -88,6 +88,7 @@ try:
             self.logfilename = ''  #: stores the full filepathname of the session log file
             self.session_is_reference = True  #: = ``True`` if this session is the reference (context) session
             self.auto_close_figures = True  #: auto close postproc figures if ``True``
+            self.postproc_plots = True  #: generate postproc figures if ``True``, postproc summary and output files are always generated
             self.save_preliminary_outputs = True  #: retains preliminary (i.e. first pass) outputs if ``True``
             self.omega_model_path = path  #: absolute path to the ``omega_model`` directory
             self.analysis_initial_year = None  #: stores the analysis initial year, e.g. vehicle base year + 1
@@ -155,6 +156,9 @@ try:
             # "developer" settings:
             self.use_prerun_context_outputs = False  #: if ``True`` then use context session outputs from a previously run context session
             self.prerun_context_folder = ''  #: path to the previously run context session, if ``use_prerun_context_outputs`` is ``True``
+            self.use_input_snapshots = False  #: if ``True`` then save and restore the post-validation state of shared input files to speed up session initialization, see ``common.input_snapshots``
+            self.input_snapshot_folder = os.path.expanduser('~') + os.sep + 'omega_input_snapshots' + os.sep  #: path to the input snapshot folder, if ``use_input_snapshots`` is ``True``
+            self.clear_input_snapshots = False  #: if ``True`` then delete all input snapshots at the start of the session, if ``use_input_snapshots`` is ``True``
             self.battery_GWh_limit_years = [2020]  #: used in combination with ``battery_GWh_limit`` to create industry-level battery production capacity limits year over year
             self.battery_GWh_limit = [1e9]  #: used in combination with ``battery_GWh_limit_years`` to create industry-level battery production capacity limits year over year
             self.producer_price_modification_scaler = 0.0  #: if non-zero then some scalar portion of vehicle incentives (price modifications) are incorporated into the producer vehicle generalized cost
@@ -181,6 +185,7 @@ try:
             self.producer_strategic_compliance_buffer_years = [2020]  #: used in combination with ``producer_strategic_compliance_buffer`` to allow manually banking (or burning) GHG credits year over year
             self.producer_strategic_compliance_buffer = [0.0]  #: used in combination with ``producer_strategic_compliance_buffer_years`` to allow manually banking (or burning) GHG credits year over year
             self.relax_second_pass_GWh = False  #: if ``True`` then second pass battery GWh production may exceed first pass production
+            self.release_finalized_cost_curves = True  #: if ``True`` then finalized vehicles release their cost curves, which are only needed during the compliance search, to reduce memory use
 
             # advanced developer settings:
             self.vehicles_file_base_year_offset = None  #: added to the base year vehicles file model year and prior redesign year
@@ -194,6 +199,7 @@ try:
             self.rlhp60_max_scaler = 1.0  #: maximum roadload horsepower at 60 MPH scaler when sweeping RLHP60
             self.allow_ice_of_bev = False  #: if ``True`` then base year BEVs will have ICE-equivalent alternative powertrain vehicles available starting at first redesign
             self.phev_battery_kwh = None  #: ``'RSE'`` => use RSE, ``None`` => use range calc, otherwise use scalar value to size PHEV battery capacity
+            self.check_cost_cloud_rses = False  #: if ``True`` then evaluate the response surface equations of each cost curve class on a test grid spanning the RSE inputs of the base year vehicles during initialization and fail initialization if any output is NaN or negative
             self.force_two_pass = False  #: can be used to force two pass (consolidated and non-consolidated compliance passes) as desired
             self.include_manufacturers_list = 'all'  #: ``'all'`` to include all base year vehicle manufacturers, else list of manufacturers to include, e.g. ``['Ford', 'Honda', ...]``
             self.exclude_manufacturers_list = 'none'  #: ``'none'`` to include all base year vehicle manufacturers, else list of manufacturers to exclude, e.g. ``['Ferrari', 'Bugatti', ...]``
@@ -207,6 +213,7 @@ try:
             self.flat_context_year = 2021  #: used in combination with ``flat_context`` to set constant context values
             self.run_profiler = False  #: run profiler if ``True``
             self.multiprocessing = True and not self.run_profiler and not getattr(sys, 'frozen', False)  #: enables multiprocessing if ``True``
+            self.parallel_postproc_plots = True  #: render postproc figures in the multiprocessing worker pool if ``True`` and ``multiprocessing`` is enabled
 
             # search and convergence-related developer settings:
             self.producer_num_market_share_options = 3  #: nominal number of market share options considered per producer compliance search iteration
@@ -214,19 +221,31 @@ try:
             self.producer_num_tech_options_per_bev_vehicle = 1  #: nominal number of tech options per BEV vehicle considered per producer compliance search iteration
             self.producer_compliance_search_min_share_range = 1e-5  #: the minimum share range used during producer compliance search iteration
             self.producer_compliance_search_convergence_factor = 0.9  #: producer search share range = ``producer_compliance_search_convergence_factor ** iteration_num``
+            self.producer_compliance_search_warm_start = False  #: if ``True`` then the producer compliance search of each year after the first starts from the prior year's decision with a narrower initial share range, falling back to the full range if no compliant option is found
+            self.producer_compliance_search_warm_start_iterations = 22  #: the number of initial search iterations skipped by a warm-started producer compliance search, the initial share range is ``producer_compliance_search_convergence_factor ** producer_compliance_search_warm_start_iterations``
             self.producer_compliance_search_tolerance = 1e-6  #: used to determine if producer compliance search as found an acceptable solution, relative to 1.0 being perfect compliance
             self.producer_voluntary_overcompliance_min_benefit_frac = 0.01  #: minimum benefit of voluntary overcompliance, as a fraction of compliance cost, experimental
             self.producer_voluntary_overcompliance_min_strategic_compliance_ratio = 0.9999  #: determines the maxinum voluntary overcompliance to consider, experimental
             self.producer_consumer_max_iterations = 5  #: determines the maximum number of producer-consumer cross subsidy iterations to consider
             self.producer_consumer_convergence_tolerance = 5e-4  #: the threshhold for determining producer-consumer share convergence, absolute market share
+            self.producer_consumer_acceleration = 'none'  #: producer-consumer share iteration acceleration, ``'none'`` to pass the consumer shares to the next producer compliance search as-is, ``'relaxation'`` to pass shares blended from the producer and consumer shares or ``'anderson'`` to pass shares extrapolated from the last few producer and consumer share vectors (Anderson mixing)
+            self.producer_consumer_relaxation_factor = 0.5  #: the weight of the consumer shares relative to the producer shares when ``producer_consumer_acceleration`` is ``'relaxation'`` or ``'anderson'``, 1.0 = consumer shares only
+            self.producer_consumer_anderson_depth = 3  #: the maximum number of prior producer-consumer iterations used to extrapolate shares when ``producer_consumer_acceleration`` is ``'anderson'``
             self.consumer_pricing_num_options = 14  #: the number of cross-subsidy pricing options to consider per cross-subsidy iteration per market class
+            self.cross_subsidy_search_method = 'grid'  #: cross-subsidy multiplier search method, ``'grid'`` to search a successively tightened grid of ``consumer_pricing_num_options`` multipliers per market class or ``'newton'`` to solve for the multipliers with a damped Newton method
+            self.cross_subsidy_solver_max_iterations = 20  #: the maximum number of solver iterations per cross-subsidy search when ``cross_subsidy_search_method`` is ``'newton'``
             self.producer_cross_subsidy_price_tolerance = 5e-4  #: the threshhold for determining producer-consumer price convergence, relative to 1.0 being perfect price convergence
 
             # logging and verbosity-related settings:
             # list of modules to allow verbose log files, or empty to disable:
             self.verbose_log_modules = ['producer_compliance_search', 'cross_subsidy_search_',
                                         'cv_cost_curves_', 'v_cost_curves_', 'v_cost_clouds_',
-                                        'v_cloud_plots_', 'cv_cloud_plots', 'effects_']  #: used to enable verbose log file outputs for various modules
+                                        'v_cloud_plots_', 'cv_cloud_plots', 'effects_', 'compliance_search_cache_',
+                                        'compliance_search_transport_',
+                                        'producer_compliance_search_warm_start_check_']  #: used to enable verbose log file outputs for various modules
+
+            self.iteration_log_column_prefixes = []  #: column name prefixes of the columns logged to the producer-consumer iteration log, e.g. ``['total_', 'pricing_score']``, or empty to log all columns.  The columns used by post-processing are always logged
+            self.iteration_log_spill_rows = 0  #: if > 0, the number of producer-consumer iteration log rows held in memory before they are written to a temporary file in the output folder
 
             # list of modules to allow verbose console output, or empty to disable
             self.verbose_console_modules = ['producer_compliance_search_',
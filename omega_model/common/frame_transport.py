@@ -0,0 +1,171 @@
+"""
+
+**Routines to pass DataFrames between the session process and pool workers via memory-mapped files.**
+
+Vehicle and composite vehicle cost curves are sent to and returned from pool workers during
+``compliance_search.create_composite_vehicles()``.  Pickling them through the pool pipes copies every cost curve several
+times.  Instead, the numeric columns of a cost curve are written column by column to a file in the session output
+folder and the cost curve is replaced by a lightweight, picklable ``MappedFrame`` descriptor.  The receiving process
+memory-maps the file, rebuilds the DataFrame and removes the file.
+
+Each file is loaded exactly once, so a cost curve that is passed on to another worker without being loaded keeps its
+file until it is loaded there.  If a pool worker fails, the files of the cost curves that will not be loaded are
+discarded instead.
+
+----
+
+**CODE**
+
+"""
+
+print('importing %s' % __file__)
+
+from omega_model import *
+
+import uuid
+
+
+class MappedFrame(OMEGABase):
+    """
+    **Picklable descriptor of a DataFrame whose numeric columns are stored in a memory-mapped file.**
+
+    """
+    def __init__(self, df):
+        """
+        Write the numeric columns (and numeric index) of ``df`` to a new file in the session output folder.
+
+        Args:
+            df (DataFrame): the DataFrame to store
+
+        """
+        self.filename = '%s%s__%s.frame' % (omega_globals.options.output_folder,
+                                            omega_globals.options.session_unique_name, uuid.uuid4().hex)
+        self.columns = list(df.columns)
+        self.num_rows = len(df)
+        self.layout = []  # list of (column name, dtype string, byte offset) of the columns stored in the file
+
+        numeric_columns = [c for c in df.columns if is_numeric_dtype(df[c])]
+        self.non_numeric_data = df[[c for c in df.columns if c not in numeric_columns]]
+
+        if is_numeric_dtype(df.index):
+            self.index = None
+            self.index_name = df.index.name
+            arrays = [(None, df.index.values)]
+        else:
+            self.index = df.index
+            arrays = []
+
+        arrays += [(c, df[c].values) for c in numeric_columns]
+
+        self.nbytes = 0
+        try:
+            with open(self.filename, 'wb') as f:
+                for column, values in arrays:
+                    values = np.ascontiguousarray(values)
+                    f.write(values.tobytes())
+                    self.layout.append((column, values.dtype.str, self.nbytes))
+                    self.nbytes += values.nbytes
+        except BaseException:
+            self.discard()
+            raise
+
+    def load(self):
+        """
+        Rebuild the DataFrame from the memory-mapped file, then remove the file.
+
+        Returns:
+            The DataFrame
+
+        """
+        data = dict()
+        index = self.index
+
+        if self.nbytes:
+            mapped_data = np.memmap(self.filename, dtype=np.uint8, mode='r')
+        else:
+            mapped_data = None  # empty DataFrame, nothing to map
+
+        try:
+            for column, dtype, offset in self.layout:
+                if mapped_data is None:
+                    values = np.empty(0, dtype=dtype)
+                else:
+                    values = np.frombuffer(mapped_data, dtype=dtype, count=self.num_rows, offset=offset).copy()
+                if column is None:
+                    index = pd.Index(values, name=self.index_name)
+                else:
+                    data[column] = values
+        finally:
+            del mapped_data
+            os.remove(self.filename)
+
+        df = pd.DataFrame(data, index=index)
+        for c in self.non_numeric_data.columns:
+            df[c] = self.non_numeric_data[c].values
+
+        return df[self.columns]
+
+    def discard(self):
+        """
+        Remove the memory-mapped file, if it still exists, without loading it.
+
+        """
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+
+def export_cost_curves(vehicles):
+    """
+    Replace the cost curves of the given vehicles with ``MappedFrame`` descriptors, prior to sending the vehicles to
+    (or returning them from) a pool worker.
+
+    Args:
+        vehicles ([Vehicle or CompositeVehicle]): the vehicles to export the cost curves of
+
+    Returns:
+        The number of bytes written to memory-mapped files
+
+    """
+    nbytes = 0
+
+    for v in vehicles:
+        if isinstance(v.cost_curve, pd.DataFrame):
+            v.cost_curve = MappedFrame(v.cost_curve)
+            nbytes += v.cost_curve.nbytes
+
+    return nbytes
+
+
+def import_cost_curves(vehicles):
+    """
+    Restore the cost curves of the given vehicles from their ``MappedFrame`` descriptors, if any.
+
+    Args:
+        vehicles ([Vehicle or CompositeVehicle]): the vehicles to import the cost curves of
+
+    Returns:
+        The number of bytes read from memory-mapped files
+
+    """
+    nbytes = 0
+
+    for v in vehicles:
+        if isinstance(v.cost_curve, MappedFrame):
+            nbytes += v.cost_curve.nbytes
+            v.cost_curve = v.cost_curve.load()
+
+    return nbytes
+
+
+def discard_cost_curves(vehicles):
+    """
+    Remove the memory-mapped files of the given vehicles' ``MappedFrame`` cost curves, if any, without loading them.
+    Used to clean up after a pool worker error, when the cost curves will not be imported.
+
+    Args:
+        vehicles ([Vehicle or CompositeVehicle]): the vehicles to discard the cost curve files of
+
+    """
+    for v in vehicles:
+        if isinstance(v.cost_curve, MappedFrame):
+            v.cost_curve.discard()
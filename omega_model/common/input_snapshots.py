@@ -0,0 +1,341 @@
+"""
+
+**Routines to save and restore the post-validation state of input file initializers.**
+
+Most of the input files in a batch are shared by most (or all) of its sessions, yet each session reads, validates and
+converts them again during ``omega.init_omega()``.  ``InputSnapshots`` runs an ``init_from_file()``-style routine the
+first time a given input is seen, stores the resulting class (and module) data as a binary (pickle) snapshot and then
+restores the snapshot instead of re-running the routine on subsequent sessions.
+
+Snapshots are keyed by:
+
+    * the input file name(s), since each session in a bundled batch reads its own copy of the input files
+    * a hash of the input file contents
+    * the input template name and version from the header row of the input file
+    * a hash of the source code of the module that reads the input file
+    * the values of any session settings the initializer depends on
+    * a hash of the contents of any other input files the initializer depends on (e.g. for validation)
+    * the Python and pandas versions
+
+Editing an input file, its template version or the code that reads it automatically invalidates the matching
+snapshot.  Snapshots can also be explicitly invalidated by calling ``InputSnapshots.invalidate()``, by setting the
+``clear_input_snapshots`` session setting to ``True`` or by running this module as a script.
+
+Snapshots are only used when the ``use_input_snapshots`` session setting is ``True``, in which case they are stored in
+the ``input_snapshot_folder``.  A summary of the initialization time of each snapshot-capable initializer is written
+to the session log by ``InputSnapshots.report()``.
+
+----
+
+**CODE**
+
+"""
+
+print('importing %s' % __file__)
+
+from omega_model import *
+
+import copyreg
+import hashlib
+import inspect
+import marshal
+import pickle
+import types
+
+
+def _reduce_code(code):
+    """
+    Pickle reducer for code objects (e.g. ``compile()``'d input file equations), which are not picklable by default.
+
+    Args:
+        code (code): the code object to reduce
+
+    Returns:
+        tuple of the callable and its arguments that re-create the code object when unpickled
+
+    """
+    return marshal.loads, (marshal.dumps(code),)
+
+
+class InputSnapshots(OMEGABase):
+    """
+    **Saves and restores the post-validation state of input file initializers.**
+
+    """
+    snapshot_extension = '.pkl'
+
+    _report = []  # private list of (description, status, seconds) for the session startup-time report
+
+    @staticmethod
+    def _hash_file(filename):
+        """
+        Calculate the hash of a file's contents.
+
+        Args:
+            filename (str): name of the file to hash
+
+        Returns:
+            The hex digest of the file contents
+
+        """
+        with open(filename, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+
+    @staticmethod
+    def calc_snapshot_key(init_function, filenames, key_options=(), extra_key_files=()):
+        """
+        Calculate the snapshot key of an initializer and its input file(s).
+
+        Args:
+            init_function (function): the initializer, e.g. ``OnroadFuel.init_from_file``
+            filenames ([strs]): the input file name(s) passed to the initializer
+            key_options ([strs]): names of session settings the initializer depends on, e.g. ``['context_id']``
+            extra_key_files ([strs]): names of other input files the initializer depends on, e.g. the drive cycles
+                file used to validate cost cloud columns
+
+        Returns:
+            The snapshot key hex digest
+
+        """
+        key = [sys.version, pd.__version__, init_function.__qualname__,
+               InputSnapshots._hash_file(inspect.getsourcefile(init_function))]
+
+        for filename in filenames:
+            version_data = pd.read_csv(filename, header=None, nrows=1).values.tolist()[0]
+            key += [file_io.get_filenameext(filename), InputSnapshots._hash_file(filename)] + \
+                [str(v) for v in version_data if v == v]
+
+        key += ['%s=%s' % (o, omega_globals.options.__getattribute__(o)) for o in key_options]
+
+        key += [InputSnapshots._hash_file(filename) for filename in extra_key_files]
+
+        return hashlib.sha1('|'.join(key).encode()).hexdigest()
+
+    @staticmethod
+    def get_snapshot_filename(owner, snapshot_key):
+        """
+        Get the snapshot pathname of a snapshot key.
+
+        Args:
+            owner (class): the class whose data is stored in the snapshot
+            snapshot_key (str): the snapshot key, from ``calc_snapshot_key()``
+
+        Returns:
+            The snapshot pathname
+
+        """
+        return omega_globals.options.input_snapshot_folder + '%s_%s%s' % \
+            (owner.__name__, snapshot_key, InputSnapshots.snapshot_extension)
+
+    @staticmethod
+    def save(snapshot_filename, state):
+        """
+        Save a snapshot.  The snapshot is written to a temporary file first then renamed so concurrent sessions never
+        read a partially written snapshot.
+
+        Args:
+            snapshot_filename (str): the snapshot pathname
+            state (dict): the snapshot data
+
+        Returns:
+            Nothing, writes the snapshot file
+
+        """
+        temp_filename = '%s.%d' % (snapshot_filename, os.getpid())
+
+        with open(temp_filename, 'wb') as f:
+            pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickler.dispatch_table = copyreg.dispatch_table.copy()
+            pickler.dispatch_table[types.CodeType] = _reduce_code
+            pickler.dump(state)
+
+        os.replace(temp_filename, snapshot_filename)
+
+    @staticmethod
+    def load(snapshot_filename):
+        """
+        Load a snapshot.
+
+        Args:
+            snapshot_filename (str): the snapshot pathname
+
+        Returns:
+            The snapshot data
+
+        """
+        with open(snapshot_filename, 'rb') as f:
+            return pickle.load(f)
+
+    @staticmethod
+    def init_from_file(init_function, filenames, owner, attributes, module_data=(), key_options=(),
+                       extra_key_files=(), verbose=False):
+        """
+        Run an input file initializer, or restore its results from a snapshot if one is available.
+
+        The snapshot holds the given ``owner`` class attributes and module-level dicts as they were after a
+        successful (error-free) run of the initializer, as well as the input file metadata appended by
+        ``validate_template_version_info()`` so the session's input file records are unaffected by the snapshot.
+        Initializers that return errors are never snapshotted, so errors are always reported.
+
+        Args:
+            init_function (function): the initializer, e.g. ``OnroadFuel.init_from_file``, called with the
+                ``filenames`` as positional arguments
+            filenames (str or [strs]): the input file name(s) passed to the initializer
+            owner (class): the class whose data is populated by the initializer, e.g. ``OnroadFuel``
+            attributes ([strs]): names of the ``owner`` class attributes populated by the initializer
+            module_data ([strs]): names of the module-level dicts of the ``owner`` class's module populated by the
+                initializer, if any
+            key_options ([strs]): names of session settings the initializer depends on, if any
+            extra_key_files ([strs]): names of other input files the initializer depends on, if any, their contents
+                are part of the snapshot key
+            verbose (bool): enable additional console and logfile output if True
+
+        Returns:
+            List of template/input errors, else empty list on success
+
+        """
+        start_time = time.time()
+
+        if type(filenames) is str:
+            filenames = [filenames]
+
+        module = sys.modules[owner.__module__]
+        metadata = omega_globals.options.inputfile_metadata
+
+        status = 'init'
+        snapshot_filename = None
+
+        if omega_globals.options.use_input_snapshots:
+            snapshot_filename = InputSnapshots.get_snapshot_filename(
+                owner, InputSnapshots.calc_snapshot_key(init_function, filenames, key_options,
+                                                        extra_key_files))
+
+            if os.path.exists(snapshot_filename):
+                try:
+                    state = InputSnapshots.load(snapshot_filename)
+
+                    for attribute, value in state['attributes'].items():
+                        setattr(owner, attribute, value)
+
+                    for name, value in state['module_data'].items():
+                        module.__dict__[name].clear()
+                        module.__dict__[name].update(value)
+
+                    # input file metadata starts with the file path, which is specific to the session
+                    filepaths = dict(zip([file_io.get_filenameext(f) for f in filenames],
+                                         [file_io.get_filepath(f) for f in filenames]))
+                    for md in state['inputfile_metadata']:
+                        metadata.append([filepaths.get(md[1], md[0])] + md[1:])
+
+                    if verbose:
+                        omega_log.logwrite('\nRestored %s from snapshot %s' % (owner.__name__, snapshot_filename))
+
+                    InputSnapshots._report.append((owner.__name__, 'restored', time.time() - start_time))
+
+                    return []
+
+                except Exception:
+                    omega_log.logwrite('*** Unable to restore snapshot %s, re-initializing ***' % snapshot_filename)
+                    status = 'refreshed'
+            else:
+                status = 'saved'
+
+        num_metadata = len(metadata)
+
+        template_errors = init_function(*filenames, verbose=verbose)
+
+        if snapshot_filename and not template_errors:
+            state = {'attributes': {a: owner.__dict__[a] for a in attributes},
+                     'module_data': {d: dict(module.__dict__[d]) for d in module_data},
+                     'inputfile_metadata': metadata[num_metadata:],
+                     }
+            try:
+                InputSnapshots.save(snapshot_filename, state)
+            except Exception:
+                omega_log.logwrite('*** Unable to save snapshot %s ***\n%s' %
+                                   (snapshot_filename, traceback.format_exc()))
+                status = 'unsaved'
+
+        InputSnapshots._report.append((owner.__name__, status, time.time() - start_time))
+
+        return template_errors
+
+    @staticmethod
+    def invalidate(owner=None):
+        """
+        Delete snapshots from the ``input_snapshot_folder``.
+
+        Args:
+            owner (class): the class whose snapshots are to be deleted, or ``None`` to delete all snapshots
+
+        Returns:
+            The number of deleted snapshots
+
+        """
+        folder = omega_globals.options.input_snapshot_folder
+
+        num_deleted = 0
+        if os.path.isdir(folder):
+            for filename in os.listdir(folder):
+                if filename.endswith(InputSnapshots.snapshot_extension) and \
+                        (owner is None or filename.startswith('%s_' % owner.__name__)):
+                    os.remove(folder + filename)
+                    num_deleted += 1
+
+        return num_deleted
+
+    @staticmethod
+    def init():
+        """
+        Initialize the startup-time report and the snapshot folder, and clear the snapshots if the
+        ``clear_input_snapshots`` session setting is ``True``.
+
+        Returns:
+            Nothing, updates ``InputSnapshots._report`` and the ``input_snapshot_folder``
+
+        """
+        InputSnapshots._report = []
+
+        if omega_globals.options.use_input_snapshots:
+            file_io.validate_folder(omega_globals.options.input_snapshot_folder)
+
+            if omega_globals.options.clear_input_snapshots:
+                num_deleted = InputSnapshots.invalidate()
+                omega_log.logwrite('Cleared %d input snapshots from %s' %
+                                   (num_deleted, omega_globals.options.input_snapshot_folder))
+
+    @staticmethod
+    def report():
+        """
+        Write the startup-time report to the session log: the initialization time and snapshot status of each
+        snapshot-capable initializer.
+
+        Returns:
+            Nothing, writes to the session log
+
+        """
+        if InputSnapshots._report:
+            omega_log.logwrite('\nInput initialization times (snapshots %s):' %
+                               ('enabled' if omega_globals.options.use_input_snapshots else 'disabled'))
+
+            for name, status, seconds in InputSnapshots._report:
+                omega_log.logwrite('  %-30s %-10s %8.3f s' % (name, status, seconds))
+
+            omega_log.logwrite('  %-30s %-10s %8.3f s\n' %
+                               ('total', '', sum([r[2] for r in InputSnapshots._report])))
+
+
+if __name__ == '__main__':
+    try:
+        if '__file__' in locals():
+            print(file_io.get_filenameext(__file__))
+
+        # set up global variables:
+        omega_globals.options = OMEGASessionSettings()
+
+        print('Deleted %d input snapshots from %s' %
+              (InputSnapshots.invalidate(), omega_globals.options.input_snapshot_folder))
+
+    except:
+        print("\n#RUNTIME FAIL\n%s\n" % traceback.format_exc())
+        sys.exit(-1)
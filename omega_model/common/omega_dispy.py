@@ -88,7 +88,7 @@ def restart_job(job):
         if dispy_debug:
             sysprint('#### Retrying job %s ####\n' % job_id_str)
         new_job = dispycluster.cluster.submit(job.id['batch_name'], job.id['batch_path'], job.id['batch_file'],
-                                              job.id['session_num'], job.id['session_name'])
+                                              job.id['session_num'], job.id['session_name'], job.id['no_plots'])
         if new_job is not None:
             new_job.id = job.id
             _retry_count[str(job.id)] += 1
@@ -215,7 +215,8 @@ def status_cb(status, node, job):
     return
 
 
-def dispy_run_session(batch_name, network_batch_path_root, batch_file, session_num, session_name, retry_count=0):
+def dispy_run_session(batch_name, network_batch_path_root, batch_file, session_num, session_name, no_plots=False,
+                      retry_count=0):
     """
     Runs an OMEGA simulation session on a DispyNode.
 
@@ -225,6 +226,7 @@ def dispy_run_session(batch_name, network_batch_path_root, batch_file, session_n
         batch_file (str): path to the batch file being run
         session_num (int): the session number to be run
         session_name (str): the name of the session being run
+        no_plots (bool): if ``True`` then the session is run with ``--no_plots``
         retry_count (int): retry count of the session
 
     """
@@ -235,6 +237,9 @@ def dispy_run_session(batch_name, network_batch_path_root, batch_file, session_n
         sys.executable, network_batch_path_root, batch_name, network_batch_path_root, batch_file, session_num,
         ).replace('/', os.sep)
 
+    if no_plots:
+        cmd += ' --no_plots'
+
     sysprint('.')
     sysprint(cmd)
     sysprint('.')
@@ -263,7 +268,7 @@ def dispy_run_session(batch_name, network_batch_path_root, batch_file, session_n
         if retry_count < 3:
             sysprint('@@@ Trying Session "%s" again (attempt %d)... @@@' % (session_name, retry_count + 1))
             dispy_run_session(batch_name, network_batch_path_root, batch_file, session_num, session_name,
-                              retry_count=retry_count + 1)
+                              no_plots=no_plots, retry_count=retry_count + 1)
         else:
             sysprint('!!! Abandoning Session "%s"... !!!' % session_name)
 
@@ -459,10 +464,11 @@ class DispyCluster(object):
             else:
                 print("Submitting Session '%s' to Cluster..." % batch.sessions[session_num].name)
                 job = self.cluster.submit(batch_name, batch_path, batch_file, session_num,
-                                          batch.sessions[session_num].name)
+                                          batch.sessions[session_num].name, not self.options.postproc_plots)
                 if job is not None:
                     job.id = dict({'batch_name': batch_name, 'batch_path': batch_path, 'batch_file': batch_file,
-                                   'session_num': session_num, 'session_name': batch.sessions[session_num].name})
+                                   'session_num': session_num, 'session_name': batch.sessions[session_num].name,
+                                   'no_plots': not self.options.postproc_plots})
                     session_jobs.append(job)
                 else:
                     print('*** Job Submit Failed %s ***' % str(job.id), file=sys.stderr)
@@ -115,6 +115,62 @@ def sales_weight_average_dataframe(df):
     return avg_df
 
 
+def sales_weight_average_groups(df, groupby_columns):
+    """
+    Column-wise equivalent of ``df.groupby(groupby_columns, as_index=False).apply(sales_weight_average_dataframe)``.
+    The numeric columns of each group are weighted (or summed) in a single array operation, rather than one operation
+    per column.
+
+    Args:
+        df (DataFrame): the dataframe to sales-weight
+        groupby_columns ([strs]): the names of the columns to group by
+
+    Returns:
+        DataFrame with one row per group, with sales-weighted-average numeric columns and combined non-numeric columns
+
+    """
+    numeric_columns = [c for c in df.columns if is_numeric_dtype(df[c])]
+    non_numeric_columns = [c for c in df.columns if not is_numeric_dtype(df[c])]
+
+    weighted_columns = [c for c in numeric_columns if 'sales' not in c and c != 'model_year']
+    summed_columns = [c for c in numeric_columns if 'sales' in c]
+
+    # one row per column, so that each group's values are summed along contiguous rows, in the same order as a 1-D sum
+    weighted_values = np.ascontiguousarray(df[weighted_columns].to_numpy(dtype=float).T)
+    summed_values = np.ascontiguousarray(df[summed_columns].to_numpy(dtype=float).T)
+    sales = df['sales'].values
+    non_numeric_values = [df[c].values for c in non_numeric_columns]
+
+    group_indices = list(df.groupby(groupby_columns).indices.values())
+
+    weighted_results = np.empty((len(weighted_columns), len(group_indices)))
+    summed_results = np.empty((len(summed_columns), len(group_indices)))
+    non_numeric_results = [[] for _ in non_numeric_columns]
+
+    for group_index, row_indices in enumerate(group_indices):
+        group_sales = sales[row_indices]
+        weighted_results[:, group_index] = \
+            np.nansum(np.take(weighted_values, row_indices, axis=1) * group_sales, axis=1) / np.sum(group_sales)
+        summed_results[:, group_index] = np.nansum(np.take(summed_values, row_indices, axis=1), axis=1)
+
+        for results, values in zip(non_numeric_results, non_numeric_values):
+            results.append(':'.join(pd.unique(values[row_indices])))
+
+    avg_dict = dict(zip(weighted_columns, weighted_results))
+    avg_dict.update(zip(summed_columns, summed_results))
+    avg_dict.update(zip(non_numeric_columns, non_numeric_results))
+
+    avg_df = pd.DataFrame({c: avg_dict[c] for c in numeric_columns + non_numeric_columns if c in avg_dict})
+
+    # group columns that are not averaged, e.g. 'model_year', lead the results, as with groupby(as_index=False)
+    first_rows = [row_indices[0] for row_indices in group_indices]
+    for c in reversed(list(dict.fromkeys(groupby_columns))):
+        if c not in avg_df:
+            avg_df.insert(0, c, df[c].values[first_rows])
+
+    return avg_df
+
+
 def plot_frontier(cost_cloud, cost_curve_name, frontier_df, x_key, y_key):
     """
     Plot a cloud and its frontier.  Saves plot to ``o2.options.output_folder``.
@@ -24,3 +24,4 @@ cumulative_battery_GWh = {'total': 0}  #: holds cumulative battery GWh productio
 share_precision = int(str.split(str(sys.float_info.epsilon), 'e-')[1])-1  #: round to the Nth digit when calculating share values in constraint dicts
 constraints = dict()  #: dict of constraint dicts by market category
 finalized_vehicles = []  #: finalized vehicles
+pool = None  #: session multiprocessing worker pool, if any
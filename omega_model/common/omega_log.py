@@ -10,8 +10,15 @@
 
 print('importing %s' % __file__)
 
+import array
+import os
+import uuid
+
+import numpy as np
+import pandas as pd
+
 from common import omega_globals  # import global variables
-from common.omega_types import OMEGABase
+from common.omega_types import OMEGABase, _int_types, _numeric_types
 
 
 class IterationLog(OMEGABase):
@@ -50,6 +57,235 @@ class IterationLog(OMEGABase):
             dataframe.to_csv(self.logfilename, mode='a', header=False, columns=sorted(dataframe.columns))
 
 
+class ColumnarIterationLog(OMEGABase):
+    """
+    Append-only columnar store of producer-consumer iteration data, used in place of a list of pandas Series.
+
+    The column schema is discovered on the first append and extended as new columns appear.  Numeric values are held
+    in typed column buffers (``array.array``), other values in object column buffers.  Appended rows are referenced
+    until ``commit()`` is called, so in-place updates to a logged row are captured until then, as they were by the
+    list of Series.  Committed rows may optionally be spilled to temporary files in the output folder.
+
+    """
+    def __init__(self, column_prefixes=None, spill_rows=0):
+        """
+        Create ColumnarIterationLog object
+
+        Args:
+            column_prefixes ([strs]): optional list of column name prefixes to log, other columns are ignored, or
+                ``None`` to log all columns
+            spill_rows (int): if > 0, the number of committed rows at which the column buffers are written to a
+                temporary file in the output folder
+
+        """
+        self.column_prefixes = tuple(column_prefixes) if column_prefixes else None
+        self.spill_rows = spill_rows
+        self._chunks = []  # list of prior chunks, DataFrames or temporary file pathnames
+        self._pending = []  # rows appended since the last commit
+        self._logged_columns = dict()  # bool by column name, True if column is logged
+        self._buffers = dict()  # column buffers by column name, array.array or list
+        self._num_rows = 0  # number of rows in the column buffers
+
+    def __len__(self):
+        """
+        Get the number of rows in the log, excluding spilled rows.
+
+        Returns:
+            The number of committed rows in the column buffers and prior in-memory chunks plus the number of pending
+            rows
+
+        """
+        return self._num_rows + len(self._pending) + \
+            sum(len(chunk) for chunk in self._chunks if isinstance(chunk, pd.DataFrame))
+
+    def append(self, row):
+        """
+        Append a row, or the rows of a DataFrame, to the log.
+
+        Args:
+            row (Series, dict or DataFrame): the row(s) to log
+
+        """
+        if isinstance(row, pd.DataFrame):
+            self._pending.extend(row.to_dict('records'))
+        else:
+            self._pending.append(row)
+
+    def extend(self, iteration_log):
+        """
+        Append the rows of another log to the log.
+
+        Args:
+            iteration_log (ColumnarIterationLog): the log to append
+
+        """
+        self.commit()
+        self._close_buffers()
+
+        iteration_log.commit()
+        iteration_log._close_buffers()
+
+        self._chunks.extend(iteration_log._chunks)
+
+    def commit(self):
+        """
+        Copy the pending rows into the column buffers, spilling the buffers to a temporary file if there are at least
+        ``spill_rows`` rows.
+
+        """
+        for row in self._pending:
+            self._append_row(row)
+
+        self._pending = []
+
+        if 0 < self.spill_rows <= self._num_rows:
+            self._spill_buffers()
+
+    def get_dataframe(self):
+        """
+        Get the logged rows as a DataFrame.
+
+        Returns:
+            DataFrame of the logged rows, one column per logged column
+
+        """
+        self.commit()
+
+        frames = [pd.read_pickle(chunk) if type(chunk) is str else chunk for chunk in self._chunks]
+        frames.append(self._buffers_to_dataframe())
+        frames = [f for f in frames if not f.empty]
+
+        if frames:
+            return pd.concat(frames, ignore_index=True, sort=False)
+        else:
+            return pd.DataFrame()
+
+    def clear(self):
+        """
+        Remove all rows from the log, including temporary files.
+
+        """
+        for chunk in self._chunks:
+            if type(chunk) is str and os.path.exists(chunk):
+                os.remove(chunk)
+
+        self._chunks = []
+        self._pending = []
+        self._buffers = dict()
+        self._num_rows = 0
+
+    def _is_logged(self, column):
+        """
+        Determine if a column is logged, based on ``column_prefixes``.
+
+        Args:
+            column (str): the column name
+
+        Returns:
+            ``True`` if the column is logged
+
+        """
+        if column not in self._logged_columns:
+            self._logged_columns[column] = self.column_prefixes is None or str(column).startswith(self.column_prefixes)
+
+        return self._logged_columns[column]
+
+    def _append_row(self, row):
+        """
+        Copy a row into the column buffers, adding new column buffers as required.
+
+        Args:
+            row (Series or dict): the row to copy
+
+        """
+        if isinstance(row, pd.Series):
+            items = zip(row.index, row.values)
+        else:
+            items = row.items()
+
+        for column, value in items:
+            if not self._is_logged(column):
+                continue
+
+            value_type = type(value)
+            buffer = self._buffers.get(column)
+
+            if buffer is None:
+                # new column, backfill prior rows
+                if value_type in _int_types and not self._num_rows:
+                    buffer = array.array('q')
+                elif value_type in _numeric_types:
+                    buffer = array.array('d', [np.nan]) * self._num_rows
+                else:
+                    buffer = [np.nan] * self._num_rows
+                self._buffers[column] = buffer
+            elif len(buffer) > self._num_rows:
+                continue  # duplicate column in row
+
+            if type(buffer) is list:
+                buffer.append(value)
+            elif value_type in _int_types and buffer.typecode == 'q':
+                buffer.append(value)
+            elif value_type in _numeric_types:
+                if buffer.typecode == 'q':
+                    buffer = self._buffers[column] = array.array('d', buffer)
+                buffer.append(value)
+            else:
+                buffer = self._buffers[column] = buffer.tolist()
+                buffer.append(value)
+
+        self._num_rows += 1
+
+        # fill columns not in row
+        for column, buffer in self._buffers.items():
+            if len(buffer) < self._num_rows:
+                if type(buffer) is list:
+                    buffer.append(np.nan)
+                else:
+                    if buffer.typecode == 'q':
+                        buffer = self._buffers[column] = array.array('d', buffer)
+                    buffer.append(np.nan)
+
+    def _buffers_to_dataframe(self):
+        """
+        Create a DataFrame from the column buffers.
+
+        Returns:
+            DataFrame of the rows in the column buffers
+
+        """
+        data = dict()
+        for column, buffer in self._buffers.items():
+            if type(buffer) is list:
+                data[column] = pd.Series(buffer, dtype=object).infer_objects().values
+            else:
+                data[column] = np.frombuffer(buffer, dtype=np.int64 if buffer.typecode == 'q' else np.float64).copy()
+
+        return pd.DataFrame(data, index=pd.RangeIndex(self._num_rows))
+
+    def _close_buffers(self):
+        """
+        Move the rows in the column buffers to a new in-memory chunk.
+
+        """
+        if self._num_rows:
+            self._chunks.append(self._buffers_to_dataframe())
+            self._buffers = dict()
+            self._num_rows = 0
+
+    def _spill_buffers(self):
+        """
+        Write the rows in the column buffers to a temporary file in the output folder.
+
+        """
+        filename = '%s%s__iteration_log_%s.pkl' % (omega_globals.options.output_folder,
+                                                   omega_globals.options.session_unique_name, uuid.uuid4().hex)
+        self._buffers_to_dataframe().to_pickle(filename)
+        self._chunks.append(filename)
+        self._buffers = dict()
+        self._num_rows = 0
+
+
 class OMEGABatchLog(OMEGABase):
     """
     Handles logfile creation at the batch level.
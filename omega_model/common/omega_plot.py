@@ -100,6 +100,22 @@ def figure(reuse_figure=False):
     return fig, ax1
 
 
+def save_pickled_figure(pickled_figure, filename):
+    """
+    Save a pickled figure to a file then close it, e.g. to render figures in a worker process.
+
+    Args:
+        pickled_figure (bytes): the pickled figure, e.g. from ``pickle.dumps(fig)``
+        filename (str): the name of the file to save
+
+    """
+    import pickle
+
+    fig = pickle.loads(pickled_figure)
+    fig.savefig(filename)
+    plt.close(fig)
+
+
 def fplothg(x, y, *args, reuse_figure=False, **kwargs):
     """
     Shortcut for figure, plot, hold on, grid on (based on Matlab plotting terminology)
@@ -203,6 +203,64 @@ class WeightedTree(OMEGABase):
             eq_str = '%s)' % eq_str[0:max(eq_str.rfind(']',), eq_str.rfind(')',))+1]
             return n.data.weighted_value, eq_str
 
+    @staticmethod
+    def calc_node_coefficients(tree, node_id, weighted=True):
+        """
+        Calculate leaf coefficients of a node, the node value (or weighted value) is the sum of each leaf value times
+        its coefficient.  Equivalent to the equation string of ``calc_node_weighted_value()``, but in a form that can
+        be evaluated as a vector product, independent of the leaf values.
+
+        Args:
+            tree (treelib.Tree): the tree to query
+            node_id (str): the id of the node to query
+            weighted (bool): if ``True`` then return weighted value coefficients, else return node value coefficients
+
+        Returns:
+            dict of leaf coefficients by leaf node id, leaves with a weight of ``None`` or 0 are omitted
+
+        """
+        if not tree.children(node_id):
+            if tree.get_node(node_id) is None:
+                raise Exception(
+                    '*** Missing drive cycle "%s" in input to WeightedTree.calc_node_coefficients() ***' % node_id)
+
+            if tree.get_node(node_id).data.weight:
+                return {node_id: tree.get_node(node_id).data.weight}
+            else:
+                return dict()
+        else:
+            n = tree.get_node(node_id)
+            if n.data.weight != 1 and n.data.weight is not None and weighted:
+                scale = n.data.weight
+            else:
+                scale = 1
+
+            coefficients = dict()
+            for child in tree.children(node_id):
+                for leaf_id, coefficient in WeightedTree.calc_node_coefficients(tree, child.identifier).items():
+                    coefficients[leaf_id] = coefficients.get(leaf_id, 0) + scale * coefficient
+
+            return coefficients
+
+    def calc_coefficients(self, node_id=None, weighted=False):
+        """
+        Calculate leaf coefficients of the given ``node_id``, or of the root if no ``node_id`` is provided.
+
+        Args:
+            node_id (str): node id to calculate the coefficients of, or tree root if not provided
+            weighted (bool): if True then return weighted value coefficients, else return node value coefficients
+
+        Returns:
+            tuple of leaf node ids and an array of their coefficients
+
+        """
+        if node_id is None:
+            node_id = self.tree.root
+
+        coefficients = WeightedTree.calc_node_coefficients(self.tree, node_id, weighted)
+
+        return list(coefficients.keys()), np.array(list(coefficients.values()), dtype=float)
+
     def calc_value(self, values_dict, node_id=None, weighted=False):
         """
         Assign values to tree leaves then calculate the value or weighted value at the given ``node_id`` or at the root
@@ -13,6 +13,11 @@ print('importing %s' % __file__)
 
 import re
 
+import numpy as np
+
+_int_types = {int, np.int32, np.int64}
+_numeric_types = _int_types | {float, np.float32, np.float64}
+
 
 def make_valid_python_identifier(s):
     """
@@ -174,6 +179,64 @@ class OMEGABase:
 
         return d
 
+    @staticmethod
+    def to_bulk_dataframe(objects, types=None):
+        """
+        Generate a dataframe of the attributes of many objects at once, one row per object.  Equivalent to
+        ``pd.DataFrame([o.to_dict(types) for o in objects])`` but without creating a dict per object.  The column
+        schema is gathered once per distinct set of object attributes rather than once per object, then each column
+        is filled directly and given a typed dtype (``int64``, ``float64``, ``bool`` or ``object``).
+
+        Args:
+            objects (list): the objects to export, may also be a list of dicts (e.g. annual data records)
+            types (list): optional list of attribute types to export, e.g. ``[int, float, str]``, attributes of other
+                types are left empty (NaN) and columns with no attributes of the given types are omitted
+
+        Returns:
+            A dataframe representation of the objects
+
+        """
+        records = [o if type(o) is dict else o.__dict__ for o in objects]
+
+        # gather column names, in order of first appearance, checking each distinct attribute set only once
+        columns = dict()
+        prior_keys = None
+        for r in records:
+            keys = r.keys()
+            if keys != prior_keys:
+                columns.update(dict.fromkeys(keys))
+                prior_keys = keys
+
+        columns = list(columns)
+        if types:
+            columns = sorted(columns)
+            types = set(types)
+
+        data = dict()
+        for k in columns:
+            if types:
+                values = [r[k] if k in r and type(r[k]) in types else None for r in records]
+                if values.count(None) == len(values):
+                    continue
+                values = [np.nan if v is None else v for v in values]
+            else:
+                values = [r.get(k, np.nan) for r in records]
+
+            value_types = set(map(type, values))
+
+            if value_types <= _int_types:
+                data[k] = np.array(values, dtype=np.int64)
+            elif value_types <= _numeric_types:
+                data[k] = np.array(values, dtype=np.float64)
+            elif value_types == {bool}:
+                data[k] = np.array(values, dtype=bool)
+            elif value_types <= {str, float}:
+                data[k] = np.array(values, dtype=object)
+            else:
+                data[k] = pd.Series(values).values
+
+        return pd.DataFrame(data, columns=list(data), index=pd.RangeIndex(len(records)))
+
     def to_namedtuple(self):
         """
         Generate a named tuple of object attributes
@@ -318,6 +381,112 @@ class OMEGAEnum(OMEGABase):
         return self.__dict.items()
 
 
+class StartYearTable(OMEGABase):
+    """
+    Maps years to the applicable "start year" of step-function input data, i.e. data that applies from its start year
+    until the next start year.  A dense year -> start year index is precomputed over the span of the start years so
+    lookups are an array index rather than a scan of the start years, and arrays of years can be looked up at once.
+
+    Example
+
+    ::
+
+        >>>start_year_table = StartYearTable([2020, 2023, 2027])
+
+        >>>start_year_table.get_start_year(2025)
+        2023
+
+        >>>start_year_table.get_start_year(2019) is None
+        True
+
+        >>>start_year_table.get_start_years(np.array([2019, 2020, 2026, 2050]))
+        array([  -1, 2020, 2023, 2027])
+
+    """
+    def __init__(self, start_years):
+        """
+        Create StartYearTable object from a list of start years.
+
+        Args:
+            start_years (list or array): the start years, in any order, duplicates are ignored
+
+        """
+        self.start_years = np.unique(np.atleast_1d(start_years)).astype(int)  #: sorted unique start years
+        self.first_year = self.start_years[0]
+
+        # dense start year index from the first to the last start year:
+        years = np.arange(self.first_year, self.start_years[-1] + 1)
+        self._dense_indices = np.searchsorted(self.start_years, years, side='right') - 1
+
+    def get_indices(self, years):
+        """
+        Get the index into ``start_years`` of the applicable start year of each of the given years.
+
+        Args:
+            years (array): the years to look up
+
+        Returns:
+            Array of ``start_years`` indices, -1 where a year precedes the first start year
+
+        """
+        dense_indices = np.minimum(np.asarray(years).astype(int) - self.first_year, len(self._dense_indices) - 1)
+
+        return np.where(dense_indices < 0, -1, self._dense_indices[np.maximum(dense_indices, 0)])
+
+    def get_start_years(self, years):
+        """
+        Get the applicable start year of each of the given years.
+
+        Args:
+            years (array): the years to look up
+
+        Returns:
+            Array of start years, -1 where a year precedes the first start year
+
+        """
+        indices = self.get_indices(years)
+
+        return np.where(indices < 0, -1, self.start_years[indices])
+
+    def get_index(self, year):
+        """
+        Get the index into ``start_years`` of the applicable start year of a year.
+
+        Args:
+            year (int): the year to look up
+
+        Returns:
+            The ``start_years`` index, or ``None`` if the year precedes the first start year
+
+        """
+        dense_index = int(year) - self.first_year
+
+        if dense_index < 0:
+            return None
+        elif dense_index >= len(self._dense_indices):
+            return len(self.start_years) - 1
+        else:
+            return int(self._dense_indices[dense_index])
+
+    def get_start_year(self, year):
+        """
+        Get the applicable start year of a year.
+
+        Args:
+            year (int): the year to look up
+
+        Returns:
+            The start year, or ``None`` if the year precedes the first start year
+
+        """
+        index = self.get_index(year)
+
+        if index is None:
+            return None
+        else:
+            return int(self.start_years[index])
+
+
 if __name__ == "__main__":
     import os, traceback
 
@@ -337,6 +506,10 @@ if __name__ == "__main__":
 
         print(test_enum['foo'])
         print(test_enum['space_force'])
+
+        start_year_table = StartYearTable([2027, 2020, 2023])
+        print(start_year_table.get_start_year(2025), start_year_table.get_start_year(2019))
+        print(start_year_table.get_start_years(np.array([2019, 2020, 2026, 2050])))
     except:
         print("\n#RUNTIME FAIL\n%s\n" % traceback.format_exc())
         sys.exit(-1)
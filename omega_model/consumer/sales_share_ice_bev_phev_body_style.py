@@ -220,82 +220,61 @@ class SalesShare(OMEGABase, SalesShareBase):
         if omega_globals.options.flat_context:
             calendar_year = omega_globals.options.flat_context_year
 
-        sales_share_denominator = 0
-        sales_share_numerator = dict()
-
         market_class_data['consumer_constrained_%s' % parent_market_class] = FALSE
 
-        for pass_num in [0, 1]:
-            for market_class_id in child_market_classes:
-                if pass_num == 0:
-                    total_cost_w_fuel_per_PMT = SalesShare.calc_consumer_generalized_cost(calendar_year,
-                                                                                          market_class_data,
-                                                                                          market_class_id,
-                                                                                          producer_decision)
-
-                    market_class_data['consumer_generalized_cost_dollars_%s' % market_class_id] = \
-                        total_cost_w_fuel_per_PMT
-
-                    gcam_data_cy = SalesShare.get_gcam_params(calendar_year, market_class_id)
-                    logit_exponent_mu = gcam_data_cy['logit_exponent_mu']
-                    sales_share_numerator[market_class_id] = gcam_data_cy['share_weight'] * (
-                            total_cost_w_fuel_per_PMT ** logit_exponent_mu)
-
-                    sales_share_denominator += sales_share_numerator[market_class_id]
+        min_constraints = omega_globals.constraints['min_constraints_%s' % parent_market_class]
+        max_constraints = omega_globals.constraints['max_constraints_%s' % parent_market_class]
 
-                else:
-                    min_constraints = omega_globals.constraints['min_constraints_%s' % parent_market_class]
-                    max_constraints = omega_globals.constraints['max_constraints_%s' % parent_market_class]
+        share_names = [mc.replace(parent_market_class + '.', '') for mc in child_market_classes]
+        share_columns = ['consumer_share_frac_%s' % mc for mc in child_market_classes]
+        abs_share_columns = ['consumer_abs_share_frac_%s' % mc for mc in child_market_classes]
 
-                    demanded_share_raw = sales_share_numerator[market_class_id] / sales_share_denominator
+        # share arrays are indexed by [child market class, market class data row]
+        generalized_costs = []
+        share_weights = []
+        logit_exponents = []
+        for market_class_id in child_market_classes:
+            total_cost_w_fuel_per_PMT = SalesShare.calc_consumer_generalized_cost(calendar_year, market_class_data,
+                                                                                  market_class_id, producer_decision)
 
-                    # constrain relative (and by extension, absolute) shares RV
-                    share_name = market_class_id.replace(parent_market_class + '.', '')
-                    demanded_share = np.minimum(np.maximum(min_constraints[share_name], demanded_share_raw),
-                                                max_constraints[share_name])
+            market_class_data['consumer_generalized_cost_dollars_%s' % market_class_id] = total_cost_w_fuel_per_PMT
 
-                    if all(demanded_share == max_constraints[share_name]):
-                        market_class_data['consumer_constrained_%s' % parent_market_class] = TRUE
+            gcam_data_cy = SalesShare.get_gcam_params(calendar_year, market_class_id)
+            generalized_costs.append(total_cost_w_fuel_per_PMT)
+            share_weights.append([gcam_data_cy['share_weight']])
+            logit_exponents.append([gcam_data_cy['logit_exponent_mu']])
 
-                    parent_share = market_class_data['consumer_abs_share_frac_%s' % parent_market_class].values
+        sales_share_numerators = np.array(share_weights) * np.array(generalized_costs) ** np.array(logit_exponents)
+        sales_share_denominator = np.sum(sales_share_numerators, axis=0)
 
-                    demanded_absolute_share = demanded_share * parent_share
+        min_shares = np.array([[min_constraints[share_name]] for share_name in share_names])
+        max_shares = np.array([[max_constraints[share_name]] for share_name in share_names])
 
-                    market_class_data['consumer_share_frac_%s' % market_class_id] = demanded_share
-                    market_class_data['consumer_abs_share_frac_%s' % market_class_id] = demanded_absolute_share
+        # constrain relative (and by extension, absolute) shares RV
+        demanded_shares = np.minimum(np.maximum(min_shares, sales_share_numerators / sales_share_denominator),
+                                     max_shares)
 
-        reconciliation_df = pd.DataFrame()
-        abs_share_columns = []
-        share_columns = []
-        share_names = []
-        for market_class_id in child_market_classes:
-            reconciliation_df['consumer_share_frac_%s' % market_class_id] = \
-                market_class_data['consumer_share_frac_%s' % market_class_id]
-            share_columns.append('consumer_share_frac_%s' % market_class_id)
-            abs_share_columns.append('consumer_abs_share_frac_%s' % market_class_id)
-            share_names.append(market_class_id.replace(parent_market_class + '.', ''))
+        if any(np.all(demanded_shares == max_shares, axis=1)):
+            market_class_data['consumer_constrained_%s' % parent_market_class] = TRUE
 
-        min_constraints = omega_globals.constraints['min_constraints_%s' % parent_market_class]
-        max_constraints = omega_globals.constraints['max_constraints_%s' % parent_market_class]
+        # reconcile shares with constraints so they sum to one
+        for N in range(len(child_market_classes), 0, -1):
+            change_needed = 1 - np.nansum(demanded_shares, axis=0)
 
-        for N in range(len(share_columns), 0, -1):
-            reconciliation_df['change_needed'] = 1 - reconciliation_df[share_columns].sum(axis=1)
+            demanded_shares = SalesShare.calc_attempted_shares(demanded_shares, change_needed, min_shares, max_shares,
+                                                               N)
 
-            for share_name, share_col in zip(share_names, share_columns):
-                reconciliation_df[share_col] = (
-                    reconciliation_df.apply(SalesShare.calc_attempted_share,
-                                            args=(share_col, min_constraints[share_name], max_constraints[share_name],
-                                                  N), axis=1))
+            if all(np.nansum(demanded_shares, axis=0) == 1):
+                break
 
-            reconciliation_df['sum'] = reconciliation_df[share_columns].sum(axis=1)
+        parent_share = market_class_data['consumer_abs_share_frac_%s' % parent_market_class].values
 
-            if all(reconciliation_df['sum'] == 1):
-                break
+        for share_col, abs_share_col, demanded_share in zip(share_columns, abs_share_columns, demanded_shares):
+            market_class_data[share_col] = demanded_share
+            market_class_data[abs_share_col] = demanded_share * parent_share
 
-        for share_name, share_col, abs_share_col in zip(share_names, share_columns, abs_share_columns):
-            market_class_data[share_col] = reconciliation_df[share_col]
-            demanded_absolute_share = market_class_data[share_col] * parent_share
-            market_class_data[abs_share_col] = demanded_absolute_share
+        for abs_share_col in abs_share_columns:
+            demanded_absolute_share = market_class_data[abs_share_col].values
 
             # distribute absolute shares to ALT / NO_ALT, NO_ALT first:
             for alt in ['NO_ALT', 'ALT']:
@@ -303,36 +282,33 @@ class SalesShare(OMEGABase, SalesShareBase):
                 if alt == 'NO_ALT':
                     market_class_data[share_id] = \
                         min_constraints[share_id.replace('consumer', 'producer')] * parent_share
-                    demanded_absolute_share -= market_class_data[share_id]
+                    demanded_absolute_share = demanded_absolute_share - market_class_data[share_id].values
                 else:
                     market_class_data[share_id] = demanded_absolute_share
 
         return market_class_data.copy()
 
     @staticmethod
-    def calc_attempted_share(row, share_col, MIN_SHARE, MAX_SHARE, N):
+    def calc_attempted_shares(shares, change_needed, min_shares, max_shares, N):
         """
-        Calculate a new share for ``share_col`` that attempts to satisfy constraints.
+        Calculate new shares that attempt to satisfy constraints, for all share categories and all rows (e.g. cross
+        subsidy options) at once.  Shares move by an equal part of the change needed, limited by the constraints.
 
         Args:
-            row (Series): share data to be reconciled with constraints
-            share_col (str): e.g. 'consumer_share_frac_sedan_wagon.BEV'
-            MIN_SHARE (float): e.g. ``0.092226211660941``
-            MAX_SHARE (float): e.g. ``0.193144311076143``
+            shares (2D array): shares to be reconciled with constraints, by share category (rows) and option (columns)
+            change_needed (array): share change needed by each option, i.e. one minus the sum of the shares
+            min_shares (2D array): column of minimum share constraints by share category, e.g. ``[[0.09], [0.80]]``
+            max_shares (2D array): column of maximum share constraints by share category, e.g. ``[[0.19], [0.90]]``
             N (int): number of share categories
 
         Returns:
-            New share to try for the share identified by ``share_col``
+            2D array of new shares to try
 
         """
-        if row['change_needed'] < 0:
-            share = max(MIN_SHARE, row[share_col] + row['change_needed'] / N)
-        elif row['change_needed'] > 0:
-            share = min(MAX_SHARE, row[share_col] + row['change_needed'] / N)
-        else:
-            share = row[share_col]
+        attempted_shares = shares + change_needed / N
 
-        return share
+        return np.where(change_needed < 0, np.fmax(min_shares, attempted_shares),
+                        np.where(change_needed > 0, np.fmin(max_shares, attempted_shares), shares))
 
     @staticmethod
     def calc_shares(calendar_year, compliance_id, producer_decision, market_class_data, mc_parent, mc_pair):
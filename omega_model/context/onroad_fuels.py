@@ -102,10 +102,8 @@ class OnroadFuel(OMEGABase):
         cache_key = (calendar_year, in_use_fuel_id, attribute)
 
         if cache_key not in OnroadFuel._data:
-            start_years = np.atleast_1d(OnroadFuel._data['start_year'][in_use_fuel_id])
-            if len(start_years[start_years <= calendar_year]) > 0:
-                year = max([yr for yr in start_years if yr <= calendar_year])
-
+            year = OnroadFuel._data['start_year_table'][in_use_fuel_id].get_start_year(calendar_year)
+            if year is not None:
                 OnroadFuel._data[cache_key] = OnroadFuel._data[in_use_fuel_id, year][attribute]
             else:
                 raise Exception('Missing policy fuel values for %s, %d or prior' % (in_use_fuel_id, calendar_year))
@@ -154,6 +152,9 @@ class OnroadFuel(OMEGABase):
         if not template_errors:
             OnroadFuel._data = df.set_index(['fuel_id', 'start_year']).to_dict(orient='index')
             OnroadFuel._data.update(df[['start_year', 'fuel_id']].set_index('fuel_id').to_dict(orient='series'))
+            OnroadFuel._data['start_year_table'] = \
+                {fuel_id: StartYearTable(df.loc[df['fuel_id'] == fuel_id, 'start_year'])
+                 for fuel_id in df['fuel_id'].unique()}
             OnroadFuel.fuel_ids = df['fuel_id'].unique()
 
         return template_errors
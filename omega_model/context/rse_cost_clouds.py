@@ -177,8 +177,107 @@ from policy.drive_cycle_ballast import DriveCycleBallast
 
 from producer.vehicles import VehicleOnroadCalculations, Vehicle, is_up_for_redesign
 
+import itertools
+from functools import reduce
+
 _cache = dict()
 
+_rse_functions = dict()  # compiled RSE set functions, by RSE set source, see ``get_rse_function()``
+
+# RSEs use python max() and min(), these allow the RSEs to be evaluated for arrays of cloud points at once
+_rse_array_globals = {'max': lambda *args: reduce(np.maximum, args), 'min': lambda *args: reduce(np.minimum, args)}
+
+_rse_check_grid_num_points = 4  # number of RSE check grid values per RSE input, see ``get_rse_check_grid()``
+
+
+def get_rse_function_source(rse_equations):
+    """
+    Get the source of a function that evaluates a set of response surface equations (RSEs) at once.
+
+    Args:
+        rse_equations (list): the RSEs, e.g. the drive cycle result equations of a cost curve class
+
+    Returns:
+        The source of a lambda of ``ETW``, ``RLHP20``, ``RLHP60`` and ``HP_ETW`` that returns a tuple of RSE values
+
+    """
+    return 'lambda ETW, RLHP20, RLHP60, HP_ETW: (%s,)' % ', '.join('(%s)' % str(eq) for eq in rse_equations)
+
+
+def get_rse_function(rse_source):
+    """
+    Get the compiled function of a set of response surface equations, compiling it on first use.  The function source
+    is stored with the cost cloud data, rather than the function itself, so the cost cloud data can be pickled (e.g.
+    to an input snapshot).
+
+    Args:
+        rse_source (str): the RSE set function source, see ``get_rse_function_source()``
+
+    Returns:
+        The RSE set function
+
+    """
+    if rse_source not in _rse_functions:
+        _rse_functions[rse_source] = eval(compile(rse_source, '<rse>', 'eval'), dict(_rse_array_globals))
+
+    return _rse_functions[rse_source]
+
+
+def eval_rse_function(rse_source, ETW, RLHP20, RLHP60, HP_ETW):
+    """
+    Evaluate a set of response surface equations for arrays of RSE inputs.
+
+    Args:
+        rse_source (str): the RSE set function source, see ``get_rse_function_source()``
+        ETW (array): equivalent test weight, lbs
+        RLHP20 (array): roadload horsepower at 20 MPH divided by ``ETW``
+        RLHP60 (array): roadload horsepower at 60 MPH divided by ``ETW``
+        HP_ETW (array): rated horsepower divided by ``ETW``
+
+    Returns:
+        2-D array of RSE values, one row per RSE and one column per set of inputs
+
+    """
+    rse_values = get_rse_function(rse_source)(ETW, RLHP20, RLHP60, HP_ETW)
+
+    # broadcast scalar RSEs (e.g. a constant hev_motor_kw) to one value per set of inputs
+    return np.array(np.broadcast_arrays(*rse_values, ETW, RLHP20, RLHP60, HP_ETW)[:len(rse_values)], dtype=float)
+
+
+def get_rse_check_grid(vehicles_filename):
+    """
+    Get the RSE input test grid used when ``check_cost_cloud_rses`` is enabled.  The grid spans the RSE inputs of the
+    base year vehicles, with the roadload horsepower ranges widened by the RLHP sweep scalers and the BEV of ICE RLHP60
+    scaler, since those are the inputs the RSEs are evaluated at.
+
+    Args:
+        vehicles_filename (str): name of the base year vehicles file
+
+    Returns:
+        List of ``ETW``, ``RLHP20``, ``RLHP60`` and ``HP_ETW`` arrays, one element per grid point
+
+    """
+    df = pd.read_csv(vehicles_filename, skiprows=1)
+
+    etw_lbs = df['etw_lbs']
+    rated_hp = np.where(df['electrification_class'] == 'EV', df['total_emachine_kw'] / 0.746, df['eng_rated_hp'])
+    rlhp20 = calc_roadload_hp(df['target_coef_a'], df['target_coef_b'], df['target_coef_c'], 20) / etw_lbs
+    rlhp60 = calc_roadload_hp(df['target_coef_a'], df['target_coef_b'], df['target_coef_c'], 60) / etw_lbs
+    hp_etw = (rated_hp / etw_lbs)[rated_hp > 0]
+
+    options = omega_globals.options
+    rlhp60_scalers = (1.0, options.bev_of_ice_rlhp60_scaler)
+
+    bounds = [(etw_lbs.min(), etw_lbs.max()),
+              (rlhp20.min() * min(1.0, options.rlhp20_min_scaler), rlhp20.max() * max(1.0, options.rlhp20_max_scaler)),
+              (rlhp60.min() * min(rlhp60_scalers) * min(1.0, options.rlhp60_min_scaler),
+               rlhp60.max() * max(rlhp60_scalers) * max(1.0, options.rlhp60_max_scaler)),
+              (hp_etw.min(), hp_etw.max())]
+
+    return [g.ravel() for g in np.meshgrid(*[np.linspace(lo, hi, _rse_check_grid_num_points) for lo, hi in bounds],
+                                           indexing='ij')]
+
+
 # define list of non-numeric columns to ignore during frontier creation since they goof up pandas auto-typing of
 # columns when switching between Series and DataFrame representations
 
@@ -303,12 +402,14 @@ class CostCloud(OMEGABase, CostCloudBase):
                                         _cache[cache_key][cost_curve_class]['rse'][c] = \
                                             compile(str(class_cloud[c]), '<string>', 'eval')
 
-                                    rse_tuple = (sorted(rse_columns), tuple(class_cloud[sorted(rse_columns)]))
+                                    rse_names = sorted(rse_columns)
+
+                                    _cache[cache_key][cost_curve_class]['rse_names'] = rse_names
 
-                                    _cache[cache_key][cost_curve_class]['rse_names'] = rse_tuple[0]
+                                    _cache[cache_key][cost_curve_class]['rse_source'] = \
+                                        get_rse_function_source(class_cloud[rse_names])
 
-                                    _cache[cache_key][cost_curve_class]['rse_tuple'] = \
-                                        str(rse_tuple[1]).replace("'", '')
+                                    get_rse_function(_cache[cache_key][cost_curve_class]['rse_source'])  # compile on load
 
                                     _cache[cache_key][cost_curve_class]['tech_flags'] = class_cloud[tech_flags]
 
@@ -393,12 +494,14 @@ class CostCloud(OMEGABase, CostCloudBase):
                                     _cache[cache_key][cost_curve_class]['rse'][c] = \
                                         compile(str(class_cloud[c]), '<string>', 'eval')
 
-                                rse_tuple = (sorted(rse_columns), tuple(class_cloud[sorted(rse_columns)]))
+                                rse_names = sorted(rse_columns)
 
-                                _cache[cache_key][cost_curve_class]['rse_names'] = rse_tuple[0]
+                                _cache[cache_key][cost_curve_class]['rse_names'] = rse_names
 
-                                _cache[cache_key][cost_curve_class]['rse_tuple'] = \
-                                    str(rse_tuple[1]).replace("'", '')
+                                _cache[cache_key][cost_curve_class]['rse_source'] = \
+                                    get_rse_function_source(class_cloud[rse_names])
+
+                                get_rse_function(_cache[cache_key][cost_curve_class]['rse_source'])  # compile on load
 
                                 _cache[cache_key][cost_curve_class]['tech_flags'] = class_cloud[tech_flags]
 
@@ -455,6 +558,176 @@ class CostCloud(OMEGABase, CostCloudBase):
 
         return template_errors
 
+    @staticmethod
+    def check_rses(verbose=False):
+        """
+        Evaluate the response surface equations of each cost curve class on a test grid of RSE inputs, to catch NaN or
+        negative RSE outputs before a run.  The grid spans the RSE inputs of the base year vehicles, see
+        ``get_rse_check_grid()``.
+
+        Args:
+            verbose (bool): enhanced console output if ``True``
+
+        Returns:
+            list of encountered errors, if any
+
+        """
+        errors = []
+
+        grid = get_rse_check_grid(omega_globals.options.vehicles_file)
+
+        for rse_group_key in _cache:
+            for cost_curve_class, cost_curve_class_data in _cache[rse_group_key].items():
+                with np.errstate(all='ignore'):
+                    rse_values = eval_rse_function(cost_curve_class_data['rse_source'], *grid)
+
+                for rse_name, values in zip(cost_curve_class_data['rse_names'], rse_values):
+                    if np.isnan(values).any() or (values < 0).any():
+                        errors.append('%s %s %s RSE output is NaN or negative on the RSE check grid' %
+                                      (rse_group_key, cost_curve_class, rse_name))
+
+        if verbose:
+            omega_log.logwrite('Checked cost cloud RSEs, %d errors' % len(errors))
+
+        return errors
+
+    @staticmethod
+    def calc_cloud_sizing(vehicle, rse_group_key, cost_curve_class, sweep_points, battery_kwh=1):
+        """
+        Size the powertrain mass, rated horsepower and battery capacity of a set of cloud points.  Mass, horsepower and
+        battery capacity depend on each other so they are solved iteratively until each point's values change by no
+        more than the convergence tolerance.  All points are iterated together as arrays, converged points are masked
+        out of subsequent iterations.
+
+        Args:
+            vehicle (Vehicle): the vehicle to size the cloud points of, with the tech flags and powertrain type of the
+                cost curve class already set
+            rse_group_key (tuple): the RSE group key of the vehicle, see ``get_rse_group_key()``
+            cost_curve_class (str): the cost curve class of the cloud points
+            sweep_points (list): list of (structure_material, footprint_ft2, rlhp20, rlhp60) tuples, one per point
+            battery_kwh (float): initial battery capacity of the points, BEVs and PHEVs only
+
+        Returns:
+            tuple of dicts of sizing values and RSE (and battery sizing) values, each value is an array with one
+            element per point
+
+        """
+        convergence_tolerance = 0.01
+        max_iterations = 100
+
+        num_points = len(sweep_points)
+        structure_material, footprint_ft2, rlhp20, rlhp60 = [np.array(p) for p in zip(*sweep_points)]
+
+        rse_names = _cache[rse_group_key][cost_curve_class]['rse_names']
+        rse_source = _cache[rse_group_key][cost_curve_class]['rse_source']
+
+        battery_sized = vehicle.powertrain_type == 'BEV' or vehicle.powertrain_type == 'PHEV'
+
+        rated_hp = np.ones(num_points)  # also the prior rated hp, for determining convergence
+        battery_kwh = np.full(num_points, battery_kwh, dtype=float)
+        prior_battery_kwh = np.ones(num_points)
+        prior_powertrain_mass_lbs = np.ones(num_points)
+
+        sizing_values = dict()
+        rse_values = dict()
+
+        active = np.arange(num_points)  # indices of points that have not converged yet
+        iteration = 0
+
+        while len(active) and iteration < max_iterations:
+            iteration += 1
+
+            # rated hp sizing ------------------------------------------------------------------------------------- #
+            structure_mass_lbs, battery_mass_lbs, powertrain_mass_lbs, \
+             delta_glider_non_structure_mass_lbs, usable_battery_capacity_norm = \
+                MassScaling.calc_mass_terms(vehicle, structure_material[active], rated_hp[active],
+                                            battery_kwh[active], footprint_ft2[active])
+
+            # update curbweight in case it's needed by DriveCycleBallast (medium-duty)
+            vehicle.curbweight_lbs = sum((vehicle.base_year_glider_non_structure_mass_lbs,
+                                         delta_glider_non_structure_mass_lbs,
+                                         powertrain_mass_lbs, structure_mass_lbs, battery_mass_lbs))
+
+            # vehicle ballast is f(curbweight_lbs) for medium-duty:
+            vehicle_ballast = DriveCycleBallast.get_ballast_lbs(vehicle)
+
+            new_rated_hp = np.minimum(1000, vehicle.curbweight_lbs / vehicle.base_year_curbweight_lbs_to_hp)
+
+            # set up RSE terms and run RSEs
+            ETW = vehicle.curbweight_lbs + vehicle_ballast
+
+            RLHP20 = rlhp20[active] / ETW
+            RLHP60 = rlhp60[active] / ETW
+            HP_ETW = new_rated_hp / ETW
+
+            cloud = dict(zip(rse_names, eval_rse_function(rse_source, ETW, RLHP20, RLHP60, HP_ETW)))
+
+            # battery sizing ---------------------------------------------------------------------------------------- #
+            new_battery_kwh = battery_kwh[active]
+            if battery_sized:
+                cloud['battery_kwh'] = battery_kwh[active]
+                cloud['usable_battery_capacity_norm'] = usable_battery_capacity_norm
+
+                cloud = vehicle.calc_battery_sizing_onroad_direct_kWh_per_mile(cloud)
+
+                battery_sizing_kwh_per_mile = cloud['battery_sizing_onroad_direct_kwh_per_mile']
+
+                if vehicle.powertrain_type == 'PHEV' and omega_globals.options.phev_battery_kwh == 'RSE':
+                    # use nominal size from RSE
+                    new_battery_kwh = cloud['hev_batt_kwh']
+                else:
+                    if vehicle.powertrain_type == 'PHEV' and omega_globals.options.phev_battery_kwh is not None:
+                        # override battery size by kWh
+                        new_battery_kwh = omega_globals.options.phev_battery_kwh
+                    else:
+                        # BEVs and range-sized PHEVs
+                        new_battery_kwh = vehicle.onroad_charge_depleting_range_mi * battery_sizing_kwh_per_mile / \
+                                          usable_battery_capacity_norm
+
+                    if vehicle.powertrain_type == 'PHEV':
+                        # use nominal size from RSE if there's no charge-depleting consumption
+                        new_battery_kwh = np.where(battery_sizing_kwh_per_mile == 0, cloud['hev_batt_kwh'],
+                                                   new_battery_kwh)
+
+            # store the latest values of the active points ---------------------------------------------------------- #
+            for k, v in cloud.items():
+                if k not in rse_values:
+                    rse_values[k] = np.zeros(num_points)
+                rse_values[k][active] = v
+
+            for k, v in (('structure_mass_lbs', structure_mass_lbs), ('battery_mass_lbs', battery_mass_lbs),
+                         ('powertrain_mass_lbs', powertrain_mass_lbs),
+                         ('delta_glider_non_structure_mass_lbs', delta_glider_non_structure_mass_lbs),
+                         ('curbweight_lbs', vehicle.curbweight_lbs), ('etw_lbs', ETW), ('hp_etw', HP_ETW)):
+                if k not in sizing_values:
+                    sizing_values[k] = np.zeros(num_points)
+                sizing_values[k][active] = v
+
+            # determine convergence --------------------------------------------------------------------------------- #
+            converged = (abs(1 - powertrain_mass_lbs / prior_powertrain_mass_lbs[active]) <= convergence_tolerance) & \
+                        (abs(1 - new_rated_hp / rated_hp[active]) <= convergence_tolerance)
+
+            if battery_sized:
+                converged = converged & \
+                            (abs(1 - new_battery_kwh / prior_battery_kwh[active]) < convergence_tolerance)
+
+            prior_powertrain_mass_lbs[active] = powertrain_mass_lbs
+            rated_hp[active] = new_rated_hp
+            prior_battery_kwh[active] = new_battery_kwh
+            battery_kwh[active] = new_battery_kwh
+
+            active = active[~converged]
+
+        if len(active):
+            omega_log.logwrite('WARNING: %s %s cloud sizing did not converge for %d of %d points after %d iterations'
+                               % (vehicle.name, cost_curve_class, len(active), num_points, max_iterations),
+                               echo_console=True)
+
+        sizing_values['rated_hp'] = rated_hp
+        sizing_values['battery_kwh'] = battery_kwh
+
+        return sizing_values, rse_values
+
     @staticmethod
     def get_cloud(vehicle):
         """
@@ -513,8 +786,7 @@ class CostCloud(OMEGABase, CostCloudBase):
 
             cost_curve_classes = {vehicle.cost_curve_class: _cache[rse_group_key][vehicle.cost_curve_class]}
 
-        # convergence terms init
-        convergence_tolerance = 0.01
+        # carry-over battery size, initial guess for the first point of each cost curve class
         battery_kwh = 1
 
         # build a list of dicts that will be dumped into the cloud at the end faster than sequentially
@@ -548,191 +820,143 @@ class CostCloud(OMEGABase, CostCloudBase):
                     else:
                         vehicle.onroad_charge_depleting_range_mi = omega_globals.options.bev_range_mi
 
-            for structure_material in structure_materials:
-                for footprint_ft2 in vehicle_footprints:
-                    for rlhp20 in rlhp20s:
-                        for rlhp60 in rlhp60s:
-                            cloud_point = copy.copy(tech_flags)  # cost_curve_classes[ccc]['tech_flags'].to_dict()
-
-                            cloud_point['powertrain_type'] = vehicle.powertrain_type
-                            cloud_point['drive_system'] = vehicle.drive_system
-                            cloud_point['application_id'] = vehicle.application_id
-
-                            # ------------------------------------------------------------------------------------#
-                            rated_hp = 1
-                            prior_rated_hp = 1
-                            prior_battery_kwh = 1
-                            prior_powertrain_mass_lbs = 1
-
-                            converged = False
-                            while not converged:
-                                # rated hp sizing --------------------------------------------------------------- #
-                                structure_mass_lbs, battery_mass_lbs, powertrain_mass_lbs, \
-                                 delta_glider_non_structure_mass_lbs, usable_battery_capacity_norm = \
-                                    MassScaling.calc_mass_terms(vehicle, structure_material, rated_hp,
-                                                                battery_kwh, footprint_ft2)
-
-                                # update curbweight in case it's needed by DriveCycleBallast (medium-duty)
-                                vehicle.curbweight_lbs = sum((vehicle.base_year_glider_non_structure_mass_lbs,
-                                                             delta_glider_non_structure_mass_lbs,
-                                                             powertrain_mass_lbs, structure_mass_lbs, battery_mass_lbs))
-
-                                # vehicle ballast is f(curbweight_lbs) for medium-duty:
-                                vehicle_ballast = DriveCycleBallast.get_ballast_lbs(vehicle)
-
-                                rated_hp = min(1000, vehicle.curbweight_lbs / vehicle.base_year_curbweight_lbs_to_hp)
-
-                                # set up RSE terms and run RSEs
-                                ETW = vehicle.curbweight_lbs + vehicle_ballast
-
-                                RLHP20 = rlhp20 / ETW
-                                RLHP60 = rlhp60 / ETW
-                                HP_ETW = rated_hp / ETW
-
-                                cloud_point.update(zip(_cache[rse_group_key][ccc]['rse_names'],
-                                                       Eval.eval(_cache[rse_group_key][ccc]['rse_tuple'], {},
-                                                                 {'ETW': ETW, 'RLHP20': RLHP20, 'RLHP60': RLHP60,
-                                                                  'HP_ETW': HP_ETW})))
-
-                                # battery sizing -------------------------------------------------------------------- #
-                                if vehicle.powertrain_type == 'BEV' or vehicle.powertrain_type == 'PHEV':
-                                    cloud_point['battery_kwh'] = battery_kwh
-                                    cloud_point['usable_battery_capacity_norm'] = usable_battery_capacity_norm
-
-                                    cloud_point = vehicle.calc_battery_sizing_onroad_direct_kWh_per_mile(cloud_point)
-
-                                    if vehicle.powertrain_type == 'PHEV' and \
-                                            (omega_globals.options.phev_battery_kwh == 'RSE' or
-                                             cloud_point['battery_sizing_onroad_direct_kwh_per_mile'] == 0):
-                                        # use nominal size from RSE
-                                        battery_kwh = cloud_point['hev_batt_kwh']
-                                    elif vehicle.powertrain_type == 'PHEV' and \
-                                            omega_globals.options.phev_battery_kwh is not None:
-                                        # override battery size by kWh
-                                        battery_kwh = omega_globals.options.phev_battery_kwh
-                                    else:
-                                        # BEVs and range-sized PHEVs
-                                        battery_kwh = vehicle.onroad_charge_depleting_range_mi * \
-                                                      cloud_point['battery_sizing_onroad_direct_kwh_per_mile'] / \
-                                                      usable_battery_capacity_norm
-
-                                # determine convergence ------------------------------------------------------------- #
-                                converged = abs(
-                                    1 - powertrain_mass_lbs / prior_powertrain_mass_lbs) <= convergence_tolerance and \
-                                            abs(1 - rated_hp / prior_rated_hp) <= convergence_tolerance
-
-                                if vehicle.powertrain_type == 'BEV' or vehicle.powertrain_type == 'PHEV':
-                                    converged = converged and \
-                                            abs(1 - battery_kwh / prior_battery_kwh) < convergence_tolerance
-
-                                prior_powertrain_mass_lbs = powertrain_mass_lbs
-                                prior_rated_hp = rated_hp
-                                prior_battery_kwh = battery_kwh
-
-                                # ------------------------------------------------------------------------------------#
-
-                            # update battery and motor data prior to calc_cert_values (for PHEV, primarily)
-                            if vehicle.powertrain_type != 'BEV' and vehicle.powertrain_type != 'PHEV':
-                                # battery size and total motor/generator power come from RSEs for ICE/HEV
-                                cloud_point['battery_kwh'] = cloud_point['hev_batt_kwh']
-                                cloud_point['total_emachine_kw'] = cloud_point['hev_motor_kw']
-                                cloud_point['tractive_motor_kw'] = 0
-                            elif vehicle.powertrain_type == 'PHEV':
-                                # PHEV battery size and motor power determined by vehicle and iterative range calculation
-                                cloud_point['battery_kwh'] = battery_kwh
-                                cloud_point['total_emachine_kw'] = cloud_point['hev_motor_kw']
-                                cloud_point['tractive_motor_kw'] = 0
-                            else:
-                                # BEV battery size and motor power determined by vehicle and iterative range calculation
-                                cloud_point['battery_kwh'] = battery_kwh
-                                cloud_point['total_emachine_kw'] = rated_hp * 0.746
-                                cloud_point['tractive_motor_kw'] = \
-                                    cloud_point['total_emachine_kw'] * vehicle.base_year_tractive_motor_kw / \
-                                    vehicle.base_year_total_emachine_kw
-
-                            cloud_point = vehicle.calc_cert_and_onroad_values(cloud_point)
-
-                            if rlhp20 == vehicle_rlhp20 and \
-                                    rlhp60 == vehicle_rlhp60 and \
-                                    footprint_ft2 == ASTM_round(vehicle.base_year_footprint_ft2, sweep_precision) and \
-                                    structure_material == vehicle.structure_material and \
-                                    ccc == vehicle.cost_curve_class and vehicle.fueling_class != 'BEV':
-                                vehicle.onroad_direct_oncycle_co2e_grams_per_mile = \
-                                    cloud_point['onroad_direct_oncycle_co2e_grams_per_mile']
-                                if vehicle.model_year == omega_globals.options.analysis_initial_year:
-                                    vehicle.base_year_cert_direct_oncycle_co2e_grams_per_mile = \
-                                        cloud_point['cert_direct_oncycle_co2e_grams_per_mile']
-                                    vehicle.base_year_onroad_direct_oncycle_co2e_grams_per_mile = \
-                                        cloud_point['onroad_direct_oncycle_co2e_grams_per_mile']
-
-                            elif rlhp20 == vehicle_rlhp20 and \
-                                    rlhp60 == vehicle_rlhp60 and \
-                                    footprint_ft2 == ASTM_round(vehicle.base_year_footprint_ft2, sweep_precision) and \
-                                    structure_material == vehicle.structure_material and \
-                                    ccc == vehicle.cost_curve_class and vehicle.fueling_class == 'BEV':
-                                vehicle.onroad_direct_oncycle_kwh_per_mile = \
-                                    cloud_point['onroad_direct_oncycle_kwh_per_mile']
-                                if vehicle.model_year == omega_globals.options.analysis_initial_year:
-                                    vehicle.base_year_cert_direct_oncycle_kwh_per_mile = \
-                                        cloud_point['cert_direct_oncycle_kwh_per_mile']
-                                    vehicle.base_year_onroad_direct_oncycle_kwh_per_mile = \
-                                        cloud_point['onroad_direct_oncycle_kwh_per_mile']
-
-                            v = copy.copy(vehicle)
-                            v.footprint_ft2 = footprint_ft2
-                            cloud_point['target_co2e_Mg_per_vehicle'] = \
-                                omega_globals.options.VehicleTargets.calc_target_co2e_Mg(v, sales_variants=1)
-
-                            cloud_point['cert_co2e_Mg_per_vehicle'] = \
-                                omega_globals.options.VehicleTargets.\
-                                    calc_cert_co2e_Mg(v, co2_gpmi_variants=cloud_point['cert_co2e_grams_per_mile'],
-                                                      sales_variants=1)
-
-                            cloud_point['credits_co2e_Mg_per_vehicle'] = \
-                                cloud_point['target_co2e_Mg_per_vehicle'] - cloud_point['cert_co2e_Mg_per_vehicle']
-
-                            # required cloud data for powertrain costing, etc:
-                            cloud_point['cost_curve_class'] = ccc
-                            cloud_point['structure_mass_lbs'] = structure_mass_lbs
-                            cloud_point['footprint_ft2'] = footprint_ft2
-                            cloud_point['structure_material'] = structure_material
-                            cloud_point['curbweight_lbs'] = vehicle.curbweight_lbs
-                            cloud_point['etw_lbs'] = ETW
-                            cloud_point['rated_hp'] = rated_hp
-                            cloud_point['battery_mass_lbs'] = battery_mass_lbs
-                            cloud_point['powertrain_mass_lbs'] = powertrain_mass_lbs
-                            cloud_point['delta_glider_non_structure_mass_lbs'] = \
-                                delta_glider_non_structure_mass_lbs
-                            cloud_point['glider_non_structure_mass_lbs'] = \
-                                vehicle.base_year_glider_non_structure_mass_lbs + \
-                                delta_glider_non_structure_mass_lbs
-
-                            # informative data for troubleshooting:
-                            if omega_globals.options.log_vehicle_cloud_years == 'all' or \
-                                    vehicle.model_year in omega_globals.options.log_vehicle_cloud_years or \
-                                    vehicle.base_year_vehicle_id == omega_globals.options.canary_byvid:
-                                cloud_point['vehicle_id'] = vehicle.vehicle_id
-                                cloud_point['vehicle_base_year_id'] = vehicle.base_year_vehicle_id
-                                cloud_point['vehicle_name'] = vehicle.name
-                                cloud_point['model_year'] = vehicle.model_year
-                                cloud_point['vehicle_base_year_eng_rated_hp'] = vehicle.base_year_eng_rated_hp
-                                cloud_point['vehicle_mot_rated_kw'] = vehicle.total_emachine_kw
-                                cloud_point['rlhp20'] = rlhp20
-                                cloud_point['rlhp60'] = rlhp60
-                                cloud_point['hp_etw'] = HP_ETW
-
-                            # add powertrain costs
-                            powertrain_costs = \
-                                omega_globals.options.PowertrainCost.calc_cost(vehicle, cloud_point['powertrain_type'],
-                                                         cloud_point)  # includes battery cost
-
-                            powertrain_cost_terms = ['engine_cost', 'driveline_cost', 'emachine_cost', 'battery_cost',
-                                                     'electrified_driveline_cost']
-
-                            for idx, ct in enumerate(powertrain_cost_terms):
-                                cloud_point[ct] = powertrain_costs[idx]
-
-                            cloud_points.append(cloud_point)
+            sweep_points = list(itertools.product(structure_materials, vehicle_footprints, rlhp20s, rlhp60s))
+
+            # size all the points of the cost curve class at once
+            sizing_values, rse_values = \
+                CostCloud.calc_cloud_sizing(vehicle, rse_group_key, ccc, sweep_points, battery_kwh)
+
+            battery_kwh = sizing_values['battery_kwh'][-1]
+
+            # unpack to python scalars for the per-point calculations
+            sizing_values = {k: v.tolist() for k, v in sizing_values.items()}
+            rse_values = {k: v.tolist() for k, v in rse_values.items()}
+
+            ccc_cloud_points = []
+            for point_idx, (structure_material, footprint_ft2, rlhp20, rlhp60) in enumerate(sweep_points):
+                cloud_point = copy.copy(tech_flags)  # cost_curve_classes[ccc]['tech_flags'].to_dict()
+
+                cloud_point['powertrain_type'] = vehicle.powertrain_type
+                cloud_point['drive_system'] = vehicle.drive_system
+                cloud_point['application_id'] = vehicle.application_id
+
+                for k, v in rse_values.items():
+                    cloud_point[k] = v[point_idx]
+
+                structure_mass_lbs = sizing_values['structure_mass_lbs'][point_idx]
+                battery_mass_lbs = sizing_values['battery_mass_lbs'][point_idx]
+                powertrain_mass_lbs = sizing_values['powertrain_mass_lbs'][point_idx]
+                delta_glider_non_structure_mass_lbs = sizing_values['delta_glider_non_structure_mass_lbs'][point_idx]
+                rated_hp = sizing_values['rated_hp'][point_idx]
+                ETW = sizing_values['etw_lbs'][point_idx]
+                HP_ETW = sizing_values['hp_etw'][point_idx]
+
+                # converged curbweight, in case it's needed by DriveCycleBallast (medium-duty) or for costing
+                vehicle.curbweight_lbs = sizing_values['curbweight_lbs'][point_idx]
+
+                # update battery and motor data prior to calc_cert_values (for PHEV, primarily)
+                if vehicle.powertrain_type != 'BEV' and vehicle.powertrain_type != 'PHEV':
+                    # battery size and total motor/generator power come from RSEs for ICE/HEV
+                    cloud_point['battery_kwh'] = cloud_point['hev_batt_kwh']
+                    cloud_point['total_emachine_kw'] = cloud_point['hev_motor_kw']
+                    cloud_point['tractive_motor_kw'] = 0
+                elif vehicle.powertrain_type == 'PHEV':
+                    # PHEV battery size and motor power determined by vehicle and iterative range calculation
+                    cloud_point['battery_kwh'] = sizing_values['battery_kwh'][point_idx]
+                    cloud_point['total_emachine_kw'] = cloud_point['hev_motor_kw']
+                    cloud_point['tractive_motor_kw'] = 0
+                else:
+                    # BEV battery size and motor power determined by vehicle and iterative range calculation
+                    cloud_point['battery_kwh'] = sizing_values['battery_kwh'][point_idx]
+                    cloud_point['total_emachine_kw'] = rated_hp * 0.746
+                    cloud_point['tractive_motor_kw'] = \
+                        cloud_point['total_emachine_kw'] * vehicle.base_year_tractive_motor_kw / \
+                        vehicle.base_year_total_emachine_kw
+
+                cloud_point = vehicle.calc_cert_and_onroad_values(cloud_point)
+
+                if rlhp20 == vehicle_rlhp20 and \
+                        rlhp60 == vehicle_rlhp60 and \
+                        footprint_ft2 == ASTM_round(vehicle.base_year_footprint_ft2, sweep_precision) and \
+                        structure_material == vehicle.structure_material and \
+                        ccc == vehicle.cost_curve_class and vehicle.fueling_class != 'BEV':
+                    vehicle.onroad_direct_oncycle_co2e_grams_per_mile = \
+                        cloud_point['onroad_direct_oncycle_co2e_grams_per_mile']
+                    if vehicle.model_year == omega_globals.options.analysis_initial_year:
+                        vehicle.base_year_cert_direct_oncycle_co2e_grams_per_mile = \
+                            cloud_point['cert_direct_oncycle_co2e_grams_per_mile']
+                        vehicle.base_year_onroad_direct_oncycle_co2e_grams_per_mile = \
+                            cloud_point['onroad_direct_oncycle_co2e_grams_per_mile']
+
+                elif rlhp20 == vehicle_rlhp20 and \
+                        rlhp60 == vehicle_rlhp60 and \
+                        footprint_ft2 == ASTM_round(vehicle.base_year_footprint_ft2, sweep_precision) and \
+                        structure_material == vehicle.structure_material and \
+                        ccc == vehicle.cost_curve_class and vehicle.fueling_class == 'BEV':
+                    vehicle.onroad_direct_oncycle_kwh_per_mile = \
+                        cloud_point['onroad_direct_oncycle_kwh_per_mile']
+                    if vehicle.model_year == omega_globals.options.analysis_initial_year:
+                        vehicle.base_year_cert_direct_oncycle_kwh_per_mile = \
+                            cloud_point['cert_direct_oncycle_kwh_per_mile']
+                        vehicle.base_year_onroad_direct_oncycle_kwh_per_mile = \
+                            cloud_point['onroad_direct_oncycle_kwh_per_mile']
+
+                # required cloud data for powertrain costing, etc:
+                cloud_point['cost_curve_class'] = ccc
+                cloud_point['structure_mass_lbs'] = structure_mass_lbs
+                cloud_point['footprint_ft2'] = footprint_ft2
+                cloud_point['structure_material'] = structure_material
+                cloud_point['curbweight_lbs'] = vehicle.curbweight_lbs
+                cloud_point['etw_lbs'] = ETW
+                cloud_point['rated_hp'] = rated_hp
+                cloud_point['battery_mass_lbs'] = battery_mass_lbs
+                cloud_point['powertrain_mass_lbs'] = powertrain_mass_lbs
+                cloud_point['delta_glider_non_structure_mass_lbs'] = \
+                    delta_glider_non_structure_mass_lbs
+                cloud_point['glider_non_structure_mass_lbs'] = \
+                    vehicle.base_year_glider_non_structure_mass_lbs + \
+                    delta_glider_non_structure_mass_lbs
+
+                # informative data for troubleshooting:
+                if omega_globals.options.log_vehicle_cloud_years == 'all' or \
+                        vehicle.model_year in omega_globals.options.log_vehicle_cloud_years or \
+                        vehicle.base_year_vehicle_id == omega_globals.options.canary_byvid:
+                    cloud_point['vehicle_id'] = vehicle.vehicle_id
+                    cloud_point['vehicle_base_year_id'] = vehicle.base_year_vehicle_id
+                    cloud_point['vehicle_name'] = vehicle.name
+                    cloud_point['model_year'] = vehicle.model_year
+                    cloud_point['vehicle_base_year_eng_rated_hp'] = vehicle.base_year_eng_rated_hp
+                    cloud_point['vehicle_mot_rated_kw'] = vehicle.total_emachine_kw
+                    cloud_point['rlhp20'] = rlhp20
+                    cloud_point['rlhp60'] = rlhp60
+                    cloud_point['hp_etw'] = HP_ETW
+
+                # add powertrain costs
+                powertrain_costs = \
+                    omega_globals.options.PowertrainCost.calc_cost(vehicle, cloud_point['powertrain_type'],
+                                             cloud_point)  # includes battery cost
+
+                powertrain_cost_terms = ['engine_cost', 'driveline_cost', 'emachine_cost', 'battery_cost',
+                                         'electrified_driveline_cost']
+
+                for idx, ct in enumerate(powertrain_cost_terms):
+                    cloud_point[ct] = powertrain_costs[idx]
+
+                ccc_cloud_points.append(cloud_point)
+
+            # calculate target and cert Mg for all points of the cost curve class at once
+            target_co2e_Mg, cert_co2e_Mg = omega_globals.options.VehicleTargets.calc_target_and_cert_co2e_Mg(
+                vehicle, [cp['cert_co2e_grams_per_mile'] for cp in ccc_cloud_points],
+                footprint_ft2=[cp['footprint_ft2'] for cp in ccc_cloud_points],
+                curbweight_lbs=[cp['curbweight_lbs'] for cp in ccc_cloud_points])
+
+            for cloud_point, target_Mg, cert_Mg in zip(ccc_cloud_points, target_co2e_Mg.tolist(),
+                                                       cert_co2e_Mg.tolist()):
+                cloud_point['target_co2e_Mg_per_vehicle'] = target_Mg
+                cloud_point['cert_co2e_Mg_per_vehicle'] = cert_Mg
+                cloud_point['credits_co2e_Mg_per_vehicle'] = target_Mg - cert_Mg
+
+            cloud_points += ccc_cloud_points
 
         cost_cloud = pd.DataFrame(cloud_points)
 
@@ -868,6 +1092,9 @@ if __name__ == '__main__':
                                         omega_globals.options.phev_vehicle_simulation_results_file,
                                         verbose=True)
 
+        if not init_fail:
+            init_fail += CostCloud.check_rses(verbose=True)
+
         if not init_fail:
             pass
         else:
@@ -23,7 +23,7 @@ from omega_model.consumer import stock, sales_volume
 from context.onroad_fuels import OnroadFuel
 from context.price_modifications import PriceModifications
 
-import postproc_session
+cross_subsidy_search_stats = dict()  # cross subsidy search counts, by statistic, for the current compliance id
 
 
 def calc_cross_subsidy_options_and_response(calendar_year, market_class_tree, compliance_id, producer_decision,
@@ -42,7 +42,7 @@ def calc_cross_subsidy_options_and_response(calendar_year, market_class_tree, co
         cross_subsidy_options_and_response (DataFrame, Series): initiall empty dataframe or Series containing cross
             subsidy options and response
         producer_consumer_iteration_num (int): producer-consumer iteration number
-        iteration_log (DataFrame): DataFrame of producer-consumer iteration data
+        iteration_log (ColumnarIterationLog): log of producer-consumer iteration data
         node_name (str): name of the current node
         verbose (bool): enable additional console output if True
 
@@ -68,11 +68,14 @@ def calc_cross_subsidy_options_and_response(calendar_year, market_class_tree, co
 
         if all(mc in market_class_data[compliance_id] for mc in cross_subsidy_group):
             # search cross subsidy options at this level of the tree
+            if omega_globals.options.cross_subsidy_search_method == 'newton':
+                search_function = solve_cross_subsidies
+            else:
+                search_function = search_cross_subsidies
+
             cross_subsidy_options_and_response, iteration_log = \
-                search_cross_subsidies(calendar_year, compliance_id, node_name, cross_subsidy_group,
-                                       producer_decision,
-                                       cross_subsidy_options_and_response, producer_consumer_iteration_num,
-                                       iteration_log)
+                search_function(calendar_year, compliance_id, node_name, cross_subsidy_group, producer_decision,
+                                cross_subsidy_options_and_response, producer_consumer_iteration_num, iteration_log)
         elif any(mc in market_class_data[compliance_id] for mc in cross_subsidy_group):
             # only one child available from the manufacturer for this market class (e.g. ICE or BEV-only)
             only_child = [mc for mc in cross_subsidy_group if mc in market_class_data[compliance_id]]
@@ -259,11 +262,13 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
     omega_log.logwrite("\nRunning %s Pass %d: Manufacturer=%s" % (omega_globals.options.session_unique_name,
                                                                   pass_num, compliance_id),
                        echo_console=True)
+    cross_subsidy_search_stats.clear()
     analysis_end_year = omega_globals.options.analysis_final_year + 1
     credit_banks[compliance_id] = CreditBank(
         omega_globals.options.ghg_credit_params_file,
         omega_globals.options.ghg_credits_file, compliance_id)
     prior_producer_decision_and_response = None
+    producer_consumer_iterations = []
     for calendar_year in range(omega_globals.options.analysis_initial_year, analysis_end_year):
 
         credit_banks[compliance_id].update_credit_age(calendar_year)
@@ -289,6 +294,8 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
                     'strategic_offset'].item()
 
         producer_decision_and_response = None
+        consumer_response = None
+        share_history = []
         best_winning_combo_with_sales_response = None
         omega_globals.locked_price_modification_data = dict()
 
@@ -304,7 +311,7 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
             candidate_mfr_composite_vehicles, pre_production_vehicles, producer_decision, market_class_tree, \
                 producer_compliant, GWh_limit = \
                 compliance_search.search_production_options(compliance_id, calendar_year,
-                                                            producer_decision_and_response,
+                                                            consumer_response,
                                                             producer_consumer_iteration_num,
                                                             strategic_target_offset_Mg,
                                                             prior_producer_decision_and_response)
@@ -341,6 +348,12 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
 
             if iterate_producer_consumer:
                 producer_consumer_iteration_num += 1
+
+                if omega_globals.options.producer_consumer_acceleration in ['relaxation', 'anderson']:
+                    consumer_response = \
+                        accelerate_producer_consumer_shares(producer_decision_and_response, share_history)
+                else:
+                    consumer_response = producer_decision_and_response
             else:
                 if producer_consumer_iteration_num >= omega_globals.options.producer_consumer_max_iterations:
                     if 'p-c_max_iterations' in omega_globals.options.verbose_console_modules:
@@ -352,6 +365,12 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
         update_cross_subsidy_log_data(producer_decision_and_response, calendar_year, compliance_id, converged,
                                       producer_consumer_iteration_num, producer_compliant, share_convergence_error)
 
+        producer_consumer_iterations.append({'compliance_id': compliance_id, 'calendar_year': calendar_year,
+                                             'producer_consumer_iterations': producer_consumer_iteration_num + 1,
+                                             'converged': converged * 1,
+                                             'share_convergence_error': share_convergence_error,
+                                             'cross_subsidy_pricing_error': cross_subsidy_pricing_error})
+
         producer_decision_and_response['cross_subsidy_iteration_num'] = -10  # tag final result
 
         iteration_log.append(producer_decision_and_response)
@@ -372,8 +391,28 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
 
         stock.update_stock(calendar_year, compliance_id)
 
+        iteration_log.commit()
+
         prior_producer_decision_and_response = producer_decision_and_response
 
+    if cross_subsidy_search_stats:
+        omega_log.logwrite('%s cross subsidy %s search: %d searches, %d iterations, %d evaluations, %d converged' %
+                           (compliance_id, omega_globals.options.cross_subsidy_search_method,
+                            cross_subsidy_search_stats['searches'], cross_subsidy_search_stats['iterations'],
+                            cross_subsidy_search_stats['evaluations'], cross_subsidy_search_stats['converged']))
+
+    if producer_consumer_iterations:
+        producer_consumer_iterations = pd.DataFrame(producer_consumer_iterations)
+        producer_consumer_iterations['producer_consumer_acceleration'] = \
+            omega_globals.options.producer_consumer_acceleration
+        producer_consumer_iterations.to_csv(omega_globals.options.output_folder +
+                                            omega_globals.options.session_unique_name +
+                                            ' %s producer_consumer_iterations.csv' % compliance_id, index=False)
+        omega_log.logwrite('%s producer-consumer %s acceleration: %d iterations in %d years, %d years converged' %
+                           (compliance_id, omega_globals.options.producer_consumer_acceleration,
+                            producer_consumer_iterations['producer_consumer_iterations'].sum(),
+                            len(producer_consumer_iterations), producer_consumer_iterations['converged'].sum()))
+
     credit_banks[compliance_id].credit_bank.to_csv(omega_globals.options.output_folder +
                                                    omega_globals.options.session_unique_name +
                                                    ' %s GHG_credit_balances.csv' % compliance_id,
@@ -410,6 +449,98 @@ def run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_ba
             cost_tracker)
 
 
+def run_compliance_id_worker(compliance_id, pass_num, cumulative_battery_GWh, credit_banks,
+                             manufacturer_annual_data_table, iteration_log):
+    """
+    Run ``run_compliance_id()`` in a pool worker.  Bulk results (finalized vehicles, iteration log, vehicle and
+    manufacturer annual data) are pickled to per-compliance id files in the output folder so that only their pathnames
+    are returned through the pool.  The annual data records are pickled as-is, rather than as a table, so their values
+    keep the same types as in a single-process run.
+
+    Args:
+        compliance_id (str): manufacturer name, or 'consolidated_OEM'
+        pass_num (int): the pass number, 0 = first, 1 = second, etc.
+        cumulative_battery_GWh (dict): holds cumulative battery GWh production, by calendar year, from first pass
+        credit_banks (dict): credit banks, by compliance id
+        manufacturer_annual_data_table (None, or DataFrame): if provided, contains manufacturer-level data from the
+            first pass
+        iteration_log (ColumnarIterationLog): producer-consumer iteration data
+
+    Returns:
+        tuple of compliance id, dict of result pathnames by result name, credit banks, context and session new vehicle
+        generalized costs and cost tracker data
+
+    """
+    import pickle
+
+    (compliance_id, finalized_vehicles, credit_banks, iteration_log, vehicle_annual_data, manufacturer_annual_data,
+     context_new_vehicle_generalized_costs, session_new_vehicle_generalized_costs, cost_tracker) = \
+        run_compliance_id(compliance_id, pass_num, cumulative_battery_GWh, credit_banks,
+                          manufacturer_annual_data_table, iteration_log)
+
+    results_prefix = omega_globals.options.output_folder + omega_globals.options.session_unique_name + \
+        '_pass%d_%s_' % (pass_num, compliance_id)
+
+    result_files = dict()
+    try:
+        for result_name, result_data in [('finalized_vehicles', finalized_vehicles), ('iteration_log', iteration_log),
+                                         ('vehicle_annual_data', vehicle_annual_data),
+                                         ('manufacturer_annual_data', manufacturer_annual_data)]:
+            result_files[result_name] = results_prefix + result_name + '.pkl'
+            with open(result_files[result_name], 'wb') as f:
+                pickle.dump(result_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        remove_compliance_id_result_files(result_files)
+        raise
+
+    return (compliance_id, result_files, credit_banks, context_new_vehicle_generalized_costs,
+            session_new_vehicle_generalized_costs, cost_tracker)
+
+
+def remove_compliance_id_result_files(result_files):
+    """
+    Remove the result files written by ``run_compliance_id_worker()``, if they exist.
+
+    Args:
+        result_files (dict): result file pathnames by result name
+
+    """
+    for result_file in result_files.values():
+        if os.path.exists(result_file):
+            os.remove(result_file)
+
+
+def load_compliance_id_results(worker_results):
+    """
+    Load the bulk results written by ``run_compliance_id_worker()`` and remove the result files.
+
+    Args:
+        worker_results (tuple): the return value of ``run_compliance_id_worker()``
+
+    Returns:
+        tuple of finalized vehicles, credit banks, iteration log, vehicle annual data, manufacturer annual data,
+        context and session new vehicle generalized costs and cost tracker data, as returned by
+        ``run_compliance_id()`` less the compliance id
+
+    """
+    import pickle
+
+    (compliance_id, result_files, credit_banks, context_new_vehicle_generalized_costs,
+     session_new_vehicle_generalized_costs, cost_tracker) = worker_results
+
+    results = dict()
+    try:
+        for result_name in ['finalized_vehicles', 'iteration_log', 'vehicle_annual_data', 'manufacturer_annual_data']:
+            with open(result_files[result_name], 'rb') as f:
+                results[result_name] = pickle.load(f)
+    finally:
+        remove_compliance_id_result_files(result_files)
+
+    return (results['finalized_vehicles'], credit_banks, results['iteration_log'], results['vehicle_annual_data'],
+            results['manufacturer_annual_data'], context_new_vehicle_generalized_costs,
+            session_new_vehicle_generalized_costs, cost_tracker)
+
+
 def run_producer_consumer(pass_num, manufacturer_annual_data_table):
     """
     Create producer cost-minimizing technology and market share options, in consideration of market response from
@@ -427,30 +558,65 @@ def run_producer_consumer(pass_num, manufacturer_annual_data_table):
          updates omega data with final vehicle technology and market share data
 
     """
+    import queue
     from producer.vehicles import Vehicle
     from producer.vehicle_annual_data import VehicleAnnualData
     from producer.manufacturer_annual_data import ManufacturerAnnualData
     from context.new_vehicle_market import NewVehicleMarket
 
-    iteration_log = []
+    column_prefixes = omega_globals.options.iteration_log_column_prefixes
+    if column_prefixes:
+        # add the columns used by post-processing, see ``postproc_session.plot_iteration()``
+        column_prefixes = list(column_prefixes) + \
+            ['compliance_id', 'calendar_year', 'producer_consumer_iteration_num', 'cross_subsidy_iteration_num',
+             'producer_abs_share_frac_', 'consumer_abs_share_frac_', 'consumer_generalized_cost_dollars_',
+             'cost_multiplier_', 'average_onroad_direct_co2e_gpmi_']
+
+    iteration_log = omega_log.ColumnarIterationLog(column_prefixes, omega_globals.options.iteration_log_spill_rows)
 
     credit_banks = dict()
 
     if omega_globals.options.multiprocessing and pass_num > 0:
-        results = []
-        for compliance_id in Vehicle.compliance_ids:
-            results.append(omega_globals.pool.apply_async(func=run_compliance_id,
-                                                          args=[compliance_id, pass_num, credit_banks,
-                                                                omega_globals.cumulative_battery_GWh,
-                                                                manufacturer_annual_data_table, iteration_log],
-                                                          callback=None,
-                                                          error_callback=error_callback))
+        # submit the largest manufacturers first so they don't end up as stragglers
+        base_year_vehicle_counts = dict.fromkeys(Vehicle.compliance_ids, 0)
+        for v in omega_globals.finalized_vehicles:
+            if v.compliance_id in base_year_vehicle_counts:
+                base_year_vehicle_counts[v.compliance_id] += 1
+
+        # worker results, or exceptions, are queued by the pool callbacks as the workers complete
+        completed_results = queue.Queue()
+
+        def worker_error_callback(e):
+            error_callback(e)
+            completed_results.put(e)
+
+        for compliance_id in sorted(Vehicle.compliance_ids, key=lambda cid: (-base_year_vehicle_counts[cid], cid)):
+            omega_globals.pool.apply_async(func=run_compliance_id_worker,
+                                           args=[compliance_id, pass_num, omega_globals.cumulative_battery_GWh,
+                                                 credit_banks, manufacturer_annual_data_table, iteration_log],
+                                           callback=completed_results.put,
+                                           error_callback=worker_error_callback)
+
+        # load results as they complete, merge them in compliance id order.  If a worker fails, the result files of
+        # the remaining workers are removed as they complete, then the worker exception is raised
+        compliance_id_results = dict()
+        worker_exception = None
+        for _ in Vehicle.compliance_ids:
+            worker_results = completed_results.get()
+            if isinstance(worker_results, BaseException):
+                worker_exception = worker_exception or worker_results
+            elif worker_exception:
+                remove_compliance_id_result_files(worker_results[1])
+            else:
+                compliance_id_results[worker_results[0]] = load_compliance_id_results(worker_results)
 
-        compliance_id_results = sorted([r.get() for r in results])
+        if worker_exception:
+            raise worker_exception
 
-        for (compliance_id, cid_finalized_vehicles, cid_credit_bank, cid_iteration_log, cid_vehicle_annual_data,
+        for compliance_id in sorted(compliance_id_results):
+            (cid_finalized_vehicles, cid_credit_bank, cid_iteration_log, cid_vehicle_annual_data,
              cid_manufacturer_annual_data, cid_context_new_vehicle_generalized_costs,
-             cid_session_new_vehicle_generalized_costs, cid_cost_tracker) in compliance_id_results:
+             cid_session_new_vehicle_generalized_costs, cid_cost_tracker) = compliance_id_results.pop(compliance_id)
 
             cid_finalized_vehicles.sort()
             omega_globals.finalized_vehicles.extend(cid_finalized_vehicles)
@@ -479,7 +645,9 @@ def run_producer_consumer(pass_num, manufacturer_annual_data_table):
             run_compliance_id(compliance_id, pass_num, omega_globals.cumulative_battery_GWh, credit_banks,
                               manufacturer_annual_data_table, iteration_log)
 
-    iteration_log_df = pd.DataFrame(iteration_log)
+    iteration_log_df = iteration_log.get_dataframe()
+
+    iteration_log.clear()
 
     iteration_log_df = iteration_log_df.drop_duplicates()
 
@@ -564,7 +732,7 @@ def iterate_producer_cross_subsidy(calendar_year, compliance_id, best_producer_d
             consumer share response with best convergence
         candidate_mfr_composite_vehicles ([CompositeVehicles]): list of manufacturer composite vehicles, production
             candidates
-        iteration_log (DataFrame): DataFrame of producer-consumer and cross-subsidy iteration data
+        iteration_log (ColumnarIterationLog): log of producer-consumer and cross-subsidy iteration data
         producer_consumer_iteration_num (int): producer-consumer iteration number
         producer_market_classes (list): list of candidate_mfr_composite_vehicles grouped by market class
         producer_decision (Series): result of producer compliance search, *without* consumer response
@@ -728,7 +896,7 @@ def search_cross_subsidies(calendar_year, compliance_id, mcat, cross_subsidy_gro
         cross_subsidy_options_and_response (DataFrame, Series): initially empty dataframe or Series containing cross
             subsidy options and response
         producer_consumer_iteration_num (int): producer-consumer iteration number
-        iteration_log (DataFrame): DataFrame of producer-consumer iteration data
+        iteration_log (ColumnarIterationLog): log of producer-consumer iteration data
 
     Returns:
         tuple of ``cross_subsidy_options_and_response``, updated ``iteration_log``
@@ -740,11 +908,15 @@ def search_cross_subsidies(calendar_year, compliance_id, mcat, cross_subsidy_gro
     prev_multiplier_range = dict()
     continue_search = True
 
+    num_evaluations = 0
+
     while continue_search:
         continue_search, cross_subsidy_options = \
             create_cross_subsidy_options(calendar_year, continue_search, cross_subsidy_group, multiplier_columns,
                                          prev_multiplier_range, producer_decision, cross_subsidy_options_and_response)
 
+        num_evaluations += len(cross_subsidy_options)
+
         cross_subsidy_options_and_response = \
             omega_globals.options.SalesShare.calc_shares(calendar_year, compliance_id, producer_decision,
                                                          cross_subsidy_options, mcat, cross_subsidy_group)
@@ -805,12 +977,236 @@ def search_cross_subsidies(calendar_year, compliance_id, mcat, cross_subsidy_gro
     update_cross_subsidy_group_console_log(cross_subsidy_group, share_convergence_error, cross_subsidy_pricing_error,
                                           mcat_converged)
 
+    update_cross_subsidy_search_stats(mcat_cross_subsidy_iteration_num, num_evaluations, mcat_converged)
+
     if 'cross_subsidy_search' in omega_globals.options.verbose_console_modules:
         omega_log.logwrite('')
 
     return cross_subsidy_options_and_response, iteration_log
 
 
+def solve_cross_subsidies(calendar_year, compliance_id, mcat, cross_subsidy_group, producer_decision,
+                          cross_subsidy_options_and_response, producer_consumer_iteration_num, iteration_log):
+    """
+    Solve for the cross-subsidy multipliers that zero the error between producer and consumer market shares while
+    maintaining revenue neutrality for the producer, an alternative to the grid search of ``search_cross_subsidies()``.
+
+    The absolute share errors of all but one market class of the group (the shares sum to the parent share) and the
+    average price ratio error are treated as functions of the multipliers and solved in the least-squares sense with a
+    damped Newton method, bounded by the min and max multipliers.  The price ratio error is heavily weighted so the
+    solution maintains revenue neutrality where the consumer share constraints prevent share convergence.  The
+    Jacobian is calculated by forward differences, the perturbed multipliers are evaluated in the same consumer
+    response call as the current multipliers.
+
+    Args:
+        calendar_year (int): the year in which the compliance calculations take place
+        compliance_id (str): name of manufacturer, e.g. 'consolidated_OEM'
+        mcat (str): market category, e.g. 'hauling' / 'non_hauling'
+        cross_subsidy_group (list): list of cross-subsidized market classes, e.g. ['hauling.BEV', 'hauling.ICE']
+        producer_decision (Series): result of producer compliance search, *without* consumer response
+        cross_subsidy_options_and_response (DataFrame, Series): initially empty dataframe or Series containing cross
+            subsidy options and response
+        producer_consumer_iteration_num (int): producer-consumer iteration number
+        iteration_log (ColumnarIterationLog): log of producer-consumer iteration data
+
+    Returns:
+        tuple of ``cross_subsidy_options_and_response``, updated ``iteration_log``
+
+    """
+    multiplier_columns = ['cost_multiplier_%s' % mc for mc in cross_subsidy_group]
+    multiplier_min = omega_globals.options.consumer_pricing_multiplier_min
+    multiplier_max = omega_globals.options.consumer_pricing_multiplier_max
+    multiplier_step = 1e-4
+    price_residual_weight = 1e3  # revenue neutrality takes precedence over share convergence
+
+    multipliers = np.ones(len(cross_subsidy_group))
+    solve_multiplier = np.full(len(cross_subsidy_group), not omega_globals.options.producer_shares_mode)
+    for idx, mc in enumerate(cross_subsidy_group):
+        if omega_globals.locked_price_modification_data and mc in omega_globals.locked_price_modification_data:
+            # use recorded multipliers
+            multipliers[idx] = omega_globals.locked_price_modification_data[mc]['market_class_multiplier']
+            solve_multiplier[idx] = False
+    solve_indices = np.nonzero(solve_multiplier)[0]
+
+    num_evaluations = 0
+
+    def evaluate(multipliers):
+        """
+        Evaluate the consumer response to the given multipliers and their forward-difference perturbations.
+
+        Args:
+            multipliers (array): cross subsidy multipliers by market class
+
+        Returns:
+            tuple of the consumer response to ``multipliers`` (Series), the residuals (array) and the Jacobian of the
+            residuals with respect to the solved multipliers (2D array)
+
+        """
+        nonlocal num_evaluations
+
+        multiplier_options = [multipliers]
+        steps = []
+        for idx in solve_indices:
+            step = multiplier_step if multipliers[idx] + multiplier_step <= multiplier_max else -multiplier_step
+            perturbed_multipliers = multipliers.copy()
+            perturbed_multipliers[idx] += step
+            multiplier_options.append(perturbed_multipliers)
+            steps.append(step)
+
+        response = calc_cross_subsidy_options_response(calendar_year, compliance_id, mcat, cross_subsidy_group,
+                                                       multiplier_columns, np.array(multiplier_options),
+                                                       producer_decision, cross_subsidy_options_and_response)
+        num_evaluations += len(response)
+
+        residuals = [response['consumer_abs_share_frac_%s' % mc].values -
+                     producer_decision['producer_abs_share_frac_%s' % mc] for mc in cross_subsidy_group[:-1]]
+        residuals.append(price_residual_weight * response['pricing_price_ratio_delta_%s_raw' % mcat].values)
+        residuals = np.array(residuals, dtype=float)
+
+        jacobian = (residuals[:, 1:] - residuals[:, [0]]) / np.array(steps)
+
+        response = response.iloc[0].copy()
+        response['pricing_score'] = \
+            response['pricing_price_ratio_delta_%s' % mcat] + response['abs_share_delta_%s' % mcat]
+
+        if 'cross_subsidy_search' in omega_globals.options.verbose_log_modules:
+            iteration_log.append(response.copy())
+
+        return response, residuals[:, 0], jacobian
+
+    response, residuals, jacobian = evaluate(multipliers)
+    best_response = response
+
+    mcat_cross_subsidy_iteration_num = 0
+    while True:
+        share_convergence_error = response['abs_share_delta_%s' % mcat]
+        cross_subsidy_pricing_error = response['pricing_price_ratio_delta_%s' % mcat]
+
+        mcat_converged = (cross_subsidy_pricing_error <=
+                          omega_globals.options.producer_cross_subsidy_price_tolerance) \
+                         and \
+                         (share_convergence_error <= omega_globals.options.producer_consumer_convergence_tolerance)
+
+        if mcat_converged or not len(solve_indices) or \
+                mcat_cross_subsidy_iteration_num >= omega_globals.options.cross_subsidy_solver_max_iterations:
+            break
+
+        # least-squares step, market classes held at their min or max share by the consumer response have no
+        # influence on the residuals and are ignored
+        newton_step = np.zeros_like(multipliers)
+        newton_step[solve_indices] = np.linalg.lstsq(jacobian, -residuals, rcond=1e-6)[0]
+
+        # damp the step until the residuals improve
+        damping = 1.0
+        improved = False
+        while not improved and damping >= 1 / 16:
+            new_multipliers = np.clip(multipliers + damping * newton_step, multiplier_min, multiplier_max)
+            new_response, new_residuals, new_jacobian = evaluate(new_multipliers)
+            improved = np.linalg.norm(new_residuals) < np.linalg.norm(residuals)
+            damping /= 2
+
+        mcat_cross_subsidy_iteration_num += 1
+
+        if not improved or np.all(new_multipliers == multipliers):
+            break  # no further improvement available within the multiplier limits
+
+        multipliers, response, residuals, jacobian = new_multipliers, new_response, new_residuals, new_jacobian
+
+        if response['pricing_score'] < best_response['pricing_score']:
+            best_response = response
+
+        if 'cross_subsidy_search' in omega_globals.options.verbose_console_modules:
+            omega_log.logwrite('%s = %s R:%s' % (' / '.join(multiplier_columns), multipliers, residuals))
+
+    cross_subsidy_options_and_response = best_response
+    cross_subsidy_options_and_response['selected_cross_subsidy_option'] = 1
+    cross_subsidy_options_and_response['cross_subsidy_iteration_num_%s' % mcat] = mcat_cross_subsidy_iteration_num
+
+    share_convergence_error = cross_subsidy_options_and_response['abs_share_delta_%s' % mcat]
+    cross_subsidy_pricing_error = cross_subsidy_options_and_response['pricing_price_ratio_delta_%s' % mcat]
+
+    mcat_converged = (cross_subsidy_pricing_error <= omega_globals.options.producer_cross_subsidy_price_tolerance) \
+        and (share_convergence_error <= omega_globals.options.producer_consumer_convergence_tolerance)
+
+    # update iteration log
+    update_cross_subsidy_log_data(cross_subsidy_options_and_response, calendar_year, compliance_id, mcat_converged,
+                                  producer_consumer_iteration_num, None, share_convergence_error)
+
+    iteration_log.append(cross_subsidy_options_and_response)
+
+    if cross_subsidy_options_and_response['consumer_constrained_%s' % mcat] and \
+            'p-c_shares_and_costs' in omega_globals.options.verbose_console_modules:
+        omega_log.logwrite('%%%%%% consumer %s shares constrained %%%%%%' % mcat)
+
+    update_cross_subsidy_group_console_log(cross_subsidy_group, share_convergence_error, cross_subsidy_pricing_error,
+                                          mcat_converged)
+
+    update_cross_subsidy_search_stats(mcat_cross_subsidy_iteration_num, num_evaluations, mcat_converged)
+
+    return cross_subsidy_options_and_response, iteration_log
+
+
+def calc_cross_subsidy_options_response(calendar_year, compliance_id, mcat, cross_subsidy_group, multiplier_columns,
+                                        multipliers, producer_decision, cross_subsidy_options_and_response):
+    """
+    Calculate the consumer response and cross-subsidy metrics of the given cross subsidy multipliers.
+
+    Args:
+        calendar_year (int): the year in which the compliance calculations take place
+        compliance_id (str): name of manufacturer, e.g. 'consolidated_OEM'
+        mcat (str): market category, e.g. 'hauling' / 'non_hauling'
+        cross_subsidy_group (list): list of cross-subsidized market classes, e.g. ['hauling.BEV', 'hauling.ICE']
+        multiplier_columns ([strs]): list of cost multiplier columns,
+            e.g. ['cost_multiplier_hauling.BEV', 'cost_multiplier_hauling.ICE', ...]
+        multipliers (2D array): cross subsidy multipliers by option (rows) and market class (columns)
+        producer_decision (Series): result of producer compliance search, *without* consumer response
+        cross_subsidy_options_and_response (DataFrame, Series): initially empty dataframe or Series containing cross
+            subsidy options and response of previously searched market categories
+
+    Returns:
+        DataFrame of cross subsidy options and response, one row per row of ``multipliers``
+
+    """
+    if cross_subsidy_options_and_response.empty:
+        price_options_df = pd.DataFrame()
+    else:
+        price_options_df = cross_subsidy_options_and_response.to_frame().transpose()
+        # drop multiplier columns to prevent duplicates during cartesian product:
+        price_options_df = price_options_df.drop(multiplier_columns, axis=1, errors='ignore')
+
+    price_options_df = cartesian_prod(price_options_df, pd.DataFrame(multipliers, columns=multiplier_columns))
+
+    for mc, mcc in zip(cross_subsidy_group, multiplier_columns):
+        calc_cross_subsidy_prices(calendar_year, mc, mcc, producer_decision, price_options_df)
+
+    cross_subsidy_options_and_response = \
+        omega_globals.options.SalesShare.calc_shares(calendar_year, compliance_id, producer_decision,
+                                                     price_options_df, mcat, cross_subsidy_group)
+
+    calc_cross_subsidy_metrics(mcat, cross_subsidy_group, producer_decision, cross_subsidy_options_and_response)
+
+    return cross_subsidy_options_and_response
+
+
+def update_cross_subsidy_search_stats(num_iterations, num_evaluations, converged):
+    """
+    Update the cross subsidy search statistics of the current compliance id.
+
+    Args:
+        num_iterations (int): number of search iterations
+        num_evaluations (int): number of cross subsidy options evaluated (consumer responses calculated)
+        converged (bool): ``True`` if the search converged
+
+    Returns:
+        Nothing, updates ``cross_subsidy_search_stats``
+
+    """
+    cross_subsidy_search_stats['searches'] = cross_subsidy_search_stats.get('searches', 0) + 1
+    cross_subsidy_search_stats['iterations'] = cross_subsidy_search_stats.get('iterations', 0) + num_iterations
+    cross_subsidy_search_stats['evaluations'] = cross_subsidy_search_stats.get('evaluations', 0) + num_evaluations
+    cross_subsidy_search_stats['converged'] = cross_subsidy_search_stats.get('converged', 0) + converged
+
+
 def update_cross_subsidy_group_console_log(cross_subsidy_group, share_convergence_error, cross_subsidy_pricing_error,
                                           mcat_converged):
     """
@@ -960,13 +1356,7 @@ def create_cross_subsidy_options(calendar_year, continue_search, mc_pair, multip
 
         price_options_df = cartesian_prod(price_options_df, pd.DataFrame(multiplier_range, columns=[mcc]))
 
-        price_options_df['average_ALT_cross_subsidized_price_%s' % mc] = \
-            producer_decision['average_ALT_new_vehicle_mfr_cost_%s' % mc] * price_options_df[mcc].values
-
-        price_modification = PriceModifications.get_price_modification(calendar_year, mc)
-
-        price_options_df['average_ALT_modified_cross_subsidized_price_%s' % mc] = \
-            price_options_df['average_ALT_cross_subsidized_price_%s' % mc].values + price_modification
+        calc_cross_subsidy_prices(calendar_year, mc, mcc, producer_decision, price_options_df)
 
         prev_multiplier_range[mcc] = multiplier_range
 
@@ -978,6 +1368,31 @@ def create_cross_subsidy_options(calendar_year, continue_search, mc_pair, multip
     return continue_search, price_options_df
 
 
+def calc_cross_subsidy_prices(calendar_year, mc, multiplier_column, producer_decision, price_options_df):
+    """
+    Calculate the cross subsidized and modified cross subsidized prices of a market class for each cross subsidy
+    pricing option.
+
+    Args:
+        calendar_year (int): calendar year of the iteration
+        mc (str): market class, e.g. 'hauling.BEV'
+        multiplier_column (str): name of the market class multiplier column, e.g. 'cost_multiplier_hauling.BEV'
+        producer_decision (DataFrame): producer production decision dataframe
+        price_options_df (DataFrame): cross subsidy pricing options
+
+    Returns:
+        Nothing, updates ``price_options_df``
+
+    """
+    price_options_df['average_ALT_cross_subsidized_price_%s' % mc] = \
+        producer_decision['average_ALT_new_vehicle_mfr_cost_%s' % mc] * price_options_df[multiplier_column].values
+
+    price_modification = PriceModifications.get_price_modification(calendar_year, mc)
+
+    price_options_df['average_ALT_modified_cross_subsidized_price_%s' % mc] = \
+        price_options_df['average_ALT_cross_subsidized_price_%s' % mc].values + price_modification
+
+
 def tighten_multiplier_range(multiplier_column, prev_multiplier_ranges, producer_decision_and_response,
                              search_collapsed):
     """
@@ -1361,6 +1776,62 @@ def detect_producer_consumer_convergence(producer_decision_and_response, produce
     return converged, share_convergence_error, cross_subsidy_pricing_error
 
 
+def accelerate_producer_consumer_shares(producer_decision_and_response, share_history):
+    """
+    Adjust the consumer shares passed to the next producer compliance search according to
+    ``producer_consumer_acceleration``.
+
+    With ``'relaxation'`` the shares are blended from the producer and consumer shares, which damps share oscillation
+    between producer-consumer iterations.  With ``'anderson'`` the shares are extrapolated from up to
+    ``producer_consumer_anderson_depth`` prior iterations by Anderson mixing, i.e. the combination of the prior
+    iterations that minimizes the share residual (consumer minus producer shares) is relaxed instead.  Extrapolated
+    shares outside of [0, 1] fall back to relaxation.  Both are affine combinations of share vectors, so child
+    market class shares still sum to their parent market category shares.
+
+    Args:
+        producer_decision_and_response (Series): producer compliance search result with consumer share response
+        share_history (list): list of prior (share columns, producer shares, consumer shares) tuples for the current
+            calendar year, updated in place
+
+    Returns:
+        A copy of ``producer_decision_and_response`` with adjusted consumer shares
+
+    """
+    consumer_share_columns = [c for c in producer_decision_and_response.index
+                              if c.startswith('consumer_abs_share_frac_') and
+                              c.replace('consumer', 'producer', 1) in producer_decision_and_response]
+    producer_share_columns = [c.replace('consumer', 'producer', 1) for c in consumer_share_columns]
+
+    producer_shares = producer_decision_and_response[producer_share_columns].values.astype(float)
+    consumer_shares = producer_decision_and_response[consumer_share_columns].values.astype(float)
+
+    if share_history and share_history[-1][0] != consumer_share_columns:
+        share_history.clear()  # prior iterations are not comparable
+
+    share_history.append((consumer_share_columns, producer_shares, consumer_shares))
+    del share_history[:-(omega_globals.options.producer_consumer_anderson_depth + 1)]
+
+    relaxation_factor = omega_globals.options.producer_consumer_relaxation_factor
+    shares = producer_shares + relaxation_factor * (consumer_shares - producer_shares)
+
+    if omega_globals.options.producer_consumer_acceleration == 'anderson' and len(share_history) > 1:
+        prior_shares = np.array([h[1] for h in share_history])
+        residuals = np.array([h[2] - h[1] for h in share_history])
+        delta_shares = np.diff(prior_shares, axis=0).T
+        delta_residuals = np.diff(residuals, axis=0).T
+
+        gamma = np.linalg.lstsq(delta_residuals, residuals[-1], rcond=None)[0]
+        extrapolated_shares = shares - (delta_shares + relaxation_factor * delta_residuals) @ gamma
+
+        if np.all(extrapolated_shares >= -1e-9) and np.all(extrapolated_shares <= 1 + 1e-9):
+            shares = np.clip(extrapolated_shares, 0, 1)
+
+    consumer_response = producer_decision_and_response.copy()
+    consumer_response[consumer_share_columns] = shares
+
+    return consumer_response
+
+
 def get_module(module_name):
     """
     Get a Python module by module name
@@ -1462,20 +1933,29 @@ def init_user_definable_decomposition_attributes(verbose_init):
         ``producer.vehicles.DecompositionAttributes``, ``producer.vehicles.Vehicle``
 
     """
+    from common.input_snapshots import InputSnapshots
     from policy.drive_cycles import DriveCycles
     from producer.vehicles import Vehicle, DecompositionAttributes
 
     init_fail = []
 
     # init drive cycles PRIOR to CostCloud since CostCloud needs the drive cycle names for validation
-    init_fail += DriveCycles.init_from_file(omega_globals.options.drive_cycles_file,
-                                            verbose=verbose_init)
+    init_fail += InputSnapshots.init_from_file(DriveCycles.init_from_file, omega_globals.options.drive_cycles_file,
+                                               DriveCycles, ['_data', 'drive_cycle_names'], verbose=verbose_init)
+
+    CostCloud = omega_globals.options.CostCloud
+    init_fail += InputSnapshots.init_from_file(CostCloud.init_cost_clouds_from_files,
+                                               [omega_globals.options.ice_vehicle_simulation_results_file,
+                                                omega_globals.options.bev_vehicle_simulation_results_file,
+                                                omega_globals.options.phev_vehicle_simulation_results_file],
+                                               CostCloud, ['tech_flags', 'rse_names', 'cost_cloud_data_columns'],
+                                               module_data=['_cache'],
+                                               extra_key_files=[omega_globals.options.drive_cycles_file],
+                                               verbose=verbose_init)
 
-    init_fail += omega_globals.options.CostCloud. \
-        init_cost_clouds_from_files(omega_globals.options.ice_vehicle_simulation_results_file,
-                                    omega_globals.options.bev_vehicle_simulation_results_file,
-                                    omega_globals.options.phev_vehicle_simulation_results_file,
-                                    verbose=verbose_init)
+    # check the RSEs after the (possible) snapshot restore, the check grid depends on the base year vehicles file
+    if not init_fail and omega_globals.options.check_cost_cloud_rses:
+        init_fail += CostCloud.check_rses(verbose=verbose_init)
 
     init_fail += omega_globals.options.OffCycleCredits.init_from_file(omega_globals.options.offcycle_credits_file,
                                                                       verbose=verbose_init)
@@ -1506,8 +1986,12 @@ def init_omega(session_runtime_options):
     omega_globals.options = session_runtime_options
 
     if omega_globals.options.auto_close_figures:
-        import matplotlib
-        matplotlib.use('Agg')
+        # matplotlib is only loaded if plots are made, so select its non-interactive backend without importing it
+        if 'matplotlib' in sys.modules:
+            import matplotlib
+            matplotlib.use('Agg')
+        else:
+            os.environ['MPLBACKEND'] = 'Agg'
 
     omega_log.init_logfile()
 
@@ -1548,10 +2032,14 @@ def init_omega(session_runtime_options):
 
     from consumer.sales_volume import init_sales_volume
 
+    from common.input_snapshots import InputSnapshots
+
     file_io.validate_folder(omega_globals.options.output_folder)
 
     verbose_init = omega_globals.options.verbose
 
+    InputSnapshots.init()
+
     try:
         init_fail = init_user_definable_decomposition_attributes(verbose_init)
 
@@ -1572,11 +2060,18 @@ def init_omega(session_runtime_options):
         init_fail += omega_globals.options.OnroadVMT.init_from_file(omega_globals.options.onroad_vmt_file,
                                                                     verbose=verbose_init)
 
-        init_fail += OnroadFuel.init_from_file(omega_globals.options.onroad_fuels_file,
-                                               verbose=verbose_init)
-
-        init_fail += NewVehicleMarket.init_from_file(omega_globals.options.context_new_vehicle_market_file,
-                                                     verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(OnroadFuel.init_from_file,
+                                                   omega_globals.options.onroad_fuels_file,
+                                                   OnroadFuel, ['_data', 'fuel_ids'], verbose=verbose_init)
+
+        init_fail += InputSnapshots.init_from_file(NewVehicleMarket.init_from_file,
+                                                   omega_globals.options.context_new_vehicle_market_file,
+                                                   NewVehicleMarket,
+                                                   ['_data', '_data_by_csc_rc', '_data_by_rc', '_data_by_csc',
+                                                    '_data_by_bs', '_data_by_total', 'hauling_context_size_class_info',
+                                                    'context_size_classes', 'context_ids', 'context_case_ids'],
+                                                   key_options=['context_id', 'context_case_id'],
+                                                   verbose=verbose_init)
 
         # must come after NewVehicleMarket and OnroadFuel init for input validation
         init_fail += FuelPrice.init_from_file(omega_globals.options.context_fuel_prices_file,
@@ -1586,8 +2081,8 @@ def init_omega(session_runtime_options):
             omega_globals.options.context_electricity_prices_file, verbose=verbose_init
         )
 
-        init_fail += BodyStyles.init_from_file(omega_globals.options.body_styles_file,
-                                               verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(BodyStyles.init_from_file, omega_globals.options.body_styles_file,
+                                                   BodyStyles, ['body_styles'], verbose=verbose_init)
 
         NewVehicleMarket.init_context_new_vehicle_generalized_costs(
             omega_globals.options.context_new_vehicle_generalized_costs_file)
@@ -1601,32 +2096,40 @@ def init_omega(session_runtime_options):
         init_fail += ProductionConstraints.init_from_file(omega_globals.options.production_constraints_file,
                                                           verbose=verbose_init)
 
-        init_fail += MassScaling.init_from_file(omega_globals.options.mass_scaling_file,
-                                                verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(MassScaling.init_from_file,
+                                                   omega_globals.options.mass_scaling_file,
+                                                   MassScaling, ['_data', 'structure_materials'],
+                                                   verbose=verbose_init)
 
-        init_fail += UpstreamMethods.init_from_file(omega_globals.options.fuel_upstream_methods_file,
-                                                    verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(UpstreamMethods.init_from_file,
+                                                   omega_globals.options.fuel_upstream_methods_file,
+                                                   UpstreamMethods, ['_data', '_cache'], verbose=verbose_init)
 
-        init_fail += UtilityFactorMethods.init_from_file(omega_globals.options.utility_factor_methods_file,
-                                                    verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(UtilityFactorMethods.init_from_file,
+                                                   omega_globals.options.utility_factor_methods_file,
+                                                   UtilityFactorMethods, ['_data', '_cache', '_start_year_table'],
+                                                   verbose=verbose_init)
 
         init_fail += RequiredSalesShare.init_from_file(omega_globals.options.required_sales_share_file,
                                                        verbose=verbose_init)
 
-        init_fail += DriveCycleWeights.init_from_file(omega_globals.options.drive_cycle_weights_file,
-                                                      verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(DriveCycleWeights.init_from_file,
+                                                   omega_globals.options.drive_cycle_weights_file,
+                                                   DriveCycleWeights, ['_data'], verbose=verbose_init)
 
-        init_fail += DriveCycleBallast.init_from_file(omega_globals.options.drive_cycle_ballast_file,
-                                                      verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(DriveCycleBallast.init_from_file,
+                                                   omega_globals.options.drive_cycle_ballast_file,
+                                                   DriveCycleBallast, ['_data'], verbose=verbose_init)
 
-        init_fail += Incentives.init_from_file(omega_globals.options.production_multipliers_file,
-                                               verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(Incentives.init_from_file,
+                                                   omega_globals.options.production_multipliers_file,
+                                                   Incentives, ['_data'], verbose=verbose_init)
 
         init_fail += omega_globals.options.VehicleTargets.init_from_file(omega_globals.options.policy_targets_file,
                                                                          verbose=verbose_init)
 
-        init_fail += PolicyFuel.init_from_file(omega_globals.options.policy_fuels_file,
-                                               verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(PolicyFuel.init_from_file, omega_globals.options.policy_fuels_file,
+                                                   PolicyFuel, ['_data', 'fuel_ids'], verbose=verbose_init)
 
         init_fail += CreditBank.validate_ghg_credit_params_template(omega_globals.options.ghg_credit_params_file,
                                                                     verbose=verbose_init)
@@ -1634,14 +2137,18 @@ def init_omega(session_runtime_options):
         init_fail += Manufacturer.init_from_file(omega_globals.options.manufacturers_file,
                                                           verbose=verbose_init)
 
-        init_fail += WorkFactor.init_from_file(omega_globals.options.workfactor_definition_file, verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(WorkFactor.init_from_file,
+                                                   omega_globals.options.workfactor_definition_file,
+                                                   WorkFactor, ['_data', '_cache', 'start_years'],
+                                                   verbose=verbose_init)
 
         # must be after Manufacturer init for input validation
         init_fail += CreditBank.validate_ghg_credits_template(omega_globals.options.ghg_credits_file,
                                                               verbose=verbose_init)
 
-        init_fail += ImplicitPriceDeflators.init_from_file(omega_globals.options.ip_deflators_file,
-                                                           verbose=verbose_init)
+        init_fail += InputSnapshots.init_from_file(ImplicitPriceDeflators.init_from_file,
+                                                   omega_globals.options.ip_deflators_file,
+                                                   ImplicitPriceDeflators, ['_data', '_cache'], verbose=verbose_init)
 
         init_fail += omega_globals.options.PowertrainCost.init_from_file(omega_globals.options.powertrain_cost_input_file,
                                                    verbose=verbose_init)
@@ -1660,6 +2167,8 @@ def init_omega(session_runtime_options):
             init_fail += Vehicle.init_from_file(omega_globals.options.onroad_vehicle_calculations_file,
                                                      verbose=verbose_init)
 
+        InputSnapshots.report()
+
         if not init_fail:
             # initial year = initial fleet model year (latest year of data)
             omega_globals.options.analysis_initial_year = \
@@ -1824,7 +2333,9 @@ def run_omega(session_runtime_options, standalone_run=False):
                                   omega_globals.options.session_unique_name, omega_globals.pass_num),
                               omega_globals.options.notification_email, omega_globals.options.notification_password)
 
-                # postproc session
+                # postproc session, imported on first use since it loads matplotlib
+                import postproc_session
+
                 manufacturer_annual_data_table, manufacturer_gigawatthour_limit_data = \
                     postproc_session.run_postproc(iteration_log, credit_banks)
 
@@ -1099,6 +1099,7 @@ class OMEGABatchCLIOptions(OMEGABase):
         self.verbose = False
         self.timestamp = None
         self.auto_close_figures = True
+        self.postproc_plots = True
         self.dispy = False
         self.dispy_ping = False
         self.dispy_debug = False
@@ -1143,6 +1144,7 @@ def run_bundled_sessions(options, remote_batchfile, session_list):
     batch.force_numeric_developer_params()
     batch.get_batch_settings()
     batch.settings.auto_close_figures = options.auto_close_figures
+    batch.settings.postproc_plots = options.postproc_plots
     batch.add_sessions(verbose=False)
     # process sessions:
     for s_index in session_list:
@@ -1210,7 +1212,7 @@ def run_bundled_sessions(options, remote_batchfile, session_list):
 def run_omega_batch(no_validate=False, no_sim=False, bundle_path=None, no_bundle=False,
                     batch_file='', session_num=None, verbose=False, timestamp=None, show_figures=False, dispy=False,
                     dispy_ping=False, dispy_debug=False, dispy_exclusive=False, dispy_scheduler=None, local=False,
-                    network=False, analysis_final_year=None):
+                    network=False, analysis_final_year=None, no_plots=False):
     """
     The top-level entry point for running a batch with the given settings, called from the GUI with a dictionary
     of arguments.  Reads the source batch file, expanding factorially where there are multi-valued parameters, bundles
@@ -1237,6 +1239,8 @@ def run_omega_batch(no_validate=False, no_sim=False, bundle_path=None, no_bundle
         local (bool): if ``True`` then run ``dispy`` parallel processing on the local machine only, no network nodes
         network (bool): if ``True`` then allow ``dispy`` parallel processing on networked nodes
         analysis_final_year (int): optional override for the analysis final year batch parameter
+        no_plots (bool): skip generating postproc figures if ``True``, postproc summary and output files are still
+            generated
 
     Returns:
         Nothing
@@ -1260,6 +1264,7 @@ def run_omega_batch(no_validate=False, no_sim=False, bundle_path=None, no_bundle
     options.verbose = verbose
     options.timestamp = timestamp
     options.auto_close_figures = not show_figures
+    options.postproc_plots = not no_plots
     options.dispy = dispy
     options.dispy_ping = dispy_ping
     options.dispy_debug = dispy_debug
@@ -1565,6 +1570,8 @@ if __name__ == '__main__':
     parser.add_argument('--timestamp', type=str,
                         help='Timestamp string, overrides creating timestamp from system clock', default=None)
     parser.add_argument('--show_figures', action='store_true', help='Display figure windows (no auto-close)')
+    parser.add_argument('--no_plots', action='store_true',
+                        help='Skip generating postproc figures, summary and output files are still generated')
     parser.add_argument('--dispy', action='store_true', help='Run sessions on dispynode(s)')
     parser.add_argument('--dispy_ping', action='store_true', help='Ping dispynode(s)')
     parser.add_argument('--dispy_debug', action='store_true', help='Enable verbose dispy debug messages')
@@ -1635,7 +1642,8 @@ if __name__ == '__main__':
                             verbose=args.verbose, timestamp=args.timestamp, show_figures=args.show_figures,
                             dispy=args.dispy, dispy_ping=args.dispy_ping, dispy_debug=args.dispy_debug,
                             dispy_exclusive=args.dispy_exclusive, dispy_scheduler=args.dispy_scheduler,
-                            local=args.local, network=args.network, analysis_final_year=args.analysis_final_year)
+                            local=args.local, network=args.network, analysis_final_year=args.analysis_final_year,
+                            no_plots=args.no_plots)
         except:
             import traceback
 
@@ -10,7 +10,9 @@ the tests to each other.
 
 ``class DriveCycleWeights`` loads the share tree input file, validates the leaves of the tree against known cycles
 and provides methods to query the tree for weighted results.  Most of the heavy lifting is done by
-``class WeightedTree``, see ``omega_trees.py``
+``class WeightedTree``, see ``omega_trees.py``.  Each queried node is compiled once into a weight vector (drive cycle
+names and coefficients) so weighted results are vector products of the coefficients and the cycle results, for a
+single vehicle or a whole cloud at once.
 
 Child share weights must add up to 1.0 at each node of the tree, with the exception of weights with the value ``None``,
 these are used to ignore unused nodes (different vehicle types have different numbers of drive cycle phases but share
@@ -92,6 +94,9 @@ class DriveCycleWeights(OMEGABase):
     """
     
     _data = dict()  # private dict, drive cycle weights by fuel class and calendar year
+
+    # charge-sustaining phases blended with charge-depleting phases by the (FTP, HWFET, US06) PHEV utility factors
+    phev_utility_factor_phases = (('ftp_1', 'ftp_2', 'ftp_3', 'ftp_4'), ('hwfet',), ('us06_1', 'us06_2'))
     
     @staticmethod
     def validate_drive_cycle_names(tree, filename):
@@ -182,10 +187,67 @@ class DriveCycleWeights(OMEGABase):
                                     DriveCycleWeights._data[fc] = dict()
                                 DriveCycleWeights._data[fc][calendar_year] = tree
 
-                DriveCycleWeights._data[fc]['start_year'] = np.array([*DriveCycleWeights._data[fc]])  # CU
+                DriveCycleWeights._data[fc]['start_year_table'] = StartYearTable([*DriveCycleWeights._data[fc]])
 
         return template_errors
 
+    @staticmethod
+    def get_weight_vector(calendar_year, fueling_class, node_id=None, weighted=True):
+        """
+        Get the compiled weight vector of a share tree node, i.e. the drive cycle (leaf) names of the node and their
+        coefficients.  A node's (weighted) value is the vector product of the coefficients and the cycle values.
+
+        Args:
+            calendar_year (numeric): calendar year of the share tree
+            fueling_class (str): e.g. 'ICE', 'BEV', etc
+            node_id (str): name of tree node,  e.g. 'cs_cert_direct_oncycle_co2e_grams_per_mile'
+            weighted (bool): if True, return weighted value coefficients (node value * weight),
+                else return node value coefficients
+
+        Returns:
+            tuple of drive cycle names and an array of their coefficients
+
+        """
+        cache_key = calendar_year, fueling_class, node_id, weighted
+
+        if cache_key not in DriveCycleWeights._data:
+
+            start_year = DriveCycleWeights._data[fueling_class]['start_year_table'].get_start_year(calendar_year)
+            if start_year is not None:
+                DriveCycleWeights._data[cache_key] = \
+                    DriveCycleWeights._data[fueling_class][start_year].calc_coefficients(node_id=node_id,
+                                                                                         weighted=weighted)
+            else:
+                raise Exception('Missing drive cycle weights for %s, %d or prior' % (fueling_class, calendar_year))
+
+        return DriveCycleWeights._data[cache_key]
+
+    @staticmethod
+    def calc_vector_product(cycle_names, coefficients, cycle_values):
+        """
+        Calculate the vector product of weight coefficients and cycle values.
+
+        Args:
+            cycle_names (list): drive cycle names, e.g. from ``get_weight_vector()``
+            coefficients (array): drive cycle coefficients, e.g. from ``get_weight_vector()``
+            cycle_values (dict, DataFrame): contains cycle values to be weighted, scalars or arrays, one per cycle
+                name
+
+        Returns:
+            The weighted value, a pandas ``Series`` if ``cycle_values`` is a DataFrame, else a scalar or array
+
+        """
+        values = [cycle_values[cn] for cn in cycle_names]
+
+        if type(cycle_values) is pd.DataFrame:
+            return pd.Series(np.dot(coefficients, values), index=cycle_values.index, dtype=float)
+
+        try:
+            return np.dot(coefficients, values)
+        except ValueError:
+            # mix of scalar and array cycle values
+            return np.dot(coefficients, np.broadcast_arrays(*values))
+
     @staticmethod
     def calc_weighted_value(calendar_year, fueling_class, cycle_values, node_id=None, weighted=True):
         """
@@ -207,23 +269,54 @@ class DriveCycleWeights(OMEGABase):
             A pandas ``Series`` object of the weighted results
 
         """
-        cache_key = calendar_year, fueling_class, node_id, weighted
+        cycle_names, coefficients = \
+            DriveCycleWeights.get_weight_vector(calendar_year, fueling_class, node_id, weighted)
 
-        if cache_key not in DriveCycleWeights._data:
+        return DriveCycleWeights.calc_vector_product(cycle_names, coefficients, cycle_values)
 
-            start_years = DriveCycleWeights._data[fueling_class]['start_year']
-            if len(start_years[start_years <= calendar_year]) > 0:
-                calendar_year = max(start_years[start_years <= calendar_year])
-                try:
-                    eq_str = DriveCycleWeights._data[fueling_class][calendar_year].calc_value(cycle_values, node_id=node_id,
-                                                                      weighted=weighted)[1]
-                except:
-                    print('drive cycle weights exception !!!')
-                DriveCycleWeights._data[cache_key] = eq_str
-            else:
-                raise Exception('Missing drive cycle weights for %s, %d or prior' % (fueling_class, calendar_year))
+    @staticmethod
+    def calc_phev_weighted_value(calendar_year, cycle_values, node_id, utility_factors):
+        """
+        Query the PHEV share tree for a charge-sustaining node value after each charge-sustaining phase result
+        has been blended with the corresponding charge-depleting result by the phase utility factor, i.e.
+        ``uf * cd + (1 - uf) * cs``.  The blend is applied to the weight vector products, so the cycle values are
+        not modified.
 
-        return Eval.eval(DriveCycleWeights._data[cache_key], {}, {'results': cycle_values})
+        Args:
+            calendar_year (numeric): calendar year to calculated weighted value in
+            cycle_values (dict, DataFrame): contains charge-depleting and charge-sustaining cycle phase values
+            node_id (str): name of charge-sustaining tree node, e.g. 'cs_cert_direct_oncycle_co2e_grams_per_mile'
+            utility_factors (tuple): (FTP, HWFET, US06) utility factors, see ``calc_phev_utility_factors()``
+
+        Returns:
+            The blended node value
+
+        """
+        cycle_names, coefficients = DriveCycleWeights.get_weight_vector(calendar_year, 'PHEV', node_id, False)
+
+        cache_key = calendar_year, 'PHEV', node_id, 'utility_factor_blend'
+
+        if cache_key not in DriveCycleWeights._data:
+            # split the charge-sustaining phases by utility factor and pair them with their charge-depleting phases
+            blend_vectors = []
+            for phases in DriveCycleWeights.phev_utility_factor_phases:
+                blend_idx = [idx for idx, cn in enumerate(cycle_names)
+                             if cn.startswith('cs_') and cn.split(':')[0][3:] in phases]
+                blend_vectors.append(([cycle_names[idx] for idx in blend_idx],
+                                      ['cd_' + cycle_names[idx][3:] for idx in blend_idx],
+                                      coefficients[blend_idx]))
+            DriveCycleWeights._data[cache_key] = blend_vectors
+
+        value = DriveCycleWeights.calc_vector_product(cycle_names, coefficients, cycle_values)
+
+        for utility_factor, (cs_names, cd_names, blend_coefficients) in \
+                zip(utility_factors, DriveCycleWeights._data[cache_key]):
+            if cs_names:
+                value = value + utility_factor * \
+                        (DriveCycleWeights.calc_vector_product(cd_names, blend_coefficients, cycle_values) -
+                         DriveCycleWeights.calc_vector_product(cs_names, blend_coefficients, cycle_values))
+
+        return value
 
     @staticmethod
     def calc_cert_direct_oncycle_co2e_grams_per_mile(calendar_year, fueling_class, cycle_values):
@@ -241,49 +334,12 @@ class DriveCycleWeights(OMEGABase):
 
         """
         if fueling_class == 'PHEV':
-            ftp_cd_uf, hwfet_cd_uf, us06_uf = \
-                DriveCycleWeights.calc_phev_utility_factors(calendar_year, cycle_values)
-
-            phev_cycle_values = cycle_values.copy()
-
-            cd_ftp_1_co2e_grams_per_mile = cycle_values['cd_ftp_1:cert_direct_oncycle_co2e_grams_per_mile']
-            cd_ftp_2_co2e_grams_per_mile = cycle_values['cd_ftp_2:cert_direct_oncycle_co2e_grams_per_mile']
-            cd_ftp_3_co2e_grams_per_mile = cycle_values['cd_ftp_3:cert_direct_oncycle_co2e_grams_per_mile']
-            cd_ftp_4_co2e_grams_per_mile = cycle_values['cd_ftp_4:cert_direct_oncycle_co2e_grams_per_mile']
-            cd_hwfet_co2e_grams_per_mile = cycle_values['cd_hwfet:cert_direct_oncycle_co2e_grams_per_mile']
-            cd_us06_1_co2e_grams_per_mile = cycle_values['cd_us06_1:cert_direct_oncycle_co2e_grams_per_mile']
-            cd_us06_2_co2e_grams_per_mile = cycle_values['cd_us06_2:cert_direct_oncycle_co2e_grams_per_mile']
-
-            cs_ftp_1_co2e_grams_per_mile = cycle_values['cs_ftp_1:cert_direct_oncycle_co2e_grams_per_mile']
-            cs_ftp_2_co2e_grams_per_mile = cycle_values['cs_ftp_2:cert_direct_oncycle_co2e_grams_per_mile']
-            cs_ftp_3_co2e_grams_per_mile = cycle_values['cs_ftp_3:cert_direct_oncycle_co2e_grams_per_mile']
-            cs_ftp_4_co2e_grams_per_mile = cycle_values['cs_ftp_4:cert_direct_oncycle_co2e_grams_per_mile']
-            cs_hwfet_co2e_grams_per_mile = cycle_values['cs_hwfet:cert_direct_oncycle_co2e_grams_per_mile']
-            cs_us06_1_co2e_grams_per_mile = cycle_values['cs_us06_1:cert_direct_oncycle_co2e_grams_per_mile']
-            cs_us06_2_co2e_grams_per_mile = cycle_values['cs_us06_2:cert_direct_oncycle_co2e_grams_per_mile']
-
-            phev_cycle_values['cs_ftp_1:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                ftp_cd_uf * cd_ftp_1_co2e_grams_per_mile + (1 - ftp_cd_uf) * cs_ftp_1_co2e_grams_per_mile
-            phev_cycle_values['cs_ftp_2:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                ftp_cd_uf * cd_ftp_2_co2e_grams_per_mile + (1 - ftp_cd_uf) * cs_ftp_2_co2e_grams_per_mile
-            phev_cycle_values['cs_ftp_3:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                ftp_cd_uf * cd_ftp_3_co2e_grams_per_mile + (1 - ftp_cd_uf) * cs_ftp_3_co2e_grams_per_mile
-            phev_cycle_values['cs_ftp_4:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                ftp_cd_uf * cd_ftp_4_co2e_grams_per_mile + (1 - ftp_cd_uf) * cs_ftp_4_co2e_grams_per_mile
-            phev_cycle_values['cs_hwfet:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                hwfet_cd_uf * cd_hwfet_co2e_grams_per_mile + (1 - hwfet_cd_uf) * cs_hwfet_co2e_grams_per_mile
-            phev_cycle_values['cs_us06_1:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                us06_uf * cd_us06_1_co2e_grams_per_mile + (1 - us06_uf) * cs_us06_1_co2e_grams_per_mile
-            phev_cycle_values['cs_us06_2:cert_direct_oncycle_co2e_grams_per_mile'] = \
-                us06_uf * cd_us06_2_co2e_grams_per_mile + (1 - us06_uf) * cs_us06_2_co2e_grams_per_mile
+            utility_factors = DriveCycleWeights.calc_phev_utility_factors(calendar_year, cycle_values)
 
             cs_cert_direct_oncycle_co2e_grams_per_mile = \
-                DriveCycleWeights.calc_weighted_value(calendar_year, fueling_class, phev_cycle_values,
-                                                      'cs_cert_direct_oncycle_co2e_grams_per_mile', weighted=False)
-
-            # cd_cert_direct_oncycle_co2e_grams_per_mile = \
-            #     DriveCycleWeights.calc_weighted_value(calendar_year, fueling_class, phev_cycle_values,
-            #                                           'cd_cert_direct_oncycle_co2e_grams_per_mile', weighted=False)
+                DriveCycleWeights.calc_phev_weighted_value(calendar_year, cycle_values,
+                                                           'cs_cert_direct_oncycle_co2e_grams_per_mile',
+                                                           utility_factors)
 
         else:
             cs_cert_direct_oncycle_co2e_grams_per_mile = \
@@ -312,53 +368,21 @@ class DriveCycleWeights(OMEGABase):
         utility_factor = 0
 
         if fueling_class == 'PHEV':
-            ftp_cd_uf, hwfet_cd_uf, us06_uf = DriveCycleWeights.calc_phev_utility_factors(calendar_year, cycle_values)
-
             if charge_depleting_only:
+                # utility factors are not needed for charge-depleting values, which also keeps this path array-safe
                 cd_cert_direct_oncycle_kwh_per_mile = \
                     DriveCycleWeights.calc_weighted_value(calendar_year, fueling_class, cycle_values,
                                                       'cd_cert_direct_oncycle_kwh_per_mile', weighted=False)
             else:
-                phev_cycle_values = cycle_values.copy()
-
-                cd_ftp_1_kwh_per_mile = cycle_values['cd_ftp_1:cert_direct_oncycle_kwh_per_mile']
-                cd_ftp_2_kwh_per_mile = cycle_values['cd_ftp_2:cert_direct_oncycle_kwh_per_mile']
-                cd_ftp_3_kwh_per_mile = cycle_values['cd_ftp_3:cert_direct_oncycle_kwh_per_mile']
-                cd_ftp_4_kwh_per_mile = cycle_values['cd_ftp_4:cert_direct_oncycle_kwh_per_mile']
-                cd_hwfet_kwh_per_mile = cycle_values['cd_hwfet:cert_direct_oncycle_kwh_per_mile']
-                cd_us06_1_kwh_per_mile = cycle_values['cd_us06_1:cert_direct_oncycle_kwh_per_mile']
-                cd_us06_2_kwh_per_mile = cycle_values['cd_us06_2:cert_direct_oncycle_kwh_per_mile']
-
-                cs_ftp_1_kwh_per_mile = cycle_values['cs_ftp_1:cert_direct_oncycle_kwh_per_mile']
-                cs_ftp_2_kwh_per_mile = cycle_values['cs_ftp_2:cert_direct_oncycle_kwh_per_mile']
-                cs_ftp_3_kwh_per_mile = cycle_values['cs_ftp_3:cert_direct_oncycle_kwh_per_mile']
-                cs_ftp_4_kwh_per_mile = cycle_values['cs_ftp_4:cert_direct_oncycle_kwh_per_mile']
-                cs_hwfet_kwh_per_mile = cycle_values['cs_hwfet:cert_direct_oncycle_kwh_per_mile']
-                cs_us06_1_kwh_per_mile = cycle_values['cs_us06_1:cert_direct_oncycle_kwh_per_mile']
-                cs_us06_2_kwh_per_mile = cycle_values['cs_us06_2:cert_direct_oncycle_kwh_per_mile']
-
-                phev_cycle_values['cs_ftp_1:cert_direct_oncycle_kwh_per_mile'] = \
-                    ftp_cd_uf * cd_ftp_1_kwh_per_mile + (1 - ftp_cd_uf) * cs_ftp_1_kwh_per_mile
-                phev_cycle_values['cs_ftp_2:cert_direct_oncycle_kwh_per_mile'] = \
-                    ftp_cd_uf * cd_ftp_2_kwh_per_mile + (1 - ftp_cd_uf) * cs_ftp_2_kwh_per_mile
-                phev_cycle_values['cs_ftp_3:cert_direct_oncycle_kwh_per_mile'] = \
-                    ftp_cd_uf * cd_ftp_3_kwh_per_mile + (1 - ftp_cd_uf) * cs_ftp_3_kwh_per_mile
-                phev_cycle_values['cs_ftp_4:cert_direct_oncycle_kwh_per_mile'] = \
-                    ftp_cd_uf * cd_ftp_4_kwh_per_mile + (1 - ftp_cd_uf) * cs_ftp_4_kwh_per_mile
-                phev_cycle_values['cs_hwfet:cert_direct_oncycle_kwh_per_mile'] = \
-                    hwfet_cd_uf * cd_hwfet_kwh_per_mile + (1 - hwfet_cd_uf) * cs_hwfet_kwh_per_mile
-                phev_cycle_values['cs_us06_1:cert_direct_oncycle_kwh_per_mile'] = \
-                    us06_uf * cd_us06_1_kwh_per_mile + (1 - us06_uf) * cs_us06_1_kwh_per_mile
-                phev_cycle_values['cs_us06_2:cert_direct_oncycle_kwh_per_mile'] = \
-                    us06_uf * cd_us06_2_kwh_per_mile + (1 - us06_uf) * cs_us06_2_kwh_per_mile
+                utility_factors = DriveCycleWeights.calc_phev_utility_factors(calendar_year, cycle_values)
 
                 cs_cert_direct_oncycle_kwh_per_mile = \
-                    DriveCycleWeights.calc_weighted_value(calendar_year, fueling_class, phev_cycle_values,
-                                                          'cs_cert_direct_oncycle_kwh_per_mile', weighted=False)
+                    DriveCycleWeights.calc_phev_weighted_value(calendar_year, cycle_values,
+                                                               'cs_cert_direct_oncycle_kwh_per_mile', utility_factors)
 
                 # calculate weighted utility factor
                 cd_cert_direct_oncycle_kwh_per_mile = \
-                    DriveCycleWeights.calc_weighted_value(calendar_year, fueling_class, phev_cycle_values,
+                    DriveCycleWeights.calc_weighted_value(calendar_year, fueling_class, cycle_values,
                                                           'cd_cert_direct_oncycle_kwh_per_mile', weighted=False)
 
                 utility_factor = cs_cert_direct_oncycle_kwh_per_mile / cd_cert_direct_oncycle_kwh_per_mile
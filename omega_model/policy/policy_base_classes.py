@@ -154,6 +154,31 @@ class VehicleTargetsBase:
         raise Exception('**Attempt to call abstract method TargetsBase.%s() without child class override**' %
                         inspect.currentframe().f_code.co_name)
 
+    @staticmethod
+    def calc_target_and_cert_co2e_Mg(vehicle, cert_co2e_grams_per_mile, footprint_ft2=None, curbweight_lbs=None,
+                                     sales_variants=1):
+        """
+        Calculate target and cert CO2e Mg for variants of a vehicle (e.g. cost cloud points) in a single call.
+        The standards are looked up once for the vehicle's reg class and model year and the vehicle is not modified.
+
+        Includes the effect of production multipliers.
+
+        Args:
+            vehicle (Vehicle): the vehicle, provides the reg class, model year and other vehicle-level attributes
+            cert_co2e_grams_per_mile (numeric list-like): cert CO2e g/mi of each variant
+            footprint_ft2 (numeric list-like): optional footprint of each variant, else the vehicle footprint is used
+            curbweight_lbs (numeric list-like): optional curb weight of each variant, else the vehicle curb weight is
+                used
+            sales_variants (numeric list-like): optional sales variants
+
+        Returns:
+
+            tuple of target and cert CO2e Mg arrays, one value per variant.
+
+        """
+        raise Exception('**Attempt to call abstract method TargetsBase.%s() without child class override**' %
+                        inspect.currentframe().f_code.co_name)
+
     @staticmethod
     def init_from_file(filename, verbose=False):
         """
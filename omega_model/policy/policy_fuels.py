@@ -95,10 +95,8 @@ class PolicyFuel(OMEGABase):
         cache_key = (calendar_year, fuel_id, attribute)
 
         if cache_key not in PolicyFuel._data:
-            start_years = np.atleast_1d(PolicyFuel._data['start_year'][fuel_id])
-            if len(start_years[start_years <= calendar_year]) > 0:
-                year = max([yr for yr in start_years if yr <= calendar_year])
-
+            year = PolicyFuel._data['start_year_table'][fuel_id].get_start_year(calendar_year)
+            if year is not None:
                 PolicyFuel._data[cache_key] = PolicyFuel._data[fuel_id, year][attribute]
             else:
                 raise Exception('Missing policy fuel values for %s, %d or prior' % (fuel_id, calendar_year))
@@ -147,6 +145,9 @@ class PolicyFuel(OMEGABase):
         if not template_errors:
             PolicyFuel._data = df.set_index(['fuel_id', 'start_year']).to_dict(orient='index')
             PolicyFuel._data.update(df[['start_year', 'fuel_id']].set_index('fuel_id').to_dict(orient='series'))
+            PolicyFuel._data['start_year_table'] = \
+                {fuel_id: StartYearTable(df.loc[df['fuel_id'] == fuel_id, 'start_year'])
+                 for fuel_id in df['fuel_id'].unique()}
             PolicyFuel.fuel_ids = df['fuel_id'].unique()
 
         return template_errors
@@ -116,11 +116,10 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
 
         if cache_key not in VehicleTargets._data:
 
-            start_years = VehicleTargets._data[vehicle.reg_class_id]['start_year']
-
-            if len(start_years[start_years <= vehicle.model_year]) > 0:
-                model_year = max(start_years[start_years <= vehicle.model_year])
+            model_year = \
+                VehicleTargets._data[vehicle.reg_class_id]['start_year_table'].get_start_year(vehicle.model_year)
 
+            if model_year is not None:
                 coefficients = VehicleTargets._data[vehicle.reg_class_id, model_year]
 
                 if vehicle.footprint_ft2 <= coefficients['fp_min']:
@@ -154,11 +153,9 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
         cache_key = (reg_class_id, model_year, 'lifetime_vmt')
 
         if cache_key not in VehicleTargets._data:
-            start_years = VehicleTargets._data[reg_class_id]['start_year']
-
-            if len(start_years[start_years <= model_year]) > 0:
-                year = max(start_years[start_years <= model_year])
+            year = VehicleTargets._data[reg_class_id]['start_year_table'].get_start_year(model_year)
 
+            if year is not None:
                 VehicleTargets._data[cache_key] = VehicleTargets._data[reg_class_id, year]['lifetime_vmt']
             else:
                 raise Exception('Missing GHG target lifetime VMT parameters for %s, %d or prior'
@@ -186,11 +183,10 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             Target CO2e Mg value(s) for the given vehicle and/or sales variants.
 
         """
-        start_years = VehicleTargets._data[vehicle.reg_class_id]['start_year']
-
-        if len(start_years[start_years <= vehicle.model_year]) > 0:
-            vehicle_model_year = max(start_years[start_years <= vehicle.model_year])
+        vehicle_model_year = \
+            VehicleTargets._data[vehicle.reg_class_id]['start_year_table'].get_start_year(vehicle.model_year)
 
+        if vehicle_model_year is not None:
             vehicle.lifetime_VMT = VehicleTargets.calc_cert_lifetime_vmt(vehicle.reg_class_id, vehicle_model_year)
 
             co2_gpmi = VehicleTargets.calc_target_co2e_gpmi(vehicle)
@@ -231,12 +227,10 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             Cert CO2e Mg value(s) for the given vehicle, CO2e g/mi variants and/or sales variants.
 
         """
-        start_years = VehicleTargets._data[vehicle.reg_class_id]['start_year']
-
-        if len(start_years[start_years <= vehicle.model_year]) > 0:
-
-            vehicle_model_year = max(start_years[start_years <= vehicle.model_year])
+        vehicle_model_year = \
+            VehicleTargets._data[vehicle.reg_class_id]['start_year_table'].get_start_year(vehicle.model_year)
 
+        if vehicle_model_year is not None:
             vehicle.lifetime_VMT = VehicleTargets.calc_cert_lifetime_vmt(vehicle.reg_class_id, vehicle_model_year)
 
             if co2_gpmi_variants is not None:
@@ -258,6 +252,53 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             raise Exception('Missing GHG target parameters for %s, %d or prior'
                             % (vehicle.reg_class_id, vehicle.model_year))
 
+    @staticmethod
+    def calc_target_and_cert_co2e_Mg(vehicle, cert_co2e_grams_per_mile, footprint_ft2=None, curbweight_lbs=None,
+                                     sales_variants=1):
+        """
+        Calculate target and cert CO2e Mg for variants of a vehicle (e.g. cost cloud points) in a single call.
+        The standards are looked up once for the vehicle's reg class and model year and the vehicle is not modified.
+
+        Includes the effect of production multipliers.
+
+        Args:
+            vehicle (Vehicle): the vehicle, provides the reg class, model year and other vehicle-level attributes
+            cert_co2e_grams_per_mile (numeric list-like): cert CO2e g/mi of each variant
+            footprint_ft2 (numeric list-like): optional footprint of each variant, else the vehicle footprint is used
+            curbweight_lbs (numeric list-like): not used by footprint-based targets
+            sales_variants (numeric list-like): optional sales variants
+
+        Returns:
+
+            tuple of target and cert CO2e Mg arrays, one value per variant.
+
+        """
+        model_year = VehicleTargets._data[vehicle.reg_class_id]['start_year_table'].get_start_year(vehicle.model_year)
+
+        if model_year is not None:
+            coefficients = VehicleTargets._data[vehicle.reg_class_id, model_year]
+            lifetime_VMT = VehicleTargets.calc_cert_lifetime_vmt(vehicle.reg_class_id, model_year)
+
+            if footprint_ft2 is None:
+                footprint_ft2 = vehicle.footprint_ft2
+            footprint_ft2 = np.asarray(footprint_ft2, dtype=float)
+
+            target_co2e_gpmi = np.where(footprint_ft2 <= coefficients['fp_min'], coefficients['a_coeff'],
+                                        np.where(footprint_ft2 > coefficients['fp_max'], coefficients['b_coeff'],
+                                                 footprint_ft2 * coefficients['c_coeff'] + coefficients['d_coeff']))
+
+            cert_co2e_gpmi = np.asarray(cert_co2e_grams_per_mile, dtype=float)
+            sales = np.asarray(sales_variants)
+            production_multiplier = Incentives.get_production_multiplier(vehicle)
+
+            target_co2e_Mg = target_co2e_gpmi * lifetime_VMT * sales * production_multiplier / 1e6
+            cert_co2e_Mg = cert_co2e_gpmi * lifetime_VMT * sales * production_multiplier / 1e6
+
+            return target_co2e_Mg, cert_co2e_Mg
+        else:
+            raise Exception('Missing GHG target parameters for %s, %d or prior'
+                            % (vehicle.reg_class_id, vehicle.model_year))
+
     @staticmethod
     def init_from_file(filename, verbose=False):
         """
@@ -302,7 +343,8 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             VehicleTargets._data = df.set_index(['reg_class_id', 'start_year']).sort_index().to_dict(orient='index')
 
             for rc in df['reg_class_id'].unique():
-                VehicleTargets._data[rc] = {'start_year': np.array(df['start_year'].loc[df['reg_class_id'] == rc])}
+                VehicleTargets._data[rc] = \
+                    {'start_year_table': StartYearTable(df['start_year'].loc[df['reg_class_id'] == rc])}
 
         return template_errors
 
@@ -73,7 +73,7 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
 
     """
     _cache = dict()  # the input file target equations
-    start_years = dict()
+    _start_year_tables = dict()  # private dict, StartYearTable by cert_fuel_id
     _data = dict()  # private dict, workfactor-based GHG target by cert_fuel_id and start year
 
     @staticmethod
@@ -88,9 +88,9 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             Vehicle target CO2e in g/mi.
 
         """
-        start_years = VehicleTargets.start_years[vehicle.cert_fuel_id]
+        year = VehicleTargets._start_year_tables[vehicle.cert_fuel_id].get_start_year(vehicle.model_year)
 
-        if len([yr for yr in start_years if yr <= vehicle.model_year]) > 0:
+        if year is not None:
 
             workfactor = 0
             if vehicle.reg_class_id == 'mediumduty':
@@ -100,7 +100,6 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
                 workfactor = WorkFactor.calc_workfactor(model_year, curbweight_lbs, gvwr_lbs, gcwr_lbs, drive_system)
 
             vehicle.workfactor = workfactor
-            year = max([yr for yr in start_years if yr <= vehicle.model_year])
             target = \
                 eval(VehicleTargets._cache[(vehicle.reg_class_id, year, vehicle.cert_fuel_id)]['co2_gram_per_mile'],
                      locals())
@@ -129,12 +128,9 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
 
         locals_dict = locals()
 
-        start_years = VehicleTargets.start_years[cert_fuel_id]
-
-        if len([yr for yr in start_years if yr <= model_year]) > 0:
-
-            year = max([yr for yr in start_years if yr <= model_year])
+        year = VehicleTargets._start_year_tables[cert_fuel_id].get_start_year(model_year)
 
+        if year is not None:
             useful_life = VehicleTargets._cache[(reg_class_id, year, cert_fuel_id)]['useful_life_miles']
         else:
             raise Exception(f'Missing GHG CO2e g/mi target parameters for {reg_class_id}, '
@@ -162,10 +158,9 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             Target CO2e Mg value(s) for the given vehicle and/or sales variants.
 
         """
-        start_years = VehicleTargets.start_years[vehicle.cert_fuel_id]
+        model_year = VehicleTargets._start_year_tables[vehicle.cert_fuel_id].get_start_year(vehicle.model_year)
 
-        if len([yr for yr in start_years if yr <= vehicle.model_year]) > 0:
-            model_year = max([yr for yr in start_years if yr <= vehicle.model_year])
+        if model_year is not None:
 
             vehicle.lifetime_VMT \
                 = VehicleTargets.calc_cert_useful_life_vmt(vehicle.reg_class_id, model_year, vehicle.cert_fuel_id)
@@ -208,10 +203,9 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             Cert CO2e Mg value(s) for the given vehicle, CO2e g/mi variants and/or sales variants.
 
         """
-        start_years = VehicleTargets.start_years[vehicle.cert_fuel_id]
+        model_year = VehicleTargets._start_year_tables[vehicle.cert_fuel_id].get_start_year(vehicle.model_year)
 
-        if len([yr for yr in start_years if yr <= vehicle.model_year]) > 0:
-            model_year = max([yr for yr in start_years if yr <= vehicle.model_year])
+        if model_year is not None:
 
             vehicle.lifetime_VMT \
                 = VehicleTargets.calc_cert_useful_life_vmt(vehicle.reg_class_id, model_year, vehicle.cert_fuel_id)
@@ -235,6 +229,59 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
             raise Exception(f'Missing GHG CO2e g/mi target parameters for {vehicle.reg_class_id}, '
                             f'{vehicle.model_year}, {vehicle.cert_fuel_id} or prior')
 
+    @staticmethod
+    def calc_target_and_cert_co2e_Mg(vehicle, cert_co2e_grams_per_mile, footprint_ft2=None, curbweight_lbs=None,
+                                     sales_variants=1):
+        """
+        Calculate target and cert CO2e Mg for variants of a vehicle (e.g. cost cloud points) in a single call.
+        The standards are looked up once for the vehicle's reg class, model year and cert fuel and the vehicle is not
+        modified.
+
+        Args:
+            vehicle (Vehicle): the vehicle, provides the reg class, model year and other vehicle-level attributes
+            cert_co2e_grams_per_mile (numeric list-like): cert CO2e g/mi of each variant
+            footprint_ft2 (numeric list-like): not used by workfactor-based targets
+            curbweight_lbs (numeric list-like): optional curb weight of each variant, else the vehicle curb weight is
+                used
+            sales_variants (numeric list-like): optional sales variants
+
+        Returns:
+
+            tuple of target and cert CO2e Mg arrays, one value per variant.
+
+        """
+        model_year = VehicleTargets._start_year_tables[vehicle.cert_fuel_id].get_start_year(vehicle.model_year)
+
+        if model_year is not None:
+
+            lifetime_VMT = \
+                VehicleTargets.calc_cert_useful_life_vmt(vehicle.reg_class_id, model_year, vehicle.cert_fuel_id)
+
+            if curbweight_lbs is None:
+                curbweight_lbs = vehicle.curbweight_lbs
+            curbweight_lbs = np.asarray(curbweight_lbs, dtype=float)
+
+            workfactor = 0
+            if vehicle.reg_class_id == 'mediumduty':
+                workfactor = WorkFactor.calc_workfactor(vehicle.model_year, curbweight_lbs, vehicle.gvwr_lbs,
+                                                        vehicle.gcwr_lbs, vehicle.drive_system)
+
+            target_co2e_gpmi = \
+                eval(VehicleTargets._cache[(vehicle.reg_class_id, model_year, vehicle.cert_fuel_id)]
+                     ['co2_gram_per_mile'], {'np': np}, {'workfactor': workfactor, 'vehicle': vehicle})
+            target_co2e_gpmi = np.broadcast_to(target_co2e_gpmi, np.shape(curbweight_lbs))
+
+            cert_co2e_gpmi = np.asarray(cert_co2e_grams_per_mile, dtype=float)
+            sales = np.asarray(sales_variants)
+
+            target_co2e_Mg = target_co2e_gpmi * lifetime_VMT * sales / pow(10, 6)
+            cert_co2e_Mg = cert_co2e_gpmi * lifetime_VMT * sales / pow(10, 6)
+
+            return target_co2e_Mg, cert_co2e_Mg
+        else:
+            raise Exception(f'Missing GHG CO2e g/mi target parameters for {vehicle.reg_class_id}, '
+                            f'{vehicle.model_year}, {vehicle.cert_fuel_id} or prior')
+
     @staticmethod
     def init_from_file(filename, verbose=False):
         """
@@ -250,7 +297,7 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
 
         """
         VehicleTargets._cache.clear()
-        VehicleTargets.start_years.clear()
+        VehicleTargets._start_year_tables.clear()
         VehicleTargets._data.clear()
 
         if verbose:
@@ -307,7 +354,8 @@ class VehicleTargets(OMEGABase, VehicleTargetsBase):
                     = compile(str(target_info['co2_gram_per_mile']), '<string>', 'eval')
 
             for fuel in df['cert_fuel_id'].unique():
-                VehicleTargets.start_years[fuel] = [yr for yr in df.loc[df['cert_fuel_id'] == fuel, 'start_year']]
+                VehicleTargets._start_year_tables[fuel] = \
+                    StartYearTable(df.loc[df['cert_fuel_id'] == fuel, 'start_year'])
 
         return template_errors
 
@@ -178,6 +178,8 @@ class UtilityFactorMethods(OMEGABase):
 
     _cache = dict()
 
+    _start_year_table = None  # private StartYearTable, maps calendar years to rows of ``_data``
+
     @staticmethod
     def calc_city_utility_factor(calendar_year, miles):
         """
@@ -196,15 +198,11 @@ class UtilityFactorMethods(OMEGABase):
 
         if cache_key not in UtilityFactorMethods._cache:
 
-            start_years = np.atleast_1d(UtilityFactorMethods._data['start_year'])
-            if len(start_years[start_years <= calendar_year]) > 0:
-                calendar_year = max(start_years[start_years <= calendar_year])
-
-                method = UtilityFactorMethods._data['city_method'].loc[
-                    UtilityFactorMethods._data['start_year'] == calendar_year].item()
+            row = UtilityFactorMethods._start_year_table.get_index(calendar_year)
+            if row is not None:
+                method = UtilityFactorMethods._data['city_method'].iloc[row]
 
-                norm_dist = UtilityFactorMethods._data['city_norm_dist'].loc[
-                    UtilityFactorMethods._data['start_year'] == calendar_year].item()
+                norm_dist = UtilityFactorMethods._data['city_norm_dist'].iloc[row]
 
                 UtilityFactorMethods._cache[cache_key + '_method'] = utility_factor_methods_dict[method]
                 UtilityFactorMethods._cache[cache_key + '_norm_dist'] = norm_dist
@@ -238,15 +236,11 @@ class UtilityFactorMethods(OMEGABase):
 
         if cache_key not in UtilityFactorMethods._cache:
 
-            start_years = np.atleast_1d(UtilityFactorMethods._data['start_year'])
-            if len(start_years[start_years <= calendar_year]) > 0:
-                calendar_year = max(start_years[start_years <= calendar_year])
-
-                method = UtilityFactorMethods._data['highway_method'].loc[
-                    UtilityFactorMethods._data['start_year'] == calendar_year].item()
+            row = UtilityFactorMethods._start_year_table.get_index(calendar_year)
+            if row is not None:
+                method = UtilityFactorMethods._data['highway_method'].iloc[row]
 
-                norm_dist = UtilityFactorMethods._data['highway_norm_dist'].loc[
-                    UtilityFactorMethods._data['start_year'] == calendar_year].item()
+                norm_dist = UtilityFactorMethods._data['highway_norm_dist'].iloc[row]
 
                 UtilityFactorMethods._cache[cache_key + '_method'] = utility_factor_methods_dict[method]
                 UtilityFactorMethods._cache[cache_key + '_norm_dist'] = norm_dist
@@ -296,7 +290,8 @@ class UtilityFactorMethods(OMEGABase):
                                                              verbose=verbose)
 
             if not template_errors:
-                UtilityFactorMethods._data = df
+                UtilityFactorMethods._data = df.sort_values('start_year').reset_index(drop=True)
+                UtilityFactorMethods._start_year_table = StartYearTable(df['start_year'])
 
         return template_errors
 
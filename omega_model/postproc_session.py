@@ -20,10 +20,59 @@ market_classes = []
 market_categories = []
 
 vehicle_data = []
+model_year_vehicles = dict()
 vehicle_annual_data = None
 mfr_cost_data = None
 mfr_market_share_results = None
 
+figure_queue = []  # (figure, filename) pairs waiting to be rendered by ``render_figures()``
+
+
+def save_figure(fig, filename):
+    """
+    Save a post-processing figure.  When figures are auto-closed the figure is queued and rendered later by
+    ``render_figures()``, otherwise it's saved immediately (figure windows may be re-used).
+
+    Args:
+        fig (Figure): the figure to save
+        filename (str): the name of the file to save
+
+    """
+    if omega_globals.options.auto_close_figures:
+        figure_queue.append((fig, filename))
+    else:
+        fig.savefig(filename)
+
+
+def render_figures():
+    """
+    Render the queued post-processing figures to their files then close them.  Figures are rendered in parallel by
+    the session's worker process pool if available and ``parallel_postproc_plots`` is ``True``, otherwise they are
+    rendered in the session process.
+
+    Returns:
+        Nothing, saves figure files and clears the ``figure_queue``
+
+    """
+    if omega_globals.options.parallel_postproc_plots and omega_globals.options.multiprocessing and \
+            omega_globals.pool is not None:
+        import pickle
+
+        results = []
+        for fig, filename in figure_queue:
+            results.append(omega_globals.pool.apply_async(func=save_pickled_figure,
+                                                          args=[pickle.dumps(fig), filename]))
+
+        [r.get() for r in results]
+    else:
+        for fig, filename in figure_queue:
+            fig.savefig(filename)
+
+    for fig, _ in figure_queue:
+        plt.close(fig)
+
+    figure_queue.clear()
+
 
 def run_postproc(iteration_log, credit_banks):
     """
@@ -39,7 +88,7 @@ def run_postproc(iteration_log, credit_banks):
     """
     from producer.vehicles import Vehicle
     import pandas as pd
-    global vehicle_data, vehicle_annual_data
+    global vehicle_data, model_year_vehicles, vehicle_annual_data
 
     global market_classes, market_categories
     market_classes = omega_globals.options.MarketClass.market_classes
@@ -57,6 +106,11 @@ def run_postproc(iteration_log, credit_banks):
 
     vehicle_data = sorted([v for v in omega_globals.finalized_vehicles if v.in_production])
 
+    # group production vehicles by model year once, the summary and plot data are tallied from the groups
+    model_year_vehicles = {cy: [] for cy in vehicle_years}
+    for v in vehicle_data:
+        model_year_vehicles.setdefault(v.model_year, []).append(v)
+
     vehicle_annual_data_df = pd.DataFrame(VehicleAnnualData._data)
     # index vehicle annual data by compliance id, vehicle id and age for quick access and save to csv
     # vehicle_annual_data_df = vehicle_annual_data_df.set_index(['compliance_id', 'vehicle_id', 'age'])
@@ -77,8 +131,8 @@ def run_postproc(iteration_log, credit_banks):
 
     analysis_years = vehicle_years[1:]
 
-    vehicles_table = pd.DataFrame([v.to_dict(types=[int, float, bool, str, np.int64, np.float64])
-                                   for v in sorted(omega_globals.finalized_vehicles)])
+    vehicles_table = OMEGABase.to_bulk_dataframe(sorted(omega_globals.finalized_vehicles),
+                                                 types=[int, float, bool, str, np.int64, np.float64])
     vehicles_table['vehicle_id'] = vehicles_table['vehicle_id'] + '_' + vehicles_table['reg_class_id']
     vehicles_table.to_csv(
         omega_globals.options.output_folder + omega_globals.options.session_unique_name + '_vehicles.csv',
@@ -222,7 +276,7 @@ def run_postproc(iteration_log, credit_banks):
             session_results['%s_model_year_cert_co2e_Mg' % compliance_id] = model_year_cert_co2e_Mg
 
     for compliance_id in Vehicle.compliance_ids:
-        if 'iteration' in omega_globals.options.verbose_postproc:
+        if 'iteration' in omega_globals.options.verbose_postproc and omega_globals.options.postproc_plots:
             plot_iteration(iteration_log, compliance_id)
 
         if not omega_globals.options.consolidate_manufacturers:
@@ -318,6 +372,8 @@ def run_postproc(iteration_log, credit_banks):
         pt_cost_df = pd.DataFrame.from_dict(omega_globals.options.PowertrainCost.cost_tracker, orient='index')
         pt_cost_df.to_csv(powertrain_costs_filename, index=False)
 
+    render_figures()
+
     return manufacturer_annual_data_table, mfr_gigawatthour_limit_data
 
 
@@ -415,7 +471,7 @@ def plot_cert_co2e_gpmi(calendar_years):
         weighted_value = 0
         count = 0
         vehicle_id_and_vmt_and_co2gpmi = [((v.compliance_id, v.vehicle_id), v.lifetime_VMT, v.cert_co2e_grams_per_mile)
-                                          for v in vehicle_data if v.model_year == cy]
+                                          for v in model_year_vehicles[cy]]
 
         for vehicle_id, lifetime_vmt, co2gpmi in vehicle_id_and_vmt_and_co2gpmi:
             weighted_value += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * lifetime_vmt * co2gpmi
@@ -431,7 +487,7 @@ def plot_cert_co2e_gpmi(calendar_years):
             count = 0
             vehicle_id_and_vmt_and_co2gpmi_market_class_id = \
                 [((v.compliance_id, v.vehicle_id), v.lifetime_VMT, v.cert_co2e_grams_per_mile, v.market_class_id)
-                 for v in vehicle_data if v.model_year == cy]
+                 for v in model_year_vehicles[cy]]
 
             for vehicle_id, lifetime_vmt, co2gpmi, market_class_id in vehicle_id_and_vmt_and_co2gpmi_market_class_id:
                 if mcat in market_class_id.split('.'):
@@ -462,32 +518,31 @@ def plot_cert_co2e_gpmi(calendar_years):
 
         co2e_data[mc] = market_class_co2e
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, co2e_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, co2e_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'CO2e [g/mi]',
-              '%s\nAverage Vehicle Cert CO2e g/mi by Market Category v Year' %
-              omega_globals.options.session_unique_name)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cert CO2e gpmi Mkt Cat.png' %
-        omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, co2e_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, co2e_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, co2e_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'CO2e [g/mi]',
+                  '%s\nAverage Vehicle Cert CO2e g/mi by Market Category v Year' %
+                  omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cert CO2e gpmi Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
+
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, co2e_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
 
-    label_xyt(ax1, 'Year', 'CO2e [g/mi]',
-              '%s\nAverage Vehicle Cert CO2e g/mi  by Market Class v Year' %
-              omega_globals.options.session_unique_name)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cert CO2e gpmi Mkt Cls.png' %
-        omega_globals.options.session_unique_name)
+        label_xyt(ax1, 'Year', 'CO2e [g/mi]',
+                  '%s\nAverage Vehicle Cert CO2e g/mi  by Market Class v Year' %
+                  omega_globals.options.session_unique_name)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cert CO2e gpmi Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
 
     return co2e_data
 
@@ -511,7 +566,7 @@ def plot_cert_direct_oncycle_co2e_gpmi(calendar_years):
         count = 0
         vehicle_id_and_vmt_and_co2gpmi = [((v.compliance_id, v.vehicle_id), v.lifetime_VMT,
                                            v.cert_direct_oncycle_co2e_grams_per_mile)
-                                          for v in vehicle_data if v.model_year == cy]
+                                          for v in model_year_vehicles[cy]]
 
         for vehicle_id, lifetime_vmt, co2gpmi in vehicle_id_and_vmt_and_co2gpmi:
             weighted_value += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * lifetime_vmt * co2gpmi
@@ -528,7 +583,7 @@ def plot_cert_direct_oncycle_co2e_gpmi(calendar_years):
             vehicle_id_and_vmt_and_co2gpmi_market_class_id = \
                 [((v.compliance_id, v.vehicle_id), v.lifetime_VMT, v.cert_direct_oncycle_co2e_grams_per_mile,
                   v.market_class_id)
-                 for v in vehicle_data if v.model_year == cy]
+                 for v in model_year_vehicles[cy]]
 
             for vehicle_id, lifetime_vmt, co2gpmi, market_class_id in vehicle_id_and_vmt_and_co2gpmi_market_class_id:
                 if mcat in market_class_id.split('.'):
@@ -559,32 +614,31 @@ def plot_cert_direct_oncycle_co2e_gpmi(calendar_years):
 
         co2e_data[mc] = market_class_co2e
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, co2e_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, co2e_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'CO2e [g/mi]',
-              '%s\nAverage Vehicle Cert Direct Oncycle CO2e g/mi by Market Category v Year' %
-              omega_globals.options.session_unique_name)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cert CO2e Direct gpmi Mkt Cat.png' %
-        omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, co2e_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, co2e_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, co2e_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'CO2e [g/mi]',
+                  '%s\nAverage Vehicle Cert Direct Oncycle CO2e g/mi by Market Category v Year' %
+                  omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cert CO2e Direct gpmi Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
 
-    label_xyt(ax1, 'Year', 'CO2e [g/mi]',
-              '%s\nAverage Vehicle Cert Direct Oncycle CO2e g/mi  by Market Class v Year' %
-              omega_globals.options.session_unique_name)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cert CO2e Direct gpmi Mkt Cls.png' %
-        omega_globals.options.session_unique_name)
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, co2e_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+
+        label_xyt(ax1, 'Year', 'CO2e [g/mi]',
+                  '%s\nAverage Vehicle Cert Direct Oncycle CO2e g/mi  by Market Class v Year' %
+                  omega_globals.options.session_unique_name)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cert CO2e Direct gpmi Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
 
     return co2e_data
 
@@ -608,7 +662,7 @@ def plot_cert_direct_kwh_pmi(calendar_years):
         weighted_value = 0
         count = 0
         vehicle_id_and_kwh = \
-            [((v.compliance_id, v.vehicle_id), v.cert_direct_kwh_per_mile) for v in vehicle_data if v.model_year == cy]
+            [((v.compliance_id, v.vehicle_id), v.cert_direct_kwh_per_mile) for v in model_year_vehicles[cy]]
 
         for vehicle_id, kwh in vehicle_id_and_kwh:
             weighted_value += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * kwh
@@ -625,7 +679,7 @@ def plot_cert_direct_kwh_pmi(calendar_years):
 
             vehicle_id_and_market_class_id_and_kwh = \
                 [((v.compliance_id, v.vehicle_id), v.market_class_id, v.cert_direct_kwh_per_mile)
-                 for v in vehicle_data if v.model_year == cy]
+                 for v in model_year_vehicles[cy]]
 
             for vehicle_id, market_class_id, kwh in vehicle_id_and_market_class_id_and_kwh:
                 if mcat in market_class_id.split('.'):
@@ -645,7 +699,7 @@ def plot_cert_direct_kwh_pmi(calendar_years):
 
             vehicle_id_and_kwh = \
                 [((v.compliance_id, v.vehicle_id), v.cert_direct_kwh_per_mile)
-                 for v in vehicle_data if v.model_year == cy and v.market_class_id == mc]
+                 for v in model_year_vehicles[cy] if v.market_class_id == mc]
 
             for vehicle_id, kwh in vehicle_id_and_kwh:
                 weighted_value += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * kwh
@@ -655,34 +709,33 @@ def plot_cert_direct_kwh_pmi(calendar_years):
 
         average_cert_direct_kwh_data[mc] = market_class_cost
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, average_cert_direct_kwh_data[mcat],
-                 **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, average_cert_direct_kwh_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'Energy Consumption [kWh/mi]',
-              '%s\nAverage Vehicle Cert kWh/mi by Market Category v Year' %
-              omega_globals.options.session_unique_name)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cert kWh pmi Mkt Cat.png' %
-        omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, average_cert_direct_kwh_data[mc],
-                 **omega_globals.options.MarketClass.get_linestyle(mc))
-
-    label_xyt(ax1, 'Year', 'Energy Consumption [kWh/mi]',
-              '%s\nAverage Vehicle Cert kWh/mi  by Market Class v Year' %
-              omega_globals.options.session_unique_name)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cert kWh pmi Mkt Cls.png' %
-        omega_globals.options.session_unique_name)
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, average_cert_direct_kwh_data[mcat],
+                     **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, average_cert_direct_kwh_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'Energy Consumption [kWh/mi]',
+                  '%s\nAverage Vehicle Cert kWh/mi by Market Category v Year' %
+                  omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cert kWh pmi Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
+
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, average_cert_direct_kwh_data[mc],
+                     **omega_globals.options.MarketClass.get_linestyle(mc))
+
+        label_xyt(ax1, 'Year', 'Energy Consumption [kWh/mi]',
+                  '%s\nAverage Vehicle Cert kWh/mi  by Market Class v Year' %
+                  omega_globals.options.session_unique_name)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cert kWh pmi Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
     return average_cert_direct_kwh_data
 
 
@@ -705,7 +758,7 @@ def plot_target_co2e_gpmi(calendar_years):
         count = 0
         vehicle_id_and_vmt_and_co2gpmi = \
             [((v.compliance_id, v.vehicle_id), v.lifetime_VMT, v.target_co2e_grams_per_mile)
-             for v in vehicle_data if v.model_year == cy]
+             for v in model_year_vehicles[cy]]
 
         for vehicle_id, lifetime_vmt, co2gpmi in vehicle_id_and_vmt_and_co2gpmi:
             weighted_value += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * lifetime_vmt * co2gpmi
@@ -721,7 +774,7 @@ def plot_target_co2e_gpmi(calendar_years):
             count = 0
             vehicle_id_and_vmt_and_co2gpmi_market_class_id = \
                 [((v.compliance_id, v.vehicle_id), v.lifetime_VMT, v.target_co2e_grams_per_mile, v.market_class_id)
-                 for v in vehicle_data if v.model_year == cy]
+                 for v in model_year_vehicles[cy]]
 
             for vehicle_id, lifetime_vmt, co2gpmi, market_class_id in vehicle_id_and_vmt_and_co2gpmi_market_class_id:
                 if mcat in market_class_id.split('.'):
@@ -752,32 +805,31 @@ def plot_target_co2e_gpmi(calendar_years):
 
         co2e_data[mc] = market_class_co2e
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, co2e_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, co2e_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'CO2e [g/mi]',
-              '%s\nAverage Vehicle Target CO2e g/mi by Market Category v Year' %
-              omega_globals.options.session_unique_name)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Target CO2e gpmi Mkt Cat.png' %
-        omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, co2e_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, co2e_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, co2e_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'CO2e [g/mi]',
+                  '%s\nAverage Vehicle Target CO2e g/mi by Market Category v Year' %
+                  omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Target CO2e gpmi Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
+
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, co2e_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
 
-    label_xyt(ax1, 'Year', 'CO2e [g/mi]',
-              '%s\nAverage Vehicle Target CO2e g/mi  by Market Class v Year' %
-              omega_globals.options.session_unique_name)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Target CO2e gpmi Mkt Cls.png' %
-        omega_globals.options.session_unique_name)
+        label_xyt(ax1, 'Year', 'CO2e [g/mi]',
+                  '%s\nAverage Vehicle Target CO2e g/mi  by Market Class v Year' %
+                  omega_globals.options.session_unique_name)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Target CO2e gpmi Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
 
     return co2e_data
 
@@ -802,7 +854,7 @@ def plot_vehicle_cost(calendar_years):
         weighted_cost = 0
         count = 0
         vehicle_id_and_cost = [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_cost_dollars)
-                               for v in vehicle_data if v.model_year == cy]
+                               for v in model_year_vehicles[cy]]
         for vehicle_id, cost in vehicle_id_and_cost:
             weighted_cost += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * cost
             count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -817,7 +869,7 @@ def plot_vehicle_cost(calendar_years):
             count = 0
             vehicle_id_and_market_class_id_and_cost = \
                 [((v.compliance_id, v.vehicle_id), v.market_class_id, v.new_vehicle_mfr_cost_dollars)
-                 for v in vehicle_data if v.model_year == cy]
+                 for v in model_year_vehicles[cy]]
 
             for vehicle_id, market_class_id, cost in vehicle_id_and_market_class_id_and_cost:
                 if mcat in market_class_id.split('.'):
@@ -835,7 +887,7 @@ def plot_vehicle_cost(calendar_years):
             weighted_cost = 0
             count = 0
             vehicle_id_and_cost = [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_cost_dollars)
-                                   for v in vehicle_data if v.model_year == cy and v.market_class_id == mc]
+                                   for v in model_year_vehicles[cy] if v.market_class_id == mc]
             for vehicle_id, cost in vehicle_id_and_cost:
                 weighted_cost += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * cost
                 count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -844,29 +896,30 @@ def plot_vehicle_cost(calendar_years):
 
         average_cost_data[mc] = market_class_cost
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, average_cost_data[mcat],
-                 **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, average_cost_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'Cost [$]',
-              '%s\nAverage Vehicle Cost by Market Category v Year' % omega_globals.options.session_unique_name)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cost Mkt Cat.png' % omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, average_cost_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, average_cost_data[mcat],
+                     **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, average_cost_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'Cost [$]',
+                  '%s\nAverage Vehicle Cost by Market Category v Year' % omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cost Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
 
-    label_xyt(ax1, 'Year', 'Cost [$]',
-              '%s\nAverage Vehicle Cost  by Market Class v Year' % omega_globals.options.session_unique_name)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V Cost Mkt Cls.png' % omega_globals.options.session_unique_name)
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, average_cost_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+
+        label_xyt(ax1, 'Year', 'Cost [$]',
+                  '%s\nAverage Vehicle Cost  by Market Class v Year' % omega_globals.options.session_unique_name)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Cost Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
 
     return average_cost_data
 
@@ -892,8 +945,8 @@ def plot_manufacturer_vehicle_cost(calendar_years, compliance_id):
     for cy in calendar_years:
         weighted_cost = 0
         count = 0
-        vehicle_id_and_cost = [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_cost_dollars) for v in vehicle_data
-                               if v.model_year == cy and v.compliance_id == compliance_id]
+        vehicle_id_and_cost = [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_cost_dollars)
+                               for v in model_year_vehicles[cy] if v.compliance_id == compliance_id]
 
         for vehicle_id, cost in vehicle_id_and_cost:
             weighted_cost += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * cost
@@ -910,7 +963,7 @@ def plot_manufacturer_vehicle_cost(calendar_years, compliance_id):
 
             vehicle_id_and_market_class_id_and_cost = \
                 [((v.compliance_id, v.vehicle_id), v.market_class_id, v.new_vehicle_mfr_cost_dollars)
-                 for v in vehicle_data if v.model_year == cy and v.compliance_id == compliance_id]
+                 for v in model_year_vehicles[cy] if v.compliance_id == compliance_id]
 
             for vehicle_id, market_class_id, cost in vehicle_id_and_market_class_id_and_cost:
                 if mcat in market_class_id.split('.'):
@@ -930,7 +983,7 @@ def plot_manufacturer_vehicle_cost(calendar_years, compliance_id):
 
             vehicle_id_and_cost = \
                 [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_cost_dollars)
-                 for v in vehicle_data if v.model_year == cy and v.market_class_id == mc and
+                 for v in model_year_vehicles[cy] if v.market_class_id == mc and
                  v.compliance_id == compliance_id]
 
             for vehicle_id, cost in vehicle_id_and_cost:
@@ -941,31 +994,32 @@ def plot_manufacturer_vehicle_cost(calendar_years, compliance_id):
 
         mfr_cost_data['%s_%s' % (compliance_id, mc)] = market_class_cost
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, mfr_cost_data['%s_%s' % (compliance_id, mcat)],
-                 **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, mfr_cost_data['%s_total' % compliance_id], '.-')
-    ax1.legend(market_categories + ['%s_total' % compliance_id])
-    label_xyt(ax1, 'Year', 'Cost [$]',
-              '%s %s\nAverage Vehicle Cost by Market Category v Year' %
-              (compliance_id, omega_globals.options.session_unique_name))
-    fig.savefig(omega_globals.options.output_folder + '%s %s V Cost Mkt Cat.png'
-                % (omega_globals.options.session_unique_name, compliance_id))
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, mfr_cost_data['%s_%s' % (compliance_id, mc)],
-                 **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, mfr_cost_data['%s_%s' % (compliance_id, mcat)],
+                     **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, mfr_cost_data['%s_total' % compliance_id], '.-')
+        ax1.legend(market_categories + ['%s_total' % compliance_id])
+        label_xyt(ax1, 'Year', 'Cost [$]',
+                  '%s %s\nAverage Vehicle Cost by Market Category v Year' %
+                  (compliance_id, omega_globals.options.session_unique_name))
+        save_figure(fig, omega_globals.options.output_folder + '%s %s V Cost Mkt Cat.png'
+                    % (omega_globals.options.session_unique_name, compliance_id))
+
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, mfr_cost_data['%s_%s' % (compliance_id, mc)],
+                     **omega_globals.options.MarketClass.get_linestyle(mc))
 
-    label_xyt(ax1, 'Year', 'Cost [$]',
-              '%s %s\nAverage Vehicle Cost  by Market Class v Year'
-              % (compliance_id, omega_globals.options.session_unique_name))
-    ax1.legend(market_classes)
-    fig.savefig(omega_globals.options.output_folder + '%s %s V Cost Mkt Cls.png'
-                % (omega_globals.options.session_unique_name, compliance_id))
+        label_xyt(ax1, 'Year', 'Cost [$]',
+                  '%s %s\nAverage Vehicle Cost  by Market Class v Year'
+                  % (compliance_id, omega_globals.options.session_unique_name))
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s %s V Cost Mkt Cls.png'
+                    % (omega_globals.options.session_unique_name, compliance_id))
 
     return mfr_cost_data
 
@@ -990,7 +1044,7 @@ def plot_vehicle_generalized_cost(calendar_years):
         weighted_cost = 0
         count = 0
         vehicle_id_and_cost = [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_generalized_cost_dollars)
-                               for v in vehicle_data if v.model_year == cy]
+                               for v in model_year_vehicles[cy]]
 
         for vehicle_id, cost in vehicle_id_and_cost:
             weighted_cost += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * cost
@@ -1007,7 +1061,7 @@ def plot_vehicle_generalized_cost(calendar_years):
 
             vehicle_id_and_market_class_id_and_cost = \
                 [((v.compliance_id, v.vehicle_id), v.market_class_id, v.new_vehicle_mfr_generalized_cost_dollars)
-                 for v in vehicle_data if v.model_year == cy]
+                 for v in model_year_vehicles[cy]]
 
             for vehicle_id, market_class_id, cost in vehicle_id_and_market_class_id_and_cost:
                 if mcat in market_class_id.split('.'):
@@ -1027,7 +1081,7 @@ def plot_vehicle_generalized_cost(calendar_years):
 
             vehicle_id_and_cost = \
                 [((v.compliance_id, v.vehicle_id), v.new_vehicle_mfr_generalized_cost_dollars)
-                 for v in vehicle_data if v.model_year == cy and v.market_class_id == mc]
+                 for v in model_year_vehicles[cy] if v.market_class_id == mc]
 
             for vehicle_id, cost in vehicle_id_and_cost:
                 weighted_cost += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count'] * cost
@@ -1037,33 +1091,32 @@ def plot_vehicle_generalized_cost(calendar_years):
 
         cost_data[mc] = market_class_cost
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, cost_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, cost_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'Cost [$]',
-              '%s\nAverage Vehicle Generalized Cost by Market Category v Year' %
-              omega_globals.options.session_unique_name)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V GenCost Mkt Cat.png' %
-        omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, cost_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, cost_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, cost_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'Cost [$]',
+                  '%s\nAverage Vehicle Generalized Cost by Market Category v Year' %
+                  omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V GenCost Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
 
-    label_xyt(ax1, 'Year', 'Cost [$]',
-              '%s\nAverage Vehicle Generalized_Cost  by Market Class v Year' %
-              omega_globals.options.session_unique_name)
-    # ax1.set_ylim(15e3, 80e3)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL V GenCost Mkt Cls.png' %
-        omega_globals.options.session_unique_name)
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, cost_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+
+        label_xyt(ax1, 'Year', 'Cost [$]',
+                  '%s\nAverage Vehicle Generalized_Cost  by Market Class v Year' %
+                  omega_globals.options.session_unique_name)
+        # ax1.set_ylim(15e3, 80e3)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V GenCost Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
 
     return cost_data
 
@@ -1085,12 +1138,12 @@ def plot_vehicle_megagrams(calendar_years):
     Mg_data['vehicle'] = []
     for cy in calendar_years:
         Mg_data['vehicle'].append(
-            sum([v.cert_co2e_Mg for v in vehicle_data if v.model_year == cy]))
+            sum([v.cert_co2e_Mg for v in model_year_vehicles[cy]]))
 
     for mcat in market_categories:
         market_category_Mg = []
         for idx, cy in enumerate(calendar_years):
-            market_id_and_Mg = [(v.market_class_id, v.cert_co2e_Mg) for v in vehicle_data if v.model_year == cy]
+            market_id_and_Mg = [(v.market_class_id, v.cert_co2e_Mg) for v in model_year_vehicles[cy]]
             Mg = 0
             for market_class_id, cert_co2e_Mg in market_id_and_Mg:
                 if mcat in market_class_id.split('.'):
@@ -1102,35 +1155,36 @@ def plot_vehicle_megagrams(calendar_years):
     for mc in market_classes:
         market_class_Mg = []
         for idx, cy in enumerate(calendar_years):
-            market_class_Mg.append(sum([v.cert_co2e_Mg for v in vehicle_data if v.model_year == cy
-                                        and v.market_class_id == mc]))
+            market_class_Mg.append(sum([v.cert_co2e_Mg for v in model_year_vehicles[cy]
+                                        if v.market_class_id == mc]))
 
         Mg_data[mc] = market_class_Mg
 
-    # market category chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, Mg_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.plot(calendar_years, Mg_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    ax1.legend(market_categories + ['vehicle'])
-    label_xyt(ax1, 'Year', 'CO2e [Mg]',
-              '%s\nVehicle CO2e Mg by Market Category v Year' % omega_globals.options.session_unique_name)
-    fig.savefig(omega_globals.options.output_folder + '%s ALL V Mg Mkt Cat.png' %
-                omega_globals.options.session_unique_name)
-
-    # market class chart
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, Mg_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+    if omega_globals.options.postproc_plots:
+        # market category chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, Mg_data[mcat], **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.plot(calendar_years, Mg_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        ax1.legend(market_categories + ['vehicle'])
+        label_xyt(ax1, 'Year', 'CO2e [Mg]',
+                  '%s\nVehicle CO2e Mg by Market Category v Year' % omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Mg Mkt Cat.png' %
+                    omega_globals.options.session_unique_name)
 
-    ax1.plot(calendar_years, Mg_data['vehicle'],
-             **omega_globals.options.MarketClass.get_linestyle('vehicle'))
-    label_xyt(ax1, 'Year', 'CO2e [Mg]',
-              '%s\nVehicle CO2e Mg  by Market Class v Year' % omega_globals.options.session_unique_name)
-    ax1.legend(market_classes + ['vehicle'])
-    fig.savefig(omega_globals.options.output_folder + '%s ALL V Mg Mkt Cls.png' %
-                omega_globals.options.session_unique_name)
+        # market class chart
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, Mg_data[mc], **omega_globals.options.MarketClass.get_linestyle(mc))
+
+        ax1.plot(calendar_years, Mg_data['vehicle'],
+                 **omega_globals.options.MarketClass.get_linestyle('vehicle'))
+        label_xyt(ax1, 'Year', 'CO2e [Mg]',
+                  '%s\nVehicle CO2e Mg  by Market Class v Year' % omega_globals.options.session_unique_name)
+        ax1.legend(market_classes + ['vehicle'])
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL V Mg Mkt Cls.png' %
+                    omega_globals.options.session_unique_name)
 
     return Mg_data
 
@@ -1153,15 +1207,15 @@ def plot_vehicle_GWh(calendar_years, manufacturer_id=None):
     GWh_data['vehicle'] = []
     for cy in calendar_years:
         GWh_data['vehicle'].append(
-            sum([v.initial_registered_count * v.battery_kwh / 1e6 for v in vehicle_data
-                 if v.model_year == cy and (manufacturer_id is None or v.manufacturer_id == manufacturer_id)]))
+            sum([v.initial_registered_count * v.battery_kwh / 1e6 for v in model_year_vehicles[cy]
+                 if (manufacturer_id is None or v.manufacturer_id == manufacturer_id)]))
 
     for mcat in market_categories:
         market_category_GWh = []
         for idx, cy in enumerate(calendar_years):
             market_id_and_Mg = \
-                [(v.market_class_id, v.initial_registered_count*v.battery_kwh/1e6) for v in vehicle_data
-                 if v.model_year == cy and (manufacturer_id is None or v.manufacturer_id == manufacturer_id)]
+                [(v.market_class_id, v.initial_registered_count*v.battery_kwh/1e6) for v in model_year_vehicles[cy]
+                 if (manufacturer_id is None or v.manufacturer_id == manufacturer_id)]
             Mg = 0
             for market_class_id, cert_co2e_Mg in market_id_and_Mg:
                 if mcat in market_class_id.split('.'):
@@ -1173,13 +1227,13 @@ def plot_vehicle_GWh(calendar_years, manufacturer_id=None):
     for mc in market_classes:
         market_class_GWh = []
         for idx, cy in enumerate(calendar_years):
-            market_class_GWh.append(sum([v.initial_registered_count * v.battery_kwh / 1e6 for v in vehicle_data
-                                         if v.model_year == cy and v.market_class_id == mc and
+            market_class_GWh.append(sum([v.initial_registered_count * v.battery_kwh / 1e6
+                                         for v in model_year_vehicles[cy] if v.market_class_id == mc and
                                          (manufacturer_id is None or v.manufacturer_id == manufacturer_id)]))
 
         GWh_data[mc] = market_class_GWh
 
-    if manufacturer_id is None:
+    if manufacturer_id is None and omega_globals.options.postproc_plots:
         manufacturer_id = 'ALL'
 
         # market category chart
@@ -1196,7 +1250,7 @@ def plot_vehicle_GWh(calendar_years, manufacturer_id=None):
         ax1.legend(market_categories + ['total_GWh', 'limit'])
         label_xyt(ax1, 'Year', 'GWh',
                   '%s\nVehicle GWh by Market Category v Year' % omega_globals.options.session_unique_name)
-        fig.savefig(omega_globals.options.output_folder + '%s %s V GWh Mkt Cat.png' %
+        save_figure(fig, omega_globals.options.output_folder + '%s %s V GWh Mkt Cat.png' %
                     (omega_globals.options.session_unique_name, manufacturer_id))
 
         # market class chart
@@ -1213,7 +1267,7 @@ def plot_vehicle_GWh(calendar_years, manufacturer_id=None):
         label_xyt(ax1, 'Year', 'GWh]',
                   '%s\nVehicle GWh  by Market Class v Year' % omega_globals.options.session_unique_name)
         ax1.legend(market_classes + ['total_GWh', 'limit'])
-        fig.savefig(omega_globals.options.output_folder + '%s %s V GWh Mkt Cls.png' %
+        save_figure(fig, omega_globals.options.output_folder + '%s %s V GWh Mkt Cls.png' %
                     (omega_globals.options.session_unique_name, manufacturer_id))
 
     return GWh_data
@@ -1241,7 +1295,7 @@ def plot_market_shares(calendar_years, total_sales):
         for idx, cy in enumerate(calendar_years):
             count = 0
             vehicle_id_and_market_class_id = [((v.compliance_id, v.vehicle_id), v.market_class_id)
-                                              for v in vehicle_data if v.model_year == cy]
+                                              for v in model_year_vehicles[cy]]
             for vehicle_id, market_class_id in vehicle_id_and_market_class_id:
                 if mcat in market_class_id.split('.'):
                     count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -1256,7 +1310,7 @@ def plot_market_shares(calendar_years, total_sales):
         for idx, cy in enumerate(calendar_years):
             count = 0
             vehicle_ids = [(v.compliance_id, v.vehicle_id)
-                           for v in vehicle_data if v.model_year == cy and v.market_class_id == mc]
+                           for v in model_year_vehicles[cy] if v.market_class_id == mc]
             for vehicle_id in vehicle_ids:
                 count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
 
@@ -1269,7 +1323,7 @@ def plot_market_shares(calendar_years, total_sales):
         for idx, cy in enumerate(calendar_years):
             count = 0
             vehicle_ids = [(v.compliance_id, v.vehicle_id)
-                           for v in vehicle_data if v.model_year == cy and v.context_size_class == csc]
+                           for v in model_year_vehicles[cy] if v.context_size_class == csc]
 
             for vehicle_id in vehicle_ids:
                 count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -1283,7 +1337,7 @@ def plot_market_shares(calendar_years, total_sales):
         for idx, cy in enumerate(calendar_years):
             count = 0
             vehicle_ids = [(v.compliance_id, v.vehicle_id)
-                           for v in vehicle_data if v.model_year == cy and v.reg_class_id == rc]
+                           for v in model_year_vehicles[cy] if v.reg_class_id == rc]
 
             for vehicle_id in vehicle_ids:
                 count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -1291,51 +1345,52 @@ def plot_market_shares(calendar_years, total_sales):
             market_category_abs_share_frac.append(float(count) / max(1, total_sales[idx]))
         market_share_results['abs_share_frac_%s' % rc] = market_category_abs_share_frac
 
-    # plot market category results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mcat in market_categories:
-        ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % mcat],
-                 **omega_globals.options.MarketClass.get_linestyle(mcat))
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
-              '%s\nMarket Category Absolute Market Shares' % omega_globals.options.session_unique_name)
-    ax1.legend(market_categories)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL Mkt Cat Shares.png' % omega_globals.options.session_unique_name)
-
-    # plot market class results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for mc in market_classes:
-        ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % mc],
-                 **omega_globals.options.MarketClass.get_linestyle(mc))
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
-              '%s\nMarket Class Absolute Market Shares' % omega_globals.options.session_unique_name)
-    ax1.legend(market_classes)
-    fig.savefig(
-        omega_globals.options.output_folder + '%s ALL Mkt Cls Shares.png' % omega_globals.options.session_unique_name)
-
-    # plot context size class results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for csc in NewVehicleMarket.base_year_context_size_class_sales:
-        ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % csc], '.--')
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
-              '%s\nContext Size Class Absolute Market Shares' % omega_globals.options.session_unique_name)
-    ax1.legend(NewVehicleMarket.base_year_context_size_class_sales.keys(), ncol=2, loc='upper center')
-    fig.savefig(omega_globals.options.output_folder + '%s ALL CSC Shares.png' %
-                omega_globals.options.session_unique_name)
-
-    # plot reg class results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    for rc in omega_globals.options.RegulatoryClasses.reg_classes:
-        ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % rc], '.--')
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
-              '%s\nReg Class Absolute Market Shares' % omega_globals.options.session_unique_name)
-    ax1.legend(omega_globals.options.RegulatoryClasses.reg_classes, ncol=2, loc='upper center')
-    fig.savefig(omega_globals.options.output_folder + '%s ALL RC Shares.png' %
-                omega_globals.options.session_unique_name)
+    if omega_globals.options.postproc_plots:
+        # plot market category results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mcat in market_categories:
+            ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % mcat],
+                     **omega_globals.options.MarketClass.get_linestyle(mcat))
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
+                  '%s\nMarket Category Absolute Market Shares' % omega_globals.options.session_unique_name)
+        ax1.legend(market_categories)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL Mkt Cat Shares.png' %
+                    omega_globals.options.session_unique_name)
+
+        # plot market class results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for mc in market_classes:
+            ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % mc],
+                     **omega_globals.options.MarketClass.get_linestyle(mc))
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
+                  '%s\nMarket Class Absolute Market Shares' % omega_globals.options.session_unique_name)
+        ax1.legend(market_classes)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL Mkt Cls Shares.png' %
+                    omega_globals.options.session_unique_name)
+
+        # plot context size class results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for csc in NewVehicleMarket.base_year_context_size_class_sales:
+            ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % csc], '.--')
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
+                  '%s\nContext Size Class Absolute Market Shares' % omega_globals.options.session_unique_name)
+        ax1.legend(NewVehicleMarket.base_year_context_size_class_sales.keys(), ncol=2, loc='upper center')
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL CSC Shares.png' %
+                    omega_globals.options.session_unique_name)
+
+        # plot reg class results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        for rc in omega_globals.options.RegulatoryClasses.reg_classes:
+            ax1.plot(calendar_years, market_share_results['abs_share_frac_%s' % rc], '.--')
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]',
+                  '%s\nReg Class Absolute Market Shares' % omega_globals.options.session_unique_name)
+        ax1.legend(omega_globals.options.RegulatoryClasses.reg_classes, ncol=2, loc='upper center')
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL RC Shares.png' %
+                    omega_globals.options.session_unique_name)
 
     return market_share_results
 
@@ -1366,8 +1421,8 @@ def plot_manufacturer_market_shares(calendar_years, compliance_id, total_sales):
         market_category_abs_share_frac = []
         for idx, cy in enumerate(calendar_years):
             count = 0
-            vehicle_id_and_market_class_id = [((v.compliance_id, v.vehicle_id), v.market_class_id) for v in vehicle_data
-                                              if v.model_year == cy and v.compliance_id == compliance_id]
+            vehicle_id_and_market_class_id = [((v.compliance_id, v.vehicle_id), v.market_class_id)
+                                              for v in model_year_vehicles[cy] if v.compliance_id == compliance_id]
             for vehicle_id, market_class_id in vehicle_id_and_market_class_id:
                 if mcat in market_class_id.split('.'):
                     count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -1382,7 +1437,7 @@ def plot_manufacturer_market_shares(calendar_years, compliance_id, total_sales):
         for idx, cy in enumerate(calendar_years):
             count = 0
             vehicle_ids = [(v.compliance_id, v.vehicle_id)
-                           for v in vehicle_data if v.model_year == cy and v.market_class_id == mc and
+                           for v in model_year_vehicles[cy] if v.market_class_id == mc and
                            v.compliance_id == compliance_id]
             for vehicle_id in vehicle_ids:
                 count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -1396,7 +1451,7 @@ def plot_manufacturer_market_shares(calendar_years, compliance_id, total_sales):
         for idx, cy in enumerate(calendar_years):
             count = 0
             vehicle_ids = [(v.compliance_id, v.vehicle_id)
-                           for v in vehicle_data if v.model_year == cy and v.context_size_class == csc
+                           for v in model_year_vehicles[cy] if v.context_size_class == csc
                            and v.compliance_id == compliance_id]
 
             for vehicle_id in vehicle_ids:
@@ -1410,8 +1465,8 @@ def plot_manufacturer_market_shares(calendar_years, compliance_id, total_sales):
         market_category_abs_share_frac = []
         for idx, cy in enumerate(calendar_years):
             count = 0
-            vehicle_ids = [(v.compliance_id, v.vehicle_id) for v in vehicle_data if v.model_year == cy
-                           and v.reg_class_id == rc and v.compliance_id == compliance_id]
+            vehicle_ids = [(v.compliance_id, v.vehicle_id) for v in model_year_vehicles[cy]
+                           if v.reg_class_id == rc and v.compliance_id == compliance_id]
 
             for vehicle_id in vehicle_ids:
                 count += vehicle_annual_data[vehicle_id + tuple([0])]['registered_count']
@@ -1419,63 +1474,64 @@ def plot_manufacturer_market_shares(calendar_years, compliance_id, total_sales):
             market_category_abs_share_frac.append(float(count) / max(1, total_sales[idx]))
         mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, rc)] = market_category_abs_share_frac
 
-    # plot market category results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    labels = []
-    for mcat in market_categories:
-        if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mcat)]) > 0:
-            ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mcat)],
-                     **omega_globals.options.MarketClass.get_linestyle(mcat))
-            labels += [mcat]
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nMarket Category Absolute Market Shares'
-              % (compliance_id, omega_globals.options.session_unique_name))
-    ax1.legend(labels)
-    fig.savefig(omega_globals.options.output_folder + '%s %s Mkt Cat Shares.png'
-                % (omega_globals.options.session_unique_name, compliance_id))
-
-    # plot market class results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    labels = []
-    for mc in market_classes:
-        if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mc)]) > 0:
-            ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mc)],
-                     **omega_globals.options.MarketClass.get_linestyle(mc))
-            labels += [mc]
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nMarket Class Absolute Market Shares'
-              % (compliance_id, omega_globals.options.session_unique_name))
-    ax1.legend(labels)
-    fig.savefig(omega_globals.options.output_folder + '%s %s Mkt Cls Shares.png'
-                % (omega_globals.options.session_unique_name, compliance_id))
-
-    # plot context size class results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    labels = []
-    for csc in NewVehicleMarket.base_year_context_size_class_sales:
-        if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, csc)]) > 0:
-            ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, csc)], '.--')
-            labels += [csc]
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nContext Size Class Absolute Market Shares'
-              % (compliance_id, omega_globals.options.session_unique_name))
-    ax1.legend(labels, ncol=2, loc='upper center')
-    fig.savefig(omega_globals.options.output_folder + '%s %s CSC Shares.png'
-                % (omega_globals.options.session_unique_name, compliance_id))
-
-    # plot reg class results
-    fig, ax1 = figure(omega_globals.options.auto_close_figures)
-    labels = []
-    for rc in omega_globals.options.RegulatoryClasses.reg_classes:
-        if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, rc)]) > 0:
-            ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, rc)], '.--')
-            labels += [rc]
-    ax1.set_ylim(-0.05, 1.05)
-    label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nReg Class Absolute Market Shares'
-              % (compliance_id, omega_globals.options.session_unique_name))
-    ax1.legend(labels, ncol=2, loc='upper center')
-    fig.savefig(omega_globals.options.output_folder + '%s %s RC Shares.png'
-                % (omega_globals.options.session_unique_name, compliance_id))
+    if omega_globals.options.postproc_plots:
+        # plot market category results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        labels = []
+        for mcat in market_categories:
+            if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mcat)]) > 0:
+                ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mcat)],
+                         **omega_globals.options.MarketClass.get_linestyle(mcat))
+                labels += [mcat]
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nMarket Category Absolute Market Shares'
+                  % (compliance_id, omega_globals.options.session_unique_name))
+        ax1.legend(labels)
+        save_figure(fig, omega_globals.options.output_folder + '%s %s Mkt Cat Shares.png'
+                    % (omega_globals.options.session_unique_name, compliance_id))
+
+        # plot market class results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        labels = []
+        for mc in market_classes:
+            if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mc)]) > 0:
+                ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, mc)],
+                         **omega_globals.options.MarketClass.get_linestyle(mc))
+                labels += [mc]
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nMarket Class Absolute Market Shares'
+                  % (compliance_id, omega_globals.options.session_unique_name))
+        ax1.legend(labels)
+        save_figure(fig, omega_globals.options.output_folder + '%s %s Mkt Cls Shares.png'
+                    % (omega_globals.options.session_unique_name, compliance_id))
+
+        # plot context size class results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        labels = []
+        for csc in NewVehicleMarket.base_year_context_size_class_sales:
+            if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, csc)]) > 0:
+                ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, csc)], '.--')
+                labels += [csc]
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nContext Size Class Absolute Market Shares'
+                  % (compliance_id, omega_globals.options.session_unique_name))
+        ax1.legend(labels, ncol=2, loc='upper center')
+        save_figure(fig, omega_globals.options.output_folder + '%s %s CSC Shares.png'
+                    % (omega_globals.options.session_unique_name, compliance_id))
+
+        # plot reg class results
+        fig, ax1 = figure(omega_globals.options.auto_close_figures)
+        labels = []
+        for rc in omega_globals.options.RegulatoryClasses.reg_classes:
+            if max(mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, rc)]) > 0:
+                ax1.plot(calendar_years, mfr_market_share_results['abs_share_frac_%s_%s' % (compliance_id, rc)], '.--')
+                labels += [rc]
+        ax1.set_ylim(-0.05, 1.05)
+        label_xyt(ax1, 'Year', 'Absolute Market Share [%]', '%s %s\nReg Class Absolute Market Shares'
+                  % (compliance_id, omega_globals.options.session_unique_name))
+        ax1.legend(labels, ncol=2, loc='upper center')
+        save_figure(fig, omega_globals.options.output_folder + '%s %s RC Shares.png'
+                    % (omega_globals.options.session_unique_name, compliance_id))
 
     return mfr_market_share_results
 
@@ -1499,7 +1555,7 @@ def plot_total_sales(calendar_years, compliance_ids):
     total_sales = []
     for cy in calendar_years:
         count = 0
-        vad_ids = [(v.compliance_id, v.vehicle_id, 0) for v in vehicle_data if v.model_year == cy]
+        vad_ids = [(v.compliance_id, v.vehicle_id, 0) for v in model_year_vehicles[cy]]
         for vad_id in vad_ids:
             count += vehicle_annual_data[vad_id]['registered_count']
         total_sales.append(count)
@@ -1512,11 +1568,11 @@ def plot_total_sales(calendar_years, compliance_ids):
         for cy in calendar_years:
             count = 0
             if omega_globals.options.consolidate_manufacturers:
-                vad_ids = [('consolidated_OEM', v.vehicle_id, 0) for v in vehicle_data
-                           if v.model_year == cy and v.manufacturer_id == compliance_id]
+                vad_ids = [('consolidated_OEM', v.vehicle_id, 0) for v in model_year_vehicles[cy]
+                           if v.manufacturer_id == compliance_id]
             else:
-                vad_ids = [(v.manufacturer_id, v.vehicle_id, 0) for v in vehicle_data
-                       if v.model_year == cy and v.manufacturer_id == compliance_id]
+                vad_ids = [(v.manufacturer_id, v.vehicle_id, 0) for v in model_year_vehicles[cy]
+                           if v.manufacturer_id == compliance_id]
             for vad_id in vad_ids:
                 count += vehicle_annual_data[vad_id]['registered_count']
             manufacturer_sales[compliance_id].append(count)
@@ -1536,19 +1592,21 @@ def plot_total_sales(calendar_years, compliance_ids):
     context_sales = np.array(
         [new_vehicle_market.NewVehicleMarket.context_based_total_sales[cy] for cy in calendar_years[1:]])
 
-    fig, ax1 = fplothg(calendar_years[1:], context_sales / 1e6, '.-',
-                       reuse_figure=omega_globals.options.auto_close_figures)
+    if omega_globals.options.postproc_plots:
+        fig, ax1 = fplothg(calendar_years[1:], context_sales / 1e6, '.-',
+                           reuse_figure=omega_globals.options.auto_close_figures)
 
-    ax1.plot(calendar_years, total_sales / 1e6)
+        ax1.plot(calendar_years, total_sales / 1e6)
 
-    for manufacturer in manufacturer_sales:
-        ax1.plot(calendar_years, np.array(manufacturer_sales[manufacturer]) / 1e6)
+        for manufacturer in manufacturer_sales:
+            ax1.plot(calendar_years, np.array(manufacturer_sales[manufacturer]) / 1e6)
 
-    ax1.legend(['context sales', 'sales'] + list(manufacturer_sales.keys()))
-    label_xyt(ax1, 'Year', 'Sales [millions]', '%s\nTotal Sales Versus Calendar Year\n Total Sales %.2f Million' % (
-        omega_globals.options.session_unique_name, total_sales.sum() / 1e6))
+        ax1.legend(['context sales', 'sales'] + list(manufacturer_sales.keys()))
+        label_xyt(ax1, 'Year', 'Sales [millions]', '%s\nTotal Sales Versus Calendar Year\n Total Sales %.2f Million' % (
+            omega_globals.options.session_unique_name, total_sales.sum() / 1e6))
 
-    fig.savefig(omega_globals.options.output_folder + '%s ALL Sales v Year.png' % omega_globals.options.session_unique_name)
+        save_figure(fig, omega_globals.options.output_folder + '%s ALL Sales v Year.png' %
+                    omega_globals.options.session_unique_name)
 
     return context_sales, total_sales, manufacturer_sales
 
@@ -1604,55 +1662,56 @@ def plot_manufacturer_compliance(calendar_years, compliance_id, credit_history):
     calendar_year_cert_co2e_Mg = ManufacturerAnnualData.get_calendar_year_cert_co2e_Mg(compliance_id)
     model_year_cert_co2e_Mg = ManufacturerAnnualData.get_model_year_cert_co2e_Mg(compliance_id)
     total_cost_billions = ManufacturerAnnualData.get_total_cost_billions(compliance_id)
-    # compliance chart
-    ax1, fig = plot_compliance(calendar_years, compliance_id, target_co2e_Mg, calendar_year_cert_co2e_Mg,
-                               model_year_cert_co2e_Mg)
-    label_xyt(ax1, 'Year', 'CO2e [Mg]', '%s %s\nCert and Compliance Versus Year\n Total Cost $%.2f Billion' % (
-        compliance_id, omega_globals.options.session_unique_name, total_cost_billions))
-
-    target_co2e_Mg_dict = dict(zip(calendar_years, target_co2e_Mg))
-    calendar_year_cert_co2e_Mg_dict = dict(zip(calendar_years, calendar_year_cert_co2e_Mg))
-    model_year_cert_co2e_Mg_dict = dict(zip(calendar_years, model_year_cert_co2e_Mg))
-
-    if credit_history is not None:
-        for _, t in credit_history.transaction_log.iterrows():
-            try:
-                if type(t.credit_destination) is not str and t.model_year in calendar_year_cert_co2e_Mg_dict:
-                    draw_transfer_arrow(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year],
-                                    t.credit_destination, target_co2e_Mg_dict[t.credit_destination])
-                elif type(t.credit_destination) is not str and t.model_year not in calendar_year_cert_co2e_Mg_dict:
-                    ax1.plot(t.model_year, target_co2e_Mg_dict[calendar_years[0]], 'o', color='orange')
-                    draw_transfer_arrow(t.model_year, target_co2e_Mg_dict[calendar_years[0]],
-                                        t.credit_destination, model_year_cert_co2e_Mg_dict[t.credit_destination])
-                    ax1.set_xlim(calendar_years[0] - 5, ax1.get_xlim()[1])
-                elif t.credit_destination == 'EXPIRATION' and t.model_year in calendar_year_cert_co2e_Mg_dict:
-                    # expiration of analysis year credits
-                    if compliance_id != 'consolidated_OEM' and omega_globals.pass_num > 0:
-                        color = '#929591'
-                    else:
-                        color = 'red'
-                    draw_expiration_arrow(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year], color=color)
-                elif t.credit_destination == 'EXPIRATION' and t.model_year not in calendar_year_cert_co2e_Mg_dict:
-                    # exipration of credit banked prior to first analysis year
-                    ax1.plot(t.model_year, target_co2e_Mg_dict[calendar_years[0]], 'o', color='orange')
-                    if compliance_id != 'consolidated_OEM' and omega_globals.pass_num > 0:
-                        color = '#929591'
-                    else:
-                        color = 'red'
-                    draw_expiration_arrow(t.model_year, target_co2e_Mg_dict[calendar_years[0]], color=color)
-                else:  # "PAST_DUE"
-                    if compliance_id != 'consolidated_OEM' and omega_globals.pass_num > 0:
-                        color = '#929591'
-                    else:
-                        color = 'red'
-                    ax1.plot(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year], 'x', color=color)
-                    plt.scatter(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year], s=80, facecolors='none',
-                                edgecolors=color)
-            except:
-                pass
-
-    fig.savefig(omega_globals.options.output_folder + '%s %s Cert Mg v Year.png' %
-                (omega_globals.options.session_unique_name, compliance_id))
+    if omega_globals.options.postproc_plots:
+        # compliance chart
+        ax1, fig = plot_compliance(calendar_years, compliance_id, target_co2e_Mg, calendar_year_cert_co2e_Mg,
+                                   model_year_cert_co2e_Mg)
+        label_xyt(ax1, 'Year', 'CO2e [Mg]', '%s %s\nCert and Compliance Versus Year\n Total Cost $%.2f Billion' % (
+            compliance_id, omega_globals.options.session_unique_name, total_cost_billions))
+
+        target_co2e_Mg_dict = dict(zip(calendar_years, target_co2e_Mg))
+        calendar_year_cert_co2e_Mg_dict = dict(zip(calendar_years, calendar_year_cert_co2e_Mg))
+        model_year_cert_co2e_Mg_dict = dict(zip(calendar_years, model_year_cert_co2e_Mg))
+
+        if credit_history is not None:
+            for _, t in credit_history.transaction_log.iterrows():
+                try:
+                    if type(t.credit_destination) is not str and t.model_year in calendar_year_cert_co2e_Mg_dict:
+                        draw_transfer_arrow(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year],
+                                            t.credit_destination, target_co2e_Mg_dict[t.credit_destination])
+                    elif type(t.credit_destination) is not str and t.model_year not in calendar_year_cert_co2e_Mg_dict:
+                        ax1.plot(t.model_year, target_co2e_Mg_dict[calendar_years[0]], 'o', color='orange')
+                        draw_transfer_arrow(t.model_year, target_co2e_Mg_dict[calendar_years[0]],
+                                            t.credit_destination, model_year_cert_co2e_Mg_dict[t.credit_destination])
+                        ax1.set_xlim(calendar_years[0] - 5, ax1.get_xlim()[1])
+                    elif t.credit_destination == 'EXPIRATION' and t.model_year in calendar_year_cert_co2e_Mg_dict:
+                        # expiration of analysis year credits
+                        if compliance_id != 'consolidated_OEM' and omega_globals.pass_num > 0:
+                            color = '#929591'
+                        else:
+                            color = 'red'
+                        draw_expiration_arrow(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year], color=color)
+                    elif t.credit_destination == 'EXPIRATION' and t.model_year not in calendar_year_cert_co2e_Mg_dict:
+                        # exipration of credit banked prior to first analysis year
+                        ax1.plot(t.model_year, target_co2e_Mg_dict[calendar_years[0]], 'o', color='orange')
+                        if compliance_id != 'consolidated_OEM' and omega_globals.pass_num > 0:
+                            color = '#929591'
+                        else:
+                            color = 'red'
+                        draw_expiration_arrow(t.model_year, target_co2e_Mg_dict[calendar_years[0]], color=color)
+                    else:  # "PAST_DUE"
+                        if compliance_id != 'consolidated_OEM' and omega_globals.pass_num > 0:
+                            color = '#929591'
+                        else:
+                            color = 'red'
+                        ax1.plot(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year], 'x', color=color)
+                        plt.scatter(t.model_year, calendar_year_cert_co2e_Mg_dict[t.model_year], s=80, facecolors='none',
+                                    edgecolors=color)
+                except:
+                    pass
+
+        save_figure(fig, omega_globals.options.output_folder + '%s %s Cert Mg v Year.png' %
+                    (omega_globals.options.session_unique_name, compliance_id))
 
     return calendar_year_cert_co2e_Mg, model_year_cert_co2e_Mg, target_co2e_Mg
 
@@ -1725,7 +1784,7 @@ def plot_iteration(iteration_log, compliance_id):
                 plt.grid()
                 plt.legend(['producer_abs_share_frac_%s' % mc, 'consumer_abs_share_frac_%s' % mc])
                 plt.ylim([0, 1])
-                plt.savefig('%s%s %s Iter %s %s.png' % (
+                save_figure(plt.gcf(), '%s%s %s Iter %s %s.png' % (
                     omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id,
                     mc, iteration_label))
 
@@ -1747,9 +1806,9 @@ def plot_iteration(iteration_log, compliance_id):
         plt.ylabel('Cost $ / mi')
         plt.title('%s Consumer Generalized Cost %s' % (compliance_id, iteration_label))
         plt.grid()
-        plt.savefig('%s%s %s ConsumerGC %s.png' % (omega_globals.options.output_folder,
-                                                   omega_globals.options.session_unique_name, compliance_id,
-                                                   iteration_label))
+        save_figure(plt.gcf(), '%s%s %s ConsumerGC %s.png' %
+                    (omega_globals.options.output_folder, omega_globals.options.session_unique_name,
+                     compliance_id, iteration_label))
 
         plt.figure()
         if iteration == -1:
@@ -1766,7 +1825,7 @@ def plot_iteration(iteration_log, compliance_id):
         plt.ylabel('Cost Multiplier')
         plt.title('%s Producer Cost Multipliers %s' % (compliance_id, iteration_label))
         plt.grid()
-        plt.savefig('%s%s %s Producer Cost Multipliers %s.png' % (
+        save_figure(plt.gcf(), '%s%s %s Producer Cost Multipliers %s.png' % (
             omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id,
             iteration_label))
 
@@ -1775,8 +1834,8 @@ def plot_iteration(iteration_log, compliance_id):
     label_xyt(ax1, '', 'Iteration [#]', '%s Iteration mean = %.2f' %
               (compliance_id, last_logged['producer_consumer_iteration_num'].mean()))
 
-    fig.savefig('%s%s %s Iter Counts.png' % (omega_globals.options.output_folder,
-                                             omega_globals.options.session_unique_name, compliance_id))
+    save_figure(fig, '%s%s %s Iter Counts.png' %
+                (omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id))
 
     # plot producer initial share and g/mi decisions
     plt.figure()
@@ -1785,8 +1844,8 @@ def plot_iteration(iteration_log, compliance_id):
     plt.title('%s Producer Initial Absolute Market Shares' % compliance_id)
     plt.grid()
     plt.legend(['producer_abs_share_frac_%s' % mc for mc in market_classes])
-    plt.savefig('%s%s %s Producer Abs Shares Initial.png' % (omega_globals.options.output_folder,
-                                                             omega_globals.options.session_unique_name, compliance_id))
+    save_figure(plt.gcf(), '%s%s %s Producer Abs Shares Initial.png' %
+                (omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id))
 
     # plot producer initial share and g/mi decisions
     plt.figure()
@@ -1795,8 +1854,8 @@ def plot_iteration(iteration_log, compliance_id):
     plt.title('%s Producer Final Absolute Market Shares' % compliance_id)
     plt.grid()
     plt.legend(['producer_abs_share_frac_%s' % mc for mc in market_classes])
-    plt.savefig('%s%s %s Producer Abs Shares Final.png' % (omega_globals.options.output_folder,
-                                                             omega_globals.options.session_unique_name, compliance_id))
+    save_figure(plt.gcf(), '%s%s %s Producer Abs Shares Final.png' %
+                (omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id))
 
     plt.figure()
     for mc in market_classes:
@@ -1804,8 +1863,8 @@ def plot_iteration(iteration_log, compliance_id):
     plt.title('%s Producer Initial CO2e g/mi' % compliance_id)
     plt.grid()
     plt.legend(['average_onroad_direct_co2e_gpmi_%s' % mc for mc in market_classes])
-    plt.savefig('%s%s %s Producer CO2e gpmi Initial.png' % (omega_globals.options.output_folder,
-                                                            omega_globals.options.session_unique_name, compliance_id))
+    save_figure(plt.gcf(), '%s%s %s Producer CO2e gpmi Initial.png' %
+                (omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id))
 
     plt.figure()
     for mc in market_classes:
@@ -1813,5 +1872,5 @@ def plot_iteration(iteration_log, compliance_id):
     plt.title('%s Producer Final CO2e g/mi' % compliance_id)
     plt.grid()
     plt.legend(['average_onroad_direct_co2e_gpmi_%s' % mc for mc in market_classes])
-    plt.savefig('%s%s %s Producer CO2e gpmi Final.png' % (omega_globals.options.output_folder,
-                                                            omega_globals.options.session_unique_name, compliance_id))
+    save_figure(plt.gcf(), '%s%s %s Producer CO2e gpmi Final.png' %
+                (omega_globals.options.output_folder, omega_globals.options.session_unique_name, compliance_id))
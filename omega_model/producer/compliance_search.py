@@ -28,9 +28,9 @@ from policy.required_sales_share import RequiredSalesShare
 
 from producer.manufacturer_annual_data import ManufacturerAnnualData
 
-import matplotlib.pyplot as plt
+from common.frame_transport import export_cost_curves, import_cost_curves, discard_cost_curves
 
-_cache = dict()
+_cache = dict()  # composite vehicle data by (compliance_id, calendar_year), evicted when the year is finalized
 
 
 def error_callback(e):
@@ -45,7 +45,8 @@ def error_callback(e):
     print(e)
 
 
-def create_tech_sweeps(composite_vehicles, candidate_production_decisions, share_range):
+def create_tech_sweeps(composite_vehicles, candidate_production_decisions, share_range,
+                       prior_producer_decision_and_response=None):
     """
     Create tech sweeps is responsible for creating tech (CO2e g/mi levels) options to
     develop a set of candidate compliance outcomes for the manufacturer in the given year as a function of the
@@ -68,11 +69,16 @@ def create_tech_sweeps(composite_vehicles, candidate_production_decisions, share
     target has been met within a tolerance. Ultimately a single candidate production decision is selected and passed
     to the consumer which reacts to the generalized cost of each option with a desired market share.
 
+    A warm-started search has a first pass share range less than 1.0, in which case the first pass tech options are
+    generated around the prior year's tech options, where available.
+
     Args:
         composite_vehicles ([CompositeVehicle]): the list of producer composite vehicles
         candidate_production_decisions (None, DataFrame): zero or 1 or 2 candidate production decisions chosen from the
             results of the previous search iteration
         share_range (float): determines the numerical range of share and tech options that are considered
+        prior_producer_decision_and_response (Series): prior-year producer decision and response, used to center the
+            first pass tech options of a warm-started search
 
     Returns:
         A dataframe containing a range of composite vehicle CO2e g/mi options factorially combined
@@ -82,8 +88,13 @@ def create_tech_sweeps(composite_vehicles, candidate_production_decisions, share
 
     # Generate tech options (CO2e g/mi levels)
     for cv in composite_vehicles:
-        if share_range == 1.0:
-            cv.tech_option_iteration_num = 0  # reset vehicle tech option progression
+        if candidate_production_decisions is None:
+            # reset vehicle tech option progression, a warm-started search starts part way through the progression
+            if share_range == 1.0:
+                cv.tech_option_iteration_num = 0
+            else:
+                cv.tech_option_iteration_num = int(round(
+                    np.log(share_range) / np.log(omega_globals.options.producer_compliance_search_convergence_factor)))
 
         if cv.fueling_class == 'ICE':
             num_tech_options = omega_globals.options.producer_num_tech_options_per_ice_vehicle
@@ -94,15 +105,24 @@ def create_tech_sweeps(composite_vehicles, candidate_production_decisions, share
         veh_max_cost_curve_index = cv.get_max_cost_curve_index()
 
         if candidate_production_decisions is not None:
-            cost_curve_options = np.array([])
-
             if ((candidate_production_decisions['veh_%s_sales' % cv.vehicle_id] > 0) or
                     (cv.tech_option_iteration_num > 0)):
                 cv.tech_option_iteration_num += 1
 
+            center_production_decision = candidate_production_decisions
+        elif share_range < 1.0 and prior_producer_decision_and_response is not None and \
+                'veh_%s_cost_curve_indices' % cv.vehicle_id in prior_producer_decision_and_response:
+            # warm start, generate options around last year's tech
+            center_production_decision = prior_producer_decision_and_response
+        else:
+            center_production_decision = None
+
+        if center_production_decision is not None:
+            cost_curve_options = np.array([])
+
             tech_share_range = omega_globals.options.producer_compliance_search_convergence_factor ** \
                                cv.tech_option_iteration_num
-            veh_cost_curve_index = candidate_production_decisions['veh_%s_cost_curve_indices' % cv.vehicle_id]
+            veh_cost_curve_index = center_production_decision['veh_%s_cost_curve_indices' % cv.vehicle_id]
             min_value = max(veh_min_cost_curve_index, veh_cost_curve_index * (1 - tech_share_range))
             max_value = min(veh_max_cost_curve_index, veh_cost_curve_index * (1 + tech_share_range))
 
@@ -193,7 +213,7 @@ def round_constraints(constraints, min_val=0.0, max_val=1.0):
         # CU RV
 
 
-def create_share_sweeps(calendar_year, market_class_dict, candidate_production_decisions, share_range,
+def create_share_sweeps(compliance_id, calendar_year, market_class_dict, candidate_production_decisions, share_range,
                         consumer_response, context_based_total_sales, prior_producer_decision_and_response,
                         producer_consumer_iteration_num, node_name='', verbose=False):
     """
@@ -222,7 +242,13 @@ def create_share_sweeps(calendar_year, market_class_dict, candidate_production_d
     include the ``consumer_response`` and are used as to generate nearby market share options, again as a function of
     the ``share_range`` as the producer continues to search compliance options.
 
+    A warm-started search has a first pass share range less than 1.0, in which case the first pass market shares are
+    generated around the prior year's market shares, within the first pass constraints.  The share constraints
+    recorded for the consumer and later iterations are those of a cold first pass, only the producer's share sweep is
+    narrowed.
+
     Args:
+        compliance_id (str): manufacturer name, or 'consolidated_OEM'
         calendar_year (int): the year in which the compliance calculations take place
         market_class_dict (dict): a dict of CompositeVehicle object lists hiearchically grouped by market categories
             into market classes
@@ -253,7 +279,7 @@ def create_share_sweeps(calendar_year, market_class_dict, candidate_production_d
             print('processing ' + k)
         if type(market_class_dict[k]) is dict and set(market_class_dict[k].keys()) != {'ALT', 'NO_ALT'}:
             # process subtree
-            child_df_list.append(create_share_sweeps(calendar_year, market_class_dict[k],
+            child_df_list.append(create_share_sweeps(compliance_id, calendar_year, market_class_dict[k],
                                 candidate_production_decisions, share_range,
                                 consumer_response, context_based_total_sales,
                                 prior_producer_decision_and_response, producer_consumer_iteration_num,
@@ -293,11 +319,11 @@ def create_share_sweeps(calendar_year, market_class_dict, candidate_production_d
                 if len(responsive_children) > 1:
 
                     if consumer_response is None:
-                        node_abs_share = _cache['mcat_data_%d' % calendar_year][node_name]['abs_share']
+                        node_abs_share = _cache[compliance_id, calendar_year]['mcat_data'][node_name]['abs_share']
                     else:
                         node_abs_share = consumer_response['consumer_abs_share_frac_%s' % node_name]
 
-                    if share_range == 1.0:
+                    if candidate_production_decisions is None:
                         locked_consumer_shares = False
 
                         if consumer_response is not None:
@@ -493,25 +519,53 @@ def create_share_sweeps(calendar_year, market_class_dict, candidate_production_d
                         round_constraints(min_constraints)
                         round_constraints(max_constraints)
 
+                        # constraint_partition determines the share constraints passed to the consumer and to later
+                        # producer-consumer iterations, it's the node partition except when warm starting
                         if locked_consumer_shares:
                             node_partition = pd.DataFrame.from_dict([min_constraints])
+                            constraint_partition = node_partition
+                        elif share_range < 1.0 and prior_producer_decision_and_response is not None and \
+                                all(scn in prior_producer_decision_and_response and scn in min_constraints and
+                                    scn in max_constraints for scn in abs_share_column_names) and \
+                                sum(prior_producer_decision_and_response[scn] for scn in abs_share_column_names) > 0:
+                            # warm start, generate shares around last year's relative shares
+                            prior_node_abs_share = \
+                                sum(prior_producer_decision_and_response[scn] for scn in abs_share_column_names)
+                            prior_shares = pd.Series(
+                                {scn: min(max_constraints[scn], max(min_constraints[scn],
+                                          prior_producer_decision_and_response[scn] / prior_node_abs_share))
+                                 for scn in abs_share_column_names})
+
+                            node_partition = \
+                                generate_constrained_nearby_shares(abs_share_column_names, prior_shares, share_range,
+                                                               omega_globals.options.producer_num_market_share_options,
+                                                               min_constraints=min_constraints,
+                                                               max_constraints=max_constraints)
+
+                            # only the producer's share sweep is narrowed, the constraints span the cold start
+                            # partition so the warm start doesn't change the consumer's allowed share range
+                            constraint_partition = partition(abs_share_column_names,
+                                      num_levels=omega_globals.options.producer_num_market_share_options,
+                                      min_constraints=min_constraints, max_constraints=max_constraints)
                         else:
                             node_partition = partition(abs_share_column_names,
                                       num_levels=omega_globals.options.producer_num_market_share_options,
                                       min_constraints=min_constraints, max_constraints=max_constraints)
+                            constraint_partition = node_partition
 
                         # CU RV
 
                         sales_share_df = node_abs_share * node_partition
+                        constraint_share_df = node_abs_share * constraint_partition
 
                         # capture constraints
                         for c in children:
                             min_constraints[c] = 0
                             max_constraints[c] = 0
                         min_constraints[node_name] = 0
-                        for scn in sales_share_df.columns:
-                            min_constraints[scn] = sales_share_df[scn].min() / node_abs_share
-                            max_constraints[scn] = sales_share_df[scn].max() / node_abs_share
+                        for scn in constraint_share_df.columns:
+                            min_constraints[scn] = constraint_share_df[scn].min() / node_abs_share
+                            max_constraints[scn] = constraint_share_df[scn].max() / node_abs_share
                             for c in children:
                                 if c in scn.split('.'):
                                     min_constraints[c] += min_constraints[scn]
@@ -554,7 +608,7 @@ def create_share_sweeps(calendar_year, market_class_dict, candidate_production_d
             # but I guess it adds some tracking info to the dataframe which might be useful for debugging
             sales_share_dict = dict()
             for c, scn in zip(children, abs_share_column_names):
-                sales_share_dict[scn] = [_cache['mcat_data_%d' % calendar_year][c]['abs_share']]
+                sales_share_dict[scn] = [_cache[compliance_id, calendar_year]['mcat_data'][c]['abs_share']]
 
             sales_share_df = pd.DataFrame.from_dict(sales_share_dict)
 
@@ -605,7 +659,7 @@ def apply_production_decision_to_composite_vehicles(composite_vehicles, selected
 
 def search_production_options(compliance_id, calendar_year, producer_decision_and_response,
                               producer_consumer_iteration_num, strategic_target_offset_Mg,
-                              prior_producer_decision_and_response):
+                              prior_producer_decision_and_response, allow_warm_start=True):
     """
     This function implements the producer search for a set of technologies (CO2e g/mi values) and market shares that
     achieve a desired compliance outcome taking into consideration the strategic target offset which allows
@@ -617,6 +671,11 @@ def search_production_options(compliance_id, calendar_year, producer_decision_an
     (``producer_consumer_iteration_num`` > 0) the producer decision and consumer response is used to constrain the range
     of market shares under consideration by the producer.
 
+    If ``producer_compliance_search_warm_start`` is enabled, the first producer-consumer iteration of each year after
+    the first starts ``producer_compliance_search_warm_start_iterations`` search iterations in, with tech and share
+    options centered on the prior year's decision.  If no compliant option is found, the search is repeated over the
+    full range.
+
     Args:
         compliance_id (str): manufacturer name, or 'consolidated_OEM'
         calendar_year (int): the year of the compliance search
@@ -627,6 +686,7 @@ def search_production_options(compliance_id, calendar_year, producer_decision_an
             negative then the raw compliance outcome will be over-compliance. Used to strategically under- or over-
             comply, perhaps as a result of the desired to earn or burn prior credits in the credit bank
         prior_producer_decision_and_response (Series): prior-year producer decision and response
+        allow_warm_start (bool): if ``False`` then search the full range regardless of the warm start setting
 
     Returns:
         A tuple of ``composite_vehicles`` (list of CompositeVehicle objects),
@@ -646,13 +706,22 @@ def search_production_options(compliance_id, calendar_year, producer_decision_an
         omega_log.IterationLog('%s%d_%d_%s_producer_compliance_search.csv' % (
             omega_globals.options.output_folder, calendar_year, producer_consumer_iteration_num, compliance_id))
 
+    warm_start = allow_warm_start and omega_globals.options.producer_compliance_search_warm_start and \
+        prior_producer_decision_and_response is not None and producer_consumer_iteration_num == 0
+
+    if warm_start:
+        initial_search_iteration = omega_globals.options.producer_compliance_search_warm_start_iterations
+    else:
+        initial_search_iteration = 0
+
     continue_search = True
     search_iteration = 0
     best_candidate_production_decision = None
     most_strategic_production_decision = None
 
     while continue_search:
-        share_range = omega_globals.options.producer_compliance_search_convergence_factor ** search_iteration
+        share_range = omega_globals.options.producer_compliance_search_convergence_factor ** \
+                      (initial_search_iteration + search_iteration)
 
         composite_vehicles, pre_production_vehicles, market_class_tree, context_based_total_sales = \
             create_composite_vehicles(calendar_year, compliance_id)
@@ -665,13 +734,20 @@ def search_production_options(compliance_id, calendar_year, producer_decision_an
         production_options = []
 
         for candidate_production_decision in candidate_production_decisions:
-            tech_sweeps = create_tech_sweeps(composite_vehicles, candidate_production_decision, share_range)
+            tech_sweeps = create_tech_sweeps(composite_vehicles, candidate_production_decision, share_range,
+                                             prior_producer_decision_and_response)
 
-            share_sweeps = create_share_sweeps(calendar_year, market_class_tree,
+            share_sweeps = create_share_sweeps(compliance_id, calendar_year, market_class_tree,
                                                candidate_production_decision, share_range,
                                                producer_decision_and_response, context_based_total_sales,
                                                prior_producer_decision_and_response, producer_consumer_iteration_num)
 
+            if warm_start and search_iteration == 0 and \
+                    'producer_compliance_search_warm_start_check' in omega_globals.options.verbose_log_modules:
+                check_warm_start_constraints(compliance_id, calendar_year, market_class_tree,
+                                             producer_decision_and_response, context_based_total_sales,
+                                             producer_consumer_iteration_num)
+
             # attempt to save some RAM...
             tech_sweeps = tech_sweeps.astype(np.float32)
             share_sweeps = share_sweeps.astype(np.float32)
@@ -800,6 +876,22 @@ def search_production_options(compliance_id, calendar_year, producer_decision_an
 
         continue_search = (share_range > omega_globals.options.producer_compliance_search_min_share_range)  # RV
 
+    if warm_start:
+        full_range_search_iterations = calc_num_search_iterations(0)
+
+        if producer_compliance_possible is False:
+            omega_log.logwrite('%d %s producer compliance search warm start: no compliant option after %d iterations, '
+                               'searching full range, %d iterations saved' %
+                               (calendar_year, compliance_id, search_iteration, -search_iteration))
+
+            return search_production_options(compliance_id, calendar_year, producer_decision_and_response,
+                                             producer_consumer_iteration_num, strategic_target_offset_Mg,
+                                             prior_producer_decision_and_response, allow_warm_start=False)
+
+        omega_log.logwrite('%d %s producer compliance search warm start: %d iterations, %d iterations saved' %
+                           (calendar_year, compliance_id, search_iteration,
+                            full_range_search_iterations - search_iteration))
+
     if producer_compliance_possible is not None:
         if 'producer_compliance_search' in omega_globals.options.verbose_console_modules:
             omega_log.logwrite('PRODUCER FINAL COMPLIANCE DELTA %f' %
@@ -834,6 +926,66 @@ def search_production_options(compliance_id, calendar_year, producer_decision_an
            producer_compliance_possible, battery_GWh_limit
 
 
+def check_warm_start_constraints(compliance_id, calendar_year, market_class_tree, consumer_response,
+                                 context_based_total_sales, producer_consumer_iteration_num):
+    """
+    Check that a warm-started first pass share sweep recorded the same share constraints as a cold (full range) first
+    pass would have.  The cold first pass share sweep is repeated and its constraints compared to the current
+    ``omega_globals.constraints``, which are then restored.
+
+    Args:
+        compliance_id (str): manufacturer name, or 'consolidated_OEM'
+        calendar_year (int): the year of the compliance search
+        market_class_tree (dict): a dict of CompositeVehicle object lists hiearchically grouped by market categories
+            into market classes
+        consumer_response (Series): the producer decision and consumer response from the prior iteration, if any
+        context_based_total_sales (float): context-based total vehicle sales for the given year
+        producer_consumer_iteration_num (int): producer-consumer iteration number
+
+    Returns:
+        Nothing, logs any constraint mismatches
+
+    """
+    warm_constraints = omega_globals.constraints.copy()
+
+    create_share_sweeps(compliance_id, calendar_year, market_class_tree, None, 1.0, consumer_response,
+                        context_based_total_sales, None, producer_consumer_iteration_num)
+
+    cold_constraints = omega_globals.constraints
+    omega_globals.constraints = warm_constraints
+
+    mismatched_constraints = [k for k in set(warm_constraints) | set(cold_constraints)
+                              if warm_constraints.get(k) != cold_constraints.get(k)]
+
+    if mismatched_constraints:
+        omega_log.logwrite('WARNING: %d %s producer compliance search warm start constraints differ from cold start '
+                           'constraints: %s' % (calendar_year, compliance_id, sorted(mismatched_constraints)),
+                           echo_console=True)
+    else:
+        omega_log.logwrite('%d %s producer compliance search warm start constraints match cold start constraints' %
+                           (calendar_year, compliance_id))
+
+
+def calc_num_search_iterations(initial_search_iteration):
+    """
+    Calculate the number of producer compliance search iterations required to reach the minimum share range.
+
+    Args:
+        initial_search_iteration (int): the initial convergence factor exponent, non-zero for a warm-started search
+
+    Returns:
+        The number of search iterations
+
+    """
+    num_search_iterations = 1
+    while omega_globals.options.producer_compliance_search_convergence_factor ** \
+            (initial_search_iteration + num_search_iterations - 1) > \
+            omega_globals.options.producer_compliance_search_min_share_range:
+        num_search_iterations += 1
+
+    return num_search_iterations
+
+
 def calc_composite_vehicle(mc, rc, alt, mctrc):
     """
     Calculate composite vehicle for the set of vehicles in the given market class / reg class / alt class
@@ -855,6 +1007,56 @@ def calc_composite_vehicle(mc, rc, alt, mctrc):
     return cv
 
 
+def calc_vehicle_frontier_worker(vehicle):
+    """
+    Pool worker version of ``calc_vehicle_frontier()``, the vehicle cost curve is returned via a memory-mapped file.
+
+    Args:
+        vehicle (Vehicle): the vehicle to calculate a frontier for
+
+    Returns:
+        Returns ``vehicle`` with updated frontier
+
+    """
+    calc_vehicle_frontier(vehicle)
+
+    export_cost_curves([vehicle])
+
+    return vehicle
+
+
+def calc_composite_vehicle_worker(mc, rc, alt, mctrc):
+    """
+    Pool worker version of ``calc_composite_vehicle()``, the source vehicle cost curves are received and the composite
+    and source vehicle cost curves are returned via memory-mapped files.
+
+    Args:
+        mc (str): market classs id, e.g. 'hauling.ICE'
+        rc (str): regulatory class, e.g. 'car', 'truck'
+        alt (str): 'ALT' or 'NO_ALT'
+        mctrc (dict): market-class/reg-clas tree
+
+    Returns:
+        The composite vehicle for the set of vehicles in the given market class / reg class / alt class
+
+    """
+    cv = None
+    try:
+        import_cost_curves(mctrc[mc][rc][alt])
+
+        cv = calc_composite_vehicle(mc, rc, alt, mctrc)
+
+        export_cost_curves([cv] + cv.vehicle_list)
+    except BaseException:
+        # the cost curves will not be imported by the session process, remove their files
+        discard_cost_curves(mctrc[mc][rc][alt])
+        if cv is not None:
+            discard_cost_curves([cv] + cv.vehicle_list)
+        raise
+
+    return cv
+
+
 def create_composite_vehicles(calendar_year, compliance_id):
     """
     Create composite vehicles based on the prior year's finalized vehicle production and update the sales mix based on
@@ -872,7 +1074,7 @@ def create_composite_vehicles(calendar_year, compliance_id):
 
     """
 
-    cache_key = calendar_year
+    cache_key = (compliance_id, calendar_year)
 
     if cache_key not in _cache:
         # pull in last year's vehicles:
@@ -895,14 +1097,26 @@ def create_composite_vehicles(calendar_year, compliance_id):
             else:
                 pre_production_vehicles.append(new_veh)
 
+        transported_bytes = 0
+
         if omega_globals.options.multiprocessing:
+            # cost curves are passed to and from the pool via memory-mapped files, see common.frame_transport
             results = []
             for new_veh in manufacturer_vehicles:
-                results.append(omega_globals.pool.apply_async(func=calc_vehicle_frontier,
+                results.append(omega_globals.pool.apply_async(func=calc_vehicle_frontier_worker,
                                                               args=[new_veh],
                                                               callback=None,
                                                               error_callback=error_callback))
-            manufacturer_vehicles = [r.get() for r in results]
+            try:
+                manufacturer_vehicles = [r.get() for r in results]
+            except BaseException:
+                # remove the cost curve files returned by the workers that did complete
+                for r in results:
+                    r.wait()
+                    if r.successful():
+                        discard_cost_curves([r.get()])
+                raise
+            transported_bytes += sum([v.cost_curve.nbytes for v in manufacturer_vehicles])
         else:
             for new_veh in manufacturer_vehicles:
                 calc_vehicle_frontier(new_veh)
@@ -977,28 +1191,27 @@ def create_composite_vehicles(calendar_year, compliance_id):
         # CU RV
 
         # sales by market category, ALT / NO_ALT
-        _cache['mcat_data_%d' % calendar_year] = dict()
+        mcat_data = dict()
         for mcat in omega_globals.options.MarketClass.market_categories:
-            _cache['mcat_data_%d' % calendar_year][mcat] = {'sales': 0, 'abs_share': 0,
-                                                            'NO_ALT_sales': 0, 'ALT_sales': 0,
-                                                            'NO_ALT_abs_share': 0, 'ALT_abs_share': 0}
+            mcat_data[mcat] = {'sales': 0, 'abs_share': 0, 'NO_ALT_sales': 0, 'ALT_sales': 0,
+                               'NO_ALT_abs_share': 0, 'ALT_abs_share': 0}
 
         for mcat in omega_globals.options.MarketClass.market_categories:
             for new_veh in manufacturer_vehicles:
                 new_veh_abs_share = new_veh.projected_sales / context_based_total_sales
                 if new_veh.base_year_vehicle_id in non_covered_byvids:
                     if mcat in str.split(new_veh.market_class_id, '.'):
-                        _cache['mcat_data_%d' % calendar_year][mcat]['NO_ALT_sales'] += new_veh.projected_sales
-                        _cache['mcat_data_%d' % calendar_year][mcat]['NO_ALT_abs_share'] += new_veh_abs_share
-                        _cache['mcat_data_%d' % calendar_year][mcat]['sales'] += new_veh.projected_sales
-                        _cache['mcat_data_%d' % calendar_year][mcat]['abs_share'] += new_veh_abs_share
+                        mcat_data[mcat]['NO_ALT_sales'] += new_veh.projected_sales
+                        mcat_data[mcat]['NO_ALT_abs_share'] += new_veh_abs_share
+                        mcat_data[mcat]['sales'] += new_veh.projected_sales
+                        mcat_data[mcat]['abs_share'] += new_veh_abs_share
                 else:
                     if mcat in str.split(new_veh.market_class_id, '.'):
                         if new_veh.base_year_product:
-                            _cache['mcat_data_%d' % calendar_year][mcat]['ALT_sales'] += new_veh.projected_sales
-                            _cache['mcat_data_%d' % calendar_year][mcat]['ALT_abs_share'] += new_veh_abs_share
-                            _cache['mcat_data_%d' % calendar_year][mcat]['sales'] += new_veh.projected_sales
-                            _cache['mcat_data_%d' % calendar_year][mcat]['abs_share'] += new_veh_abs_share
+                            mcat_data[mcat]['ALT_sales'] += new_veh.projected_sales
+                            mcat_data[mcat]['ALT_abs_share'] += new_veh_abs_share
+                            mcat_data[mcat]['sales'] += new_veh.projected_sales
+                            mcat_data[mcat]['abs_share'] += new_veh_abs_share
 
         # group by market class / reg class
         mctrc = {'ALT_sales': 0, 'NO_ALT_sales': 0}
@@ -1043,12 +1256,31 @@ def create_composite_vehicles(calendar_year, compliance_id):
             results = []
             # start longest jobs first!
             for mc, rc, alt, _ in mcrc_priority_list:
-                results.append(omega_globals.pool.apply_async(func=calc_composite_vehicle,
-                                                              args=[mc, rc, alt, mctrc],
+                # send only the source vehicles of this composite vehicle
+                mc_mctrc = {mc: {rc: {alt: mctrc[mc][rc][alt]}, '%s_sales' % alt: mctrc[mc]['%s_sales' % alt]}}
+                results.append(omega_globals.pool.apply_async(func=calc_composite_vehicle_worker,
+                                                              args=[mc, rc, alt, mc_mctrc],
                                                               callback=None,
                                                               error_callback=error_callback))
 
-            composite_vehicles = [r.get() for r in results]
+            try:
+                composite_vehicles = [r.get() for r in results]
+            except BaseException:
+                # remove the cost curve files returned by the workers that did complete, and any source vehicle cost
+                # curve files that were not loaded
+                for r in results:
+                    r.wait()
+                    if r.successful():
+                        discard_cost_curves([r.get()] + r.get().vehicle_list)
+                discard_cost_curves(manufacturer_vehicles)
+                raise
+
+            for cv in composite_vehicles:
+                transported_bytes += import_cost_curves([cv] + cv.vehicle_list)
+
+            if 'compliance_search_transport' in omega_globals.options.verbose_log_modules:
+                omega_log.logwrite('%d %s cost curve transport: %.1f MB via memory-mapped files' %
+                                   (calendar_year, compliance_id, transported_bytes / 1e6))
         else:
             for mc, rc, alt, _ in mcrc_priority_list:
                 composite_vehicles.append(calc_composite_vehicle(mc, rc, alt, mctrc))
@@ -1073,6 +1305,7 @@ def create_composite_vehicles(calendar_year, compliance_id):
         _cache[cache_key] = {'composite_vehicles': composite_vehicles,
                              'pre_production_vehicles': pre_production_vehicles,
                              'market_class_tree': market_class_tree,
+                             'mcat_data': mcat_data,
                              # CU
                              }
     else:
@@ -1146,10 +1379,16 @@ def finalize_production(calendar_year, compliance_id, candidate_mfr_composite_ve
             veh.global_cumulative_battery_GWh = omega_globals.cumulative_battery_GWh
             omega_globals.options.PowertrainCost.calc_cost(veh, update_tracker=True)  # update build dict
 
+            if omega_globals.options.release_finalized_cost_curves:
+                veh.release_cost_curve()
+
             omega_globals.finalized_vehicles.append(veh)
 
     # propagate pre-production vehicles
     for ppv in pre_production_vehicles:
+        if omega_globals.options.release_finalized_cost_curves:
+            ppv.release_cost_curve()
+
         omega_globals.finalized_vehicles.append(ppv)
 
     # save generalized costs
@@ -1169,11 +1408,47 @@ def finalize_production(calendar_year, compliance_id, candidate_mfr_composite_ve
                                         calendar_year_cert_co2e_Mg=cert_co2e_Mg,
                                         manufacturer_vehicle_cost_dollars=producer_decision['total_cost_dollars']
                                         )
-    _cache.clear()
+    evict_cache(compliance_id, calendar_year)
 
     return target_co2e_Mg - cert_co2e_Mg, production_battery_gigawatthours
 
 
+def evict_cache(compliance_id, calendar_year):
+    """
+    Evict the cached composite vehicle data of a compliance id and calendar year once the year's production has been
+    finalized.  The composite vehicle cost curves are released too if ``release_finalized_cost_curves`` is enabled.
+    Cache memory use is logged if ``'compliance_search_cache'`` is in ``verbose_log_modules``.
+
+    Args:
+        compliance_id (str): manufacturer name, or 'consolidated_OEM'
+        calendar_year (int): the year of the compliance search
+
+    Returns:
+        Nothing, updates ``_cache``
+
+    """
+    cache_entry = _cache.pop((compliance_id, calendar_year), None)
+
+    if cache_entry is None:
+        return
+
+    if 'compliance_search_cache' in omega_globals.options.verbose_log_modules:
+        import psutil
+
+        cost_curve_bytes = sum([cv.cost_curve.memory_usage(deep=True).sum()
+                                for cv in cache_entry['composite_vehicles'] if cv.cost_curve is not None])
+
+        omega_log.logwrite('%d %s compliance search cache: evicted %d composite vehicles (%.1f MB cost curves), '
+                           '%d pre-production vehicles, %d entries remaining, RSS %.1f MB' %
+                           (calendar_year, compliance_id, len(cache_entry['composite_vehicles']),
+                            cost_curve_bytes / 1e6, len(cache_entry['pre_production_vehicles']), len(_cache),
+                            psutil.Process().memory_info().rss / 1e6))
+
+    if omega_globals.options.release_finalized_cost_curves:
+        for cv in cache_entry['composite_vehicles']:
+            cv.cost_curve = None
+
+
 def decompose_candidate_vehicles(candidate_mfr_composite_vehicles, producer_decision):
     """
     Propagate sales to source vehicles and interpolate cost curve data.
@@ -1285,15 +1560,16 @@ def create_production_options_from_shares(composite_vehicles, tech_and_share_com
                 'veh_%s_cost_curve_indices' % composite_veh.vehicle_id].values
 
         # get cert and target Mg for the composite vehicle from the composite cost curve
+        composite_veh_co2e_Mg_per_vehicle = \
+            DecompositionAttributes.interp1d_attributes(composite_veh, composite_veh.cost_curve,
+                                                        cost_curve_interp_key, composite_veh_cost_curve_options,
+                                                        ['cert_co2e_Mg_per_vehicle', 'target_co2e_Mg_per_vehicle'])
+
         composite_veh_cert_co2e_Mg = \
-            composite_veh_sales * \
-            DecompositionAttributes.interp1d(composite_veh, composite_veh.cost_curve, cost_curve_interp_key,
-                                             composite_veh_cost_curve_options, 'cert_co2e_Mg_per_vehicle')
+            composite_veh_sales * composite_veh_co2e_Mg_per_vehicle['cert_co2e_Mg_per_vehicle']
 
         composite_veh_target_co2e_Mg = \
-            composite_veh_sales * \
-            DecompositionAttributes.interp1d(composite_veh, composite_veh.cost_curve, cost_curve_interp_key,
-                                             composite_veh_cost_curve_options, 'target_co2e_Mg_per_vehicle')
+            composite_veh_sales * composite_veh_co2e_Mg_per_vehicle['target_co2e_Mg_per_vehicle']
 
         production_data['veh_%s_sales' % composite_veh.vehicle_id] = composite_veh_sales
         production_data['veh_%s_total_cost_dollars' % composite_veh.vehicle_id] = composite_veh_total_cost_dollars
@@ -1340,6 +1616,8 @@ def _plot_tech_share_combos_total(calendar_year, production_options):
         production_options (DataFrame): dataframe of the production options, including compliance outcomes in Mg
 
     """
+    import matplotlib.pyplot as plt
+
     plt.figure()
     plt.plot(production_options['total_cert_co2e_megagrams'],
              production_options['total_cost_dollars'], '.')
@@ -369,18 +369,16 @@ class VehicleAggregation(OMEGABase):
                 df['prior_redesign_year'] += omega_globals.options.vehicles_file_base_year_offset
                 df['model_year'] += omega_globals.options.vehicles_file_base_year_offset
 
-            for idx, row in df.iterrows():
-                # calc powertrain cost
+            # calc powertrain costs, the powertrain cost models are evaluated one vehicle at a time
+            powertrain_cost = np.zeros(len(df))
+            cleared_tech_flags = dict.fromkeys(omega_globals.options.CostCloud.tech_flags, 0)
+
+            for row_idx, row in enumerate(df.to_dict('records')):
                 veh = Vehicle(row['manufacturer_id'])
                 veh.model_year = row['model_year']
                 veh.body_style = row['body_style']
                 veh.drive_system = row['drive_system']
 
-                if row['base_year_powertrain_type'] in ['BEV', 'FCV']:
-                    df.loc[idx, 'rated_hp'] = row['total_emachine_kw'] / 0.746
-                else:
-                    df.loc[idx, 'rated_hp'] = row['eng_rated_hp']
-
                 if row['base_year_powertrain_type'] == 'FCV':
                     # RV FCV map FCV to BEV for now
                     veh.base_year_powertrain_type = 'BEV'
@@ -394,61 +392,58 @@ class VehicleAggregation(OMEGABase):
                 veh.cert_fuel_id = row['cert_fuel_id']
 
                 veh.market_class_id = omega_globals.options.MarketClass.get_vehicle_market_class(veh)
-                row['market_class_id'] = omega_globals.options.MarketClass.get_vehicle_market_class(veh)
 
                 veh.global_cumulative_battery_GWh = omega_globals.cumulative_battery_GWh
 
                 veh.application_id = row['application_id']
                 Vehicle.set_fueling_class(veh)
 
-                # clear row tech flags:
-                for tech_flag in omega_globals.options.CostCloud.tech_flags:
-                    row[tech_flag] = 0
-
-                # set row tech flags needed by powertrain cost:
-                for tech_flag, value in omega_globals.options.CostCloud.get_tech_flags(veh).items():
-                    row[tech_flag] = value
+                # row with cleared tech flags, then the tech flags needed by powertrain cost:
+                pkg_info = pd.Series({**row, 'market_class_id': veh.market_class_id, **cleared_tech_flags,
+                                      **omega_globals.options.CostCloud.get_tech_flags(veh)})
 
-                powertrain_cost = sum(omega_globals.options.PowertrainCost.calc_cost(veh, veh.base_year_powertrain_type, row))
+                powertrain_cost[row_idx] = \
+                    sum(omega_globals.options.PowertrainCost.calc_cost(veh, veh.base_year_powertrain_type, pkg_info))
 
-                # calc glider cost
-                veh.structure_material = row['structure_material']
-                veh.height_in = row['height_in']
-                veh.ground_clearance_in = row['ground_clearance_in']
-                veh.base_year_msrp_dollars = row['msrp_dollars']
-                row['base_year_msrp_dollars'] = row['msrp_dollars']
+            df['rated_hp'] = np.where(df['base_year_powertrain_type'].isin(['BEV', 'FCV']),
+                                      df['total_emachine_kw'] / 0.746, df['eng_rated_hp'])
 
-                veh.unibody_structure = row['unibody_structure']
-                veh.body_style = row['body_style']
-
-                veh.base_year_glider_non_structure_cost_dollars = \
-                    GliderCost.get_base_year_glider_non_structure_cost(veh, row['structure_mass_lbs'], powertrain_cost)
+            # calc glider costs column-wise, for groups of vehicles with common glider cost terms
+            glider_structure_cost_dollars = np.zeros(len(df))
+            glider_non_structure_cost_dollars = np.zeros(len(df))
 
-                veh.base_year_footprint_ft2 = row['footprint_ft2']
+            for (body_style, unibody_structure, structure_material, model_year), group_indices in \
+                    df.groupby(['body_style', 'unibody_structure', 'structure_material', 'model_year']).\
+                    indices.items():
+                group_df = df.iloc[group_indices]
 
-                veh.base_year_curbweight_lbs = row['curbweight_lbs']
+                veh = Vehicle(group_df['manufacturer_id'].iloc[0])
+                veh.model_year = int(model_year)
+                veh.body_style = body_style
+                veh.unibody_structure = int(unibody_structure)
+                veh.structure_material = structure_material
+                veh.height_in = group_df['height_in'].values
+                veh.ground_clearance_in = group_df['ground_clearance_in'].values
+                veh.base_year_msrp_dollars = group_df['msrp_dollars'].values
+                veh.base_year_footprint_ft2 = group_df['footprint_ft2'].values
+                veh.base_year_curbweight_lbs = group_df['curbweight_lbs'].values
 
-                glider_structure_cost_dollars, glider_non_structure_cost_dollars = \
-                    GliderCost.calc_cost(veh, pd.DataFrame([row]))
+                veh.base_year_glider_non_structure_cost_dollars = \
+                    GliderCost.get_base_year_glider_non_structure_cost(veh, group_df['structure_mass_lbs'].values,
+                                                                       powertrain_cost[group_indices])
 
-                df.loc[idx, 'glider_structure_cost_dollars'] = \
-                    float(glider_structure_cost_dollars)
+                glider_structure_cost_dollars[group_indices], glider_non_structure_cost_dollars[group_indices] = \
+                    GliderCost.calc_cost(veh, group_df)
 
-                df.loc[idx, 'glider_non_structure_cost_dollars'] = \
-                    float(glider_non_structure_cost_dollars)
+            df['glider_structure_cost_dollars'] = glider_structure_cost_dollars
+            df['glider_non_structure_cost_dollars'] = glider_non_structure_cost_dollars
 
-                workfactor = 0
-                if row['reg_class_id'] == 'mediumduty':
-                    model_year, curbweight_lbs, gvwr_lbs, gcwr_lbs, drive_system \
-                        = row['model_year'], row['curbweight_lbs'], row['gvwr_lbs'], row['gcwr_lbs'], \
-                        row['drive_system']
-                    workfactor = \
-                        WorkFactor.calc_workfactor(model_year, curbweight_lbs, gvwr_lbs, gcwr_lbs, drive_system)
-                df.at[idx, 'workfactor'] = workfactor
-                veh.gvwr_lbs = row['gvwr_lbs']
-                veh.gcwr_lbs = row['gcwr_lbs']
-                veh.base_year_gvwr_lbs = row['gvwr_lbs']
-                veh.base_year_gcwr_lbs = row['gcwr_lbs']
+            # calc medium-duty workfactors column-wise, by model year and drive system
+            mediumduty_df = df[df['reg_class_id'] == 'mediumduty']
+            for (model_year, drive_system), group_df in mediumduty_df.groupby(['model_year', 'drive_system']):
+                df.loc[group_df.index, 'workfactor'] = \
+                    WorkFactor.calc_workfactor(int(model_year), group_df['curbweight_lbs'].values,
+                                               group_df['gvwr_lbs'].values, group_df['gcwr_lbs'].values, drive_system)
 
             df['glider_non_structure_mass_lbs'] = df['curbweight_lbs'] - df['powertrain_mass_lbs'] \
                                                   - df['structure_mass_lbs'] - df['battery_mass_lbs']
@@ -456,7 +451,7 @@ class VehicleAggregation(OMEGABase):
             df.to_csv(omega_globals.options.output_folder + 'costed_vehicles.csv', columns=sorted(df.columns))
 
             # calculate weighted numeric values within the groups, and combined string values
-            agg_df = df.groupby(aggregation_columns, as_index=False).apply(sales_weight_average_dataframe)
+            agg_df = sales_weight_average_groups(df, aggregation_columns)
             agg_df['vehicle_name'] = agg_df[aggregation_columns].apply(lambda x: ':'.join(x.values.astype(str)), axis=1)
 
             if omega_globals.options.consolidate_manufacturers:
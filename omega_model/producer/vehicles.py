@@ -81,7 +81,6 @@ from policy.offcycle_credits import OffCycleCredits
 from policy.upstream_methods import UpstreamMethods
 
 from common.omega_functions import cartesian_prod, calc_frontier
-from common.omega_plot import figure, label_xyt, vlineat
 from common.omega_functions import weighted_value
 
 from context.fuel_prices import FuelPrice
@@ -196,54 +195,152 @@ class DecompositionAttributes(OMEGABase):
             return vehicle.__getattribute__(attribute_name)  # None
 
     @staticmethod
-    def interp1d_non_numeric(vehicle, cost_curve_non_numeric_data, index_column, index_value, attribute_name):
+    def calc_interp_brackets(xp, x):
         """
-        Interpolate non-numeric data
+        Calculate the linear interpolation brackets of the given x-axis value(s), so that any number of y-axis value
+        sets can be interpolated without repeating the bracket search, see ``apply_interp_brackets()``.
+        Interpolation results are identical to ``np.interp()``, including clamping to the end points.
+
+        Args:
+            xp (numeric Array): the increasing x-axis values of the data points
+            x (numeric or numeric Array): the x-axis value(s) at which to interpolate
+
+        Returns:
+            tuple of lower and upper bracket indices, x offsets from the lower and upper bracket points, bracket spans,
+            a mask of points that take the lower bracket value directly and a mask of NaN x-axis values
+
+        """
+        xp = np.asarray(xp, dtype=float)
+        x = np.asarray(x, dtype=float)
+
+        last_index = len(xp) - 1
+
+        bracket_index = np.searchsorted(xp, x, side='right') - 1
+        lower = np.clip(bracket_index, 0, last_index)
+        upper = np.minimum(lower + 1, last_index)
+
+        exact = (bracket_index < 0) | (bracket_index >= last_index) | (xp[lower] == x)
+
+        return lower, upper, x - xp[lower], x - xp[upper], xp[upper] - xp[lower], exact, np.isnan(x)
+
+    @staticmethod
+    def apply_interp_brackets(brackets, fp):
+        """
+        Interpolate a stacked block of y-axis values using brackets from ``calc_interp_brackets()``.
+
+        Args:
+            brackets (tuple): interpolation brackets from ``calc_interp_brackets()``
+            fp (numeric Array): the y-axis values of the data points, one row per attribute, one column per data point
+
+        Returns:
+            Numeric Array of interpolated values, one row per attribute, one column per x-axis value
+
+        """
+        lower, upper, lower_offset, upper_offset, span, exact, nan_x = brackets
+
+        fp = np.asarray(fp, dtype=float)
+        fp_lower = fp[..., lower]
+        fp_upper = fp[..., upper]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            slope = (fp_upper - fp_lower) / span
+            values = slope * lower_offset + fp_lower
+
+            # if we get nan in one direction, try the other (same as np.interp())
+            retry = np.isnan(values)
+            if retry.any():
+                values = np.where(retry, slope * upper_offset + fp_upper, values)
+                values = np.where(np.isnan(values) & (fp_lower == fp_upper), fp_lower, values)
+
+        values = np.where(exact, fp_lower, values)
+
+        return np.where(nan_x, np.nan, values)
+
+    @staticmethod
+    def interp1d_attributes(vehicle, cost_curve, index_column, index_value, attribute_names):
+        """
+        Interpolate multiple attributes of the given cost curve in a single pass, the bracket (or nearest point)
+        search is performed once and applied to all the attributes.  Equivalent to calling ``interp1d()`` for each
+        attribute.
 
         Args:
             vehicle (Vehicle or CompositeVehicle): the vehicle object
-            cost_curve_non_numeric_data (DataFrame): the cost curve non-numeric data to interpolate
+            cost_curve (DataFrame): the cost curve to interpolate
             index_column (str): the name of the x-axis / index column
             index_value (numeric): the x-axis / index value(s) at which to interpolate
-            attribute_name (str): name of the attribute to interpolate
+            attribute_names ([strs]): names of the attributes to interpolate
 
         Returns:
-            None, updates vehicle attributes based on interpolation
+            dict of floats or numeric Arrays of values at each index value, by attribute name
 
         """
+        if type(vehicle) is not CompositeVehicle:
+            prefix = 'veh_%s_' % vehicle.vehicle_id
+        else:
+            prefix = ''
 
-        if attribute_name in cost_curve_non_numeric_data:
-            if index_column not in cost_curve_non_numeric_data:
-                cost_curve_non_numeric_data[index_column] = vehicle.cost_curve[
-                    'veh_%s_%s' % (vehicle.vehicle_id, index_column)]
-                cost_curve_non_numeric_data.reset_index(inplace=True)
+        curve_attributes = [an for an in attribute_names if '%s%s' % (prefix, an) in cost_curve]
+        column_names = ['%s%s' % (prefix, an) for an in curve_attributes]
 
-            interp_index = float(np.interp(index_value,
-                                  cost_curve_non_numeric_data[index_column],
-                                  cost_curve_non_numeric_data.index))
+        values = dict()
 
-            if interp_index <= 0:
-                value = cost_curve_non_numeric_data[attribute_name].iloc[0]
-            elif interp_index >= max(cost_curve_non_numeric_data.index):
-                value = cost_curve_non_numeric_data[attribute_name].iloc[-1]
-            elif cost_curve_non_numeric_data[attribute_name].iloc[math.trunc(interp_index)] != \
-                    cost_curve_non_numeric_data[attribute_name].iloc[math.trunc(interp_index) + 1]:
+        if curve_attributes:
+            if len(cost_curve) > 1:
+                if isinstance(index_value, Iterable):
+                    # true interpolation (multiple values passed as index):
+                    brackets = DecompositionAttributes.calc_interp_brackets(cost_curve[index_column].values,
+                                                                            index_value)
+                    block = DecompositionAttributes.apply_interp_brackets(
+                        brackets, cost_curve[column_names].to_numpy(dtype=float).T)
+                    values.update(zip(curve_attributes, block))
+                else:
+                    # nearest result retrieval (get final result, single value):
+                    nearest_index = np.nanargmin(np.abs(index_value - cost_curve[index_column].values))
+                    for an, cn in zip(curve_attributes, column_names):
+                        values[an] = cost_curve[cn].values[nearest_index]
+            else:
+                for an, cn in zip(curve_attributes, column_names):
+                    values[an] = cost_curve[cn].item()
 
-                offset = interp_index - math.trunc(interp_index)
+        return {an: values[an] if an in values else vehicle.__getattribute__(an) for an in attribute_names}
 
-                # CU RV for intermediate string values
+    @staticmethod
+    def interp1d_non_numeric_attributes(vehicle, cost_curve_non_numeric_data, index_column, index_value,
+                                        attribute_names):
+        """
+        Nearest-neighbour interpolation of multiple non-numeric attributes, the nearest cost curve point is determined
+        once and applied to all the attributes.  Values between two cost curve points take the value of the nearer
+        point.
 
-                if offset < 0.5:
-                    value = cost_curve_non_numeric_data[attribute_name].iloc[math.trunc(interp_index)]
-                else:
-                    value = cost_curve_non_numeric_data[attribute_name].iloc[math.trunc(interp_index) + 1]
+        Args:
+            vehicle (Vehicle): the vehicle object
+            cost_curve_non_numeric_data (DataFrame): the cost curve non-numeric data to interpolate, one row per
+                ``vehicle.cost_curve`` point
+            index_column (str): the name of the x-axis / index column
+            index_value (numeric): the x-axis / index value at which to interpolate
+            attribute_names ([strs]): names of the attributes to interpolate
 
-            else:
-                value = cost_curve_non_numeric_data[attribute_name].iloc[math.trunc(interp_index)]
+        Returns:
+            dict of interpolated values by attribute name, ``None`` for attributes not in the non-numeric data
+
+        """
+        xp = vehicle.cost_curve['veh_%s_%s' % (vehicle.vehicle_id, index_column)].values
+        last_index = len(xp) - 1
+
+        interp_index = float(np.interp(index_value, xp, np.arange(len(xp))))
+
+        if interp_index <= 0:
+            nearest_index = 0
+        elif interp_index >= last_index:
+            nearest_index = last_index
         else:
-            value = None
+            nearest_index = math.trunc(interp_index)
+            # CU RV for intermediate string values
+            if interp_index - nearest_index >= 0.5:
+                nearest_index += 1
 
-        return value
+        return {an: cost_curve_non_numeric_data[an].values[nearest_index] if an in cost_curve_non_numeric_data
+                else None for an in attribute_names}
 
     @classmethod
     def rename_decomposition_columns(cls, vehicle, cost_curve):
@@ -507,18 +604,16 @@ class CompositeVehicle(OMEGABase):
 
         for v in self.vehicle_list:
             if 'cost_curve' in self.__dict__:
-                for ccv in DecompositionAttributes.values:
-                    v.__setattr__(ccv,
-                              DecompositionAttributes.interp1d(v, self.cost_curve, cost_curve_interp_key,
-                                                               self.__getattribute__(cost_curve_interp_key),
-                                                               ccv))
-
-                for ccv in omega_globals.options.CostCloud.cloud_non_numeric_data_columns:
-                    v.__setattr__(ccv,
-                          DecompositionAttributes.interp1d_non_numeric(v, v.cost_curve_non_numeric_data,
-                                                                       cost_curve_interp_key,
-                                                                       v.__getattribute__(cost_curve_interp_key),
-                                                                       ccv))
+                for ccv, value in DecompositionAttributes.interp1d_attributes(
+                        v, self.cost_curve, cost_curve_interp_key, self.__getattribute__(cost_curve_interp_key),
+                        DecompositionAttributes.values).items():
+                    v.__setattr__(ccv, value)
+
+                for ccv, value in DecompositionAttributes.interp1d_non_numeric_attributes(
+                        v, v.cost_curve_non_numeric_data, cost_curve_interp_key,
+                        v.__getattribute__(cost_curve_interp_key),
+                        omega_globals.options.CostCloud.cloud_non_numeric_data_columns).items():
+                    v.__setattr__(ccv, value)
 
             v.initial_registered_count = self.initial_registered_count * v.composite_vehicle_share_frac
             v.set_target_co2e_Mg()  # varies by model year and initial_registered_count
@@ -587,6 +682,8 @@ class CompositeVehicle(OMEGABase):
 
         """
         if plot:
+            from common.omega_plot import figure, label_xyt
+
             fig, ax1 = figure()
             label_xyt(ax1, cost_curve_interp_key, 'Generalized Cost [$]', '%s' % self.name)
 
@@ -1438,6 +1535,20 @@ class Vehicle(OMEGABase):
 
         return alt_veh
 
+    def release_cost_curve(self):
+        """
+        Release the vehicle cost curve data once the vehicle's model year has been finalized.  The cost curve is only
+        needed during the compliance search, vehicles carried over into the next model year have their cost curve
+        recalculated if they are in production, so holding on to it only increases memory use and the cost of
+        passing vehicles to and from worker processes.
+
+        Returns:
+            Nothing, clears ``cost_curve`` and ``cost_curve_non_numeric_data``
+
+        """
+        self.cost_curve = None
+        self.cost_curve_non_numeric_data = None
+
     @staticmethod
     def clone_vehicle(vehicle):
         """
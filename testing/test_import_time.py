@@ -0,0 +1,127 @@
+"""
+
+test_import_time.py
+
+Reports the ``python -X importtime`` import totals of the batch, session worker and effects entry points and checks
+them against an import-time budget.  Heavy, plot-only or optional dependencies (e.g. matplotlib, treelib) are
+expected to load on first use rather than at import time, an entry point that imports one of them fails the test.
+
+Usage:
+    python test_import_time.py [--budget_ms 1500] [--num_top 10]
+
+----
+
+**CODE**
+
+"""
+
+import os
+import sys
+import subprocess
+
+path = os.path.abspath(os.path.dirname(os.path.abspath(__file__)) + os.sep + '..')
+
+# entry point module: folders (relative to the repository root) to add to PYTHONPATH
+entry_points = {
+    'omega_batch': ['', 'omega_model'],  # batch process, including ``--no_sim`` batch validation
+    'omega': ['', 'omega_model'],  # session runner and multiprocessing pool workers (``omega.init_omega``)
+    'common.omega_dispy': ['', 'omega_model'],  # dispy session workers (``dispy_run_session``)
+    'omega_effects.omega_effects_main': ['', 'omega_effects'],  # effects batch process and pool workers
+}
+
+# modules which should only load on first use
+lazy_modules = ['matplotlib', 'treelib', 'pyDOE2', 'dispy', 'scipy', 'tkinter']
+
+
+def measure_import_time(module_name, python_paths):
+    """
+    Import a module in a fresh interpreter and collect the ``-X importtime`` data.
+
+    Args:
+        module_name (str): the module to import
+        python_paths ([strs]): folders, relative to the repository root, to add to the PYTHONPATH
+
+    Returns:
+        List of (self microseconds, cumulative microseconds, import depth, imported module name) tuples
+
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.join(path, p) for p in python_paths])
+
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import %s' % module_name],
+                            env=env, cwd=os.path.join(path, python_paths[-1]), capture_output=True, text=True)
+
+    if result.returncode:
+        raise Exception('Unable to import %s:\n%s' % (module_name, result.stderr))
+
+    import_data = []
+    for line in result.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line and 'self [us]' not in line:
+            self_us, cumulative_us, name = line.replace('import time:', '').split('|')
+            import_data.append((int(self_us), int(cumulative_us), (len(name) - len(name.lstrip())) // 2,
+                                name.strip()))
+
+    return import_data
+
+
+def report_import_time(module_name, import_data, budget_ms, num_top):
+    """
+    Print the import time report of an entry point and check it against the budget.
+
+    Args:
+        module_name (str): the entry point module
+        import_data ([tuples]): import time data from ``measure_import_time()``
+        budget_ms (float): the import-time budget, milliseconds
+        num_top (int): number of heaviest top-level imports to report
+
+    Returns:
+        List of budget errors, else empty list on success
+
+    """
+    errors = []
+
+    total_ms = sum([d[0] for d in import_data]) / 1000
+    top_level = sorted([d for d in import_data if d[2] <= 1], key=lambda d: d[1], reverse=True)
+
+    print('\n%s: %.1f ms total import time, %d modules' % (module_name, total_ms, len(import_data)))
+    for self_us, cumulative_us, depth, name in top_level[0:num_top]:
+        print('    %10.1f ms  %s' % (cumulative_us / 1000, name))
+
+    if total_ms > budget_ms:
+        errors.append('%s import time %.1f ms exceeds budget of %.1f ms' % (module_name, total_ms, budget_ms))
+
+    imported_lazy_modules = sorted(set([d[3].split('.')[0] for d in import_data
+                                        if d[3].split('.')[0] in lazy_modules]))
+    if imported_lazy_modules:
+        errors.append('%s imports %s at import time' % (module_name, imported_lazy_modules))
+
+    return errors
+
+
+if __name__ == "__main__":
+    import argparse
+    import traceback
+
+    try:
+        parser = argparse.ArgumentParser(description='Report and check entry point import times')
+        parser.add_argument('--budget_ms', type=float, default=1500,
+                            help='Import-time budget per entry point, milliseconds')
+        parser.add_argument('--num_top', type=int, default=10,
+                            help='Number of heaviest top-level imports to report per entry point')
+        args = parser.parse_args()
+
+        errors = []
+        for entry_point, python_paths in entry_points.items():
+            errors += report_import_time(entry_point, measure_import_time(entry_point, python_paths),
+                                         args.budget_ms, args.num_top)
+    except:
+        print("\n#RUNTIME FAIL\n%s\n" % traceback.format_exc())
+        sys.exit(-1)
+
+    if errors:
+        print('\nIMPORT TIME FAILED:')
+        for e in errors:
+            print('    %s' % e)
+        sys.exit(-1)
+    else:
+        print('\nIMPORT TIME PASSED')